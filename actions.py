@@ -74,6 +74,7 @@ from src.drone_config import ConfigLoader
 from src.flight_timeout_utils import calculate_land_disarm_timeout, calculate_rtl_completion_timeout
 from src.drone_api_routes import DRONE_NAVIGATION_HOME_ROUTE, DRONE_STATE_ROUTE
 from src.led_controller import LEDController
+from src.local_state_bus import read_local_state_snapshot
 from src.mission_startup import arm_with_preflight_gate
 from src.params import Params
 
@@ -677,7 +678,14 @@ async def wait_for_telemetry_condition(stream_factory, predicate, description, t
 
 
 def _get_local_drone_state_snapshot(timeout: float = 1.0):
-    """Read the local drone API state as a fallback readiness signal for this container."""
+    """Read the local drone state as a fallback readiness signal for this container.
+
+    Prefers the coordinator's shared-memory state bus and falls back to the
+    local drone API over HTTP when the bus is unavailable or stale.
+    """
+    bus_snapshot = read_local_state_snapshot()
+    if bus_snapshot is not None:
+        return bus_snapshot.drone_state
     try:
         response = requests.get(
             f"http://127.0.0.1:{Params.drone_api_port}{DRONE_STATE_ROUTE}",
@@ -691,7 +699,10 @@ def _get_local_drone_state_snapshot(timeout: float = 1.0):
 
 
 def _get_local_home_position_snapshot(timeout: float = 1.0):
-    """Read the local drone API home position as a fallback altitude reference."""
+    """Read the local home position (state bus first, then HTTP) as a fallback altitude reference."""
+    bus_snapshot = read_local_state_snapshot()
+    if bus_snapshot is not None:
+        return bus_snapshot.home_position
     try:
         response = requests.get(
             f"http://127.0.0.1:{Params.drone_api_port}{DRONE_NAVIGATION_HOME_ROUTE}",
@@ -706,8 +717,12 @@ def _get_local_home_position_snapshot(timeout: float = 1.0):
 
 def _get_local_relative_altitude_snapshot(timeout: float = 1.0):
     """Derive relative altitude from the local drone API when MAVSDK telemetry lags."""
-    drone_state = _get_local_drone_state_snapshot(timeout=timeout)
-    home_position = _get_local_home_position_snapshot(timeout=timeout)
+    bus_snapshot = read_local_state_snapshot()
+    if bus_snapshot is not None:
+        drone_state, home_position = bus_snapshot.drone_state, bus_snapshot.home_position
+    else:
+        drone_state = _get_local_drone_state_snapshot(timeout=timeout)
+        home_position = _get_local_home_position_snapshot(timeout=timeout)
     if not drone_state or not home_position:
         return None
 
@@ -41,6 +41,8 @@ from src.connectivity_checker import ConnectivityChecker
 from src.enums import State  # Import State enum
 from src.led_colors import LEDColors, LEDState  # Unified LED color system
 from src.heartbeat_sender import HeartbeatSender
+from src.local_state_bus import LocalStateBusPublisher
+from src.mission_trigger_scheduler import MissionTriggerScheduler
 from src.pos_id_auto_detector import PosIDAutoDetector  # Import the new class
 
 # Unified logging system
@@ -167,6 +169,7 @@ drone_setup = None
 heartbeat_sender = None
 connectivity_checker = None
 pos_id_auto_detector = None
+local_state_publisher = None
 api_server = None
 
 # Initialize LEDController instance if not in simulation mode
@@ -197,6 +200,8 @@ async def schedule_missions_async(drone_setup_instance):
     """
     Asynchronous function that continuously schedules missions.
     Notifies the systemd watchdog and logs state changes (not every tick).
+    Timed missions are launched at their exact deadline by MissionTriggerScheduler
+    rather than on the next poll tick.
     """
     # Track last state to implement change-based logging
     last_mission = None
@@ -205,7 +210,8 @@ async def schedule_missions_async(drone_setup_instance):
     last_summary_time = 0
     SUMMARY_INTERVAL = 60  # Log status summary every 60 seconds
 
-    while True:
+    def on_tick():
+        nonlocal last_mission, last_state, last_trigger_time, last_summary_time
         notifier.notify("WATCHDOG=1")
         current_time = int(time.time())
 
@@ -239,8 +245,13 @@ async def schedule_missions_async(drone_setup_instance):
             )
             last_summary_time = current_time
 
-        await drone_setup_instance.schedule_mission()
-        await asyncio.sleep(1.0 / params.schedule_mission_frequency)
+    scheduler = MissionTriggerScheduler(
+        drone_setup_instance,
+        poll_interval=1.0 / params.schedule_mission_frequency,
+        wake_margin=params.trigger_wake_margin_seconds,
+        on_tick=on_tick,
+    )
+    await scheduler.run()
 
 # -----------------------------------------------------------------------------
 # Main Loop
@@ -252,7 +263,7 @@ def main_loop():
     Monitors drone state changes, updates LED status via ConnectivityChecker,
     sends watchdog notifications, and manages thread cleanup on exit.
     """
-    global drone_comms, drone_setup, connectivity_checker, heartbeat_sender, pos_id_auto_detector, api_server
+    global drone_comms, drone_setup, connectivity_checker, heartbeat_sender, pos_id_auto_detector, api_server, local_state_publisher
 
     try:
         logger.info("Starting the main loop...")
@@ -349,6 +360,8 @@ def main_loop():
         if heartbeat_sender:
             heartbeat_sender.stop()
             logger.info("HeartbeatSender stopped.")
+        if local_state_publisher:
+            local_state_publisher.stop()
         if pos_id_auto_detector:
             pos_id_auto_detector.stop()
             logger.info("PosIDAutoDetector stopped.")
@@ -424,9 +437,22 @@ def main():
         api_server.set_drone_communicator(drone_comms)
         logger.info("DroneAPIServer's DroneCommunicator set.")
 
+        api_server.set_local_mavlink_controller(local_drone_controller)
+
         drone_comms.start_communication()
         logger.info("DroneCommunicator communication started.")
 
+        # Publish local drone state to shared memory for mission processes
+        global local_state_publisher
+        local_state_publisher = safe_init(
+            "LocalStateBusPublisher",
+            lambda: LocalStateBusPublisher(drone_comms, drone_config),
+            led_controller,
+            critical=False  # Non-critical - mission processes fall back to HTTP
+        )
+        if local_state_publisher:
+            local_state_publisher.start()
+
         # Start the FastAPI HTTP server if enabled in the parameters
         if params.enable_drones_http_server:
             api_thread = threading.Thread(target=api_server.run, daemon=True)
@@ -119,7 +119,7 @@ from mavsdk.telemetry import LandedState
 from mavsdk.action import ActionError
 from tenacity import retry, stop_after_attempt, wait_fixed
 
-from src.led_controller import LEDController
+from src.led_controller import LEDColorTimeline, LEDController
 from src.mission_startup import arm_with_preflight_gate
 from src.drone_api_routes import DRONE_LOCAL_POSITION_ROUTE
 from src.params import Params
@@ -673,6 +673,10 @@ async def perform_trajectory(
         f"{'PX4 native landing' if trajectory_ends_high else 'controlled landing'}."
     )
 
+    # Show LEDs follow the mission clock on the render worker, off the setpoint
+    # path; the first set_color below (error / mission complete) takes over.
+    led_controller.play_timeline(LEDColorTimeline.from_waypoints(waypoints), start_time)
+
     # -----------------------------------
     # Main Trajectory Execution Loop
     # -----------------------------------
@@ -787,9 +791,6 @@ async def perform_trajectory(
                 else:
                     in_initial_climb = False
 
-                # Update LED color for feedback
-                led_controller.set_color(ledr, ledg, ledb)
-
                 if in_initial_climb:
                     # Enhanced logging for initial climb start (once per flight)
                     # Only print when first entering climb (time < 0.1s to print once)
@@ -941,8 +942,6 @@ async def perform_trajectory(
                         # Position‐only
                         await drone.offboard.set_position_ned(ln)
 
-                led_controller.set_color(ledr, ledg, ledb)
-
                 # --- (5) Progress & Landing Trigger ---
                 time_to_end = waypoints[-1][0] - t_wp
                 prog = (waypoint_index + 1) / total_waypoints
@@ -81,6 +81,82 @@ import numpy as np
 import pandas as pd
 from functions.trajectories import *
 
+CSV_HEADER = ["idx", "t", "px", "py", "pz", "vx", "vy", "vz", "ax", "ay", "az", "yaw", "mode", "ledr", "ledg", "ledb"]
+CSV_WRITE_CHUNK_ROWS = 20000
+# 12 significant digits keeps every value within ~5e-13 relative of the float
+# and formats several times faster than repr. Pass float_format=None for
+# repr output, byte-identical to writing the rows one at a time.
+DEFAULT_CSV_FLOAT_FORMAT = "%.12g"
+
+
+class TrajectoryBlocks:
+    """
+    Collects trajectory phases as column blocks and writes them to CSV in bulk.
+
+    Each block is one phase (climb, hold, move, maneuver...) given as the 16
+    CSV columns, where a column is either a scalar (the same value on every
+    row) or a numpy array with one value per row. Integers are written as
+    integers and floats with ``float_format``; with ``float_format=None``
+    rows are formatted exactly as ``csv.writer`` formats the equivalent
+    Python values.
+    """
+
+    def __init__(self, float_format=DEFAULT_CSV_FLOAT_FORMAT):
+        self.float_format = float_format
+        self.blocks = []
+
+    def add_block(self, columns):
+        self.blocks.append(columns)
+
+    def write_to(self, file):
+        for columns in self.blocks:
+            _write_csv_block(file, columns, self.float_format)
+
+
+def _format_csv_value(value, float_format):
+    if float_format is not None and isinstance(value, (float, np.floating)):
+        return float_format % value
+    return str(value)
+
+
+def _write_csv_block(file, columns, float_format=DEFAULT_CSV_FLOAT_FORMAT):
+    """Write one block with a single %-format per chunk of rows."""
+    arrays = [column for column in columns if np.ndim(column)]
+    rows = len(arrays[0]) if arrays else 0
+    if rows == 0:
+        return
+
+    fields = []
+    varying = []
+    for column in columns:
+        if np.ndim(column) == 0:
+            fields.append(_format_csv_value(column, float_format))
+        elif column.strides == (0,):
+            # Broadcast constant (e.g. a shape's fixed altitude): format once.
+            fields.append(_format_csv_value(column[0].item(), float_format))
+        else:
+            fields.append("%d" if column.dtype.kind in "iu" else float_format or "%r")
+            varying.append(column)
+    row_format = ",".join(fields) + "\r\n"
+
+    values = np.column_stack(varying) if varying else None
+    for start in range(0, rows, CSV_WRITE_CHUNK_ROWS):
+        stop = min(rows, start + CSV_WRITE_CHUNK_ROWS)
+        if values is None:
+            file.write(row_format * (stop - start))
+        else:
+            file.write((row_format * (stop - start)) % tuple(values[start:stop].ravel().tolist()))
+
+
+def _write_block(writer, columns):
+    """Hand a phase to a ``TrajectoryBlocks`` collector, or row by row to a csv writer."""
+    if hasattr(writer, "add_block"):
+        writer.add_block(columns)
+        return
+    rows = len(next(column for column in columns if np.ndim(column)))
+    expanded = [np.broadcast_to(column, (rows,)).tolist() if np.ndim(column) else [column] * rows for column in columns]
+    writer.writerows(zip(*expanded))
+
 def takeoff_and_initial_climb(initial_altitude, climb_rate, step_time, writer, last_time=0, last_step=0, last_coordinates=(0, 0, 0)):
     """
     This function simulates the takeoff and initial climb phase of a drone's flight.
@@ -89,7 +165,7 @@ def takeoff_and_initial_climb(initial_altitude, climb_rate, step_time, writer, l
     initial_altitude (float): The initial altitude that the drone should climb to.
     climb_rate (float): The climb rate of the drone.
     step_time (float): The simulation step time.
-    writer (object): A CSV writer object to write the simulation data.
+    writer (object): A TrajectoryBlocks collector (or csv writer) to write the simulation data.
     last_time (float): The time at the end of the last simulation phase.
     last_step (int): The step at the end of the last simulation phase.
     last_coordinates (tuple): The (x, y, z) position at the end of the last simulation phase.
@@ -102,26 +178,21 @@ def takeoff_and_initial_climb(initial_altitude, climb_rate, step_time, writer, l
     climb_time = initial_altitude / climb_rate
     climb_steps = int(climb_time / step_time)
 
-    for i in range(climb_steps):
-        idx = last_step + i
-        t = last_time + i * step_time
-        x, y, _ = last_coordinates
-        z = -1 * (climb_rate * t)
-        vx = 0.0
-        vy = 0.0
-        vz = -climb_rate
-        ax = 0
-        ay = 0
-        az = 0
-        yaw = 0
-        mode = 10
-        ledr = 0
-        ledg = 0
-        ledb = 0
-        row = [idx, t, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, ledr, ledg, ledb]
-        writer.writerow(row)
-    
-    return t, idx, (x, y, z)
+    i = np.arange(climb_steps)
+    idx = last_step + i
+    t = last_time + i * step_time
+    x, y, _ = last_coordinates
+    z = -1 * (climb_rate * t)
+    vx = 0.0
+    vy = 0.0
+    vz = -climb_rate
+    ax = ay = az = 0
+    yaw = 0
+    mode = 10
+    ledr = ledg = ledb = 0
+    _write_block(writer, [idx, t, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, ledr, ledg, ledb])
+
+    return t[-1].item(), idx[-1].item(), (x, y, z[-1].item())
 
 def hold_position(hold_time, step_time, writer, last_time, last_step, last_coordinates, mode=20, rgb=(0,0,0)):
     """
@@ -130,7 +201,7 @@ def hold_position(hold_time, step_time, writer, last_time, last_step, last_coord
     Parameters:
     hold_time: The duration for which the drone should hold its position.
     step_time: The duration of each step.
-    writer: The csv writer object to write the steps to.
+    writer: The TrajectoryBlocks collector (or csv writer) to write the steps to.
     last_time: The time at the end of the last step.
     last_step: The index of the last step.
     last_coordinates: A tuple (x, y, z) indicating the drone's current coordinates.
@@ -144,14 +215,13 @@ def hold_position(hold_time, step_time, writer, last_time, last_step, last_coord
     """
     hold_steps = int(hold_time / step_time)
 
-    for i in range(hold_steps):
-        t = last_time + i * step_time
-        x, y, z = last_coordinates
-        vx = vy = vz = 0
-        ax = ay = az = 0
-        yaw = 0
-        row = [last_step + i, t, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, *rgb]
-        writer.writerow(row)
+    i = np.arange(hold_steps)
+    t = last_time + i * step_time
+    x, y, z = last_coordinates
+    vx = vy = vz = 0
+    ax = ay = az = 0
+    yaw = 0
+    _write_block(writer, [last_step + i, t, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, *rgb])
 
     last_time += hold_time
     last_step += hold_steps
@@ -166,7 +236,7 @@ def move_to(target_coordinates, move_speed, step_time, writer, last_time, last_s
     target_coordinates: A tuple (x, y, z) indicating the target coordinates to move to.
     move_speed: The speed at which the drone should move.
     step_time: The duration of each step.
-    writer: The csv writer object to write the steps to.
+    writer: The TrajectoryBlocks collector (or csv writer) to write the steps to.
     last_time: The time at the end of the last step.
     last_step: The index of the last step.
     last_coordinates: A tuple (x, y, z) indicating the drone's current coordinates.
@@ -186,7 +256,8 @@ def move_to(target_coordinates, move_speed, step_time, writer, last_time, last_s
     move_time = distance / move_speed
     move_steps = int(move_time / step_time)
     
-    for i in range(move_steps):
+    if move_steps > 0:
+        i = np.arange(move_steps)
         t = last_time + i * step_time
         ratio = i / move_steps
         x = last_coordinates[0] + (target_coordinates[0] - last_coordinates[0]) * ratio
@@ -195,12 +266,9 @@ def move_to(target_coordinates, move_speed, step_time, writer, last_time, last_s
         vx = move_speed * (target_coordinates[0] - last_coordinates[0]) / distance
         vy = move_speed * (target_coordinates[1] - last_coordinates[1]) / distance
         vz = move_speed * (target_coordinates[2] - last_coordinates[2]) / distance
-        ax = 0
-        ay = 0
-        az = 0
+        ax = ay = az = 0
         yaw = 0
-        row = [last_step + i, t, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, *rgb]
-        writer.writerow(row)
+        _write_block(writer, [last_step + i, t, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, *rgb])
     
     last_time += move_time
     last_step += move_steps
@@ -216,7 +284,7 @@ def move_to_maneuver_start(shape_fcn, maneuver_time, diameter, direction, initia
 
     Parameters:
     shape_fcn, maneuver_time, diameter, direction, initial_altitude, step_time, shape_args: These are used to get the first setpoint of the maneuver.
-    writer: The csv writer object to write the steps to.
+    writer: The TrajectoryBlocks collector (or csv writer) to write the steps to.
     last_time: The time at the end of the last step.
     last_step: The index of the last step.
     last_coordinates: A tuple (x, y, z) indicating the drone's current coordinates.
@@ -270,7 +338,7 @@ def perform_maneuver(shape_fcn, maneuver_time, diameter, direction, initial_alti
     Parameters:
     shape_fcn: A function that given the maneuver parameters, returns the drone's target position and velocity.
     maneuver_time, diameter, direction, initial_altitude, step_time, shape_args: The parameters for shape_fcn.
-    writer: The csv writer object to write the steps to.
+    writer: The TrajectoryBlocks collector (or csv writer) to write the steps to.
     start_time: The time at the start of the maneuver.
     last_step: The index of the last step before the maneuver starts.
     start_coordinates: The drone's coordinates at the start of the maneuver.
@@ -286,20 +354,19 @@ def perform_maneuver(shape_fcn, maneuver_time, diameter, direction, initial_alti
     move_steps = int(maneuver_time / step_time)
     maneuver_start_x, maneuver_start_y = shape_fcn(0, maneuver_time, diameter, direction, initial_altitude, step_time, *shape_args)[:2]
 
-    for step in range(move_steps):
-        x, y, z, vx, vy, vz, ax, ay, az = shape_fcn(step, maneuver_time, diameter, direction, initial_altitude, step_time, *shape_args)
-        x += start_x
-        y += start_y
-        x -= maneuver_start_x
-        y -= maneuver_start_y
-        yaw = 0
-        missionTime = start_time + step * step_time
-        row = [last_step + step, missionTime, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, *rgb]
-        writer.writerow(row)
+    steps = np.arange(move_steps)
+    x, y, z, vx, vy, vz, ax, ay, az = shape_fcn(steps, maneuver_time, diameter, direction, initial_altitude, step_time, *shape_args)
+    x = x + start_x
+    y = y + start_y
+    x = x - maneuver_start_x
+    y = y - maneuver_start_y
+    yaw = 0
+    missionTime = start_time + steps * step_time
+    _write_block(writer, [last_step + steps, missionTime, x, y, z, vx, vy, vz, ax, ay, az, yaw, mode, *rgb])
 
     last_step += move_steps
     last_time = start_time + move_steps * step_time
-    last_coordinates = (x, y, z)
+    last_coordinates = (x[-1].item(), y[-1].item(), z[-1].item())
 
     return last_time, last_step, last_coordinates
 
@@ -311,7 +378,7 @@ def repeat_maneuver(num_repeats, shape_fcn, maneuver_time, diameter, direction,
     num_repeats: The number of times to repeat the maneuver.
     shape_fcn: A function that given the maneuver parameters, returns the drone's target position and velocity.
     maneuver_time, diameter, direction, initial_altitude, step_time, shape_args: The parameters for shape_fcn.
-    writer: The csv writer object to write the steps to.
+    writer: The TrajectoryBlocks collector (or csv writer) to write the steps to.
     last_time, last_step, last_coordinates: The time, step number, and coordinates at the end of the last maneuver.
     hold_time: The time to hold the position after each maneuver.
     move_speed: The speed to move back to the start of the maneuver.
@@ -344,7 +411,7 @@ def repeat_maneuver(num_repeats, shape_fcn, maneuver_time, diameter, direction,
 
 
 
-def create_active_csv(shape_name,num_repeats, diameter, direction, maneuver_time, start_x, start_y, initial_altitude, climb_rate,move_speed, hold_time , step_time, output_file="active.csv"):
+def create_active_csv(shape_name,num_repeats, diameter, direction, maneuver_time, start_x, start_y, initial_altitude, climb_rate,move_speed, hold_time , step_time, output_file="active.csv", float_format=DEFAULT_CSV_FLOAT_FORMAT):
 
     map_shape_to_code(shape_name)
     shape_code, shape_fcn, shape_args = map_shape_to_code(shape_name)
@@ -355,11 +422,9 @@ def create_active_csv(shape_name,num_repeats, diameter, direction, maneuver_time
     print(f"Shape Arguments: {shape_args}")
    
    
-    header = ["idx", "t", "px", "py", "pz", "vx", "vy", "vz", "ax", "ay", "az", "yaw", "mode", "ledr", "ledg", "ledb"]
-
     with open(output_file, mode="w", newline="") as file:
-        writer = csv.writer(file)
-        writer.writerow(header)
+        csv.writer(file).writerow(CSV_HEADER)
+        writer = TrajectoryBlocks(float_format)
 
         # Initialize variables
         last_time = 0.0
@@ -397,6 +462,8 @@ def create_active_csv(shape_name,num_repeats, diameter, direction, maneuver_time
         # Call the move_to function
         last_time, last_step, last_coordinates = move_to(return_coordinates, move_speed, step_time, writer, last_time, last_step, last_coordinates, mode=90)
 
+        writer.write_to(file)
+
         
             
             
@@ -5,10 +5,17 @@ the instantaneous local reference.
 """
 import logging
 import navpy
+import numpy as np
 from smart_swarm_src.utils import transform_body_to_nea
 
 logger = logging.getLogger(__name__)
 
+# WGS 84 first eccentricity squared as published in NIMA TR8350.2 (the value
+# navpy.earthrad uses), so the array path stays in step with navpy.ned2lla.
+WGS84_ECC_SQRD = 6.69437999014e-3
+# ecef2lla converges in a handful of steps anywhere near the ellipsoid.
+MAX_LATITUDE_ITERATIONS = 20
+
 def calculate_follower_global_position(leader_lat, leader_lon, leader_alt, leader_yaw,
                                      offset_config):
     """
@@ -58,6 +65,91 @@ def calculate_follower_global_position(leader_lat, leader_lon, leader_alt, leade
         logger.error(f"Failed to calculate follower position: {e}")
         raise
 
+def calculate_follower_global_positions(leader_lats, leader_lons, leader_alts, leader_yaws,
+                                        offset_config):
+    """
+    Array form of `calculate_follower_global_position` for a whole leader trajectory.
+
+    Applies the same offset to every leader waypoint in one pass and returns
+    (lats, lons, alts) arrays. Each step mirrors navpy's ned2lla (ned2ecef,
+    lla2ecef, iterative ecef2lla) with a per-waypoint reference, so results
+    match the scalar path to floating-point rounding (numpy's array power may
+    differ from scalar pow in the last bit of an earth radius: <1e-13 deg,
+    <1e-8 m).
+
+    Args:
+        leader_lats, leader_lons, leader_alts: Leader global positions (array-like)
+        leader_yaws: Leader yaw angles in degrees (array-like)
+        offset_config: Dict with offset_x, offset_y, offset_z, frame
+    """
+    lats = np.asarray(leader_lats, dtype=float)
+    lons = np.asarray(leader_lons, dtype=float)
+    alts = np.asarray(leader_alts, dtype=float)
+
+    if offset_config['frame'] == "body":
+        # Body coordinate mode: offset_x=Forward, offset_y=Right
+        yaw_rad = np.radians(np.asarray(leader_yaws, dtype=float))
+        cos_yaw = np.cos(yaw_rad)
+        sin_yaw = np.sin(yaw_rad)
+        offset_forward = offset_config['offset_x']
+        offset_right = offset_config['offset_y']
+        north = offset_forward * cos_yaw - offset_right * sin_yaw
+        east = offset_forward * sin_yaw + offset_right * cos_yaw
+    else:
+        # NED coordinate mode: offset_x=North, offset_y=East
+        north = np.full(lats.shape, offset_config['offset_x'], dtype=float)
+        east = np.full(lats.shape, offset_config['offset_y'], dtype=float)
+    # Swarm Design defines positive offset_z as Up. Convert to NED down.
+    down = np.full(lats.shape, -offset_config['offset_z'], dtype=float)
+
+    lat_rad = np.deg2rad(lats)
+    lon_rad = np.deg2rad(lons)
+    sin_lat, cos_lat = np.sin(lat_rad), np.cos(lat_rad)
+    sin_lon, cos_lon = np.sin(lon_rad), np.cos(lon_rad)
+
+    # NED -> ECEF rotation per waypoint; stacked matmul keeps navpy's np.dot rounding.
+    ecef_to_ned = np.zeros((lats.size, 3, 3))
+    ecef_to_ned[:, 0, 0] = -sin_lat * cos_lon
+    ecef_to_ned[:, 0, 1] = -sin_lat * sin_lon
+    ecef_to_ned[:, 0, 2] = cos_lat
+    ecef_to_ned[:, 1, 0] = -sin_lon
+    ecef_to_ned[:, 1, 1] = cos_lon
+    ecef_to_ned[:, 2, 0] = -cos_lat * cos_lon
+    ecef_to_ned[:, 2, 1] = -cos_lat * sin_lon
+    ecef_to_ned[:, 2, 2] = -sin_lat
+    ned = np.stack((north, east, down), axis=-1)[:, :, np.newaxis]
+    ecef = np.matmul(ecef_to_ned.transpose(0, 2, 1), ned)[:, :, 0]
+
+    # Leader position in ECEF.
+    rew, _ = navpy.earthrad(lats, lat_unit='deg')
+    x = ecef[:, 0] + (rew + alts) * cos_lat * cos_lon
+    y = ecef[:, 1] + (rew + alts) * cos_lat * sin_lon
+    z = ecef[:, 2] + ((1 - WGS84_ECC_SQRD) * rew + alts) * sin_lat
+
+    # ECEF -> LLA, iterating each waypoint only until its own latitude converges,
+    # exactly as the scalar call would.
+    follower_lons = np.arctan2(y, x)
+    p = np.sqrt(x**2 + y**2)
+    follower_lats = np.arctan2(z, p * (1 - WGS84_ECC_SQRD))
+    follower_alts = np.empty_like(follower_lats)
+    active = np.arange(lats.size)
+    for _ in range(MAX_LATITUDE_ITERATIONS):
+        if not active.size:
+            break
+        lat_a, p_a, z_a = follower_lats[active], p[active], z[active]
+        rew_a, _ = navpy.earthrad(lat_a, lat_unit='rad')
+        follower_alts[active] = p_a / np.cos(lat_a) - rew_a
+        err = np.arctan2(z_a * (1 + WGS84_ECC_SQRD * rew_a * np.sin(lat_a) / z_a), p_a) - lat_a
+        follower_lats[active] = lat_a + err
+        active = active[np.abs(err) > 1e-10]
+    if active.size:
+        raise RuntimeError(
+            f"Follower latitude did not converge within {MAX_LATITUDE_ITERATIONS} iterations "
+            f"for {active.size} waypoint(s)"
+        )
+
+    return np.rad2deg(follower_lats), np.rad2deg(follower_lons), follower_alts
+
 def calculate_follower_yaw(leader_yaw, offset_config):
     """
     Calculate follower yaw angle
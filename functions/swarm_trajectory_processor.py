@@ -10,7 +10,7 @@ from typing import Dict, Any, List
 
 from functions.file_management import ensure_directory_exists, clear_directory
 from functions.swarm_analyzer import analyze_swarm_structure, fetch_swarm_data
-from functions.swarm_global_calculator import calculate_follower_global_position, calculate_follower_yaw
+from functions.swarm_global_calculator import calculate_follower_global_positions, calculate_follower_yaw
 from functions.swarm_trajectory_smoother import smooth_trajectory_with_waypoints
 from functions.swarm_plotter import generate_swarm_plots
 from functions.swarm_trajectory_utils import get_swarm_trajectory_folders
@@ -117,34 +117,27 @@ def load_leader_trajectories(raw_dir: str, top_leaders: list) -> Dict[int, pd.Da
 
 def calculate_follower_trajectory(leader_trajectory: pd.DataFrame, drone_config: Dict[str, Any]) -> pd.DataFrame:
     """Calculate follower trajectory based on leader trajectory and offset configuration"""
-    
-    follower_data = []
-    
-    for _, leader_row in leader_trajectory.iterrows():
-        # Calculate follower position
-        follower_lat, follower_lon, follower_alt = calculate_follower_global_position(
-            leader_row['lat'], leader_row['lon'], leader_row['alt'], leader_row['yaw'],
-            drone_config
-        )
-        
-        # Calculate follower yaw
-        follower_yaw = calculate_follower_yaw(leader_row['yaw'], drone_config)
-        
-        # Create follower data point
-        follower_point = leader_row.copy()
-        follower_point['lat'] = follower_lat
-        follower_point['lon'] = follower_lon
-        follower_point['alt'] = follower_alt
-        follower_point['yaw'] = follower_yaw
-        
-        # Update LED colors for followers
-        follower_point['ledr'] = Params.swarm_follower_led_color[0]
-        follower_point['ledg'] = Params.swarm_follower_led_color[1]
-        follower_point['ledb'] = Params.swarm_follower_led_color[2]
-        
-        follower_data.append(follower_point)
-    
-    return pd.DataFrame(follower_data)
+    follower_trajectory = leader_trajectory.copy()
+
+    # One array pass over the whole leader trajectory instead of a navpy call per row.
+    follower_lats, follower_lons, follower_alts = calculate_follower_global_positions(
+        leader_trajectory['lat'].to_numpy(),
+        leader_trajectory['lon'].to_numpy(),
+        leader_trajectory['alt'].to_numpy(),
+        leader_trajectory['yaw'].to_numpy(),
+        drone_config,
+    )
+    follower_trajectory['lat'] = follower_lats
+    follower_trajectory['lon'] = follower_lons
+    follower_trajectory['alt'] = follower_alts
+    follower_trajectory['yaw'] = calculate_follower_yaw(leader_trajectory['yaw'], drone_config)
+
+    # Update LED colors for followers
+    follower_trajectory['ledr'] = Params.swarm_follower_led_color[0]
+    follower_trajectory['ledg'] = Params.swarm_follower_led_color[1]
+    follower_trajectory['ledb'] = Params.swarm_follower_led_color[2]
+
+    return follower_trajectory
 
 
 def _normalize_swarm_dataframe(swarm_data: List[Dict[str, Any]]) -> pd.DataFrame:
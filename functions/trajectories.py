@@ -1,6 +1,25 @@
 import time
 import math
 
+import numpy as np
+
+
+def _xp(step):
+    """Math namespace for ``step``: numpy for an array of steps, ``math`` for one step."""
+    return np if isinstance(step, np.ndarray) else math
+
+
+def _shape_result(step, *values):
+    """Return shape outputs, broadcasting constants to the step array when one is given.
+
+    Every shape function accepts either a single ``step`` (returning scalars,
+    as before) or a numpy array of steps, in which case all nine outputs are
+    arrays shaped like ``step``; constant outputs are zero-copy broadcasts.
+    """
+    if not isinstance(step, np.ndarray):
+        return values
+    return tuple(np.broadcast_to(value, step.shape) for value in values)
+
 
 def map_shape_to_code(shape_name):
     """
@@ -40,122 +59,128 @@ def map_shape_to_code(shape_name):
 
 
 def sine_wave_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time, turns):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time * turns
+    theta = 2 * direction * xp.pi * t / maneuver_time * turns
 
     x = diameter * t / maneuver_time
-    y = diameter * math.sin(theta)
+    y = diameter * xp.sin(theta)
     z = -1 * initial_alt
 
     vx = diameter / maneuver_time
-    vy = diameter * math.cos(theta) * 2 * direction * math.pi * turns / maneuver_time
+    vy = diameter * xp.cos(theta) * 2 * direction * xp.pi * turns / maneuver_time
     vz = 0
 
-    ax = -diameter * math.sin(theta) * 2 * direction * math.pi * turns / maneuver_time ** 2
-    ay = diameter * math.cos(theta) * 4 * direction * math.pi * turns ** 2 / maneuver_time ** 2
+    ax = -diameter * xp.sin(theta) * 2 * direction * xp.pi * turns / maneuver_time ** 2
+    ay = diameter * xp.cos(theta) * 4 * direction * xp.pi * turns ** 2 / maneuver_time ** 2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 
 
 def infinity_shape_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time
+    theta = 2 * direction * xp.pi * t / maneuver_time
 
-    x = (diameter / 2) * math.sin(theta)
-    y = direction * (diameter / 4) * math.sin(2 * theta)
+    x = (diameter / 2) * xp.sin(theta)
+    y = direction * (diameter / 4) * xp.sin(2 * theta)
     z = -1 * initial_alt
 
-    vx = (diameter / 2) * math.cos(theta) * 2 * direction * math.pi / maneuver_time
-    vy = direction * (diameter / 4) * math.cos(2 * theta) * 4 * direction * math.pi / maneuver_time
+    vx = (diameter / 2) * xp.cos(theta) * 2 * direction * xp.pi / maneuver_time
+    vy = direction * (diameter / 4) * xp.cos(2 * theta) * 4 * direction * xp.pi / maneuver_time
     vz = 0
 
-    ax = -(diameter / 2) * math.sin(theta) * 4 * direction * math.pi * math.cos(theta) / maneuver_time ** 2
-    ay = -direction * (diameter / 4) * math.sin(2 * theta) * 8 * direction * math.pi * math.cos(2 * theta) / maneuver_time ** 2
+    ax = -(diameter / 2) * xp.sin(theta) * 4 * direction * xp.pi * xp.cos(theta) / maneuver_time ** 2
+    ay = -direction * (diameter / 4) * xp.sin(2 * theta) * 8 * direction * xp.pi * xp.cos(2 * theta) / maneuver_time ** 2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 def spiral_square_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time, turns):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time * turns
+    theta = 2 * direction * xp.pi * t / maneuver_time * turns
 
     r = diameter * t / maneuver_time
-    x = r * math.cos(theta)
-    y = r * math.sin(theta)
+    x = r * xp.cos(theta)
+    y = r * xp.sin(theta)
     z = -1 * initial_alt
 
-    vx = diameter * (math.cos(theta) - t * math.sin(theta)) / maneuver_time
-    vy = diameter * (math.sin(theta) + t * math.cos(theta)) / maneuver_time
+    vx = diameter * (xp.cos(theta) - t * xp.sin(theta)) / maneuver_time
+    vy = diameter * (xp.sin(theta) + t * xp.cos(theta)) / maneuver_time
     vz = 0
 
-    ax = -diameter * math.sin(theta) * 2 * direction * math.pi * turns / maneuver_time ** 2
-    ay = diameter * math.cos(theta) * 4 * direction * math.pi * turns ** 2 / maneuver_time ** 2
+    ax = -diameter * xp.sin(theta) * 2 * direction * xp.pi * turns / maneuver_time ** 2
+    ay = diameter * xp.cos(theta) * 4 * direction * xp.pi * turns ** 2 / maneuver_time ** 2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 def star_shape_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time, points):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time
+    theta = 2 * direction * xp.pi * t / maneuver_time
 
-    r = diameter * (1 - math.sin(points * theta))
-    x = r * math.cos(theta)
-    y = r * math.sin(theta)
+    r = diameter * (1 - xp.sin(points * theta))
+    x = r * xp.cos(theta)
+    y = r * xp.sin(theta)
     z = -1 * initial_alt
 
-    vx = diameter * (math.cos(theta) - points * math.cos(points * theta)) / maneuver_time
-    vy = diameter * (math.sin(theta) - points * math.sin(points * theta)) / maneuver_time
+    vx = diameter * (xp.cos(theta) - points * xp.cos(points * theta)) / maneuver_time
+    vy = diameter * (xp.sin(theta) - points * xp.sin(points * theta)) / maneuver_time
     vz = 0
 
-    ax = -diameter * math.sin(theta) * 4 * direction * math.pi * points * math.cos(theta) / maneuver_time ** 2
-    ay = -diameter * math.sin(2 * theta) * 8 * direction * math.pi * points * math.cos(2 * theta) / maneuver_time ** 2
+    ax = -diameter * xp.sin(theta) * 4 * direction * xp.pi * points * xp.cos(theta) / maneuver_time ** 2
+    ay = -diameter * xp.sin(2 * theta) * 8 * direction * xp.pi * points * xp.cos(2 * theta) / maneuver_time ** 2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 def zigzag_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time, turns):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time * turns
+    theta = 2 * direction * xp.pi * t / maneuver_time * turns
 
     x = diameter * t / maneuver_time
-    y = diameter * math.sin(theta)
+    y = diameter * xp.sin(theta)
     z = -1 * initial_alt
 
     vx = diameter / maneuver_time
-    vy = diameter * math.cos(theta) * 2 * direction * math.pi * turns / maneuver_time
+    vy = diameter * xp.cos(theta) * 2 * direction * xp.pi * turns / maneuver_time
     vz = 0
 
-    ax = -diameter * math.sin(theta) * 2 * direction * math.pi * turns / maneuver_time ** 2
-    ay = diameter * math.cos(theta) * 4 * direction * math.pi * turns ** 2 / maneuver_time ** 2
+    ax = -diameter * xp.sin(theta) * 2 * direction * xp.pi * turns / maneuver_time ** 2
+    ay = diameter * xp.cos(theta) * 4 * direction * xp.pi * turns ** 2 / maneuver_time ** 2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 def heart_shape_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time
+    theta = 2 * direction * xp.pi * t / maneuver_time
 
     radius = diameter / 2
     scale_factor = 30 / 400  # Adjust the scale factor to match the desired ratio
 
-    x = scale_factor * radius * 16 * math.sin(theta) ** 3
-    y = radius * (13 * math.cos(theta) - 5 * math.cos(2 * theta) - 2 * math.cos(3 * theta) - math.cos(4 * theta)) / 13
+    x = scale_factor * radius * 16 * xp.sin(theta) ** 3
+    y = radius * (13 * xp.cos(theta) - 5 * xp.cos(2 * theta) - 2 * xp.cos(3 * theta) - xp.cos(4 * theta)) / 13
     z = -1 * initial_alt
 
-    vx = scale_factor * radius * 48 * math.pi * math.sin(theta) ** 2 * math.cos(theta) / maneuver_time
-    vy = radius * (13 * math.sin(theta) - 10 * math.sin(2 * theta) - 6 * math.sin(3 * theta) - 4 * math.sin(4 * theta)) * 2 * math.pi / (13 * maneuver_time)
+    vx = scale_factor * radius * 48 * xp.pi * xp.sin(theta) ** 2 * xp.cos(theta) / maneuver_time
+    vy = radius * (13 * xp.sin(theta) - 10 * xp.sin(2 * theta) - 6 * xp.sin(3 * theta) - 4 * xp.sin(4 * theta)) * 2 * xp.pi / (13 * maneuver_time)
     vz = 0
 
-    ax = -scale_factor * radius * 48 * math.pi * math.sin(theta) ** 3 * math.cos(theta) / maneuver_time ** 2
-    ay = -radius * (13 * math.cos(theta) - 10 * math.cos(2 * theta) - 6 * math.cos(3 * theta) - 4 * math.cos(4 * theta)) * 4 * math.pi ** 2 / (13 * maneuver_time ** 2)
+    ax = -scale_factor * radius * 48 * xp.pi * xp.sin(theta) ** 3 * xp.cos(theta) / maneuver_time ** 2
+    ay = -radius * (13 * xp.cos(theta) - 10 * xp.cos(2 * theta) - 6 * xp.cos(3 * theta) - 4 * xp.cos(4 * theta)) * 4 * xp.pi ** 2 / (13 * maneuver_time ** 2)
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 def stationary_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time):
@@ -172,7 +197,7 @@ def stationary_trajectory(step, maneuver_time, diameter, direction, initial_alt,
     ay =0
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 
@@ -180,64 +205,70 @@ def stationary_trajectory(step, maneuver_time, diameter, direction, initial_alt,
 
 
 def helix_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time, end_altitude, turns):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time * turns
+    theta = 2 * direction * xp.pi * t / maneuver_time * turns
 
-    x = (diameter / 2) * math.cos(theta)
-    y = (diameter / 2) * math.sin(theta)
+    x = (diameter / 2) * xp.cos(theta)
+    y = (diameter / 2) * xp.sin(theta)
     z = -1 * (initial_alt + (end_altitude - initial_alt) * (t / maneuver_time))
 
-    vx = -(diameter / 2) * math.sin(theta) * 2 * direction * math.pi * turns / maneuver_time
-    vy = (diameter / 2) * math.cos(theta) * 2 * direction * math.pi * turns / maneuver_time
+    vx = -(diameter / 2) * xp.sin(theta) * 2 * direction * xp.pi * turns / maneuver_time
+    vy = (diameter / 2) * xp.cos(theta) * 2 * direction * xp.pi * turns / maneuver_time
     vz = -1 * (initial_alt - end_altitude) / maneuver_time
 
-    ax = -(diameter / 2) * math.cos(theta) * 4 * direction * math.pi * turns ** 2 / maneuver_time ** 2
-    ay = -(diameter / 2) * math.sin(theta) * 4 * direction * math.pi * turns ** 2 / maneuver_time ** 2
+    ax = -(diameter / 2) * xp.cos(theta) * 4 * direction * xp.pi * turns ** 2 / maneuver_time ** 2
+    ay = -(diameter / 2) * xp.sin(theta) * 4 * direction * xp.pi * turns ** 2 / maneuver_time ** 2
     az = -1 * (initial_alt - end_altitude) / maneuver_time ** 2
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 
 
 def eight_shape_trajectory(step, maneuver_time, diameter, direction,initial_alt, step_time):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time
+    theta = 2 * direction * xp.pi * t / maneuver_time
 
-    x = (diameter / 2) * math.sin(theta)
-    y = direction * (diameter / 4) * math.sin(2 * theta)
+    x = (diameter / 2) * xp.sin(theta)
+    y = direction * (diameter / 4) * xp.sin(2 * theta)
     z = -1 * initial_alt
 
-    vx = (diameter / 2) * math.cos(theta) * 2 * direction * math.pi / maneuver_time
-    vy = direction * (diameter / 4) * math.cos(2 * theta) * 4 * direction * math.pi / maneuver_time
+    vx = (diameter / 2) * xp.cos(theta) * 2 * direction * xp.pi / maneuver_time
+    vy = direction * (diameter / 4) * xp.cos(2 * theta) * 4 * direction * xp.pi / maneuver_time
     vz = 0
 
-    ax = -(diameter / 2) * math.sin(theta) * 4 * direction * math.pi **2 / maneuver_time **2
-    ay = -direction * (diameter / 4) * math.sin(2 * theta) * 8 * direction * math.pi **2 / maneuver_time **2
+    ax = -(diameter / 2) * xp.sin(theta) * 4 * direction * xp.pi **2 / maneuver_time **2
+    ay = -direction * (diameter / 4) * xp.sin(2 * theta) * 8 * direction * xp.pi **2 / maneuver_time **2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 
 def circle_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time):
+    xp = _xp(step)
     t = step * step_time
-    theta = 2 * direction * math.pi * t / maneuver_time
+    theta = 2 * direction * xp.pi * t / maneuver_time
 
-    x = (diameter / 2) * math.cos(theta)
-    y = (diameter / 2) * math.sin(theta)
+    x = (diameter / 2) * xp.cos(theta)
+    y = (diameter / 2) * xp.sin(theta)
     z = -1 * initial_alt
 
-    vx = -(diameter / 2) * math.sin(theta) * 2 * direction * math.pi / maneuver_time
-    vy = (diameter / 2) * math.cos(theta) * 2 * direction * math.pi / maneuver_time
+    vx = -(diameter / 2) * xp.sin(theta) * 2 * direction * xp.pi / maneuver_time
+    vy = (diameter / 2) * xp.cos(theta) * 2 * direction * xp.pi / maneuver_time
     vz = 0
 
-    ax = -(diameter / 2) * math.cos(theta) * 4 * direction * math.pi ** 2 / maneuver_time ** 2
-    ay = -(diameter / 2) * math.sin(theta) * 4 * direction * math.pi ** 2 / maneuver_time ** 2
+    ax = -(diameter / 2) * xp.cos(theta) * 4 * direction * xp.pi ** 2 / maneuver_time ** 2
+    ay = -(diameter / 2) * xp.sin(theta) * 4 * direction * xp.pi ** 2 / maneuver_time ** 2
     az = 0
 
-    return x, y, z, vx, vy, vz, ax, ay, az
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
 
 def square_trajectory(step, maneuver_time, diameter, direction, initial_alt, step_time):
+    if isinstance(step, np.ndarray):
+        return _square_trajectory_steps(step, maneuver_time, diameter, direction, initial_alt, step_time)
+
     t = step * step_time
     side_length = diameter / math.sqrt(2)
     side_time = maneuver_time / 4
@@ -276,3 +307,38 @@ def square_trajectory(step, maneuver_time, diameter, direction, initial_alt, ste
     az = 0
 
     return x, y, z, vx, vy, vz, ax, ay, az
+
+
+def _square_trajectory_steps(step, maneuver_time, diameter, direction, initial_alt, step_time):
+    """Array form of ``square_trajectory``: the per-side branches become masks."""
+    t = step * step_time
+    side_length = diameter / math.sqrt(2)
+    side_time = maneuver_time / 4
+    side_steps = int(maneuver_time / (4 * step_time))
+
+    current_side = step // side_steps
+    side_progress = (step % side_steps) / side_steps
+    sides = [current_side == 0, current_side == 1, current_side == 2]
+
+    x = np.select(sides, [side_length * side_progress, np.full(step.shape, side_length), side_length * (1 - side_progress)], 0)
+    y = np.select(sides, [np.zeros(step.shape), side_length * side_progress, np.full(step.shape, side_length)], side_length * (1 - side_progress))
+
+    if direction == -1:
+        x, y = y, x
+
+    z = -1 * initial_alt
+
+    along_x = (current_side == 0) | (current_side == 2)
+    along_y = (current_side == 1) | (current_side == 3)
+    vx = np.where(along_x, side_length / side_time, 0)
+    vy = np.where(along_y, side_length / side_time, 0)
+    vz = 0
+
+    if direction == -1:
+        vx, vy = vy, vx
+
+    ax = np.where(along_x, -side_length / side_time ** 2 * np.sin(2 * direction * np.pi * t / maneuver_time), 0)
+    ay = np.where(along_y, -side_length / side_time ** 2 * np.cos(2 * direction * np.pi * t / maneuver_time), 0)
+    az = 0
+
+    return _shape_result(step, x, y, z, vx, vy, vz, ax, ay, az)
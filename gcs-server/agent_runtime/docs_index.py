@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import math
 import os
 import re
-from dataclasses import dataclass
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping
 
 from .models import AgentRuntimeError
 
@@ -24,6 +28,12 @@ STOPWORDS = {
     "is", "it", "link", "me", "of", "on", "or", "read", "setup", "the", "there", "to", "we", "what", "where",
     "with", "you", "your",
 }
+TOKEN_PATTERN = re.compile(r"[a-z0-9_-]+")
+BM25_K1 = 1.2
+BM25_B = 0.75
+BM25_WEIGHT = 3.0
+MAX_CACHED_TERMS = 4096
+_NGRAM_SIZES = (2, 3)
 
 
 @dataclass(frozen=True)
@@ -104,6 +114,10 @@ class GeneratedDocsIndex:
     source_context_index: str
     resources: tuple[dict[str, Any], ...]
     chunks: tuple[DocsChunk, ...]
+    search_index: "DocsSearchIndex" = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "search_index", DocsSearchIndex(self.chunks))
 
     @classmethod
     def from_file(cls, path: str | Path = DEFAULT_DOCS_INDEX_PATH) -> "GeneratedDocsIndex":
@@ -139,10 +153,10 @@ class GeneratedDocsIndex:
         )
 
     def chunk_by_id(self, chunk_id: str) -> DocsChunk:
-        for chunk in self.chunks:
-            if chunk.id == chunk_id:
-                return chunk
-        raise KeyError(f"unknown generated docs chunk: {chunk_id}")
+        position = self.search_index.position_by_id.get(chunk_id)
+        if position is None:
+            raise KeyError(f"unknown generated docs chunk: {chunk_id}")
+        return self.chunks[position]
 
     def search(self, query: str, *, limit: int = DEFAULT_SEARCH_LIMIT, tags: tuple[str, ...] = (), audience: str = "") -> list[tuple[DocsChunk, float, str]]:
         query = str(query or "").strip()
@@ -152,18 +166,177 @@ class GeneratedDocsIndex:
         limit = max(1, min(int(limit or DEFAULT_SEARCH_LIMIT), MAX_SEARCH_LIMIT))
         required_tags = {tag.lower() for tag in tags if tag}
         audience_filter = str(audience or "").strip().lower()
-        scored: list[tuple[DocsChunk, float, str]] = []
-        for chunk in self.chunks:
-            if audience_filter and chunk.audience.lower() != audience_filter:
+        search_index = self.search_index
+        phrase = query.lower()
+        scored: list[tuple[DocsChunk, float]] = []
+        for position in search_index.candidates(terms, phrase):
+            if audience_filter and search_index.audiences[position] != audience_filter:
                 continue
-            if required_tags and not required_tags.issubset({tag.lower() for tag in chunk.tags}):
+            if required_tags and not required_tags.issubset(search_index.tag_sets[position]):
                 continue
-            score = _score_chunk(chunk, query=query, terms=terms)
+            score = search_index.score(position, phrase=phrase, terms=terms)
             if score <= 0:
                 continue
-            scored.append((chunk, score, _snippet(chunk.text, terms)))
-        scored.sort(key=lambda item: (-item[1], item[0].path, item[0].id))
-        return scored[:limit]
+            scored.append((self.chunks[position], score))
+        top = heapq.nsmallest(limit, scored, key=lambda item: (-item[1], item[0].path, item[0].id))
+        return [(chunk, score, _snippet(chunk.text, terms)) for chunk, score in top]
+
+
+
+@dataclass(frozen=True)
+class _TermPostings:
+    text_frequencies: Mapping[int, int]
+    field_positions: frozenset[int]
+    idf: float
+
+    def positions(self) -> set[int]:
+        return set(self.text_frequencies) | self.field_positions
+
+
+class DocsSearchIndex:
+    """Inverted index with BM25 term statistics over generated docs chunks.
+
+    Chunks are tokenized into maximal lowercase ``[a-z0-9_-]`` runs. Query terms
+    use the same alphabet, so a term can only occur inside a single token and its
+    postings are the union of every vocabulary token that contains it. That keeps
+    the substring matching the docs tools have always had (``arm`` still finds
+    ``disarm``) while a query only visits chunks that contain one of its terms.
+
+    The tokens containing a term are found through an n-gram map (bigrams for
+    two-character terms, trigrams otherwise) instead of scanning the whole
+    vocabulary; per-term postings are kept in a bounded LRU cache.
+    """
+
+    def __init__(self, chunks: Iterable[DocsChunk]) -> None:
+        chunks = tuple(chunks)
+        self.position_by_id = {chunk.id: position for position, chunk in enumerate(chunks)}
+        self.audiences = tuple(chunk.audience.lower() for chunk in chunks)
+        self.tag_sets = tuple(frozenset(tag.lower() for tag in chunk.tags) for chunk in chunks)
+        self._titles = tuple(chunk.title.lower() for chunk in chunks)
+        self._headings = tuple(chunk.heading.lower() for chunk in chunks)
+        self._summaries = tuple(chunk.summary.lower() for chunk in chunks)
+        self._tags = tuple(" ".join(chunk.tags).lower() for chunk in chunks)
+        self._texts = tuple(chunk.text.lower() for chunk in chunks)
+        self._headers = tuple(
+            f"{title} {heading} {summary}"
+            for title, heading, summary in zip(self._titles, self._headings, self._summaries)
+        )
+
+        text_postings: dict[str, dict[int, int]] = {}
+        field_postings: dict[str, set[int]] = {}
+        lengths: list[int] = []
+        for position, text in enumerate(self._texts):
+            tokens = TOKEN_PATTERN.findall(text)
+            lengths.append(len(tokens))
+            for token, count in Counter(tokens).items():
+                text_postings.setdefault(token, {})[position] = count
+            for token in set(TOKEN_PATTERN.findall(f"{self._headers[position]} {self._tags[position]}")):
+                field_postings.setdefault(token, set()).add(position)
+
+        self._text_postings = text_postings
+        self._field_postings = field_postings
+        self._vocabulary = tuple(sorted(set(text_postings) | set(field_postings)))
+        token_ngrams: dict[str, list[int]] = {}
+        for token_index, token in enumerate(self._vocabulary):
+            grams = set()
+            for size in _NGRAM_SIZES:
+                grams.update(token[start:start + size] for start in range(len(token) - size + 1))
+            for gram in grams:
+                token_ngrams.setdefault(gram, []).append(token_index)
+        self._token_ngrams = {gram: tuple(indexes) for gram, indexes in token_ngrams.items()}
+        self._lengths = tuple(lengths)
+        self._average_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        self._term_cache: OrderedDict[str, _TermPostings] = OrderedDict()
+        self._term_cache_lock = threading.Lock()
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._texts)
+
+    def tokens_containing(self, term: str) -> list[str]:
+        """Vocabulary tokens that contain `term`, found via the n-gram map."""
+        size = min(len(term), _NGRAM_SIZES[-1])
+        if size < _NGRAM_SIZES[0]:
+            # Single characters have no n-gram entry; only the legacy scan can answer.
+            return [token for token in self._vocabulary if term in token]
+        posting_lists = []
+        for start in range(len(term) - size + 1):
+            indexes = self._token_ngrams.get(term[start:start + size])
+            if indexes is None:
+                return []
+            posting_lists.append(indexes)
+        posting_lists.sort(key=len)
+        candidates = set(posting_lists[0])
+        for indexes in posting_lists[1:]:
+            candidates.intersection_update(indexes)
+            if not candidates:
+                return []
+        # N-grams can match out of order; confirm the real substring.
+        return [self._vocabulary[index] for index in sorted(candidates) if term in self._vocabulary[index]]
+
+    def postings(self, term: str) -> _TermPostings:
+        with self._term_cache_lock:
+            cached = self._term_cache.get(term)
+            if cached is not None:
+                self._term_cache.move_to_end(term)
+                return cached
+
+        frequencies: Counter[int] = Counter()
+        field_positions: set[int] = set()
+        for token in self.tokens_containing(term):
+            occurrences = token.count(term)
+            for position, count in self._text_postings.get(token, {}).items():
+                frequencies[position] += count * occurrences
+            field_positions.update(self._field_postings.get(token, ()))
+
+        document_frequency = len(frequencies)
+        idf = math.log(1.0 + (self.chunk_count - document_frequency + 0.5) / (document_frequency + 0.5))
+        postings = _TermPostings(
+            text_frequencies=dict(frequencies),
+            field_positions=frozenset(field_positions),
+            idf=idf,
+        )
+        with self._term_cache_lock:
+            self._term_cache[term] = postings
+            self._term_cache.move_to_end(term)
+            while len(self._term_cache) > MAX_CACHED_TERMS:
+                self._term_cache.popitem(last=False)
+        return postings
+
+    def candidates(self, terms: tuple[str, ...], phrase: str) -> set[int]:
+        positions: set[int] = set()
+        for term in terms:
+            positions |= self.postings(term).positions()
+        # A chunk containing the whole phrase contains its longest token run too;
+        # this catches `snake_case` phrases whose normalized terms use dashes.
+        phrase_runs = TOKEN_PATTERN.findall(phrase)
+        if phrase_runs:
+            positions |= self.postings(max(phrase_runs, key=len)).positions()
+        return positions
+
+    def score(self, position: int, *, phrase: str, terms: tuple[str, ...]) -> float:
+        title = self._titles[position]
+        heading = self._headings[position]
+        summary = self._summaries[position]
+        tags = self._tags[position]
+        score = 0.0
+        if phrase and phrase in self._texts[position]:
+            score += 20.0
+        if phrase and phrase in self._headers[position]:
+            score += 30.0
+        length_norm = BM25_K1 * (
+            1.0 - BM25_B + BM25_B * (self._lengths[position] / self._average_length if self._average_length else 1.0)
+        )
+        for term in terms:
+            score += 12.0 if term in title else 0.0
+            score += 9.0 if term in heading else 0.0
+            score += 7.0 if term in tags else 0.0
+            score += 4.0 if term in summary else 0.0
+            postings = self.postings(term)
+            frequency = postings.text_frequencies.get(position, 0)
+            if frequency:
+                score += BM25_WEIGHT * postings.idf * frequency * (BM25_K1 + 1.0) / (frequency + length_norm)
+        return score
 
 
 def _default_index_path() -> Path:
@@ -174,8 +347,32 @@ def _default_index_path() -> Path:
     return path if path.is_absolute() else REPO_ROOT / path
 
 
+_docs_index_cache: dict[Path, tuple[tuple[int, int, int], GeneratedDocsIndex]] = {}
+_docs_index_cache_lock = threading.Lock()
+
+
+def load_docs_index(path: str | Path) -> GeneratedDocsIndex:
+    """Return the parsed index for `path`, re-reading only when the file changes."""
+    index_path = Path(path)
+    try:
+        stat = index_path.stat()
+    except OSError:
+        return GeneratedDocsIndex.from_file(index_path)
+    fingerprint = (int(stat.st_ino), int(stat.st_mtime_ns), int(stat.st_size))
+    cached = _docs_index_cache.get(index_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    with _docs_index_cache_lock:
+        cached = _docs_index_cache.get(index_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        index = GeneratedDocsIndex.from_file(index_path)
+        _docs_index_cache[index_path] = (fingerprint, index)
+        return index
+
+
 def load_default_docs_index() -> GeneratedDocsIndex:
-    return GeneratedDocsIndex.from_file(_default_index_path())
+    return load_docs_index(_default_index_path())
 
 
 def build_docs_search_payload(
@@ -276,27 +473,6 @@ def _query_terms(query: str) -> tuple[str, ...]:
     return tuple(dict.fromkeys(terms))
 
 
-def _score_chunk(chunk: DocsChunk, *, query: str, terms: tuple[str, ...]) -> float:
-    title = chunk.title.lower()
-    heading = chunk.heading.lower()
-    summary = chunk.summary.lower()
-    tags = " ".join(chunk.tags).lower()
-    text = chunk.text.lower()
-    phrase = query.strip().lower()
-    score = 0.0
-    if phrase and phrase in text:
-        score += 20.0
-    if phrase and phrase in (title + " " + heading + " " + summary):
-        score += 30.0
-    for term in terms:
-        score += 12.0 if term in title else 0.0
-        score += 9.0 if term in heading else 0.0
-        score += 7.0 if term in tags else 0.0
-        score += 4.0 if term in summary else 0.0
-        score += min(text.count(term), 6) * 1.2
-    return score
-
-
 def _snippet(text: str, terms: tuple[str, ...], *, max_chars: int = 360) -> str:
     lower = text.lower()
     first = -1
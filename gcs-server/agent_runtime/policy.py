@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
@@ -312,6 +313,20 @@ class AgentPolicy:
         return PolicyDecision(status=PolicyDecisionStatus.ALLOW, tool_id=tool.id)
 
 
+@lru_cache(maxsize=8)
+def _load_policy_file_cached(path_text: str, mtime_ns: int, size: int) -> AgentPolicy:
+    """Parse and validate one immutable policy file snapshot, without env overrides.
+
+    Tool listing and every tool call consult the policy, and parsing the YAML
+    costs milliseconds. Host-local env toggles (agent enable, circuit breaker,
+    MDS_MODE) can change at runtime, so they are applied per call on top of
+    the cached file contents rather than cached with them.
+    """
+
+    del mtime_ns, size  # The fingerprint is part of the cache key by design.
+    return AgentPolicy.from_file(Path(path_text), apply_env=False)
+
+
 def load_default_policy() -> AgentPolicy:
     """Load the repository default Simurgh policy."""
 
@@ -319,4 +334,10 @@ def load_default_policy() -> AgentPolicy:
     path = Path(raw) if raw else DEFAULT_POLICY_PATH
     if not path.is_absolute():
         path = REPO_ROOT / path
-    return AgentPolicy.from_file(path)
+    try:
+        stat = path.stat()
+        fingerprint = (int(stat.st_mtime_ns), int(stat.st_size))
+    except FileNotFoundError:
+        # Keep the existing ``agent policy not found`` error from from_file.
+        fingerprint = (0, 0)
+    return _load_policy_file_cached(str(path), *fingerprint).with_env_overrides()
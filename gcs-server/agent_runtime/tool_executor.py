@@ -6,8 +6,12 @@ import asyncio
 import json
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Callable, Mapping, Sequence
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Awaitable, Callable, Mapping, Sequence
 from urllib.parse import quote, urlencode
 
 import httpx
@@ -24,6 +28,10 @@ from .tool_registry import ToolRegistry, load_default_tool_registry
 DEFAULT_INTERNAL_TOOL_TIMEOUT_SECONDS = 20.0
 DEFAULT_TOOL_MAX_RESPONSE_CHARS = 24000
 MAX_INTERNAL_TOOL_TIMEOUT_SECONDS = 600.0
+DEFAULT_READ_TOOL_MAX_CONCURRENCY = 4
+DEFAULT_READ_TOOL_TURN_DEADLINE_SECONDS = 120.0
+DEFAULT_READ_TOOL_CACHE_TTL_SECONDS = 2.0
+DEFAULT_READ_TOOL_CACHE_MAX_ENTRIES = 256
 ADVISORY_ANSWER_TOOL_ID = "mds.operator.question.answer"
 DOCS_SEARCH_TOOL_ID = "mds.docs.search"
 DOCS_CHUNK_READ_TOOL_ID = "mds.docs.chunk.read"
@@ -51,6 +59,8 @@ LOCAL_TOOL_IDS = frozenset(
         COUNTRY_LOOKUP_TOOL_ID,
     }
 )
+_INTERNAL_CLIENT_CACHE_SIZE = 4
+_internal_clients: OrderedDict[tuple[int, str], tuple[Any, httpx.AsyncClient]] = OrderedDict()
 LOCAL_TOOL_INTENT_FILTERS = {
     GENERAL_KNOWLEDGE_TOOL_ID: frozenset({"general_knowledge", "autopilot_support"}),
     PUBLIC_PLACES_TOOL_ID: frozenset({"public_geography"}),
@@ -119,6 +129,70 @@ class GuardedToolCallResult:
         return cls(text=message, is_error=True, status_code=status_code)
 
 
+class ReadOnlyToolResultCache:
+    """Short-lived cache of successful read-only GCS route tool results.
+
+    Entries are keyed by tool id and canonical JSON arguments and expire after
+    ``ttl_seconds``. Only GET route tools are cached; advisory, guarded and
+    failed calls always execute. Policy is still evaluated before every lookup.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_READ_TOOL_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_READ_TOOL_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, ReadOnlyToolCallResult]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(tool: ToolDefinition, arguments: Mapping[str, Any]) -> tuple[str, str] | None:
+        if not is_read_only_route_tool(tool):
+            return None
+        try:
+            canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), allow_nan=False)
+        except (TypeError, ValueError):
+            return None
+        return tool.id, canonical
+
+    def get(self, tool: ToolDefinition, arguments: Mapping[str, Any]) -> ReadOnlyToolCallResult | None:
+        key = self._key(tool, arguments)
+        if key is None or self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, tool: ToolDefinition, arguments: Mapping[str, Any], result: ReadOnlyToolCallResult) -> None:
+        key = self._key(tool, arguments)
+        if key is None or self.ttl_seconds <= 0 or result.is_error:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a guarded tool changed GCS state."""
+
+        with self._lock:
+            self._entries.clear()
+
+
 @dataclass(frozen=True)
 class InternalToolExecutionContext:
     """Request-independent target for internal GCS route execution."""
@@ -139,6 +213,44 @@ def _internal_execution_context(
     return InternalToolExecutionContext.from_request(target)
 
 
+def _internal_client(execution_context: InternalToolExecutionContext) -> httpx.AsyncClient:
+    """Return the long-lived in-process client for one app and base URL.
+
+    The ASGI transport holds no sockets, so one client serves every tool call
+    of an assistant turn, concurrent ones included. Its cookie jar refuses all
+    cookies so no call ever carries state set by an earlier response.
+    """
+
+    app = execution_context.app
+    key = (id(app), execution_context.base_url)
+    cached = _internal_clients.get(key)
+    if cached is not None:
+        if cached[0] is app:
+            _internal_clients.move_to_end(key)
+            return cached[1]
+        # id() was reused by a new app; the old client must not leak.
+        asyncio.get_running_loop().create_task(cached[1].aclose())
+    client = httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app, client=(INTERNAL_TOOL_CLIENT_HOST, 0)),
+        base_url=execution_context.base_url,
+        cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+    )
+    _internal_clients[key] = (app, client)
+    while len(_internal_clients) > _INTERNAL_CLIENT_CACHE_SIZE:
+        _, (_, evicted) = _internal_clients.popitem(last=False)
+        asyncio.get_running_loop().create_task(evicted.aclose())
+    return client
+
+
+async def close_internal_clients() -> None:
+    """Close every cached in-process tool client; called at app shutdown."""
+
+    clients = [client for _, client in _internal_clients.values()]
+    _internal_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
 def _tool_timeout_seconds(tool: ToolDefinition, fallback: float) -> float:
     default = (
         tool.execution_timeout_default_seconds
@@ -295,6 +407,7 @@ async def execute_policy_allowed_read_only_tool(
     policy: AgentPolicy | None = None,
     timeout_seconds: float = DEFAULT_INTERNAL_TOOL_TIMEOUT_SECONDS,
     max_response_chars: int = DEFAULT_TOOL_MAX_RESPONSE_CHARS,
+    result_cache: ReadOnlyToolResultCache | None = None,
 ) -> ReadOnlyToolCallResult:
     """Execute one approved read-only GCS GET/advisory tool through policy gates."""
 
@@ -324,6 +437,10 @@ async def execute_policy_allowed_read_only_tool(
         return ReadOnlyToolCallResult.error(
             "Only policy-allowed read-only GET tools are callable by this Simurgh adapter."
         )
+    if result_cache is not None:
+        cached_result = result_cache.get(tool, arguments)
+        if cached_result is not None:
+            return cached_result
     route_result = _route_path_with_arguments(tool, arguments)
     if route_result.is_error:
         return route_result
@@ -333,13 +450,11 @@ async def execute_policy_allowed_read_only_tool(
 
     execution_context = _internal_execution_context(request)
     effective_timeout_seconds = _tool_timeout_seconds(tool, timeout_seconds)
-    transport = httpx.ASGITransport(app=execution_context.app, client=(INTERNAL_TOOL_CLIENT_HOST, 0))
-    async with httpx.AsyncClient(
-        transport=transport,
-        base_url=execution_context.base_url,
+    response = await _internal_client(execution_context).get(
+        route_path,
+        headers=headers,
         timeout=effective_timeout_seconds,
-    ) as client:
-        response = await client.get(route_path, headers=headers)
+    )
 
     content_type = response.headers.get("content-type", "")
     try:
@@ -367,7 +482,7 @@ async def execute_policy_allowed_read_only_tool(
         safety_notes=tool.safety_notes,
     )
 
-    return ReadOnlyToolCallResult(
+    result = ReadOnlyToolCallResult(
         text=text,
         is_error=response.status_code >= 400,
         structured_content=structured_content,
@@ -375,6 +490,79 @@ async def execute_policy_allowed_read_only_tool(
         truncated=truncated,
         evidence=evidence,
     )
+    if result_cache is not None:
+        result_cache.put(tool, arguments, result)
+    return result
+
+
+async def execute_policy_allowed_read_only_tools(
+    request: Request | InternalToolExecutionContext,
+    calls: Sequence[tuple[str, Mapping[str, Any]]],
+    *,
+    channel: str,
+    actor_role: str | None = "viewer",
+    registry: ToolRegistry | None = None,
+    policy: AgentPolicy | None = None,
+    max_concurrency: int = DEFAULT_READ_TOOL_MAX_CONCURRENCY,
+    deadline_seconds: float = DEFAULT_READ_TOOL_TURN_DEADLINE_SECONDS,
+    result_cache: ReadOnlyToolResultCache | None = None,
+    on_call_start: Callable[[int], Awaitable[None]] | None = None,
+    on_call_complete: Callable[[int, ReadOnlyToolCallResult], Awaitable[None]] | None = None,
+    execute_tool: Callable[..., Awaitable[ReadOnlyToolCallResult]] | None = None,
+) -> list[ReadOnlyToolCallResult]:
+    """Execute independent read-only tool calls concurrently, results in call order.
+
+    At most ``max_concurrency`` calls run at once and the whole batch shares
+    one deadline; a call that cannot finish before it returns an error result
+    instead of delaying the turn. ``on_call_start`` and ``on_call_complete``
+    receive the call index for progress reporting. ``execute_tool`` replaces
+    the single-call executor, defaulting to ``execute_policy_allowed_read_only_tool``.
+    """
+
+    active_registry = registry or load_default_tool_registry()
+    active_policy = policy or load_default_policy()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max(0.0, float(deadline_seconds))
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+    execute = execute_tool or execute_policy_allowed_read_only_tool
+
+    async def run_call(index: int, name: str, arguments: Mapping[str, Any]) -> ReadOnlyToolCallResult:
+        async with semaphore:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                result = ReadOnlyToolCallResult.error(
+                    f"Simurgh tool call {name} was skipped: the turn deadline was reached"
+                )
+            else:
+                if on_call_start is not None:
+                    await on_call_start(index)
+                try:
+                    result = await asyncio.wait_for(
+                        execute(
+                            request,
+                            name=name,
+                            arguments=dict(arguments),
+                            channel=channel,
+                            actor_role=actor_role,
+                            registry=active_registry,
+                            policy=active_policy,
+                            result_cache=result_cache,
+                        ),
+                        timeout=remaining,
+                    )
+                except asyncio.TimeoutError:
+                    result = ReadOnlyToolCallResult.error(
+                        f"Simurgh tool call {name} timed out at the turn deadline"
+                    )
+            if on_call_complete is not None:
+                await on_call_complete(index, result)
+            return result
+
+    return list(
+        await asyncio.gather(
+            *(run_call(index, name, arguments) for index, (name, arguments) in enumerate(calls))
+        )
+    )
 
 
 async def execute_policy_allowed_guarded_route_tool(
@@ -423,34 +611,34 @@ async def execute_policy_allowed_guarded_route_tool(
 
     headers: dict[str, str] = {INTERNAL_TOOL_CALL_HEADER: INTERNAL_TOOL_CALL_VALUE}
     execution_context = _internal_execution_context(request)
-    transport = httpx.ASGITransport(app=execution_context.app, client=(INTERNAL_TOOL_CLIENT_HOST, 0))
-    async with httpx.AsyncClient(
-        transport=transport,
-        base_url=execution_context.base_url,
+    try:
+        current_policy = (
+            current_policy_loader()
+            if current_policy_loader is not None
+            else load_default_policy()
+        )
+        current_decision = current_policy.evaluate_tool(
+            tool,
+            channel=channel,
+            approved=approved,
+            actor_role=actor_role,
+        )
+    except Exception:
+        return GuardedToolCallResult.error(
+            "Simurgh policy denied this tool call: current policy could not be loaded"
+        )
+    if current_decision.status is not PolicyDecisionStatus.ALLOW:
+        return GuardedToolCallResult.error(
+            "Simurgh policy denied this tool call: "
+            + "; ".join(current_decision.reasons)
+        )
+    response = await _internal_client(execution_context).request(
+        str(tool.route_method),
+        route_path,
+        headers=headers,
+        json=body,
         timeout=timeout_seconds,
-    ) as client:
-        try:
-            current_policy = (
-                current_policy_loader()
-                if current_policy_loader is not None
-                else load_default_policy()
-            )
-            current_decision = current_policy.evaluate_tool(
-                tool,
-                channel=channel,
-                approved=approved,
-                actor_role=actor_role,
-            )
-        except Exception:
-            return GuardedToolCallResult.error(
-                "Simurgh policy denied this tool call: current policy could not be loaded"
-            )
-        if current_decision.status is not PolicyDecisionStatus.ALLOW:
-            return GuardedToolCallResult.error(
-                "Simurgh policy denied this tool call: "
-                + "; ".join(current_decision.reasons)
-            )
-        response = await client.request(str(tool.route_method), route_path, headers=headers, json=body)
+    )
 
     content_type = response.headers.get("content-type", "")
     try:
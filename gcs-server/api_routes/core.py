@@ -8,6 +8,7 @@ from fastapi import APIRouter, HTTPException, Query, Request, Response, WebSocke
 from fastapi.responses import JSONResponse
 
 from auth_runtime import authorize_websocket
+from heartbeat_stream import HeartbeatStreamHub
 from node_boot_status import get_all_node_boot_statuses, handle_node_boot_status_post
 from presence import build_presence_snapshot, resolve_presence_thresholds
 from schemas import (
@@ -18,7 +19,6 @@ from schemas import (
     HeartbeatPostResponse,
     HeartbeatRequest,
     HeartbeatResponse,
-    HeartbeatStreamMessage,
     NetworkStatusResponse,
     NodeBootStatusPostResponse,
     NodeBootStatusReport,
@@ -152,13 +152,13 @@ def _build_fleet_action_readiness_response(
     )
 
 
-def _build_heartbeat_response(deps: Any) -> HeartbeatResponse:
+def _build_heartbeat_response(deps: Any, now: float | None = None) -> HeartbeatResponse:
     heartbeats_dict = deps.get_all_heartbeats()
     drones_config = deps.load_config()
     config_lookup = {str(drone["hw_id"]): drone for drone in drones_config}
     config_hw_ids = set(config_lookup)
 
-    current_time = time.time()
+    current_time = time.time() if now is None else now
     thresholds = resolve_presence_thresholds(deps.Params)
     heartbeats_list = []
     state_counts: dict[str, int] = {}
@@ -218,7 +218,15 @@ def _build_heartbeat_response(deps: Any) -> HeartbeatResponse:
         total_drones=len(heartbeats_list),
         online_count=online_count,
         state_counts=state_counts,
-        timestamp=int(time.time() * 1000),
+        timestamp=int(current_time * 1000),
+    )
+
+
+def _build_heartbeat_stream_hub(deps: Any) -> HeartbeatStreamHub:
+    return HeartbeatStreamHub(
+        lambda now: _build_heartbeat_response(deps, now=now).heartbeats,
+        add_change_listener=getattr(deps, "add_heartbeat_listener", None),
+        resync_interval=getattr(deps.Params, "GCS_HEARTBEAT_STREAM_RESYNC_SEC", 30.0),
     )
 
 
@@ -369,6 +377,7 @@ def _accept_heartbeat(deps: Any, heartbeat: HeartbeatRequest, request: Request)
 
 def create_core_router(deps: Any) -> APIRouter:
     router = APIRouter()
+    heartbeat_stream = _build_heartbeat_stream_hub(deps)
 
     @router.get("/api/v1/system/health", response_model=HealthCheckResponse, tags=["System"])
     @router.get("/ping", response_model=HealthCheckResponse, tags=["System"])
@@ -450,18 +459,13 @@ def create_core_router(deps: Any) -> APIRouter:
         deps.log_system_event("Heartbeat WebSocket client connected", "INFO", "websocket")
 
         try:
-            while True:
-                heartbeat_snapshot = _build_heartbeat_response(deps)
-                message = HeartbeatStreamMessage(
-                    type="heartbeat",
-                    timestamp=int(time.time() * 1000),
-                    data=heartbeat_snapshot.heartbeats,
-                )
-                await websocket.send_json(message.model_dump())
-                await asyncio.sleep(2.0)
+            # Returns once the client disconnects; a send to a closed socket raises instead.
+            await heartbeat_stream.serve(websocket)
         except WebSocketDisconnect:
-            deps.log_system_event("Heartbeat WebSocket client disconnected", "INFO", "websocket")
+            pass
         except Exception as exc:
             deps.log_system_error(f"Heartbeat WebSocket error: {exc}", "websocket")
+            return
+        deps.log_system_event("Heartbeat WebSocket client disconnected", "INFO", "websocket")
 
     return router
@@ -399,6 +399,35 @@ def create_origin_router(deps: Any) -> APIRouter:
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    @router.get("/api/v1/origin/fleet-fit", tags=["Origin"])
+    async def get_fleet_origin_fit(
+        solve_heading: bool = Query(False, description="Estimate the formation heading from the fleet geometry"),
+        heading: float = Query(0, ge=0, lt=360, description="Fixed formation heading (degrees) when not solved"),
+    ):
+        """Fit one shared origin (and optionally heading) to every drone's fresh fix and expected offset."""
+        try:
+            drones_config = deps.load_config()
+            if not drones_config:
+                raise HTTPException(status_code=500, detail="No drones configuration found")
+
+            with deps.telemetry_lock:
+                telemetry_data_copy = deps.telemetry_data_all_drones.copy()
+
+            report = deps.build_fleet_origin_fit_report(
+                telemetry_data_copy,
+                drones_config,
+                solve_heading=solve_heading,
+                heading_deg=heading,
+                trajectory_resolver=deps.get_expected_position_from_trajectory,
+            )
+            return JSONResponse(content=report)
+        except HTTPException:
+            raise
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
     @router.post("/api/v1/origin/compute", response_model=OriginComputeResponse, tags=["Origin"])
     async def compute_origin_endpoint(payload: OriginComputeRequest):
         """Preview origin from a configured drone's fresh, valid global position."""
@@ -19,9 +19,15 @@ from pydantic import BaseModel, Field
 from src.enums import Mission, State
 from src.settings.runtime import resolve_runtime_mode
 from agent_runtime.tool_executor import (
+    DEFAULT_READ_TOOL_CACHE_TTL_SECONDS,
+    DEFAULT_READ_TOOL_MAX_CONCURRENCY,
+    DEFAULT_READ_TOOL_TURN_DEADLINE_SECONDS,
+    MAX_INTERNAL_TOOL_TIMEOUT_SECONDS,
     InternalToolExecutionContext,
+    ReadOnlyToolResultCache,
     execute_policy_allowed_guarded_route_tool,
     execute_policy_allowed_read_only_tool,
+    execute_policy_allowed_read_only_tools,
     list_policy_allowed_read_only_tools,
 )
 
@@ -3419,6 +3425,16 @@ def create_simurgh_router(deps: Any | None = None) -> APIRouter:
     action_policy_dispatch_lock = asyncio.Lock()
     assistant_turn_tasks: set[asyncio.Task[Any]] = set()
     action_run_tasks: set[asyncio.Task[Any]] = set()
+    # Repeated turns re-read the same fleet and SITL routes within seconds.
+    # Cleared whenever a guarded tool is dispatched from this router.
+    read_tool_cache = ReadOnlyToolResultCache(
+        ttl_seconds=_bounded_float_env(
+            "MDS_AGENT_READ_TOOL_CACHE_TTL_SEC",
+            DEFAULT_READ_TOOL_CACHE_TTL_SECONDS,
+            minimum=0.0,
+            maximum=30.0,
+        )
+    )
     configured_action_run_store = getattr(deps, "simurgh_action_run_store", None)
     action_runs = (
         configured_action_run_store
@@ -6395,6 +6411,7 @@ def create_simurgh_router(deps: Any | None = None) -> APIRouter:
                         registry=registry,
                         policy=current_policy,
                     )
+                    read_tool_cache.clear()
                 structured = result.structured_content if isinstance(result.structured_content, Mapping) else {}
                 operation_id = structured.get("operation_id") or structured.get("id") or ""
                 summary = structured.get("summary") or result.text
@@ -7531,6 +7548,7 @@ def create_simurgh_router(deps: Any | None = None) -> APIRouter:
                         registry=registry,
                         policy=current_policy,
                     )
+                    read_tool_cache.clear()
                 action_response = result.structured_content or {
                     "status_code": result.status_code,
                     "response": result.text,
@@ -7990,6 +8008,59 @@ def create_simurgh_router(deps: Any | None = None) -> APIRouter:
             except Exception:
                 pass
 
+    async def _execute_registry_read_plan(
+        http_request: Request,
+        plan: Any,
+        *,
+        registry: Any,
+        policy: Any,
+        progress_callback: AssistantProgressCallback | None = None,
+    ) -> list[RegistryReadToolResult]:
+        """Run a plan's independent read-only calls concurrently, in plan order."""
+
+        calls = tuple(plan.tool_calls)
+        await _emit_assistant_progress(progress_callback, _registry_plan_progress_payload(plan))
+
+        async def call_started(index: int) -> None:
+            await _emit_assistant_progress(
+                progress_callback,
+                _registry_tool_call_progress_payload(calls[index], state="running"),
+            )
+
+        async def call_completed(index: int, result: Any) -> None:
+            await _emit_assistant_progress(
+                progress_callback,
+                _registry_tool_call_progress_payload(calls[index], state="complete", result=result),
+            )
+
+        tool_results = await execute_policy_allowed_read_only_tools(
+            http_request,
+            [(call.tool.id, dict(call.arguments)) for call in calls],
+            channel="agent",
+            registry=registry,
+            policy=policy,
+            max_concurrency=_bounded_int_env(
+                "MDS_AGENT_READ_TOOL_MAX_CONCURRENCY",
+                DEFAULT_READ_TOOL_MAX_CONCURRENCY,
+                minimum=1,
+                maximum=16,
+            ),
+            deadline_seconds=_bounded_float_env(
+                "MDS_AGENT_READ_TOOL_TURN_DEADLINE_SEC",
+                DEFAULT_READ_TOOL_TURN_DEADLINE_SECONDS,
+                minimum=1.0,
+                maximum=MAX_INTERNAL_TOOL_TIMEOUT_SECONDS,
+            ),
+            result_cache=read_tool_cache,
+            on_call_start=call_started,
+            on_call_complete=call_completed,
+            execute_tool=execute_policy_allowed_read_only_tool,
+        )
+        return [
+            RegistryReadToolResult(tool=call.tool, arguments=dict(call.arguments), result=result)
+            for call, result in zip(calls, tool_results)
+        ]
+
     async def _pre_action_read_only_context(
         http_request: Request,
         turn_request: SimurghAssistantTurnRequest,
@@ -8070,26 +8141,13 @@ def create_simurgh_router(deps: Any | None = None) -> APIRouter:
             except ValueError:
                 registry_label = registry.path.as_posix()
 
-            results: list[RegistryReadToolResult] = []
-            await _emit_assistant_progress(progress_callback, _registry_plan_progress_payload(registry_plan))
-            for call in registry_plan.tool_calls:
-                await _emit_assistant_progress(
-                    progress_callback,
-                    _registry_tool_call_progress_payload(call, state="running"),
-                )
-                result = await execute_policy_allowed_read_only_tool(
-                    http_request,
-                    name=call.tool.id,
-                    arguments=dict(call.arguments),
-                    channel="agent",
-                    registry=registry,
-                    policy=policy,
-                )
-                await _emit_assistant_progress(
-                    progress_callback,
-                    _registry_tool_call_progress_payload(call, state="complete", result=result),
-                )
-                results.append(RegistryReadToolResult(tool=call.tool, arguments=dict(call.arguments), result=result))
+            results = await _execute_registry_read_plan(
+                http_request,
+                registry_plan,
+                registry=registry,
+                policy=policy,
+                progress_callback=progress_callback,
+            )
 
             evidence_bundle = build_registry_read_evidence_bundle(registry_plan, results, registry_path=registry_label)
             return (
@@ -8581,26 +8639,13 @@ def create_simurgh_router(deps: Any | None = None) -> APIRouter:
         except ValueError:
             registry_label = registry.path.as_posix()
 
-        results: list[RegistryReadToolResult] = []
-        await _emit_assistant_progress(progress_callback, _registry_plan_progress_payload(plan))
-        for call in plan.tool_calls:
-            await _emit_assistant_progress(
-                progress_callback,
-                _registry_tool_call_progress_payload(call, state="running"),
-            )
-            result = await execute_policy_allowed_read_only_tool(
-                http_request,
-                name=call.tool.id,
-                arguments=dict(call.arguments),
-                channel="agent",
-                registry=registry,
-                policy=policy,
-            )
-            await _emit_assistant_progress(
-                progress_callback,
-                _registry_tool_call_progress_payload(call, state="complete", result=result),
-            )
-            results.append(RegistryReadToolResult(tool=call.tool, arguments=dict(call.arguments), result=result))
+        results = await _execute_registry_read_plan(
+            http_request,
+            plan,
+            registry=registry,
+            policy=policy,
+            progress_callback=progress_callback,
+        )
 
         evidence_bundle = build_registry_read_evidence_bundle(plan, results, registry_path=registry_label)
         read_only_evidence = evidence_bundle.public_metadata()
@@ -63,7 +63,8 @@ from fleet_rpc import FleetRPCService
 from config import (
     get_drone_git_status as _config_get_drone_git_status,
     get_gcs_git_report, load_config, save_config,
-    load_swarm, save_swarm, validate_and_process_config, get_all_drone_positions
+    load_swarm, save_swarm, validate_and_process_config, get_all_drone_positions,
+    get_fleet_config_snapshot, get_fleet_config_snapshot_service,
 )
 from utils import allowed_file, clear_show_directories, git_operations, zip_directory
 from link_presence import get_recent_link_presence
@@ -77,6 +78,7 @@ from src.enums import Mission
 from get_elevation import get_elevation
 from origin import (
     build_desired_launch_positions_report,
+    build_fleet_origin_fit_report,
     build_position_deviation_report,
     compute_origin_from_drone,
     load_origin,
@@ -84,6 +86,7 @@ from origin import (
 )
 from coordinate_utils import get_expected_position_from_trajectory
 from heartbeat import (
+    add_heartbeat_listener,
     handle_heartbeat_post,
     get_all_heartbeats,
     get_network_info_from_heartbeats,
@@ -337,6 +340,14 @@ class BackgroundServices:
             "system",
         )
 
+    async def handle_fleet_config_change(self, snapshot) -> None:
+        """Reconcile pollers when the cached fleet config snapshot changes."""
+        drones = snapshot.as_list()
+        if self.running and self._normalize_drones(drones) == self.drones:
+            # An explicit reconcile after an in-process save already applied it.
+            return
+        await self.reconcile(drones)
+
     async def stop(self):
         """Stop all background services gracefully"""
         self.running = False
@@ -921,6 +932,14 @@ async def lifespan(app: FastAPI):
     # changes can reconcile in-process without requiring a backend restart.
     await background_services.start(drones)
 
+    fleet_config_service = get_fleet_config_snapshot_service()
+    remove_fleet_config_listener = fleet_config_service.add_async_listener(
+        background_services.handle_fleet_config_change
+    )
+    fleet_config_watch_task = asyncio.create_task(
+        fleet_config_service.watch(getattr(Params, "GCS_FLEET_CONFIG_WATCH_INTERVAL_SEC", 1.0))
+    )
+
     log_system_event("GCS FastAPI server ready - all services started", "INFO", "startup")
 
     # Start background log puller (no-op loop if disabled via env)
@@ -934,8 +953,17 @@ async def lifespan(app: FastAPI):
     # before closing shared transports and background services.
     await command_submission_coordinator.stop()
     await background_puller.stop()
+    remove_fleet_config_listener()
+    fleet_config_watch_task.cancel()
+    try:
+        await fleet_config_watch_task
+    except asyncio.CancelledError:
+        pass
     await background_services.stop()
+    fleet_candidate_registry.flush_state()
     await fleet_rpc_service.close()
+    await close_drone_clients()
+    await close_internal_clients()
     tracker.close()
     log_system_event("GCS FastAPI server stopped", "INFO", "shutdown")
 
@@ -1002,6 +1030,8 @@ app.include_router(create_swarm_trajectory_router(sys.modules[__name__]))
 
 # Background log puller (disabled by default, enable via MDS_LOG_BACKGROUND_PULL=true)
 from log_background import BackgroundLogPuller
+from log_proxy import close_drone_clients
+from agent_runtime.tool_executor import close_internal_clients
 background_puller = BackgroundLogPuller()
 
 # Register Log API router (puller injected to avoid circular import)
@@ -16,6 +16,7 @@ from collections import defaultdict
 from functions.file_utils import load_json, save_json
 from functions.git_manager import get_local_git_report, get_remote_git_status
 from mds_logging import get_logger
+from fleet_config_snapshot import FleetConfigSnapshot, get_fleet_config_service
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CONFIG_FILE_PATH = os.path.join(BASE_DIR, Params.config_file_name)
@@ -28,15 +29,23 @@ CONFIG_REQUIRED_FIELDS = {'hw_id', 'pos_id', 'ip', 'mavlink_port'}
 SWARM_REQUIRED_FIELDS = {'hw_id'}
 
 
+def get_fleet_config_snapshot_service(file_path=None):
+    """Return the process-wide snapshot service for the fleet config file."""
+    return get_fleet_config_service(file_path or CONFIG_FILE_PATH)
+
+
+def get_fleet_config_snapshot(file_path=None) -> FleetConfigSnapshot:
+    """Return the cached, immutable fleet config snapshot with lookup indexes."""
+    return get_fleet_config_snapshot_service(file_path).get()
+
+
 def load_config(file_path=None):
-    """Load fleet config from JSON. Returns list of drone dicts."""
-    path = file_path or CONFIG_FILE_PATH
-    data = load_json(path)
-    if isinstance(data, dict) and 'drones' in data:
-        return data['drones']
-    if isinstance(data, list):
-        return data  # Accept raw list for backward compat during migration
-    return []
+    """Load fleet config from JSON. Returns list of drone dicts.
+
+    Served from the stat-validated snapshot cache; each call returns fresh
+    copies so callers may still mutate the rows they receive.
+    """
+    return get_fleet_config_snapshot(file_path).as_list()
 
 
 def save_config(config, file_path=None):
@@ -44,6 +53,9 @@ def save_config(config, file_path=None):
     path = file_path or CONFIG_FILE_PATH
     wrapped = {"version": 1, "drones": config}
     save_json(wrapped, path)
+    # Refresh immediately: an in-place rewrite inside one mtime tick can keep
+    # the same stat fingerprint, and listeners should see the save right away.
+    get_fleet_config_snapshot_service(path).refresh()
 
 
 def load_swarm(file_path=None):
@@ -32,6 +32,10 @@ _RESOLVED_STATES = {
     FleetCandidateState.IGNORED.value,
     FleetCandidateState.SUPERSEDED.value,
 }
+# Fields that change on every heartbeat or read; updates touching only these
+# are written behind instead of rewriting the state file each time.
+_VOLATILE_FIELDS = frozenset({"last_seen", "last_heartbeat", "heartbeat_age_sec", "heartbeat_status"})
+DEFAULT_STATE_FLUSH_INTERVAL_SEC = 5.0
 
 
 def get_fleet_candidate_registry() -> "FleetCandidateRegistry":
@@ -137,7 +141,13 @@ def _active_candidate_sort_key(candidate: FleetCandidateRecord) -> tuple[int, in
 class FleetCandidateRegistry:
     """Small durable registry for nodes awaiting enrollment, replacement, or review."""
 
-    def __init__(self, state_path: str | None = None, events_path: str | None = None):
+    def __init__(
+        self,
+        state_path: str | None = None,
+        events_path: str | None = None,
+        *,
+        state_flush_interval_sec: float = DEFAULT_STATE_FLUSH_INTERVAL_SEC,
+    ):
         default_root = Path(__file__).resolve().parents[1] / "runtime_data"
         self.state_path = Path(state_path or default_root / "fleet_candidates.json")
         self.events_path = Path(events_path or default_root / "fleet_candidate_events.jsonl")
@@ -145,6 +155,16 @@ class FleetCandidateRegistry:
         self.events_path.parent.mkdir(parents=True, exist_ok=True)
         self._lock = threading.RLock()
         self._candidates: dict[str, dict[str, Any]] = {}
+        # Write-behind state: heartbeats that only refresh liveness mark the
+        # registry dirty; a timer (or the next real transition) persists it.
+        # A state interval of 0 keeps the old write-through behaviour.
+        self.state_flush_interval_sec = max(0.0, float(state_flush_interval_sec))
+        self._persist_lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: threading.Timer | None = None
+        self._state_generation = 0
+        self._persisted_generation = 0
+        self.state_write_count = 0
         if not self.state_path.exists():
             save_json(
                 {
@@ -174,17 +194,68 @@ class FleetCandidateRegistry:
             loaded[candidate_id] = record.model_dump(mode="json")
         self._candidates = loaded
 
-    def _persist_state_locked(self) -> None:
+    def _state_snapshot_locked(self) -> tuple[int, dict[str, Any]]:
+        # Records are replaced, never mutated in place, so the list can be
+        # serialized after the registry lock is released.
+        self._state_generation += 1
+        self._dirty = False
         ordered = [self._candidates[key] for key in sorted(self._candidates)]
-        save_json(
-            {
-                "version": 1,
-                "updated_at": _now_ms(),
-                "candidates": ordered,
-            },
-            str(self.state_path),
+        return self._state_generation, {
+            "version": 1,
+            "updated_at": _now_ms(),
+            "candidates": ordered,
+        }
+
+    def _write_state_snapshot(self, generation: int, payload: dict[str, Any]) -> None:
+        with self._persist_lock:
+            if generation <= self._persisted_generation:
+                return
+            save_json(payload, str(self.state_path))
+            self._persisted_generation = generation
+            self.state_write_count += 1
+
+    def _persist_state_locked(self) -> None:
+        self._write_state_snapshot(*self._state_snapshot_locked())
+
+    def _store_candidate_locked(self, candidate_id: str, record: dict[str, Any]) -> bool:
+        """Store a refreshed record; True when it differs beyond liveness fields."""
+        previous = self._candidates.get(candidate_id)
+        self._candidates[candidate_id] = record
+        if previous is None:
+            return True
+        return any(
+            previous.get(key) != record.get(key)
+            for key in previous.keys() | record.keys()
+            if key not in _VOLATILE_FIELDS
         )
 
+    def _mark_dirty_locked(self) -> None:
+        if self.state_flush_interval_sec <= 0:
+            self._persist_state_locked()
+            return
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.state_flush_interval_sec, self._flush_from_timer)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+        self.flush_state()
+
+    def flush_state(self) -> bool:
+        """Persist liveness-only updates that are still pending; True when written."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return False
+            snapshot = self._state_snapshot_locked()
+        self._write_state_snapshot(*snapshot)
+        return True
+
     def _append_event_locked(self, event_type: str, candidate_id: str, payload: dict[str, Any]) -> None:
         event = {
             "timestamp": _now_ms(),
@@ -261,11 +332,12 @@ class FleetCandidateRegistry:
         *,
         config_entries: list[dict[str, Any]],
         now_ms: Optional[int] = None,
+        configured_maps: Optional[tuple[set[str], dict[str, str]]] = None,
     ) -> FleetCandidateRecord:
         now_ms = now_ms or _now_ms()
         record = dict(raw_record)
         state = _normalize_string(record.get("registration_state")) or FleetCandidateState.PENDING_OPERATOR_REVIEW.value
-        configured_hw_ids, configured_ips = self._configured_maps(config_entries)
+        configured_hw_ids, configured_ips = configured_maps or self._configured_maps(config_entries)
         conflict_reasons: list[str] = []
 
         hw_id = _normalize_string(record.get("hw_id"))
@@ -333,19 +405,29 @@ class FleetCandidateRegistry:
         runtime_mode: Optional[str] = None,
     ) -> list[FleetCandidateRecord]:
         normalized_runtime_mode = _normalize_runtime_mode(runtime_mode)
+        config_entries = load_config()
+        configured_maps = self._configured_maps(config_entries)
         with self._lock:
-            config_entries = load_config()
             now_ms = _now_ms()
             results: list[FleetCandidateRecord] = []
+            changed = False
             for candidate_id in sorted(self._candidates):
                 raw_record = self._candidates[candidate_id]
-                record = self._refresh_candidate_state_locked(raw_record, config_entries=config_entries, now_ms=now_ms)
-                self._candidates[candidate_id] = record.model_dump(mode="json")
+                record = self._refresh_candidate_state_locked(
+                    raw_record,
+                    config_entries=config_entries,
+                    now_ms=now_ms,
+                    configured_maps=configured_maps,
+                )
+                changed = self._store_candidate_locked(candidate_id, record.model_dump(mode="json")) or changed
                 if normalized_runtime_mode and record.runtime_mode != normalized_runtime_mode:
                     continue
                 if include_inactive or record.registration_state.value not in _RESOLVED_STATES:
                     results.append(record)
-            self._persist_state_locked()
+            if changed:
+                self._persist_state_locked()
+            elif self._candidates:
+                self._mark_dirty_locked()
             return sorted(results, key=_active_candidate_sort_key)
 
     def get_candidate(self, candidate_id: str, *, load_config) -> FleetCandidateRecord:
@@ -355,8 +437,10 @@ class FleetCandidateRegistry:
             if raw_record is None:
                 raise FleetCandidateNotFoundError(f"Candidate {candidate_id} not found")
             record = self._refresh_candidate_state_locked(raw_record, config_entries=load_config(), now_ms=_now_ms())
-            self._candidates[record.candidate_id] = record.model_dump(mode="json")
-            self._persist_state_locked()
+            if self._store_candidate_locked(record.candidate_id, record.model_dump(mode="json")):
+                self._persist_state_locked()
+            else:
+                self._mark_dirty_locked()
             return record
 
     def observe_heartbeat(self, heartbeat: dict[str, Any], *, load_config) -> Optional[FleetCandidateRecord]:
@@ -368,9 +452,13 @@ class FleetCandidateRegistry:
         heartbeat_ip = _normalize_ip(heartbeat.get("ip"))
         runtime_mode = _normalize_runtime_mode(heartbeat.get("runtime_mode"))
 
+        # The fleet config is a cached snapshot; read it before taking the
+        # registry lock so heartbeats from enrolled drones never contend on it.
+        config_entries = load_config()
+        configured_maps = self._configured_maps(config_entries)
+        configured_hw_ids = configured_maps[0]
+
         with self._lock:
-            config_entries = load_config()
-            configured_hw_ids, _configured_ips = self._configured_maps(config_entries)
             candidate_key = self._find_candidate_key_locked(node_uuid=None, hw_id=hw_id, runtime_mode=runtime_mode)
             is_new_candidate = False
 
@@ -407,9 +495,19 @@ class FleetCandidateRegistry:
                 record["ip_addresses"] = ip_addresses
                 record["primary_control_ip"] = heartbeat_ip
 
-            refreshed = self._refresh_candidate_state_locked(record, config_entries=config_entries, now_ms=_now_ms())
-            self._candidates[candidate_key] = refreshed.model_dump(mode="json")
-            self._persist_state_locked()
+            refreshed = self._refresh_candidate_state_locked(
+                record,
+                config_entries=config_entries,
+                now_ms=_now_ms(),
+                configured_maps=configured_maps,
+            )
+            changed = self._store_candidate_locked(candidate_key, refreshed.model_dump(mode="json"))
+            snapshot = None
+            if is_new_candidate or changed:
+                # Serialize and write after releasing the lock; generations keep writes ordered.
+                snapshot = self._state_snapshot_locked()
+            else:
+                self._mark_dirty_locked()
 
             if is_new_candidate:
                 self._append_event_locked("candidate.first_seen", candidate_key, refreshed.model_dump(mode="json"))
@@ -423,7 +521,10 @@ class FleetCandidateRegistry:
                         "conflict_reasons": refreshed.conflict_reasons,
                     },
                 )
-            return refreshed
+
+        if snapshot is not None:
+            self._write_state_snapshot(*snapshot)
+        return refreshed
 
     def announce_candidate(self, request: FleetCandidateAnnounceRequest, *, load_config) -> FleetCandidateRecord:
         timestamp_ms = _normalize_timestamp_ms(request.timestamp)
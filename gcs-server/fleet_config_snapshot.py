@@ -0,0 +1,292 @@
+"""Process-wide cached fleet configuration snapshots.
+
+`config.json` is read by dozens of GCS routes and background loops. This module
+keeps one parsed, immutable snapshot per config path and only re-reads the file
+when its stat fingerprint (inode, mtime, size) changes. Snapshots carry
+prebuilt `hw_id`, `pos_id`, and `ip` indexes and are safe to share across
+threads; callers that need to mutate rows must use `as_list()` copies.
+
+Change listeners run when a reload produces different fleet content, so
+background services can reconcile on config changes instead of polling. A file
+that cannot be parsed or has no `drones` list (a half-written save, an operator
+typo, a deleted file) keeps the last good snapshot and notifies nobody.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Optional
+
+from functions.file_utils import load_json
+from mds_logging import get_logger
+
+logger = get_logger("fleet_config_snapshot")
+
+ConfigFingerprint = Optional[tuple[int, int, int]]
+SnapshotListener = Callable[["FleetConfigSnapshot"], None]
+AsyncSnapshotListener = Callable[["FleetConfigSnapshot"], Awaitable[None]]
+_NOT_REJECTED = object()
+
+
+def normalize_fleet_key(value: Any) -> str:
+    """Normalize hw_id/pos_id values so `1`, `"1"`, and `" 1 "` share one key."""
+    text = str(value if value is not None else "").strip()
+    try:
+        return str(int(text))
+    except ValueError:
+        return text
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def extract_fleet_drones(data: Any) -> list[dict[str, Any]]:
+    """Accept the versioned `{"drones": [...]}` wrapper or a legacy raw list."""
+    if isinstance(data, dict) and "drones" in data:
+        drones = data["drones"]
+    elif isinstance(data, list):
+        drones = data
+    else:
+        return []
+    return [drone for drone in drones or [] if isinstance(drone, Mapping)]
+
+
+def _has_fleet_drone_list(data: Any) -> bool:
+    """True when `data` actually carries a fleet list (possibly an empty one)."""
+    return isinstance(data, list) or (isinstance(data, dict) and isinstance(data.get("drones"), list))
+
+
+@dataclass(frozen=True)
+class FleetConfigSnapshot:
+    """Immutable parsed fleet manifest with lookup indexes."""
+
+    path: str
+    version: int
+    fingerprint: ConfigFingerprint
+    loaded_at: float
+    drones: tuple[Mapping[str, Any], ...] = ()
+    by_hw_id: Mapping[str, Mapping[str, Any]] = field(default_factory=lambda: MappingProxyType({}))
+    by_pos_id: Mapping[str, tuple[Mapping[str, Any], ...]] = field(default_factory=lambda: MappingProxyType({}))
+    by_ip: Mapping[str, tuple[Mapping[str, Any], ...]] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_drones(
+        cls,
+        drones: Iterable[Mapping[str, Any]],
+        *,
+        path: str = "",
+        version: int = 0,
+        fingerprint: ConfigFingerprint = None,
+    ) -> "FleetConfigSnapshot":
+        frozen = tuple(_freeze(drone) for drone in drones)
+        by_hw_id: dict[str, Mapping[str, Any]] = {}
+        by_pos_id: dict[str, list[Mapping[str, Any]]] = {}
+        by_ip: dict[str, list[Mapping[str, Any]]] = {}
+        for drone in frozen:
+            hw_key = normalize_fleet_key(drone.get("hw_id"))
+            if hw_key:
+                # First definition wins; duplicate hw_ids are a validation error.
+                by_hw_id.setdefault(hw_key, drone)
+            pos_key = normalize_fleet_key(drone.get("pos_id", drone.get("hw_id")))
+            if pos_key:
+                by_pos_id.setdefault(pos_key, []).append(drone)
+            ip_key = str(drone.get("ip") or "").strip()
+            if ip_key:
+                by_ip.setdefault(ip_key, []).append(drone)
+
+        return cls(
+            path=path,
+            version=version,
+            fingerprint=fingerprint,
+            loaded_at=time.time(),
+            drones=frozen,
+            by_hw_id=MappingProxyType(by_hw_id),
+            by_pos_id=MappingProxyType({key: tuple(rows) for key, rows in by_pos_id.items()}),
+            by_ip=MappingProxyType({key: tuple(rows) for key, rows in by_ip.items()}),
+        )
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return mutable deep copies in the legacy `load_config()` shape."""
+        return [_thaw(drone) for drone in self.drones]
+
+    def get_by_hw_id(self, hw_id: Any) -> Optional[Mapping[str, Any]]:
+        return self.by_hw_id.get(normalize_fleet_key(hw_id))
+
+    def get_by_pos_id(self, pos_id: Any) -> tuple[Mapping[str, Any], ...]:
+        return self.by_pos_id.get(normalize_fleet_key(pos_id), ())
+
+    def get_by_ip(self, ip: Any) -> tuple[Mapping[str, Any], ...]:
+        return self.by_ip.get(str(ip or "").strip(), ())
+
+
+class FleetConfigSnapshotService:
+    """Stat-validated loader for one fleet config path."""
+
+    def __init__(self, path: str, *, loader: Callable[[str], Any] = load_json) -> None:
+        self.path = os.path.abspath(path)
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._snapshot: Optional[FleetConfigSnapshot] = None
+        self._listeners: list[SnapshotListener] = []
+        # Fingerprint of the last unusable file, so it is not re-parsed on every read.
+        self._rejected_fingerprint: Any = _NOT_REJECTED
+
+    def get(self) -> FleetConfigSnapshot:
+        fingerprint = self._stat_fingerprint()
+        snapshot = self._snapshot
+        if snapshot is not None and fingerprint is not None and snapshot.fingerprint == fingerprint:
+            return snapshot
+        if snapshot is not None and fingerprint == self._rejected_fingerprint:
+            return snapshot
+        return self._reload(fingerprint)
+
+    def refresh(self) -> FleetConfigSnapshot:
+        """Force a re-read, e.g. right after an in-process save."""
+        return self._reload(self._stat_fingerprint(), force=True)
+
+    def add_listener(self, listener: SnapshotListener) -> Callable[[], None]:
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _remove() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+
+        return _remove
+
+    def add_async_listener(
+        self,
+        listener: AsyncSnapshotListener,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> Callable[[], None]:
+        """Schedule `listener` on `loop` whenever the fleet content changes.
+
+        Reloads can be detected from worker threads, so the coroutine is always
+        handed back to the owning event loop thread-safely.
+        """
+        target_loop = loop or asyncio.get_running_loop()
+
+        def _dispatch(snapshot: FleetConfigSnapshot) -> None:
+            if target_loop.is_closed():
+                return
+            future = asyncio.run_coroutine_threadsafe(listener(snapshot), target_loop)
+            future.add_done_callback(_log_listener_failure)
+
+        return self.add_listener(_dispatch)
+
+    async def watch(self, interval_sec: float = 1.0) -> None:
+        """Detect external edits with a cheap periodic `stat()` until cancelled."""
+        interval = max(0.1, float(interval_sec))
+        while True:
+            try:
+                self.get()
+            except Exception as exc:
+                logger.warning(f"Fleet config watch failed for {self.path}: {exc}")
+            await asyncio.sleep(interval)
+
+    def _stat_fingerprint(self) -> ConfigFingerprint:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (int(stat.st_ino), int(stat.st_mtime_ns), int(stat.st_size))
+
+    def _reload(self, fingerprint: ConfigFingerprint, *, force: bool = False) -> FleetConfigSnapshot:
+        with self._lock:
+            current = self._snapshot
+            if (
+                not force
+                and current is not None
+                and fingerprint is not None
+                and current.fingerprint == fingerprint
+            ):
+                return current
+
+            drones = self._load_drones()
+            if drones is None:
+                if current is not None:
+                    if fingerprint != self._rejected_fingerprint:
+                        logger.warning(
+                            f"Fleet config {self.path} is missing or has no drones list; "
+                            f"keeping the last good snapshot (version {current.version})"
+                        )
+                    self._rejected_fingerprint = fingerprint
+                    return current
+                drones = []
+            self._rejected_fingerprint = _NOT_REJECTED
+            candidate = FleetConfigSnapshot.from_drones(
+                drones,
+                path=self.path,
+                version=(current.version if current is not None else 0),
+                fingerprint=fingerprint,
+            )
+            changed = current is None or candidate.drones != current.drones
+            if changed:
+                candidate = replace(candidate, version=candidate.version + 1)
+            self._snapshot = candidate
+            listeners = list(self._listeners) if changed and current is not None else []
+
+        for listener in listeners:
+            try:
+                listener(candidate)
+            except Exception as exc:
+                logger.warning(f"Fleet config change listener failed: {exc}")
+        return candidate
+
+    def _load_drones(self) -> Optional[list[dict[str, Any]]]:
+        """Parse the config file; None when it is unreadable or not a fleet manifest."""
+        try:
+            data = self._loader(self.path)
+        except Exception as exc:
+            logger.warning(f"Fleet config load failed for {self.path}: {exc}")
+            return None
+        if not _has_fleet_drone_list(data):
+            return None
+        return extract_fleet_drones(data)
+
+
+def _log_listener_failure(future: Any) -> None:
+    try:
+        exc = future.exception()
+    except Exception:
+        return
+    if exc is not None:
+        logger.warning(f"Fleet config async change listener failed: {exc}")
+
+
+_services: dict[str, FleetConfigSnapshotService] = {}
+_services_lock = threading.Lock()
+
+
+def get_fleet_config_service(path: str) -> FleetConfigSnapshotService:
+    """Return the process-wide snapshot service for `path`."""
+    key = os.path.abspath(path)
+    service = _services.get(key)
+    if service is not None:
+        return service
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = FleetConfigSnapshotService(key)
+            _services[key] = service
+        return service
@@ -9,6 +9,9 @@ logger = get_logger("heartbeat")
 # Thread-safe structure to store the last heartbeat for each drone
 last_heartbeats = {}  # { hw_id: { "pos_id": ...,"detected_pos_id",..., "ip": ..., "timestamp": ..., "network_info": ... } }
 last_heartbeats_lock = Lock()
+# Bumped on every accepted heartbeat so streams can push instead of polling.
+_heartbeat_version = 0
+_heartbeat_listeners = []  # callables invoked with the new version
 
 # Thread-safe structure to store network info extracted from heartbeats
 network_info_from_heartbeats = {}  # { hw_id: network_info_dict }
@@ -155,6 +158,17 @@ def handle_heartbeat_post(pos_id, hw_id, detected_pos_id=None, ip=None, timestam
                 logger.info(f"💓 Heartbeat active from drone {hw_id} (IP: {ip}, Pos: {pos_id})")
                 last_heartbeats[hw_id]['last_logged'] = time.time()
 
+        global _heartbeat_version
+        _heartbeat_version += 1
+        version = _heartbeat_version
+        listeners = list(_heartbeat_listeners)
+
+    for listener in listeners:
+        try:
+            listener(version)
+        except Exception as exc:
+            logger.warning(f"Heartbeat change listener failed: {exc}")
+
     # Store network info separately for /get-network-info endpoint
     if network_info:
         with network_info_lock:
@@ -171,6 +185,30 @@ def handle_heartbeat_post(pos_id, hw_id, detected_pos_id=None, ip=None, timestam
         "current_mode": current_runtime_mode,
     }
 
+def get_heartbeat_version():
+    """Return a counter that increases with every accepted heartbeat."""
+    with last_heartbeats_lock:
+        return _heartbeat_version
+
+
+def add_heartbeat_listener(listener):
+    """
+    Call `listener(version)` after every accepted heartbeat.
+
+    Listeners run on the thread that accepted the heartbeat, outside the store
+    lock, and must not block. Returns a callable that removes the listener.
+    """
+    with last_heartbeats_lock:
+        _heartbeat_listeners.append(listener)
+
+    def _remove():
+        with last_heartbeats_lock:
+            if listener in _heartbeat_listeners:
+                _heartbeat_listeners.remove(listener)
+
+    return _remove
+
+
 def get_all_heartbeats():
     """
     Handler for GET /api/v1/fleet/heartbeats
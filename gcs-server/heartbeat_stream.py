@@ -0,0 +1,273 @@
+"""
+Change-driven fan-out for the `/ws/heartbeats` stream.
+
+One `HeartbeatStreamHub` per router builds the heartbeat/presence snapshot and
+serializes each message once for every connected socket. Instead of resending
+the whole snapshot on a fixed 2 s tick, it publishes:
+
+- a `heartbeat_delta` with only the rows whose presence-relevant fields
+  changed, as soon as a heartbeat is accepted or the next presence threshold
+  (live -> recently_lost -> stale -> offline -> long offline) is crossed;
+- a delta for changes no heartbeat announces (a drone returning through
+  telemetry alone, fleet config edits) at the latest `max_idle_interval`
+  seconds later, when the producer rebuilds the rows even without a wake-up;
+- a full `heartbeat` snapshot on connect and every `resync_interval` seconds,
+  so clients self-heal from anything the deltas cannot see.
+
+Ages and human-readable detail strings tick every second and are therefore
+excluded from change detection; clients derive live ages from the timestamps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Optional
+
+from mds_logging import get_logger
+from schemas import HeartbeatData, HeartbeatDeltaStreamMessage, HeartbeatStreamMessage
+
+logger = get_logger("heartbeat_stream")
+
+DEFAULT_RESYNC_INTERVAL_SEC = 30.0
+DEFAULT_MAX_IDLE_INTERVAL_SEC = 2.0
+DEFAULT_MIN_PUBLISH_INTERVAL_SEC = 0.05
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 8
+# Presence uses `age <= threshold` on millisecond timestamps; wake just past it.
+_THRESHOLD_WAKE_EPSILON_SEC = 0.002
+_VOLATILE_ROW_FIELDS = frozenset({"heartbeat_age_sec"})
+_VOLATILE_PRESENCE_FIELDS = frozenset(
+    {"detail", "source", "last_seen_ms", "age_sec", "heartbeat_age_sec", "telemetry_age_sec"}
+)
+
+
+def heartbeat_change_signature(row: HeartbeatData) -> tuple:
+    """Return the presence-relevant identity of one heartbeat row."""
+    fields = row.model_dump(exclude=set(_VOLATILE_ROW_FIELDS | {"presence"}))
+    presence = {
+        key: value
+        for key, value in (row.presence or {}).items()
+        if key not in _VOLATILE_PRESENCE_FIELDS
+    }
+    return (
+        tuple(sorted(fields.items())),
+        tuple(sorted((key, repr(value)) for key, value in presence.items())),
+    )
+
+
+def seconds_to_next_presence_change(presence: dict[str, Any]) -> Optional[float]:
+    """Seconds until the next threshold crossing for one presence snapshot."""
+    thresholds = presence.get("thresholds") or {}
+    live_sec = thresholds.get("live_sec")
+    candidates = []
+    if live_sec is not None:
+        for recent_key, age_key in (
+            ("heartbeat_recent", "heartbeat_age_sec"),
+            ("telemetry_recent", "telemetry_age_sec"),
+        ):
+            age = presence.get(age_key)
+            if presence.get(recent_key) and age is not None:
+                candidates.append(live_sec - age)
+    age = presence.get("age_sec")
+    if age is not None:
+        for key in ("recent_loss_sec", "stale_sec", "long_offline_sec"):
+            threshold = thresholds.get(key)
+            if threshold is not None and threshold >= age:
+                candidates.append(threshold - age)
+    if not candidates:
+        return None
+    return max(0.0, min(candidates)) + _THRESHOLD_WAKE_EPSILON_SEC
+
+
+class HeartbeatStreamHub:
+    """Single producer that pushes heartbeat changes to every subscribed socket."""
+
+    def __init__(
+        self,
+        build_rows: Callable[[float], list[HeartbeatData]],
+        *,
+        add_change_listener: Optional[Callable[[Callable[[int], None]], Callable[[], None]]] = None,
+        resync_interval: float = DEFAULT_RESYNC_INTERVAL_SEC,
+        max_idle_interval: float = DEFAULT_MAX_IDLE_INTERVAL_SEC,
+        min_publish_interval: float = DEFAULT_MIN_PUBLISH_INTERVAL_SEC,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            build_rows: Builds the heartbeat rows for a given Unix time.
+            add_change_listener: Registers a store change callback (see
+                `heartbeat.add_heartbeat_listener`); without it the hub only
+                wakes for threshold crossings and resyncs.
+            resync_interval: Seconds between full snapshots.
+            max_idle_interval: Longest the producer sleeps before re-diffing
+                the rows, bounding how late changes without a store
+                notification (telemetry-only returns) are pushed.
+            min_publish_interval: Coalescing window for heartbeat bursts.
+            queue_size: Messages buffered per socket before it is reset to a
+                full snapshot instead of queueing further deltas.
+            clock: Wall-clock source in Unix seconds.
+        """
+        self.build_rows = build_rows
+        self.add_change_listener = add_change_listener
+        self.resync_interval = max(1.0, float(resync_interval))
+        self.max_idle_interval = min(self.resync_interval, max(0.1, float(max_idle_interval)))
+        self.min_publish_interval = max(0.0, float(min_publish_interval))
+        self.queue_size = max(1, int(queue_size))
+        self.clock = clock
+        self.next_wake_at: Optional[float] = None
+        self.messages_published = 0
+        self._subscribers: list[asyncio.Queue] = []
+        self._signatures: dict[str, tuple] = {}
+        self._next_resync_at: Optional[float] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._producer: Optional[asyncio.Task] = None
+        self._remove_listener: Optional[Callable[[], None]] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber; its queue starts with a full snapshot."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        queue.put_nowait(self._full_message(self.build_rows(self.clock())))
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        if queue in self._subscribers:
+            self._subscribers.remove(queue)
+
+    def notify_changed(self, _version: Any = None) -> None:
+        """Store change callback; safe to call from any thread."""
+        changed, loop = self._changed, self._loop
+        if changed is None or loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(changed.set)
+
+    def publish(self) -> Optional[float]:
+        """
+        Diff the current snapshot against the last one and enqueue a message.
+
+        Returns the Unix time of the next threshold crossing, resync or idle
+        re-diff, which is when the producer must wake even if no heartbeat
+        arrives.
+        """
+        now = self.clock()
+        rows = self.build_rows(now)
+        signatures = {row.hw_id: heartbeat_change_signature(row) for row in rows}
+        if self._next_resync_at is None or now >= self._next_resync_at:
+            self._broadcast(self._full_message(rows))
+            self._next_resync_at = now + self.resync_interval
+        else:
+            changed = [row for row in rows if self._signatures.get(row.hw_id) != signatures[row.hw_id]]
+            removed = sorted(set(self._signatures) - set(signatures))
+            if changed or removed:
+                self._broadcast(
+                    HeartbeatDeltaStreamMessage(
+                        timestamp=int(now * 1000),
+                        data=changed,
+                        removed=removed,
+                    ).model_dump_json()
+                )
+        self._signatures = signatures
+
+        wake_at = min(self._next_resync_at, now + self.max_idle_interval)
+        for row in rows:
+            delay = seconds_to_next_presence_change(row.presence or {})
+            if delay is not None:
+                wake_at = min(wake_at, now + delay)
+        self.next_wake_at = wake_at
+        return wake_at
+
+    async def serve(self, websocket) -> None:
+        """Stream to one accepted socket until the client disconnects."""
+        queue = self.subscribe()
+        self._ensure_producer()
+        disconnected = asyncio.ensure_future(self._wait_for_disconnect(websocket))
+        try:
+            while True:
+                next_message = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {next_message, disconnected},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if next_message not in done:
+                    next_message.cancel()
+                    return
+                await websocket.send_text(next_message.result())
+        finally:
+            disconnected.cancel()
+            self.unsubscribe(queue)
+            if not self._subscribers:
+                await self._stop_producer()
+
+    def _full_message(self, rows: list[HeartbeatData]) -> str:
+        return HeartbeatStreamMessage(
+            timestamp=int(self.clock() * 1000),
+            data=rows,
+        ).model_dump_json()
+
+    def _broadcast(self, text: str) -> None:
+        self.messages_published += 1
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(text)
+            except asyncio.QueueFull:
+                # A slow socket would miss deltas; give it one fresh snapshot instead.
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._full_message(self.build_rows(self.clock())))
+
+    @staticmethod
+    async def _wait_for_disconnect(websocket) -> None:
+        while True:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                return
+
+    def _ensure_producer(self) -> None:
+        if self._producer is not None and not self._producer.done():
+            return
+        self._changed = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._next_resync_at = self.clock() + self.resync_interval
+        self._signatures = {
+            row.hw_id: heartbeat_change_signature(row) for row in self.build_rows(self.clock())
+        }
+        if self.add_change_listener is not None:
+            self._remove_listener = self.add_change_listener(self.notify_changed)
+        self._producer = asyncio.create_task(self._run())
+
+    async def _stop_producer(self) -> None:
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        producer, self._producer = self._producer, None
+        if producer is not None:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        changed = self._changed
+        wake_at = self._next_resync_at
+        while True:
+            timeout = None if wake_at is None else max(0.0, wake_at - self.clock())
+            try:
+                await asyncio.wait_for(changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            if changed.is_set() and self.min_publish_interval:
+                # Let a burst of heartbeats land in a single delta.
+                await asyncio.sleep(self.min_publish_interval)
+            changed.clear()
+            try:
+                wake_at = self.publish()
+            except Exception as exc:
+                logger.warning(f"Heartbeat stream publish failed: {exc}")
+                wake_at = self.clock() + self.resync_interval
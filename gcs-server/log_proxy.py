@@ -13,13 +13,15 @@ import os
 import secrets
 import tempfile
 import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
 import httpx
 from pydantic import ValidationError
 
-from config import load_config
+from config import get_fleet_config_snapshot
 from mds_logging import get_logger
 from mds_logging.api_schemas import OnboardUlogSummaryResponse
 from mds_logging.schema import build_log_entry
@@ -79,6 +81,28 @@ _ULOG_DOWNLOAD_POLL_INTERVAL_SECONDS = 0.25
 _ULOG_STREAM_CHUNK_BYTES = 1024 * 1024
 _ULOG_CLEANUP_TIMEOUT_SECONDS = 5.0
 
+# Dashboard log views hit the same few drones over and over, so async proxy
+# requests share one keep-alive pool per drone host instead of paying a TCP
+# handshake and client setup per request. An open SSE tail or ULog download
+# holds its connection for its whole lifetime, so streams get a separate,
+# uncapped pool per drone; otherwise a few open tails would exhaust the
+# capped pool and starve the short JSON reads.
+_DRONE_CLIENT_LIMITS = httpx.Limits(
+    max_connections=8,
+    max_keepalive_connections=4,
+    keepalive_expiry=30.0,
+)
+_DRONE_STREAM_CLIENT_LIMITS = httpx.Limits(
+    max_connections=None,
+    max_keepalive_connections=2,
+    keepalive_expiry=30.0,
+)
+_DRONE_CLIENT_CACHE_SIZE = 256
+# httpx async connections belong to the event loop that opened them.
+_drone_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, OrderedDict[str, httpx.AsyncClient]
+] = weakref.WeakKeyDictionary()
+
 
 class DroneProxyRequestError(Exception):
     """Base error for proxied drone HTTP requests."""
@@ -171,15 +195,49 @@ def _summary_log_id_from_path(path: str) -> int | None:
 
 def resolve_drone_ip(drone_id: int) -> Optional[str]:
     """Resolve a drone_id (hw_id as int) to its IP address from fleet config."""
-    drones = load_config()
-    for d in drones:
-        hw = d.get("hw_id", "")
+    drone = get_fleet_config_snapshot().get_by_hw_id(drone_id)
+    if drone is None:
+        return None
+    return drone.get("ip")
+
+
+def _drone_client(drone_ip: str, *, streaming: bool = False) -> httpx.AsyncClient:
+    """Return the long-lived pooled client for one drone host on this event loop.
+
+    Request timeouts are passed per call. Short JSON reads share the capped
+    pool; ``streaming=True`` selects the drone's uncapped pool for SSE tails
+    and ULog downloads, which hold a connection until they finish.
+    """
+
+    loop = asyncio.get_running_loop()
+    clients = _drone_clients.get(loop)
+    if clients is None:
+        clients = _drone_clients[loop] = OrderedDict()
+    key = f"{drone_ip}:{_drone_api_port()}" + ("/stream" if streaming else "")
+    client = clients.get(key)
+    if client is not None:
+        clients.move_to_end(key)
+        return client
+    client = httpx.AsyncClient(
+        timeout=_TIMEOUT,
+        limits=_DRONE_STREAM_CLIENT_LIMITS if streaming else _DRONE_CLIENT_LIMITS,
+    )
+    clients[key] = client
+    while len(clients) > _DRONE_CLIENT_CACHE_SIZE:
+        _, evicted = clients.popitem(last=False)
+        loop.create_task(evicted.aclose())
+    return client
+
+
+async def close_drone_clients() -> None:
+    """Close every pooled drone client owned by the running event loop."""
+
+    clients = _drone_clients.pop(asyncio.get_running_loop(), None) or {}
+    for client in clients.values():
         try:
-            if int(hw) == drone_id:
-                return d.get("ip")
-        except (ValueError, TypeError):
-            continue
-    return None
+            await client.aclose()
+        except Exception as exc:
+            logger.debug("Closing pooled drone client failed: %s", exc)
 
 
 def _build_drone_url(drone_ip: str, path: str) -> str:
@@ -233,9 +291,8 @@ def _drone_machine_audience(drone_ip: str) -> str:
     normalized_ip = str(drone_ip or "").strip()
     matches = [
         str(drone.get("hw_id") or "").strip()
-        for drone in load_config()
-        if str(drone.get("ip") or "").strip() == normalized_ip
-        and str(drone.get("hw_id") or "").strip()
+        for drone in get_fleet_config_snapshot().get_by_ip(normalized_ip)
+        if str(drone.get("hw_id") or "").strip()
     ]
     unique_matches = list(dict.fromkeys(matches))
     if len(unique_matches) != 1:
@@ -309,14 +366,14 @@ async def _request_json(
         headers,
     )
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            resp = await client.request(
-                method,
-                _build_drone_url(drone_ip, path),
-                params=params,
-                json=json_body,
-                headers=request_headers,
-            )
+        resp = await _drone_client(drone_ip).request(
+            method,
+            _build_drone_url(drone_ip, path),
+            params=params,
+            json=json_body,
+            headers=request_headers,
+            timeout=timeout,
+        )
     except Exception as exc:
         raise DroneProxyUnavailableError(str(exc)) from exc
 
@@ -394,10 +451,12 @@ def fetch_drone_json_sync(
 async def fetch_drone_sessions(drone_ip: str) -> Optional[dict]:
     """Fetch session list from a drone. Returns None if unreachable."""
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(_build_drone_url(drone_ip, "/api/logs/sessions"))
-            resp.raise_for_status()
-            return resp.json()
+        resp = await _drone_client(drone_ip).get(
+            _build_drone_url(drone_ip, "/api/logs/sessions"),
+            timeout=_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as e:
         logger.warning(f"Drone at {drone_ip} unreachable: {e}")
         return None
@@ -425,13 +484,13 @@ async def fetch_drone_session_content(
     if since:
         params["since"] = since
     try:
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.get(
-                _build_drone_url(drone_ip, f"/api/logs/sessions/{session_id}"),
-                params=params,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await _drone_client(drone_ip).get(
+            _build_drone_url(drone_ip, f"/api/logs/sessions/{session_id}"),
+            params=params,
+            timeout=_TIMEOUT,
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as e:
         logger.warning(f"Drone at {drone_ip} unreachable for session {session_id}: {e}")
         return None
@@ -556,8 +615,14 @@ async def open_drone_ulog_download_stream(
     job_id: str,
     *,
     access_token: str,
-) -> tuple[httpx.AsyncClient, httpx.Response]:
-    client = httpx.AsyncClient(timeout=drone_ulog_proxy_timeout_seconds())
+) -> httpx.Response:
+    """Open a streamed ULog content response on the drone's streaming pool.
+
+    The caller owns the response and must ``aclose()`` it, which returns the
+    connection to the pool.
+    """
+
+    client = _drone_client(drone_ip, streaming=True)
     path = DRONE_ULOG_DOWNLOAD_CONTENT_ROUTE_TEMPLATE.format(job_id=job_id)
     request = client.build_request(
         "GET",
@@ -568,20 +633,20 @@ async def open_drone_ulog_download_stream(
             path,
             {DRONE_ULOG_JOB_TOKEN_HEADER: access_token},
         ),
+        timeout=drone_ulog_proxy_timeout_seconds(),
     )
     try:
         response = await client.send(request, stream=True)
     except Exception as exc:
-        await client.aclose()
         raise DroneProxyUnavailableError(str(exc)) from exc
 
     if response.status_code >= 400:
+        await response.aread()
         detail = _extract_error_detail(response)
         await response.aclose()
-        await client.aclose()
         raise DroneProxyResponseError(response.status_code, detail)
 
-    return client, response
+    return response
 
 
 def _download_job(payload: dict, *, expected_job_id: str | None = None) -> dict[str, Any]:
@@ -849,14 +914,19 @@ def _fetch_drone_ulog_summary_fallback(
     )
 
 
-def stream_drone_logs(
+async def stream_drone_logs(
     drone_ip: str,
     drone_id: int,
     level: str | None = None,
     component: str | None = None,
     source: str | None = None,
 ):
-    """Proxy SSE from a drone as a synchronous iterator for StreamingResponse."""
+    """Proxy SSE from a drone as an async iterator for StreamingResponse.
+
+    Events are pulled from the drone only as fast as the browser consumes
+    them, and the tail holds one connection from the drone's streaming pool
+    instead of a threadpool worker.
+    """
     params: dict = {}
     if level:
         params["level"] = level
@@ -865,20 +935,16 @@ def stream_drone_logs(
     if source:
         params["source"] = source
     try:
-        with httpx.Client(timeout=None) as client:
-            with client.stream(
-                "GET",
-                _build_drone_url(drone_ip, "/api/logs/stream"),
-                params=params,
-            ) as resp:
-                resp.raise_for_status()
-                for line in resp.iter_lines():
-                    if isinstance(line, bytes):
-                        line = line.decode("utf-8", errors="replace")
-                    if line.startswith("data: "):
-                        yield line + "\n\n"
-    except GeneratorExit:
-        return
+        async with _drone_client(drone_ip, streaming=True).stream(
+            "GET",
+            _build_drone_url(drone_ip, "/api/logs/stream"),
+            params=params,
+            timeout=httpx.Timeout(_TIMEOUT, read=None),
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if line.startswith("data: "):
+                    yield line + "\n\n"
     except Exception as e:
         error = build_log_entry(
             level="WARNING",
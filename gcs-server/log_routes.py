@@ -566,7 +566,7 @@ def create_log_router(
             raise HTTPException(status_code=404, detail=f"Drone {drone_id} not found in config")
 
         try:
-            client, upstream = await open_drone_ulog_download_stream(
+            upstream = await open_drone_ulog_download_stream(
                 ip,
                 resolved.node_job_id,
                 access_token=resolved.access_token,
@@ -585,7 +585,6 @@ def create_log_router(
                 declared_size = -1
             if declared_size < 0 or declared_size > max_bytes:
                 await upstream.aclose()
-                await client.aclose()
                 raise HTTPException(
                     status_code=413,
                     detail=f"ULog content exceeds MDS_ULOG_DOWNLOAD_MAX_BYTES ({max_bytes} bytes)",
@@ -606,7 +605,6 @@ def create_log_router(
                     yield chunk
             finally:
                 await upstream.aclose()
-                await client.aclose()
 
         response_headers = {}
         content_disposition = upstream.headers.get("content-disposition")
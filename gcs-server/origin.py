@@ -8,9 +8,8 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from params import Params
-from pyproj import Proj, Transformer
-from scipy.optimize import minimize
 from coordinate_utils import get_expected_position_from_trajectory
+from origin_solver import fit_origin, solve_origin_from_fix
 from mds_logging import get_logger
 from origin_reference import (
     OriginReferenceError,
@@ -214,6 +213,7 @@ def build_position_deviation_report(
     trajectory_resolver=None,
 ):
     """Build the richer deviation payload exposed by the GCS API."""
+    import numpy as np
     import pymap3d as pm
 
     deviations = {}
@@ -244,6 +244,9 @@ def build_position_deviation_report(
         )
     )
 
+    # Resolve every drone first so the geodetic conversions below run as one
+    # vectorized pymap3d call for the fleet instead of two calls per drone.
+    rows = []
     for drone in drones_config:
         hw_id = drone.get('hw_id')
         pos_id = drone.get('pos_id', hw_id)
@@ -252,7 +255,68 @@ def build_position_deviation_report(
             continue
 
         expected_north, expected_east = resolve_trajectory(pos_id, sim_mode)
+        rows.append((hw_id, pos_id, expected_north, expected_east))
+
+    resolved = [
+        index for index, row in enumerate(rows)
+        if row[2] is not None and row[3] is not None
+    ]
+    expected_geodetic = {}
+    conversion_error = None
+    if resolved:
+        try:
+            expected_lats, expected_lons, _expected_alts = pm.ned2geodetic(
+                np.array([rows[index][2] for index in resolved], dtype=float),
+                np.array([rows[index][3] for index in resolved], dtype=float),
+                0.0,
+                origin_lat,
+                origin_lon,
+                origin_alt,
+            )
+            for index, lat, lon in zip(
+                resolved,
+                np.atleast_1d(expected_lats),
+                np.atleast_1d(expected_lons),
+            ):
+                expected_geodetic[index] = (float(lat), float(lon))
+        except Exception as exc:
+            conversion_error = exc
+
+    now_ms = int(time.time() * 1000)
+    positions = {}
+    for index in expected_geodetic:
+        hw_id = rows[index][0]
+        drone_telemetry = _get_telemetry_record_for_hw_id(telemetry_data_all_drones, hw_id)
+        try:
+            positions[index] = validate_fresh_global_position(
+                drone_telemetry,
+                hw_id=hw_id,
+                now_ms=now_ms,
+                max_age_ms=position_max_age_ms,
+                require_disarmed=False,
+            )
+        except OriginReferenceError as exc:
+            positions[index] = exc
+
+    fixed = [index for index, position in positions.items() if isinstance(position, dict)]
+    current_ned = {}
+    if fixed:
+        current_norths, current_easts, _current_downs = pm.geodetic2ned(
+            np.array([positions[index]['latitude'] for index in fixed], dtype=float),
+            np.array([positions[index]['longitude'] for index in fixed], dtype=float),
+            origin_alt,
+            origin_lat,
+            origin_lon,
+            origin_alt,
+        )
+        for index, north, east in zip(
+            fixed,
+            np.atleast_1d(current_norths),
+            np.atleast_1d(current_easts),
+        ):
+            current_ned[index] = (float(north), float(east))
 
+    for index, (hw_id, pos_id, expected_north, expected_east) in enumerate(rows):
         if expected_north is None or expected_east is None:
             deviations[hw_id] = {
                 'hw_id': hw_id,
@@ -263,64 +327,39 @@ def build_position_deviation_report(
             summary_stats['errors'] += 1
             continue
 
-        try:
-            expected_lat, expected_lon, expected_alt = pm.ned2geodetic(
-                expected_north,
-                expected_east,
-                0,
-                origin_lat,
-                origin_lon,
-                origin_alt,
-            )
-        except Exception as exc:
+        if index not in expected_geodetic:
             deviations[hw_id] = {
                 'hw_id': hw_id,
                 'pos_id': pos_id,
                 'status': 'error',
-                'message': f'Coordinate conversion error: {exc}',
+                'message': f'Coordinate conversion error: {conversion_error}',
             }
             summary_stats['errors'] += 1
             continue
 
-        drone_telemetry = _get_telemetry_record_for_hw_id(telemetry_data_all_drones, hw_id)
-        try:
-            position = validate_fresh_global_position(
-                drone_telemetry,
-                hw_id=hw_id,
-                now_ms=int(time.time() * 1000),
-                max_age_ms=position_max_age_ms,
-                require_disarmed=False,
-            )
-        except OriginReferenceError as exc:
+        expected_lat, expected_lon = expected_geodetic[index]
+        expected = {
+            'lat': expected_lat,
+            'lon': expected_lon,
+            'north': expected_north,
+            'east': expected_east,
+        }
+
+        position = positions[index]
+        if isinstance(position, OriginReferenceError):
             deviations[hw_id] = {
                 'hw_id': hw_id,
                 'pos_id': pos_id,
-                'expected': {
-                    'lat': expected_lat,
-                    'lon': expected_lon,
-                    'north': expected_north,
-                    'east': expected_east,
-                },
+                'expected': expected,
                 'current': None,
                 'deviation': None,
                 'status': 'no_telemetry',
-                'message': exc.message,
+                'message': position.message,
             }
             summary_stats['no_telemetry'] += 1
             continue
 
-        current_lat = position['latitude']
-        current_lon = position['longitude']
-
-        current_north, current_east, _current_down = pm.geodetic2ned(
-            current_lat,
-            current_lon,
-            origin_alt,
-            origin_lat,
-            origin_lon,
-            origin_alt,
-        )
-
+        current_north, current_east = current_ned[index]
         deviation_north = current_north - expected_north
         deviation_east = current_east - expected_east
         deviation_horizontal = math.sqrt(deviation_north ** 2 + deviation_east ** 2)
@@ -350,15 +389,10 @@ def build_position_deviation_report(
         deviations[hw_id] = {
             'hw_id': hw_id,
             'pos_id': pos_id,
-            'expected': {
-                'lat': expected_lat,
-                'lon': expected_lon,
-                'north': expected_north,
-                'east': expected_east,
-            },
+            'expected': expected,
             'current': {
-                'lat': current_lat,
-                'lon': current_lon,
+                'lat': position['latitude'],
+                'lon': position['longitude'],
                 'north': current_north,
                 'east': current_east,
                 'position_source': position['position_source'],
@@ -465,80 +499,120 @@ def build_desired_launch_positions_report(
 def compute_origin_from_drone(current_lat, current_lon, intended_north, intended_east):
     """
     Computes the origin lat/lon based on the drone's current lat/lon and intended N,E positions.
+
+    Solved directly on the NED tangent plane (see `origin_solver`) instead of
+    iterating a numerical optimizer over per-evaluation projections.
     """
     try:
-        logger.info(f"Starting origin computation with current_lat={current_lat}, current_lon={current_lon}, intended_north={intended_north}, intended_east={intended_east}")
-
-        # Define the error function to minimize
-        def error_function(origin_coords):
-            try:
-                origin_lat, origin_lon = origin_coords
-
-                # Define the projection
-                proj_string = f"+proj=tmerc +lat_0={origin_lat} +lon_0={origin_lon} +k=1 +units=m +ellps=WGS84"
-                transformer = Transformer.from_proj(
-                    Proj('epsg:4326'),  # WGS84
-                    Proj(proj_string),
-                    always_xy=True
-                )
-
-                # Compute N,E positions of the drone's current lat/lon relative to this origin
-                east, north = transformer.transform(current_lon, current_lat)
-
-                # Compute the difference between computed N,E and intended N,E
-                delta_north = north - intended_north
-                delta_east = east - intended_east
-
-                error = delta_north ** 2 + delta_east ** 2
-
-                logger.debug(f"Origin ({origin_lat}, {origin_lon}): Delta N={delta_north}, Delta E={delta_east}, Error={error}")
-
-                return error
-            except Exception as e:
-                logger.error(f"Exception in error_function with origin_coords={origin_coords}: {e}", exc_info=True)
-                return 1e10  # Return a large error to penalize invalid origins
-
-        # Initial guess for the origin is the drone's current position
-        initial_guess = [current_lat, current_lon]
-        logger.debug(f"Initial guess for origin: {initial_guess}")
-
-        # Set bounds for latitude and longitude
-        bounds = [(-90, 90), (-180, 180)]
-
-        # Use scipy.optimize to minimize the error function
-        result = minimize(
-            error_function,
-            initial_guess,
-            method='L-BFGS-B',
-            bounds=bounds
+        origin_lat, origin_lon = solve_origin_from_fix(
+            float(current_lat),
+            float(current_lon),
+            float(intended_north),
+            float(intended_east),
         )
+    except Exception as e:
+        logger.error(f"Error computing origin from drone: {e}", exc_info=True)
+        raise
+
+    logger.info(f"Origin computed successfully: ({origin_lat}, {origin_lon})")
+    return origin_lat, origin_lon
 
-        logger.info(f"Optimization result: {result}")
 
-        solution_error = float(result.fun) if getattr(result, 'fun', None) is not None else float('inf')
-        solution_coords = getattr(result, 'x', None)
-        has_finite_solution = (
-            solution_coords is not None
-            and len(solution_coords) == 2
-            and math.isfinite(solution_coords[0])
-            and math.isfinite(solution_coords[1])
+def build_fleet_origin_fit_report(
+    telemetry_data_all_drones,
+    drones_config,
+    *,
+    solve_heading: bool = False,
+    heading_deg: float = 0.0,
+    trajectory_resolver=None,
+):
+    """Fit one shared origin (and optionally heading) to every fresh drone fix.
+
+    Drones without a trajectory start or a fresh global position are reported
+    as skipped instead of failing the fit.
+    """
+    sim_mode = getattr(Params, 'sim_mode', False)
+    resolve_trajectory = trajectory_resolver or (
+        lambda pos_id, current_sim_mode: get_expected_position_from_trajectory(
+            pos_id,
+            current_sim_mode,
+            base_dir=BASE_DIR,
         )
-        acceptable_residual = solution_error <= 1e-6
-
-        if result.success or (has_finite_solution and acceptable_residual):
-            origin_lat, origin_lon = result.x
-            if not result.success:
-                logger.warning(
-                    "Accepting origin optimization despite non-success status because residual is within tolerance: %s (fun=%s)",
-                    result.message,
-                    solution_error,
-                )
-            logger.info(f"Origin computed successfully: ({origin_lat}, {origin_lon})")
-            return origin_lat, origin_lon
-        else:
-            logger.error(f"Optimization failed: {result.message}")
-            raise Exception(f"Optimization failed: {result.message}")
+    )
+    position_max_age_ms = max(
+        1,
+        int(float(getattr(Params, 'LOCAL_MAVLINK_STALE_TIMEOUT_SEC', 15)) * 1000),
+    )
+    now_ms = int(time.time() * 1000)
 
-    except Exception as e:
-        logger.error(f"Error computing origin from drone: {e}", exc_info=True)
-        raise
+    keys, latitudes, longitudes, norths, easts = [], [], [], [], []
+    pos_ids = {}
+    skipped = []
+    for drone in drones_config:
+        hw_id = drone.get('hw_id')
+        pos_id = drone.get('pos_id', hw_id)
+        if not hw_id:
+            continue
+
+        expected_north, expected_east = resolve_trajectory(pos_id, sim_mode)
+        if expected_north is None or expected_east is None:
+            skipped.append({'hw_id': hw_id, 'pos_id': pos_id, 'reason': 'trajectory_missing'})
+            continue
+
+        try:
+            position = validate_fresh_global_position(
+                _get_telemetry_record_for_hw_id(telemetry_data_all_drones, hw_id),
+                hw_id=hw_id,
+                now_ms=now_ms,
+                max_age_ms=position_max_age_ms,
+                require_disarmed=False,
+            )
+        except OriginReferenceError as exc:
+            skipped.append({'hw_id': hw_id, 'pos_id': pos_id, 'reason': exc.code})
+            continue
+
+        keys.append(hw_id)
+        pos_ids[hw_id] = pos_id
+        latitudes.append(position['latitude'])
+        longitudes.append(position['longitude'])
+        norths.append(float(expected_north))
+        easts.append(float(expected_east))
+
+    if not keys:
+        raise ValueError("No drones with both a trajectory start and a fresh global position")
+
+    fit = fit_origin(
+        latitudes,
+        longitudes,
+        norths,
+        easts,
+        keys=keys,
+        solve_heading=solve_heading,
+        heading_deg=heading_deg,
+    )
+    return {
+        'status': 'success',
+        'origin': {
+            'lat': fit.origin_lat,
+            'lon': fit.origin_lon,
+        },
+        'heading': fit.heading_deg,
+        'heading_solved': fit.heading_solved,
+        'residuals': {
+            residual.key: {
+                'hw_id': residual.key,
+                'pos_id': pos_ids[residual.key],
+                'north': residual.north_m,
+                'east': residual.east_m,
+                'horizontal': residual.horizontal_m,
+            }
+            for residual in fit.residuals
+        },
+        'summary': {
+            'fitted_drones': fit.drone_count,
+            'skipped_drones': len(skipped),
+            'rms_residual': fit.rms_m,
+            'max_residual': fit.max_m,
+        },
+        'skipped': skipped,
+    }
@@ -0,0 +1,166 @@
+"""Formation origin estimation from GPS fixes and expected launch offsets.
+
+The GCS defines launch geometry as local North/East offsets from a shared
+origin on the WGS84 tangent plane (the same `pymap3d` NED model used by the
+deviation and launch-position reports). Estimating the origin is therefore a
+rigid 2-D fit: project every fix into a local frame, solve for the translation
+(and optionally the formation heading) in closed form, then re-centre the frame
+on the estimate. Two or three re-centring passes converge far below GPS noise,
+and every pass is a single vectorized `pymap3d` call for the whole fleet.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import pymap3d as pm
+
+DEFAULT_RECENTER_ITERATIONS = 3
+_MIN_HEADING_SPREAD_M2 = 1e-6
+
+
+@dataclass(frozen=True)
+class OriginFitResidual:
+    key: Any
+    north_m: float
+    east_m: float
+    horizontal_m: float
+
+
+@dataclass(frozen=True)
+class OriginFit:
+    origin_lat: float
+    origin_lon: float
+    heading_deg: float
+    heading_solved: bool
+    residuals: tuple[OriginFitResidual, ...]
+    rms_m: float
+    max_m: float
+
+    @property
+    def drone_count(self) -> int:
+        return len(self.residuals)
+
+
+def rotate_offsets(
+    north: np.ndarray,
+    east: np.ndarray,
+    heading_deg: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized clockwise heading rotation matching `origin.rotate_north_east`."""
+    heading_rad = math.radians(float(heading_deg) % 360.0)
+    cos_h = math.cos(heading_rad)
+    sin_h = math.sin(heading_rad)
+    return north * cos_h - east * sin_h, north * sin_h + east * cos_h
+
+
+def fit_origin(
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    norths: Sequence[float],
+    easts: Sequence[float],
+    *,
+    keys: Iterable[Any] | None = None,
+    solve_heading: bool = False,
+    heading_deg: float = 0.0,
+    iterations: int = DEFAULT_RECENTER_ITERATIONS,
+) -> OriginFit:
+    """Least-squares shared origin (and optional heading) for N drones.
+
+    `norths`/`easts` are the un-rotated expected offsets (trajectory start
+    positions). With `solve_heading=False` the fixed `heading_deg` rotation is
+    applied; otherwise the heading is estimated from the fleet geometry and
+    requires at least two distinct expected positions.
+    """
+    lat = np.asarray(latitudes, dtype=float)
+    lon = np.asarray(longitudes, dtype=float)
+    q_north = np.asarray(norths, dtype=float)
+    q_east = np.asarray(easts, dtype=float)
+    count = lat.size
+    if count == 0 or not (lon.size == q_north.size == q_east.size == count):
+        raise ValueError("origin fit requires matching, non-empty fix and offset arrays")
+    if not (
+        np.all(np.isfinite(lat))
+        and np.all(np.isfinite(lon))
+        and np.all(np.isfinite(q_north))
+        and np.all(np.isfinite(q_east))
+    ):
+        raise ValueError("origin fit inputs must be finite")
+
+    key_list = list(keys) if keys is not None else list(range(count))
+    if len(key_list) != count:
+        raise ValueError("origin fit keys must match the number of fixes")
+
+    if solve_heading:
+        centered_spread = float(np.sum((q_north - q_north.mean()) ** 2 + (q_east - q_east.mean()) ** 2))
+        if count < 2 or centered_spread < _MIN_HEADING_SPREAD_M2:
+            raise ValueError("heading estimation requires at least two distinct expected positions")
+
+    ref_lat = float(lat.mean())
+    ref_lon = float(lon.mean())
+    heading = float(heading_deg) % 360.0
+    residual_north = np.zeros(count)
+    residual_east = np.zeros(count)
+
+    for _ in range(max(1, int(iterations))):
+        p_north, p_east, _down = pm.geodetic2ned(lat, lon, 0.0, ref_lat, ref_lon, 0.0)
+        p_north = np.asarray(p_north, dtype=float)
+        p_east = np.asarray(p_east, dtype=float)
+
+        if solve_heading:
+            qc_north = q_north - q_north.mean()
+            qc_east = q_east - q_east.mean()
+            pc_north = p_north - p_north.mean()
+            pc_east = p_east - p_east.mean()
+            cross = float(np.sum(qc_north * pc_east - qc_east * pc_north))
+            dot = float(np.sum(qc_north * pc_north + qc_east * pc_east))
+            heading = math.degrees(math.atan2(cross, dot)) % 360.0
+
+        r_north, r_east = rotate_offsets(q_north, q_east, heading)
+        t_north = float(np.mean(p_north - r_north))
+        t_east = float(np.mean(p_east - r_east))
+        residual_north = p_north - (t_north + r_north)
+        residual_east = p_east - (t_east + r_east)
+
+        next_lat, next_lon, _alt = pm.ned2geodetic(t_north, t_east, 0.0, ref_lat, ref_lon, 0.0)
+        ref_lat = float(next_lat)
+        ref_lon = float(next_lon)
+
+    if not (math.isfinite(ref_lat) and math.isfinite(ref_lon)):
+        raise ValueError("origin fit produced a non-finite solution")
+
+    horizontal = np.hypot(residual_north, residual_east)
+    residuals = tuple(
+        OriginFitResidual(
+            key=key,
+            north_m=float(north),
+            east_m=float(east),
+            horizontal_m=float(distance),
+        )
+        for key, north, east, distance in zip(key_list, residual_north, residual_east, horizontal)
+    )
+    return OriginFit(
+        origin_lat=ref_lat,
+        origin_lon=ref_lon,
+        heading_deg=heading,
+        heading_solved=bool(solve_heading),
+        residuals=residuals,
+        rms_m=float(np.sqrt(np.mean(horizontal ** 2))),
+        max_m=float(np.max(horizontal)),
+    )
+
+
+def solve_origin_from_fix(
+    latitude: float,
+    longitude: float,
+    north: float,
+    east: float,
+    *,
+    iterations: int = DEFAULT_RECENTER_ITERATIONS,
+) -> tuple[float, float]:
+    """Origin whose NED frame places one GPS fix at `(north, east)`."""
+    fit = fit_origin([latitude], [longitude], [north], [east], iterations=iterations)
+    return fit.origin_lat, fit.origin_lon
@@ -36,6 +36,7 @@ from src.px4_param_models import (
     Px4ParamSnapshotRowsResponse,
 )
 from src.px4_params.service import Px4ParamService
+from fleet_config_snapshot import normalize_fleet_key
 
 
 _SNAPSHOT_STORE: dict[str, Px4ParamSnapshotResponse] = {}
@@ -154,16 +155,23 @@ def build_snapshot_rows_response(snapshot_id: str) -> Px4ParamSnapshotRowsRespon
     )
 
 
+def _fleet_lookup(deps: Any) -> Any:
+    """Prefer the cached hw_id index; plain `load_config` deps still work."""
+    snapshot_loader = getattr(deps, "get_fleet_config_snapshot", None)
+    if callable(snapshot_loader):
+        return snapshot_loader().by_hw_id
+    return {normalize_fleet_key(drone["hw_id"]): drone for drone in deps.load_config()}
+
+
 def fetch_snapshots_for_targets(deps: Any, request: Px4ParamFleetSnapshotRequest) -> Px4ParamFleetSnapshotResponse:
-    drones = deps.load_config()
-    lookup = {str(drone["hw_id"]): drone for drone in drones}
+    lookup = _fleet_lookup(deps)
     snapshots = []
     errors = []
     timeout_sec = float(getattr(deps.Params, "PX4_PARAMETER_HTTP_TIMEOUT_SEC", 20.0))
     port = int(getattr(deps.Params, "drone_api_port", 7070))
 
     for hw_id in request.hw_ids:
-        drone = lookup.get(str(hw_id))
+        drone = lookup.get(normalize_fleet_key(hw_id))
         if drone is None:
             errors.append(Px4ParamFleetSnapshotError(hw_id=str(hw_id), error="Target drone not found in config"))
             continue
@@ -198,9 +206,7 @@ def fetch_snapshots_for_targets(deps: Any, request: Px4ParamFleetSnapshotRequest
 
 
 def _resolve_target_drone(deps: Any, hw_id: str) -> dict[str, Any] | None:
-    drones = deps.load_config()
-    lookup = {str(drone["hw_id"]): drone for drone in drones}
-    return lookup.get(str(hw_id))
+    return _fleet_lookup(deps).get(normalize_fleet_key(hw_id))
 
 
 def _build_drone_api_url(ip: str, port: int, route: str) -> str:
@@ -21,6 +21,7 @@ import pymap3d
 # Shapely is only needed on GCS server, not on drones.
 # Graceful import so drone-side code that imports enums/schemas won't break.
 try:
+    import shapely
     from shapely.geometry import Polygon as ShapelyPolygon, LineString, MultiLineString
     from shapely.ops import split
     SHAPELY_AVAILABLE = True
@@ -36,6 +37,9 @@ from mds_logging import get_logger
 
 logger = get_logger("coverage_planner")
 
+EARTH_RADIUS_M = 6371000
+_CLIPPED_LINE_TYPE_IDS = (1, 5)  # shapely LineString, MultiLineString
+
 
 def _require_shapely():
     """Raise clear error if shapely not installed."""
@@ -81,8 +85,8 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
     4. Clip lines to polygon boundary
     5. Connect into boustrophedon path (alternating direction)
     6. Partition sweep lines among N drones (equal path length)
-    7. Assign sectors to drones by GPS proximity
-    8. Convert back to lat/lng
+    7. Convert back to lat/lng
+    8. Assign sectors to drones by GPS proximity or min-max completion time
     9. Add transit waypoints (takeoff -> sector entry, sector exit -> return)
     """
 
@@ -100,15 +104,17 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
             raise ValueError("At least one drone position required")
 
         # Step 1: Compute centroid as ENU origin
-        origin_lat = np.mean([p.lat for p in polygon_points])
-        origin_lng = np.mean([p.lng for p in polygon_points])
+        polygon_lats = np.array([p.lat for p in polygon_points], dtype=float)
+        polygon_lngs = np.array([p.lng for p in polygon_points], dtype=float)
+        origin_lat = np.mean(polygon_lats)
+        origin_lng = np.mean(polygon_lngs)
         origin_alt = 0.0
 
-        # Step 2: Convert polygon to ENU
-        enu_points = []
-        for p in polygon_points:
-            e, n, u = pymap3d.geodetic2enu(p.lat, p.lng, 0, origin_lat, origin_lng, origin_alt)
-            enu_points.append((e, n))
+        # Step 2: Convert polygon to ENU (one vectorized call for all vertices)
+        east, north, _ = pymap3d.geodetic2enu(
+            polygon_lats, polygon_lngs, 0, origin_lat, origin_lng, origin_alt
+        )
+        enu_points = list(zip(np.atleast_1d(east).tolist(), np.atleast_1d(north).tolist()))
 
         polygon = ShapelyPolygon(enu_points)
         if not polygon.is_valid:
@@ -133,37 +139,50 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
         partitions = self._partition_lines(boustrophedon_lines, n_drones)
 
         # Step 7: Convert drone positions to ENU
-        drone_enu = {}
-        for pos_id, (lat, lng) in drone_positions.items():
-            e, n, u = pymap3d.geodetic2enu(lat, lng, 0, origin_lat, origin_lng, origin_alt)
-            drone_enu[pos_id] = (e, n)
+        drone_ids = list(drone_positions.keys())
+        drone_east, drone_north, _ = pymap3d.geodetic2enu(
+            np.array([drone_positions[pos_id][0] for pos_id in drone_ids], dtype=float),
+            np.array([drone_positions[pos_id][1] for pos_id in drone_ids], dtype=float),
+            0, origin_lat, origin_lng, origin_alt,
+        )
+        drone_enu = {
+            pos_id: (float(e), float(n))
+            for pos_id, e, n in zip(drone_ids, np.atleast_1d(drone_east), np.atleast_1d(drone_north))
+        }
+
+        # Step 8: Convert every sector's survey vertices back to lat/lng in one call
+        sector_geodetic = self._sectors_to_geodetic(partitions, origin_lat, origin_lng, origin_alt)
+        route_lengths, transit_lengths = self._sector_distances(
+            sector_geodetic, [drone_positions[pos_id] for pos_id in drone_ids]
+        )
 
-        # Step 8: Assign sectors to drones by proximity (greedy nearest-match)
-        assignments = self._assign_sectors(partitions, drone_enu)
+        # Step 9: Assign sectors to drones (greedy nearest-match or min-max completion time)
+        if config.sector_assignment == "makespan":
+            costs = (
+                transit_lengths / config.cruise_speed_ms
+                + route_lengths[np.newaxis, :] / config.survey_speed_ms
+            )
+            assignments = self._assign_sectors_makespan(partitions, drone_enu, costs)
+        else:
+            assignments = self._assign_sectors(partitions, drone_enu)
+        sector_index = {id(part): idx for idx, part in enumerate(partitions)}
 
-        # Step 9: Build per-drone plans
+        # Step 10: Build per-drone plans
         plans = []
-        for pos_id, hw_id_str in drone_positions.items():
-            if pos_id not in assignments:
+        for drone_row, pos_id in enumerate(drone_ids):
+            sector_lines = assignments.get(pos_id)
+            if not sector_lines:
                 continue
-            sector_lines = assignments[pos_id]
-            drone_lat, drone_lng = drone_positions[pos_id]
-
-            waypoints = self._build_waypoints(
-                sector_lines, origin_lat, origin_lng, origin_alt,
-                config, drone_lat, drone_lng
-            )
-
+            sector = sector_index[id(sector_lines)]
+            lats, lngs = sector_geodetic[sector]
+            waypoints = self._build_waypoints(lats, lngs, config)
             if not waypoints:
                 continue
 
-            total_distance = self._compute_total_distance(waypoints)
-            survey_distance = sum(
-                self._haversine_m(waypoints[i].lat, waypoints[i].lng, waypoints[i+1].lat, waypoints[i+1].lng)
-                for i in range(len(waypoints)-1) if waypoints[i].is_survey_leg
-            )
+            total_distance = float(route_lengths[sector])
             assigned_area = total_area_sq_m * (len(sector_lines) / max(len(boustrophedon_lines), 1))
             est_duration = total_distance / config.survey_speed_ms if config.survey_speed_ms > 0 else 0
+            transit_distance = float(transit_lengths[drone_row, sector])
 
             plan = DroneCoveragePlan(
                 hw_id=str(pos_id),  # Will be updated with real hw_id in routes
@@ -172,6 +191,8 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
                 assigned_area_sq_m=assigned_area,
                 estimated_duration_s=est_duration,
                 total_distance_m=total_distance,
+                transit_distance_m=transit_distance,
+                predicted_completion_s=transit_distance / config.cruise_speed_ms + est_duration,
             )
             plans.append(plan)
 
@@ -179,76 +200,115 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
 
     def _compute_sweep_angle(self, enu_points: List[Tuple[float, float]]) -> float:
         """Compute optimal sweep angle aligned with the longest polygon edge."""
-        max_length = 0
-        best_angle = 0
-        n = len(enu_points)
-        for i in range(n):
-            j = (i + 1) % n
-            dx = enu_points[j][0] - enu_points[i][0]
-            dy = enu_points[j][1] - enu_points[i][1]
-            length = math.hypot(dx, dy)
-            if length > max_length:
-                max_length = length
-                best_angle = math.atan2(dy, dx)
-        return best_angle
+        points = np.asarray(enu_points, dtype=float)
+        deltas = np.roll(points, -1, axis=0) - points
+        lengths = np.hypot(deltas[:, 0], deltas[:, 1])
+        best = int(np.argmax(lengths))
+        if not lengths[best] > 0:
+            return 0
+        return math.atan2(deltas[best, 1], deltas[best, 0])
 
     def _generate_sweep_lines(
         self, polygon: 'ShapelyPolygon', angle: float, spacing: float
     ) -> List[LineString]:
-        """Generate parallel sweep lines across the polygon at the given angle."""
+        """Generate parallel sweep lines across the polygon at the given angle.
+
+        Sweep lines are clipped with a vectorized scanline over the polygon
+        edges in the rotated frame. Lines that pass exactly through a vertex
+        are clipped by shapely instead so boundary-touching cases keep the
+        same geometry as a plain ``polygon.intersection(line)``.
+        """
         # Rotate polygon to align sweep direction with x-axis
         cos_a, sin_a = math.cos(-angle), math.sin(-angle)
 
         # Get polygon bounds in rotated frame
-        coords = list(polygon.exterior.coords)
-        rotated = [(x * cos_a - y * sin_a, x * sin_a + y * cos_a) for x, y in coords]
-
-        min_y = min(p[1] for p in rotated)
-        max_y = max(p[1] for p in rotated)
-        min_x = min(p[0] for p in rotated) - 10  # Extend beyond bounds
-        max_x = max(p[0] for p in rotated) + 10
-
-        # Generate lines in rotated frame, then rotate back
-        lines = []
-        y = min_y + spacing / 2
-        cos_a_inv, sin_a_inv = math.cos(angle), math.sin(angle)
-
-        while y <= max_y:
-            # Line endpoints in rotated frame
-            x1, y1 = min_x, y
-            x2, y2 = max_x, y
+        coords = shapely.get_coordinates(polygon.exterior)
+        rotated_x = coords[:, 0] * cos_a - coords[:, 1] * sin_a
+        rotated_y = coords[:, 0] * sin_a + coords[:, 1] * cos_a
 
-            # Rotate back to original frame
-            rx1 = x1 * cos_a_inv - y1 * sin_a_inv
-            ry1 = x1 * sin_a_inv + y1 * cos_a_inv
-            rx2 = x2 * cos_a_inv - y2 * sin_a_inv
-            ry2 = x2 * sin_a_inv + y2 * cos_a_inv
+        min_y = rotated_y.min()
+        max_y = rotated_y.max()
+        min_x = rotated_x.min() - 10  # Extend beyond bounds
+        max_x = rotated_x.max() + 10
 
-            line = LineString([(rx1, ry1), (rx2, ry2)])
-            clipped = polygon.intersection(line)
-
-            if clipped.is_empty:
-                y += spacing
-                continue
-
-            if isinstance(clipped, LineString):
-                lines.append(clipped)
-            elif isinstance(clipped, MultiLineString):
-                lines.extend(list(clipped.geoms))
-
-            y += spacing
+        first_y = min_y + spacing / 2
+        if first_y > max_y:
+            return []
+        # Accumulate offsets exactly like stepping `y += spacing` line by line.
+        count = int(math.floor((max_y - first_y) / spacing)) + 2
+        offsets = np.cumsum(np.concatenate(([first_y], np.full(count - 1, spacing))))
+        offsets = offsets[offsets <= max_y]
+
+        # Polygon edges (exterior and holes) in the rotated frame
+        starts, ends = [], []
+        for ring in shapely.get_rings(polygon):
+            ring_coords = shapely.get_coordinates(ring)
+            ring_rotated = np.column_stack((
+                ring_coords[:, 0] * cos_a - ring_coords[:, 1] * sin_a,
+                ring_coords[:, 0] * sin_a + ring_coords[:, 1] * cos_a,
+            ))
+            starts.append(ring_rotated[:-1])
+            ends.append(ring_rotated[1:])
+        starts = np.concatenate(starts)
+        ends = np.concatenate(ends)
+        degenerate = np.isin(offsets, starts[:, 1])
+
+        # Each edge crosses the lines in its half-open [low_y, high_y) band
+        low_y = np.minimum(starts[:, 1], ends[:, 1])
+        high_y = np.maximum(starts[:, 1], ends[:, 1])
+        first_line = np.searchsorted(offsets, low_y, side='left')
+        crossings = np.searchsorted(offsets, high_y, side='left') - first_line
+        edge_index = np.repeat(np.arange(len(starts)), crossings)
+        run_starts = np.repeat(np.cumsum(crossings) - crossings, crossings)
+        line_index = np.arange(edge_index.size) - run_starts + np.repeat(first_line, crossings)
+
+        y = offsets[line_index]
+        edge_start = starts[edge_index]
+        edge_end = ends[edge_index]
+        x = edge_start[:, 0] + (y - edge_start[:, 1]) * (
+            (edge_end[:, 0] - edge_start[:, 0]) / (edge_end[:, 1] - edge_start[:, 1])
+        )
 
-        return lines
+        # Crossings pair up left-to-right along every line (even-odd rule)
+        order = np.lexsort((x, line_index))
+        x = x[order]
+        line_index = line_index[order]
+        segment_line = line_index[0::2]
+        segment_x = np.column_stack((x[0::2], x[1::2]))
+        keep = (segment_x[:, 1] > segment_x[:, 0]) & ~degenerate[segment_line]
+        segment_line = segment_line[keep]
+        segment_x = segment_x[keep]
+
+        # Segment endpoints rotated back to the original frame
+        cos_a_inv, sin_a_inv = math.cos(angle), math.sin(angle)
+        segment_y = offsets[segment_line][:, None]
+        segments = np.stack((
+            segment_x * cos_a_inv - segment_y * sin_a_inv,
+            segment_x * sin_a_inv + segment_y * cos_a_inv,
+        ), axis=-1)
+        geometries = shapely.linestrings(segments) if len(segments) else np.empty(0, dtype=object)
+
+        if degenerate.any():
+            vertex_lines = np.flatnonzero(degenerate)
+            vertex_segments = np.empty((vertex_lines.size, 2, 2))
+            for column, line_x in enumerate((min_x, max_x)):
+                vertex_segments[:, column, 0] = line_x * cos_a_inv - offsets[vertex_lines] * sin_a_inv
+                vertex_segments[:, column, 1] = line_x * sin_a_inv + offsets[vertex_lines] * cos_a_inv
+            clipped = shapely.intersection(polygon, shapely.linestrings(vertex_segments))
+            line_parts = ~shapely.is_empty(clipped) & np.isin(shapely.get_type_id(clipped), _CLIPPED_LINE_TYPE_IDS)
+            parts, part_index = shapely.get_parts(clipped[line_parts], return_index=True)
+            geometries = np.concatenate((geometries, parts))
+            segment_line = np.concatenate((segment_line, vertex_lines[line_parts][part_index]))
+            geometries = geometries[np.argsort(segment_line, kind='stable')]
+
+        return list(geometries)
 
     def _build_boustrophedon(self, lines: List[LineString]) -> List[LineString]:
         """Alternate direction of sweep lines for efficient coverage."""
-        result = []
-        for i, line in enumerate(lines):
-            coords = list(line.coords)
-            if i % 2 == 1:
-                coords.reverse()
-            result.append(LineString(coords))
-        return result
+        geometries = np.empty(len(lines), dtype=object)
+        geometries[:] = lines
+        geometries[1::2] = shapely.reverse(geometries[1::2])
+        return list(geometries)
 
     def _partition_lines(self, lines: List[LineString], n: int) -> List[List[LineString]]:
         """Partition sweep lines into n groups with roughly equal total path length."""
@@ -258,7 +318,7 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
             return [lines]
 
         # Compute cumulative lengths
-        lengths = [line.length for line in lines]
+        lengths = shapely.length(np.asarray(lines, dtype=object)).tolist() if lines else []
         total_length = sum(lengths)
         target_per_group = total_length / n
 
@@ -323,48 +383,133 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
 
         return assignments
 
-    def _build_waypoints(
+    def _assign_sectors_makespan(
+        self,
+        partitions: List[List[LineString]],
+        drone_enu: Dict[str, Tuple[float, float]],
+        costs: np.ndarray,
+    ) -> Dict[str, List[LineString]]:
+        """Assign sectors to minimize the slowest drone's completion time.
+
+        Solves a bottleneck assignment over the drone x sector matrix of
+        predicted completion times, then breaks ties among bottleneck-
+        optimal assignments by the smallest total completion time. The
+        greedy nearest-match assignment is scored on the same matrix and
+        kept if it is strictly better.
+        """
+        from scipy.optimize import linear_sum_assignment
+
+        drone_ids = list(drone_enu.keys())
+        if not drone_ids or not partitions:
+            return {}
+
+        # Smallest threshold that still admits a full assignment
+        thresholds = np.unique(costs)
+        low, high = 0, len(thresholds) - 1
+        while low < high:
+            middle = (low + high) // 2
+            over_threshold = (costs > thresholds[middle]).astype(float)
+            rows, cols = linear_sum_assignment(over_threshold)
+            if over_threshold[rows, cols].sum() == 0:
+                high = middle
+            else:
+                low = middle + 1
+        bottleneck = thresholds[low]
+
+        excluded_cost = costs.sum() + 1.0
+        rows, cols = linear_sum_assignment(np.where(costs <= bottleneck, costs, excluded_cost))
+        assignments = {drone_ids[row]: partitions[col] for row, col in zip(rows, cols)}
+
+        greedy = self._assign_sectors(partitions, drone_enu)
+        if self._assignment_makespan(greedy, partitions, drone_ids, costs) < self._assignment_makespan(
+            assignments, partitions, drone_ids, costs
+        ):
+            return greedy
+        return assignments
+
+    @staticmethod
+    def _assignment_makespan(
+        assignments: Dict[str, List[LineString]],
+        partitions: List[List[LineString]],
+        drone_ids: List[str],
+        costs: np.ndarray,
+    ) -> float:
+        """Slowest predicted completion time of an assignment on the cost matrix."""
+        sector_index = {id(part): idx for idx, part in enumerate(partitions)}
+        return max(
+            (float(costs[row, sector_index[id(assignments[pos_id])]])
+             for row, pos_id in enumerate(drone_ids) if pos_id in assignments),
+            default=0.0,
+        )
+
+    def _sector_distances(
         self,
-        sector_lines: List[LineString],
+        sector_geodetic: List[Tuple[np.ndarray, np.ndarray]],
+        drone_positions: List[Tuple[float, float]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Haversine route length per sector and drone x sector transit to each sector entry.
+
+        Assignment costs and the reported plan distances both come from here,
+        so they use one metric. Empty sectors have zero length and transit.
+        """
+        drones = np.array(drone_positions, dtype=float).reshape(-1, 2)
+        route_lengths = np.zeros(len(sector_geodetic))
+        transit_lengths = np.zeros((len(drones), len(sector_geodetic)))
+        for idx, (lats, lngs) in enumerate(sector_geodetic):
+            if len(lats) == 0:
+                continue
+            route_lengths[idx] = np.sum(self._haversine_m_array(lats[:-1], lngs[:-1], lats[1:], lngs[1:]))
+            transit_lengths[:, idx] = self._haversine_m_array(drones[:, 0], drones[:, 1], lats[0], lngs[0])
+        return route_lengths, transit_lengths
+
+    @staticmethod
+    def _sectors_to_geodetic(
+        sectors: List[List[LineString]],
         origin_lat: float, origin_lng: float, origin_alt: float,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Convert every sector's survey vertices to lat/lng with one pymap3d call."""
+        if not sectors:
+            return []
+        sector_coords = [shapely.get_coordinates(sector) for sector in sectors]
+        all_coords = np.concatenate(sector_coords)
+        lats, lngs, _ = pymap3d.enu2geodetic(
+            all_coords[:, 0], all_coords[:, 1], 0, origin_lat, origin_lng, origin_alt
+        )
+        lats = np.atleast_1d(lats)
+        lngs = np.atleast_1d(lngs)
+        bounds = np.cumsum([len(coords) for coords in sector_coords])[:-1]
+        return list(zip(np.split(lats, bounds), np.split(lngs, bounds)))
+
+    def _build_waypoints(
+        self,
+        lats: np.ndarray,
+        lngs: np.ndarray,
         config: SurveyConfig,
-        drone_lat: float, drone_lng: float,
     ) -> List[CoverageWaypoint]:
-        """Convert ENU sector lines to lat/lng waypoints with transit legs."""
-        waypoints = []
-        seq = 0
+        """Build waypoints for a sector's survey vertices with a transit entry leg."""
+        if len(lats) == 0:
+            return []
 
         # Transit: drone position -> first survey point (at cruise alt)
-        if sector_lines:
-            first_coord = sector_lines[0].coords[0]
-            first_lat, first_lng, _ = pymap3d.enu2geodetic(
-                first_coord[0], first_coord[1], 0, origin_lat, origin_lng, origin_alt
-            )
-
-            # Transit to sector entry
-            waypoints.append(CoverageWaypoint(
-                lat=first_lat, lng=first_lng,
-                alt_msl=config.cruise_altitude_msl,
-                is_survey_leg=False,
-                speed_ms=config.cruise_speed_ms,
-                sequence=seq,
-            ))
-            seq += 1
+        waypoints = [CoverageWaypoint(
+            lat=float(lats[0]), lng=float(lngs[0]),
+            alt_msl=config.cruise_altitude_msl,
+            is_survey_leg=False,
+            speed_ms=config.cruise_speed_ms,
+            sequence=0,
+        )]
 
         # Survey waypoints
-        for line in sector_lines:
-            for coord in line.coords:
-                lat, lng, _ = pymap3d.enu2geodetic(
-                    coord[0], coord[1], 0, origin_lat, origin_lng, origin_alt
-                )
-                waypoints.append(CoverageWaypoint(
-                    lat=lat, lng=lng,
-                    alt_msl=config.cruise_altitude_msl,  # Will be adjusted by terrain module
-                    is_survey_leg=True,
-                    speed_ms=config.survey_speed_ms,
-                    sequence=seq,
-                ))
-                seq += 1
+        waypoints.extend(
+            CoverageWaypoint(
+                lat=lat, lng=lng,
+                alt_msl=config.cruise_altitude_msl,  # Will be adjusted by terrain module
+                is_survey_leg=True,
+                speed_ms=config.survey_speed_ms,
+                sequence=seq,
+            )
+            for seq, (lat, lng) in enumerate(zip(lats.tolist(), lngs.tolist()), start=1)
+        )
 
         # Transit: last survey point -> (handled by return behavior)
 
@@ -372,18 +517,28 @@ class BoustrophedonPlanner(BaseCoveragePlanner):
 
     def _compute_total_distance(self, waypoints: List[CoverageWaypoint]) -> float:
         """Compute total path distance in meters."""
-        total = 0
-        for i in range(len(waypoints) - 1):
-            total += self._haversine_m(
-                waypoints[i].lat, waypoints[i].lng,
-                waypoints[i+1].lat, waypoints[i+1].lng
-            )
-        return total
+        if len(waypoints) < 2:
+            return 0
+        lats = np.array([wp.lat for wp in waypoints], dtype=float)
+        lngs = np.array([wp.lng for wp in waypoints], dtype=float)
+        return float(np.sum(self._haversine_m_array(lats[:-1], lngs[:-1], lats[1:], lngs[1:])))
+
+    @staticmethod
+    def _haversine_m_array(
+        lat1: np.ndarray, lng1: np.ndarray, lat2: np.ndarray, lng2: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized haversine distances between paired points in meters."""
+        dlat = np.radians(lat2 - lat1)
+        dlng = np.radians(lng2 - lng1)
+        a = (np.sin(dlat / 2) ** 2 +
+             np.cos(np.radians(lat1)) * np.cos(np.radians(lat2)) *
+             np.sin(dlng / 2) ** 2)
+        return EARTH_RADIUS_M * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
 
     @staticmethod
     def _haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """Compute haversine distance between two points in meters."""
-        R = 6371000  # Earth radius in meters
+        R = EARTH_RADIUS_M
         dlat = math.radians(lat2 - lat1)
         dlng = math.radians(lng2 - lng1)
         a = (math.sin(dlat / 2) ** 2 +
@@ -189,6 +189,10 @@ class SurveyConfig(BaseModel):
     survey_speed_ms: float = Field(default=5.0, gt=0, le=15, description="Survey speed (m/s)")
     use_terrain_following: bool = Field(default=True, description="Adjust altitude for terrain")
     camera_interval_s: float = Field(default=2.0, gt=0, le=30, description="Camera capture interval (s)")
+    sector_assignment: Literal["nearest", "makespan"] = Field(
+        default="nearest",
+        description="Sector-to-drone assignment: greedy nearest entry point, or minimize the slowest drone's completion time",
+    )
 
 
 class QuickScoutMissionRequest(BaseModel):
@@ -284,6 +288,10 @@ class DroneCoveragePlan(BaseModel):
     assigned_area_sq_m: float = Field(..., ge=0, description="Assigned coverage area (sq m)")
     estimated_duration_s: float = Field(..., ge=0, description="Estimated mission duration (s)")
     total_distance_m: float = Field(..., ge=0, description="Total path distance (m)")
+    transit_distance_m: Optional[float] = Field(None, ge=0, description="Launch position to sector entry distance (m)")
+    predicted_completion_s: Optional[float] = Field(
+        None, ge=0, description="Predicted time from launch position to sector completion (s)"
+    )
 
 
 class QuickScoutPlanningWarning(BaseModel):
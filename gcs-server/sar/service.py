@@ -15,6 +15,7 @@ import asyncio
 import secrets
 import threading
 import weakref
+from dataclasses import replace
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -70,7 +71,7 @@ from sar.schemas import (
     SearchAreaPoint,
     SurveyState,
 )
-from sar.store import get_quickscout_store
+from sar.store import QuickScoutDroneProgress, get_quickscout_store
 from sar.terrain import apply_terrain_following_with_report
 import pymap3d
 
@@ -1358,7 +1359,13 @@ class QuickScoutService:
         )
         self._raise_if_planning_job_canceled(job_id)
         mission_id = str(uuid.uuid4())
-        est_time = max((plan.estimated_duration_s for plan in plans), default=0.0)
+        est_time = max(
+            (
+                plan.predicted_completion_s if plan.predicted_completion_s is not None else plan.estimated_duration_s
+                for plan in plans
+            ),
+            default=0.0,
+        )
         now = time.time()
         operation = QuickScoutOperationRecord(
             mission_id=mission_id,
@@ -1796,25 +1803,45 @@ class QuickScoutService:
         total_waypoints: int,
         distance_covered_m: float = 0.0,
     ) -> bool:
-        result = {"applied": False, "target_exists": False}
+        return bool(
+            self._apply_drone_progress(
+                mission_id,
+                hw_id,
+                current_waypoint_index,
+                total_waypoints,
+                distance_covered_m,
+            )
+        )
 
-        def apply_progress(operation: QuickScoutOperationRecord) -> QuickScoutOperationRecord:
-            if hw_id not in operation.drone_states:
-                return operation
-            result["target_exists"] = True
+    def _apply_drone_progress(
+        self,
+        mission_id: str,
+        hw_id: str,
+        current_waypoint_index: int,
+        total_waypoints: int,
+        distance_covered_m: float,
+    ) -> Optional[bool]:
+        """Persist one progress report; ``None`` means the mission or drone is unknown.
 
-            drone_state = operation.drone_states[hw_id]
-            if drone_state.state not in {SurveyState.EXECUTING, SurveyState.COMPLETED}:
+        Only the drone's narrow progress row is read and written, so a report
+        costs the same regardless of fleet size or plan length.
+        """
+
+        result = {"applied": False}
+
+        def apply_progress(progress: QuickScoutDroneProgress) -> Optional[QuickScoutDroneProgress]:
+            state = SurveyState(progress.state)
+            if state not in {SurveyState.EXECUTING, SurveyState.COMPLETED}:
                 raise HTTPException(
                     status_code=409,
                     detail=self._problem_detail(
                         "quickscout_progress_before_execution",
                         "Progress metrics are accepted only after tracker-backed execution evidence.",
-                        details={"hw_id": hw_id, "state": drone_state.state.value},
+                        details={"hw_id": hw_id, "state": state.value},
                     ),
                 )
 
-            expected_total = int(drone_state.total_waypoints)
+            expected_total = int(progress.total_waypoints)
             if total_waypoints != expected_total:
                 raise HTTPException(
                     status_code=409,
@@ -1830,39 +1857,42 @@ class QuickScoutService:
                 )
 
             if (
-                current_waypoint_index < drone_state.current_waypoint_index
-                or distance_covered_m < drone_state.distance_covered_m
+                current_waypoint_index < progress.current_waypoint_index
+                or distance_covered_m < progress.distance_covered_m
             ):
-                return operation
+                return None
 
-            drone_state.current_waypoint_index = current_waypoint_index
-            drone_state.distance_covered_m = distance_covered_m
-            drone_state.last_update_at = time.time()
+            now = time.time()
+            coverage_percent = progress.coverage_percent
+            estimated_remaining_s = progress.estimated_remaining_s
             if total_waypoints > 0:
-                drone_state.coverage_percent = min(
+                coverage_percent = min(
                     100.0,
                     (current_waypoint_index / total_waypoints) * 100.0,
                 )
-            plan = next(
-                (candidate for candidate in operation.plans if candidate.hw_id == hw_id),
-                None,
-            )
-            if plan is not None and total_waypoints > 0:
-                remaining_ratio = max(
-                    0.0,
-                    1.0 - min(current_waypoint_index, total_waypoints) / total_waypoints,
-                )
-                drone_state.estimated_remaining_s = round(
-                    plan.estimated_duration_s * remaining_ratio,
-                    1,
-                )
-            operation.updated_at = time.time()
+                if progress.estimated_duration_s is not None:
+                    remaining_ratio = max(
+                        0.0,
+                        1.0 - min(current_waypoint_index, total_waypoints) / total_waypoints,
+                    )
+                    estimated_remaining_s = round(
+                        progress.estimated_duration_s * remaining_ratio,
+                        1,
+                    )
             result["applied"] = True
-            return operation
+            return replace(
+                progress,
+                current_waypoint_index=current_waypoint_index,
+                distance_covered_m=distance_covered_m,
+                coverage_percent=coverage_percent,
+                estimated_remaining_s=estimated_remaining_s,
+                last_update_at=now,
+                updated_at=now,
+            )
 
-        operation = self.store.mutate_operation(mission_id, apply_progress)
-        if operation is None or not result["target_exists"]:
-            return False
+        progress = self.store.mutate_drone_progress(mission_id, hw_id, apply_progress)
+        if progress is None:
+            return None
         return result["applied"]
 
     def _create_launch_revalidation_token(self, mission_id: str) -> Tuple[str, float]:
@@ -2457,17 +2487,15 @@ class QuickScoutService:
         )
 
     def report_progress(self, mission_id: str, report: DroneProgressReport) -> QuickScoutProgressReceipt:
-        operation = self.store.get_operation(mission_id)
-        if operation is None or report.hw_id not in operation.drone_states:
-            raise HTTPException(status_code=404, detail="Mission or drone not found")
-
-        applied = self.update_drone_progress(
-            mission_id=mission_id,
-            hw_id=report.hw_id,
-            current_waypoint_index=report.current_waypoint_index,
-            total_waypoints=report.total_waypoints,
-            distance_covered_m=report.distance_covered_m,
+        applied = self._apply_drone_progress(
+            mission_id,
+            report.hw_id,
+            report.current_waypoint_index,
+            report.total_waypoints,
+            report.distance_covered_m,
         )
+        if applied is None:
+            raise HTTPException(status_code=404, detail="Mission or drone not found")
         return QuickScoutProgressReceipt(
             mission_id=mission_id,
             hw_id=report.hw_id,
@@ -15,8 +15,9 @@ import os
 import sqlite3
 import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from sar.schemas import QuickScoutFinding, QuickScoutOperationRecord
 from mds_logging import get_logger
@@ -27,6 +28,54 @@ _store_instance: "QuickScoutStore | None" = None
 _store_lock = threading.Lock()
 
 
+_PROGRESS_FIELDS = (
+    "current_waypoint_index",
+    "distance_covered_m",
+    "coverage_percent",
+    "estimated_remaining_s",
+    "last_update_at",
+)
+
+
+@dataclass(frozen=True)
+class QuickScoutDroneProgress:
+    """Narrow per-drone progress row plus the gating fields progress checks need.
+
+    Waypoint progress arrives at waypoint rate from every drone, so it lives in
+    its own table instead of rewriting the whole operation document per report.
+    ``state``, ``total_waypoints`` and ``estimated_duration_s`` mirror the
+    operation record and are refreshed on every full operation write.
+    """
+
+    mission_id: str
+    hw_id: str
+    state: str
+    total_waypoints: int
+    estimated_duration_s: Optional[float]
+    current_waypoint_index: int
+    distance_covered_m: float
+    coverage_percent: float
+    estimated_remaining_s: Optional[float]
+    last_update_at: Optional[float]
+    updated_at: float
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "QuickScoutDroneProgress":
+        return cls(
+            mission_id=row["mission_id"],
+            hw_id=row["hw_id"],
+            state=row["state"],
+            total_waypoints=int(row["total_waypoints"]),
+            estimated_duration_s=row["estimated_duration_s"],
+            current_waypoint_index=int(row["current_waypoint_index"]),
+            distance_covered_m=float(row["distance_covered_m"]),
+            coverage_percent=float(row["coverage_percent"]),
+            estimated_remaining_s=row["estimated_remaining_s"],
+            last_update_at=row["last_update_at"],
+            updated_at=float(row["updated_at"]),
+        )
+
+
 def get_quickscout_store() -> "QuickScoutStore":
     global _store_instance
     if _store_instance is None:
@@ -43,6 +92,10 @@ class QuickScoutStore:
         self.db_path = Path(db_path or self._resolve_default_db_path())
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._write_lock = threading.RLock()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._generation = 0
         self._initialize_schema()
 
     @staticmethod
@@ -54,18 +107,78 @@ class QuickScoutStore:
         repo_root = Path(__file__).resolve().parents[2]
         return str(repo_root / "runtime_data" / "quickscout" / "quickscout.sqlite3")
 
+    def _db_file_identity(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (int(stat.st_dev), int(stat.st_ino))
+
     def _connect(self, *, initialize: bool = True) -> sqlite3.Connection:
+        """Return this thread's long-lived connection.
+
+        Connections are kept per thread and reused across calls, so the hot path
+        pays one ``stat()`` instead of a file open plus PRAGMA setup. A connection
+        is reopened when the database file was removed or replaced underneath it.
+        """
+
+        identity = self._db_file_identity()
+        local = self._local
+        cached = getattr(local, "connection", None)
+        if (
+            cached is not None
+            and identity is not None
+            and local.identity == identity
+            and local.generation == self._generation
+        ):
+            return cached
+        if cached is not None:
+            self._discard_connection(cached)
+            local.connection = None
+
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        db_exists = self.db_path.exists()
-        connection = sqlite3.connect(self.db_path, timeout=30.0)
+        connection = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
         connection.row_factory = sqlite3.Row
         connection.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is durable across application crashes in WAL mode and avoids an
+        # fsync per progress write; only a power loss can drop the last commits.
+        connection.execute("PRAGMA synchronous=NORMAL")
         connection.execute("PRAGMA foreign_keys=ON")
         connection.execute("PRAGMA busy_timeout=30000")
-        if initialize and not db_exists:
+        connection.execute("PRAGMA cache_size=-16000")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        if initialize and identity is None:
             self._initialize_schema_on_connection(connection)
+
+        with self._connections_lock:
+            self._connections.append(connection)
+            local.connection = connection
+            local.identity = self._db_file_identity()
+            local.generation = self._generation
         return connection
 
+    def _discard_connection(self, connection: sqlite3.Connection) -> None:
+        with self._connections_lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close every pooled connection; later calls transparently reconnect."""
+
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+            self._generation += 1
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+
     def _initialize_schema(self) -> None:
         with self._connect(initialize=False) as connection:
             self._initialize_schema_on_connection(connection)
@@ -97,6 +210,23 @@ class QuickScoutStore:
 
             CREATE INDEX IF NOT EXISTS idx_quickscout_findings_mission
             ON quickscout_findings (mission_id, timestamp);
+
+            CREATE TABLE IF NOT EXISTS quickscout_drone_progress (
+                mission_id TEXT NOT NULL,
+                hw_id TEXT NOT NULL,
+                state TEXT NOT NULL,
+                total_waypoints INTEGER NOT NULL,
+                estimated_duration_s REAL,
+                current_waypoint_index INTEGER NOT NULL,
+                distance_covered_m REAL NOT NULL,
+                coverage_percent REAL NOT NULL,
+                estimated_remaining_s REAL,
+                last_update_at REAL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (mission_id, hw_id),
+                FOREIGN KEY(mission_id) REFERENCES quickscout_operations(mission_id)
+                    ON DELETE CASCADE
+            );
             """
         )
         legacy_table_exists = connection.execute(
@@ -144,6 +274,70 @@ class QuickScoutStore:
             ),
         )
 
+    @staticmethod
+    def _write_drone_progress(
+        connection: sqlite3.Connection,
+        operation: QuickScoutOperationRecord,
+    ) -> None:
+        """Mirror a full operation write into the narrow progress table.
+
+        Full writes happen inside the same serialized transaction that read the
+        merged record, so their progress values are never older than the table.
+        """
+
+        plan_durations = {plan.hw_id: plan.estimated_duration_s for plan in operation.plans}
+        connection.execute(
+            "DELETE FROM quickscout_drone_progress WHERE mission_id = ?",
+            (operation.mission_id,),
+        )
+        connection.executemany(
+            """
+            INSERT INTO quickscout_drone_progress (
+                mission_id, hw_id, state, total_waypoints, estimated_duration_s,
+                current_waypoint_index, distance_covered_m, coverage_percent,
+                estimated_remaining_s, last_update_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    operation.mission_id,
+                    hw_id,
+                    drone.state.value,
+                    int(drone.total_waypoints),
+                    plan_durations.get(hw_id),
+                    int(drone.current_waypoint_index),
+                    float(drone.distance_covered_m),
+                    float(drone.coverage_percent),
+                    drone.estimated_remaining_s,
+                    drone.last_update_at,
+                    float(operation.updated_at),
+                )
+                for hw_id, drone in operation.drone_states.items()
+            ],
+        )
+
+    @staticmethod
+    def _read_operation(
+        connection: sqlite3.Connection,
+        row: sqlite3.Row,
+    ) -> QuickScoutOperationRecord:
+        """Validate an operation document with the newest per-drone progress applied."""
+
+        payload: dict[str, Any] = json.loads(row["payload_json"])
+        progress_rows = connection.execute(
+            "SELECT * FROM quickscout_drone_progress WHERE mission_id = ?",
+            (row["mission_id"],),
+        ).fetchall()
+        drone_states = payload.get("drone_states") or {}
+        for progress_row in progress_rows:
+            drone_state = drone_states.get(progress_row["hw_id"])
+            if not isinstance(drone_state, dict):
+                continue
+            for field_name in _PROGRESS_FIELDS:
+                drone_state[field_name] = progress_row[field_name]
+            payload["updated_at"] = max(float(payload.get("updated_at") or 0.0), float(progress_row["updated_at"]))
+        return QuickScoutOperationRecord.model_validate(payload)
+
     def save_operation(self, operation: QuickScoutOperationRecord) -> QuickScoutOperationRecord:
         """Create or deliberately replace a complete operation record.
 
@@ -153,6 +347,7 @@ class QuickScoutStore:
 
         with self._write_lock, self._connect() as connection:
             self._write_operation(connection, operation)
+            self._write_drone_progress(connection, operation)
         return operation
 
     def mutate_operation(
@@ -172,30 +367,93 @@ class QuickScoutStore:
         with self._write_lock, self._connect() as connection:
             connection.execute("BEGIN IMMEDIATE")
             row = connection.execute(
-                "SELECT payload_json FROM quickscout_operations WHERE mission_id = ?",
+                "SELECT mission_id, payload_json FROM quickscout_operations WHERE mission_id = ?",
                 (mission_id,),
             ).fetchone()
             if row is None:
                 return None
 
-            current = QuickScoutOperationRecord.model_validate(json.loads(row["payload_json"]))
+            current = self._read_operation(connection, row)
             updated = mutation(current)
             if updated.mission_id != mission_id:
                 raise ValueError("QuickScout operation mutation cannot change mission_id")
             self._write_operation(connection, updated)
+            self._write_drone_progress(connection, updated)
+            return updated
+
+    def mutate_drone_progress(
+        self,
+        mission_id: str,
+        hw_id: str,
+        mutation: Callable[[QuickScoutDroneProgress], Optional[QuickScoutDroneProgress]],
+    ) -> Optional[QuickScoutDroneProgress]:
+        """Apply one serialized progress update touching a single narrow row.
+
+        The mutation returns the replacement row, or ``None`` to leave it as is.
+        Returns ``None`` when the mission or drone is unknown. Operations
+        persisted before the progress table existed are backfilled on demand.
+        """
+
+        with self._write_lock, self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT * FROM quickscout_drone_progress WHERE mission_id = ? AND hw_id = ?",
+                (mission_id, hw_id),
+            ).fetchone()
+            if row is None:
+                operation_row = connection.execute(
+                    "SELECT mission_id, payload_json FROM quickscout_operations WHERE mission_id = ?",
+                    (mission_id,),
+                ).fetchone()
+                if operation_row is None:
+                    return None
+                self._write_drone_progress(connection, self._read_operation(connection, operation_row))
+                row = connection.execute(
+                    "SELECT * FROM quickscout_drone_progress WHERE mission_id = ? AND hw_id = ?",
+                    (mission_id, hw_id),
+                ).fetchone()
+                if row is None:
+                    return None
+
+            current = QuickScoutDroneProgress.from_row(row)
+            updated = mutation(current)
+            if updated is None:
+                return current
+            if (updated.mission_id, updated.hw_id) != (mission_id, hw_id):
+                raise ValueError("QuickScout progress mutation cannot change mission_id or hw_id")
+            connection.execute(
+                """
+                UPDATE quickscout_drone_progress SET
+                    current_waypoint_index = ?,
+                    distance_covered_m = ?,
+                    coverage_percent = ?,
+                    estimated_remaining_s = ?,
+                    last_update_at = ?,
+                    updated_at = ?
+                WHERE mission_id = ? AND hw_id = ?
+                """,
+                (
+                    int(updated.current_waypoint_index),
+                    float(updated.distance_covered_m),
+                    float(updated.coverage_percent),
+                    updated.estimated_remaining_s,
+                    updated.last_update_at,
+                    float(updated.updated_at),
+                    mission_id,
+                    hw_id,
+                ),
+            )
             return updated
 
     def get_operation(self, mission_id: str) -> Optional[QuickScoutOperationRecord]:
         with self._connect() as connection:
             row = connection.execute(
-                "SELECT payload_json FROM quickscout_operations WHERE mission_id = ?",
+                "SELECT mission_id, payload_json FROM quickscout_operations WHERE mission_id = ?",
                 (mission_id,),
             ).fetchone()
-
-        if row is None:
-            return None
-
-        return QuickScoutOperationRecord.model_validate(json.loads(row["payload_json"]))
+            if row is None:
+                return None
+            return self._read_operation(connection, row)
 
     def delete_operation(self, mission_id: str) -> bool:
         with self._write_lock, self._connect() as connection:
@@ -274,12 +532,13 @@ class QuickScoutStore:
             ).fetchone()
             if legacy_table_exists:
                 connection.execute("DELETE FROM quickscout_pois")
+            connection.execute("DELETE FROM quickscout_drone_progress")
             connection.execute("DELETE FROM quickscout_operations")
 
     def list_operations(self) -> Iterable[QuickScoutOperationRecord]:
         with self._connect() as connection:
             rows = connection.execute(
-                "SELECT payload_json FROM quickscout_operations ORDER BY created_at ASC, mission_id ASC"
+                "SELECT mission_id, payload_json FROM quickscout_operations ORDER BY created_at ASC, mission_id ASC"
             ).fetchall()
-        for row in rows:
-            yield QuickScoutOperationRecord.model_validate(json.loads(row["payload_json"]))
+            operations = [self._read_operation(connection, row) for row in rows]
+        yield from operations
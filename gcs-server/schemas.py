@@ -2084,6 +2084,13 @@ class HeartbeatStreamMessage(WebSocketMessage):
     data: List[HeartbeatData] = Field(..., description="Heartbeat data for all drones")
 
 
+class HeartbeatDeltaStreamMessage(WebSocketMessage):
+    """WebSocket heartbeat stream message carrying only changed rows"""
+    type: str = Field(default="heartbeat_delta", description="Message type")
+    data: List[HeartbeatData] = Field(..., description="Rows whose heartbeat or presence state changed")
+    removed: List[str] = Field(default_factory=list, description="Hardware IDs no longer reported")
+
+
 # ============================================================================
 # Command Tracking Schemas
 # ============================================================================
@@ -269,6 +269,31 @@ def should_log_telemetry_event(drone_id: str, success: bool) -> bool:
         return True
     return False
 
+def _refresh_unchanged_telemetry(drone_id: str) -> bool:
+    """Keep the last telemetry record after a 304 from the drone, refreshing heartbeat fields.
+
+    Returns False when there is no live record to refresh, so the caller drops
+    its ETag and fetches the full state on the next poll.
+    """
+    heartbeat_data = {}
+    with last_heartbeats_lock:
+        if drone_id in last_heartbeats:
+            heartbeat_data = last_heartbeats[drone_id].copy()
+
+    with data_lock:
+        record = telemetry_data_all_drones.get(drone_id)
+        if not record or not record.get('telemetry_available'):
+            return False
+        telemetry_data_all_drones[drone_id] = {
+            **record,
+            'heartbeat_last_seen': heartbeat_data.get('received_at_gcs_ms', heartbeat_data.get('timestamp', 0)),
+            'heartbeat_network_info': heartbeat_data.get('network_info', {}),
+            'heartbeat_first_seen': _normalize_heartbeat_first_seen(heartbeat_data.get('first_seen')),
+        }
+        last_telemetry_time[drone_id] = time.time()
+    return True
+
+
 def poll_telemetry(drone):
     """
     Poll telemetry from a single drone with intelligent logging.
@@ -278,6 +303,7 @@ def poll_telemetry(drone):
     drone_ip = drone['ip']
 
     consecutive_errors = 0
+    state_etag = None  # Last drone-state ETag; the drone answers 304 while telemetry is unchanged
     
     while True:
         try:
@@ -285,11 +311,20 @@ def poll_telemetry(drone):
             full_uri = f"http://{drone_ip}:{Params.drone_api_port}{DRONE_STATE_ROUTE}"
             
             # Make the HTTP request
-            response = requests.get(full_uri, timeout=Params.HTTP_REQUEST_TIMEOUT)
+            request_headers = {'If-None-Match': state_etag} if state_etag else None
+            response = requests.get(full_uri, headers=request_headers, timeout=Params.HTTP_REQUEST_TIMEOUT)
+
+            if response.status_code == 304:
+                if _refresh_unchanged_telemetry(drone_id):
+                    update_telemetry_stats(drone_id, True)
+                    consecutive_errors = 0
+                else:
+                    state_etag = None
 
             # Check for a successful response
-            if response.status_code == 200:
+            elif response.status_code == 200:
                 telemetry_data = response.json()
+                state_etag = response.headers.get('ETag')
 
                 # Get heartbeat data for this drone
                 heartbeat_data = {}
@@ -399,6 +434,7 @@ def poll_telemetry(drone):
             else:
                 # HTTP error - professional error handling with throttling
                 error_msg = f"HTTP {response.status_code}: {response.text[:100]}"
+                state_etag = None
                 consecutive_errors += 1
                 update_telemetry_stats(drone_id, False)
                 with data_lock:
@@ -421,6 +457,7 @@ def poll_telemetry(drone):
 
         except requests.Timeout:
             consecutive_errors += 1
+            state_etag = None
             update_telemetry_stats(drone_id, False)
             with data_lock:
                 telemetry_data_all_drones[drone_id] = _build_telemetry_unavailable_record(
@@ -442,6 +479,7 @@ def poll_telemetry(drone):
                 
         except requests.ConnectionError as e:
             consecutive_errors += 1
+            state_etag = None
             update_telemetry_stats(drone_id, False)
             with data_lock:
                 telemetry_data_all_drones[drone_id] = _build_telemetry_unavailable_record(
@@ -463,6 +501,7 @@ def poll_telemetry(drone):
                 
         except requests.RequestException as e:
             consecutive_errors += 1
+            state_etag = None
             update_telemetry_stats(drone_id, False)
             with data_lock:
                 telemetry_data_all_drones[drone_id] = _build_telemetry_unavailable_record(
@@ -484,6 +523,7 @@ def poll_telemetry(drone):
                 
         except Exception as e:
             consecutive_errors += 1
+            state_etag = None
             update_telemetry_stats(drone_id, False)
             with data_lock:
                 telemetry_data_all_drones[drone_id] = _build_telemetry_unavailable_record(
@@ -40,6 +40,9 @@ from mission_startup import arm_with_preflight_gate
 
 logger = get_logger("quickscout")
 
+# Request timeout / rate limiting: the GCS may accept the same report later.
+RETRYABLE_PROGRESS_STATUS_CODES = frozenset({408, 429})
+
 
 def check_mavsdk_server_running(port):
     """Return whether a mavsdk_server is already bound to the requested gRPC port."""
@@ -331,6 +334,7 @@ async def _monitor_active_mission(
     hw_id: str,
     total_waypoints: int,
     startup_position,
+    progress_uplink=None,
 ):
     """
     Keep QuickScout ownership alive even if MissionProgress callbacks stall.
@@ -338,101 +342,102 @@ async def _monitor_active_mission(
     MAVSDK MissionProgress has proven unreliable in some live SITL runs while PX4
     continues flying autonomously. The mission executor therefore treats progress
     callbacks as optional hints and uses `is_mission_finished()` plus telemetry
-    polling as the canonical completion signal.
+    polling as the canonical completion signal. Progress reports go through a
+    `ProgressUplink` so a slow GCS never delays this loop.
     """
-    runtime_limit_sec = max(
-        120.0,
-        _resolve_quickscout_runtime_param("COMMAND_TRACKING_QUICKSCOUT_TIMEOUT_SEC", 900.0) - 30.0,
-    )
-    poll_interval_sec = max(
-        0.5,
-        _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_REPORT_INTERVAL_SEC", 2.0),
-    )
-    finished_check_timeout_sec = max(
-        1.0,
-        _resolve_quickscout_runtime_param("QUICKSCOUT_FINISHED_CHECK_TIMEOUT_SEC", 5.0),
-    )
-    progress_stream_timeout_sec = max(
-        0.1,
-        min(
-            poll_interval_sec,
-            _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_STREAM_TIMEOUT_SEC", 0.5),
-        ),
-    )
+    owns_uplink = progress_uplink is None
+    if owns_uplink:
+        progress_uplink = ProgressUplink(gcs_url, mission_id, hw_id).start()
+    try:
+        runtime_limit_sec = max(
+            120.0,
+            _resolve_quickscout_runtime_param("COMMAND_TRACKING_QUICKSCOUT_TIMEOUT_SEC", 900.0) - 30.0,
+        )
+        poll_interval_sec = max(
+            0.5,
+            _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_REPORT_INTERVAL_SEC", 2.0),
+        )
+        finished_check_timeout_sec = max(
+            1.0,
+            _resolve_quickscout_runtime_param("QUICKSCOUT_FINISHED_CHECK_TIMEOUT_SEC", 5.0),
+        )
+        progress_stream_timeout_sec = max(
+            0.1,
+            min(
+                poll_interval_sec,
+                _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_STREAM_TIMEOUT_SEC", 0.5),
+            ),
+        )
 
-    deadline = time.monotonic() + runtime_limit_sec
-    mission_progress_iter = drone.mission.mission_progress().__aiter__()
-    position_iter = drone.telemetry.position().__aiter__()
-    last_position = startup_position
-    distance_covered_m = 0.0
-    last_progress_current = 0
-    last_progress_total = total_waypoints
-    last_reported_signature = None
+        deadline = time.monotonic() + runtime_limit_sec
+        mission_progress_iter = drone.mission.mission_progress().__aiter__()
+        position_iter = drone.telemetry.position().__aiter__()
+        last_position = startup_position
+        distance_covered_m = 0.0
+        last_progress_current = 0
+        last_progress_total = total_waypoints
+        last_reported_signature = None
 
-    while True:
-        remaining = deadline - time.monotonic()
-        if remaining <= 0:
-            raise TimeoutError(
-                f"QuickScout mission runtime exceeded {runtime_limit_sec:.0f}s without finishing."
-            )
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"QuickScout mission runtime exceeded {runtime_limit_sec:.0f}s without finishing."
+                )
 
-        try:
-            position = await asyncio.wait_for(position_iter.__anext__(), timeout=min(poll_interval_sec, remaining))
-            if last_position is not None:
-                distance_covered_m += _estimate_distance_from_positions(last_position, position)
-            last_position = position
-        except asyncio.TimeoutError:
-            pass
-        except StopAsyncIteration:
-            position_iter = drone.telemetry.position().__aiter__()
+            try:
+                position = await asyncio.wait_for(position_iter.__anext__(), timeout=min(poll_interval_sec, remaining))
+                if last_position is not None:
+                    distance_covered_m += _estimate_distance_from_positions(last_position, position)
+                last_position = position
+            except asyncio.TimeoutError:
+                pass
+            except StopAsyncIteration:
+                position_iter = drone.telemetry.position().__aiter__()
 
-        try:
-            progress = await asyncio.wait_for(
-                mission_progress_iter.__anext__(),
-                timeout=min(progress_stream_timeout_sec, remaining),
-            )
-            current = int(getattr(progress, "current", 0) or 0)
-            total = int(getattr(progress, "total", total_waypoints) or total_waypoints)
-            if current != last_progress_current or total != last_progress_total:
-                logger.info("QuickScout mission progress: waypoint %s/%s", current, total)
-            last_progress_current = current
-            last_progress_total = total
-        except asyncio.TimeoutError:
-            pass
-        except StopAsyncIteration:
-            mission_progress_iter = drone.mission.mission_progress().__aiter__()
+            try:
+                progress = await asyncio.wait_for(
+                    mission_progress_iter.__anext__(),
+                    timeout=min(progress_stream_timeout_sec, remaining),
+                )
+                current = int(getattr(progress, "current", 0) or 0)
+                total = int(getattr(progress, "total", total_waypoints) or total_waypoints)
+                if current != last_progress_current or total != last_progress_total:
+                    logger.info("QuickScout mission progress: waypoint %s/%s", current, total)
+                last_progress_current = current
+                last_progress_total = total
+            except asyncio.TimeoutError:
+                pass
+            except StopAsyncIteration:
+                mission_progress_iter = drone.mission.mission_progress().__aiter__()
 
-        status_signature = (last_progress_current, last_progress_total, int(distance_covered_m))
-        if status_signature != last_reported_signature:
-            await asyncio.to_thread(
-                report_progress,
-                gcs_url,
-                mission_id,
-                hw_id,
-                last_progress_current,
-                max(1, last_progress_total),
-                distance_covered_m,
-            )
-            last_reported_signature = status_signature
+            status_signature = (last_progress_current, last_progress_total, int(distance_covered_m))
+            if status_signature != last_reported_signature:
+                progress_uplink.submit(last_progress_current, max(1, last_progress_total), distance_covered_m)
+                last_reported_signature = status_signature
 
-        finished = await asyncio.wait_for(
-            drone.mission.is_mission_finished(),
-            timeout=min(finished_check_timeout_sec, remaining),
-        )
-        if finished:
-            logger.info(
-                "QuickScout mission finished. Final progress=%s/%s, distance=%.1fm",
-                last_progress_current,
-                last_progress_total,
-                distance_covered_m,
+            finished = await asyncio.wait_for(
+                drone.mission.is_mission_finished(),
+                timeout=min(finished_check_timeout_sec, remaining),
             )
-            return {
-                "current": max(last_progress_current, total_waypoints),
-                "total": max(last_progress_total, total_waypoints),
-                "distance_covered_m": distance_covered_m,
-            }
+            if finished:
+                logger.info(
+                    "QuickScout mission finished. Final progress=%s/%s, distance=%.1fm",
+                    last_progress_current,
+                    last_progress_total,
+                    distance_covered_m,
+                )
+                return {
+                    "current": max(last_progress_current, total_waypoints),
+                    "total": max(last_progress_total, total_waypoints),
+                    "distance_covered_m": distance_covered_m,
+                }
 
-        await asyncio.sleep(poll_interval_sec)
+            await asyncio.sleep(poll_interval_sec)
+
+    finally:
+        if owns_uplink:
+            await progress_uplink.close()
 
 
 def parse_args():
@@ -461,7 +466,13 @@ def coerce_optional_float(value, default):
 
 
 def report_progress(gcs_url, mission_id, hw_id, waypoint_index, total_waypoints, distance_m=0):
-    """Report progress to GCS server from a worker thread (best effort)."""
+    """
+    Report progress to GCS server from a worker thread (best effort).
+
+    Returns True when the GCS accepted the report, False when it is worth
+    retrying, and None when the GCS rejected it for good (a 4xx other than
+    408 or 429), so callers must not resend that payload.
+    """
     if not gcs_url:
         return False
     try:
@@ -479,6 +490,24 @@ def report_progress(gcs_url, mission_id, hw_id, waypoint_index, total_waypoints,
         )
         response.raise_for_status()
         return True
+    except requests.HTTPError as exc:
+        status_code = getattr(exc.response, "status_code", None)
+        if status_code is not None and 400 <= status_code < 500 and status_code not in RETRYABLE_PROGRESS_STATUS_CODES:
+            logger.warning(
+                "QuickScout progress report rejected for mission=%s hw_id=%s (HTTP %s); dropping it: %s",
+                mission_id,
+                hw_id,
+                status_code,
+                exc,
+            )
+            return None
+        logger.warning(
+            "QuickScout progress report was not accepted for mission=%s hw_id=%s: %s",
+            mission_id,
+            hw_id,
+            exc,
+        )
+        return False
     except Exception as exc:
         logger.warning(
             "QuickScout progress report was not accepted for mission=%s hw_id=%s: %s",
@@ -489,6 +518,113 @@ def report_progress(gcs_url, mission_id, hw_id, waypoint_index, total_waypoints,
         return False
 
 
+class ProgressUplink:
+    """
+    Latest-value-wins QuickScout progress reporter that keeps HTTP off the flight loop.
+
+    `submit()` only records the newest progress sample and never blocks. A
+    background task posts samples through `report_progress` in a worker thread;
+    samples superseded while a post is in flight or backing off are coalesced
+    into the newest one, and failed posts retry with exponential backoff. A
+    sample the GCS rejects outright (4xx other than 408/429) is dropped rather
+    than retried.
+    """
+
+    def __init__(self, gcs_url, mission_id, hw_id):
+        self.gcs_url = gcs_url
+        self.mission_id = mission_id
+        self.hw_id = hw_id
+        self.retry_initial_sec = max(
+            0.01,
+            _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_RETRY_INITIAL_SEC", 0.5),
+        )
+        self.retry_max_sec = max(
+            self.retry_initial_sec,
+            _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_RETRY_MAX_SEC", 8.0),
+        )
+        self.delivered = None
+        self.sent_count = 0
+        self.coalesced_count = 0
+        self.failed_count = 0
+        self.dropped_count = 0
+        self._pending = None
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = None
+
+    def start(self):
+        if self._task is None and self.gcs_url:
+            self._task = asyncio.create_task(self._run())
+        return self
+
+    def submit(self, waypoint_index, total_waypoints, distance_m=0.0):
+        """Queue the newest progress sample, replacing any sample not yet sent."""
+        if self._pending is not None:
+            self.coalesced_count += 1
+        self._pending = (waypoint_index, total_waypoints, distance_m)
+        self._idle.clear()
+        self._wakeup.set()
+
+    async def _run(self):
+        retry_delay_sec = self.retry_initial_sec
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            sample, self._pending = self._pending, None
+            if sample is None:
+                continue
+
+            delivered = await asyncio.to_thread(
+                report_progress,
+                self.gcs_url,
+                self.mission_id,
+                self.hw_id,
+                *sample,
+            )
+            if delivered:
+                self.sent_count += 1
+                self.delivered = sample
+                retry_delay_sec = self.retry_initial_sec
+                if self._pending is None:
+                    self._idle.set()
+                continue
+            if delivered is None:
+                self.dropped_count += 1
+                retry_delay_sec = self.retry_initial_sec
+                if self._pending is None:
+                    self._idle.set()
+                continue
+
+            self.failed_count += 1
+            if self._pending is None:
+                self._pending = sample
+            await asyncio.sleep(retry_delay_sec)
+            retry_delay_sec = min(retry_delay_sec * 2, self.retry_max_sec)
+            self._wakeup.set()
+
+    async def close(self, timeout_sec=None):
+        """Wait (bounded) for the newest sample to be delivered, then stop the worker."""
+        if self._task is None:
+            return self.delivered
+        if timeout_sec is None:
+            timeout_sec = _resolve_quickscout_runtime_param("QUICKSCOUT_PROGRESS_FLUSH_TIMEOUT_SEC", 10.0)
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=max(0.0, timeout_sec))
+        except asyncio.TimeoutError:
+            logger.warning(
+                "QuickScout progress uplink closed before the final report was accepted for mission=%s hw_id=%s",
+                self.mission_id,
+                self.hw_id,
+            )
+        finally:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        return self.delivered
+
+
 async def run_mission(args):
     """Main mission execution."""
     led = None
@@ -536,6 +672,7 @@ async def run_mission(args):
         _resolve_quickscout_runtime_param("QUICKSCOUT_POST_ACTION_TIMEOUT_SEC", 240.0),
     )
 
+    progress_uplink = ProgressUplink(gcs_url, args.mission_id, args.hw_id).start()
     try:
         mavsdk_server = start_mavsdk_server(grpc_port, Params.mavsdk_port)
         drone = System(mavsdk_server_address="127.0.0.1", port=grpc_port)
@@ -650,14 +787,7 @@ async def run_mission(args):
             timeout_sec=mission_airborne_timeout,
         )
 
-        await asyncio.to_thread(
-            report_progress,
-            gcs_url,
-            args.mission_id,
-            args.hw_id,
-            0,
-            total_waypoints,
-        )
+        progress_uplink.submit(0, total_waypoints)
 
         if led:
             led.set_color(0, 255, 0)  # Green: surveying
@@ -669,21 +799,14 @@ async def run_mission(args):
             hw_id=args.hw_id,
             total_waypoints=total_waypoints,
             startup_position=startup_position,
+            progress_uplink=progress_uplink,
         )
         distance_covered = float(mission_result["distance_covered_m"])
         completed_current = int(mission_result["current"])
         completed_total = int(mission_result["total"])
 
         logger.info(f"Mission complete. Total distance: {distance_covered:.0f}m")
-        await asyncio.to_thread(
-            report_progress,
-            gcs_url,
-            args.mission_id,
-            args.hw_id,
-            completed_current,
-            completed_total,
-            distance_covered,
-        )
+        progress_uplink.submit(completed_current, completed_total, distance_covered)
 
         if args.return_behavior == 'return_home':
             logger.info("Returning to home...")
@@ -728,6 +851,7 @@ async def run_mission(args):
             led.set_color(255, 0, 0)
         return 1
     finally:
+        await progress_uplink.close()
         stop_mavsdk_server(mavsdk_server)
 
 
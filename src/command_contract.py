@@ -2,14 +2,41 @@
 
 from __future__ import annotations
 
+import math
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from src.enums import Mission, resolve_executable_mission
 
 
+def normalize_trigger_time(value: Any) -> Union[int, float]:
+    """Return a trigger time as Unix epoch seconds, keeping whole seconds integral.
+
+    Fractional seconds are preserved so synchronized starts are not quantized
+    to the second; whole values stay ``int`` so existing whole-second
+    contracts (strict-sync resolution, command identity records) are
+    unchanged. ``None`` and empty values mean "immediate" (``0``).
+    """
+
+    if value in (None, ""):
+        return 0
+    if isinstance(value, bool):
+        raise ValueError("trigger_time must be a number of Unix epoch seconds")
+    if isinstance(value, int):
+        seconds: Union[int, float] = value
+    else:
+        seconds = float(value)
+        if not math.isfinite(seconds):
+            raise ValueError("trigger_time must be a finite number of Unix epoch seconds")
+        if seconds.is_integer():
+            seconds = int(seconds)
+    if seconds < 0:
+        raise ValueError("trigger_time must be >= 0")
+    return seconds
+
+
 class CommandOrigin(BaseModel):
     """Origin payload attached to commands that carry launch-frame context."""
 
@@ -278,11 +305,12 @@ class CommandPayloadRequest(BaseModel):
         ...,
         description="Mission code resolved to an integer value",
     )
-    trigger_time: int = Field(
+    trigger_time: Union[int, float] = Field(
         0,
-        ge=0,
-        strict=True,
-        description="Scheduled trigger time as Unix epoch seconds (0 = immediate)",
+        description=(
+            "Scheduled trigger time as Unix epoch seconds, fractional seconds "
+            "allowed (0 = immediate)"
+        ),
     )
     command_id: Optional[str] = Field(
         None,
@@ -333,6 +361,13 @@ class CommandPayloadRequest(BaseModel):
         description="Typed relative-move payload for PRECISION_MOVE",
     )
 
+    @field_validator("trigger_time", mode="before")
+    @classmethod
+    def _validate_trigger_time(cls, value: Any) -> Union[int, float]:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError("trigger_time must be a number of Unix epoch seconds")
+        return normalize_trigger_time(value)
+
     @field_validator("mission_type", mode="before")
     @classmethod
     def _normalize_mission_type(cls, value: Any) -> int:
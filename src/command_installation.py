@@ -255,7 +255,7 @@ class PreparedCommandInstallation:
     """Pure command plan plus staged, not-yet-visible runtime artifacts."""
 
     mission: int
-    trigger_time: int
+    trigger_time: int | float
     hw_id: str | int
     command_id: Optional[str]
     config_updates: Tuple[Tuple[str, Any], ...]
@@ -284,7 +284,7 @@ class CommandInstallationResult:
 
     committed: bool
     mission: int
-    trigger_time: int
+    trigger_time: int | float
     state: int
     command_id: Optional[str]
     artifact_paths: Tuple[str, ...]
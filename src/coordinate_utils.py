@@ -11,8 +11,9 @@ that were previously scattered across multiple files.
 import csv
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from pyproj import Proj, Transformer
 
@@ -45,6 +46,45 @@ def _candidate_base_dirs(base_dir: Optional[str] = None) -> list[Path]:
     return candidates
 
 
+
+# Expected launch positions only change when a show is (re)imported, but the
+# pre-launch dashboard polls them for the whole fleet every few seconds. Cache
+# the first waypoint of each trajectory CSV keyed by its stat fingerprint so a
+# poll costs one stat() per drone instead of an open+parse. A show import
+# rewrites the CSVs, which changes the fingerprint, so no explicit clear is needed.
+_TrajectoryFingerprint = Tuple[int, int, int]
+_trajectory_start_cache: Dict[str, Tuple[_TrajectoryFingerprint, Optional[Tuple[float, float]]]] = {}
+_trajectory_start_lock = threading.Lock()
+
+
+def _read_trajectory_start(trajectory_file: Path) -> Optional[Tuple[float, float]]:
+    """Return the cached (px, py) of the first waypoint, or None if empty."""
+    stat = trajectory_file.stat()
+    fingerprint = (int(stat.st_ino), int(stat.st_mtime_ns), int(stat.st_size))
+    cache_key = str(trajectory_file)
+
+    cached = _trajectory_start_cache.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    with trajectory_file.open('r') as f:
+        reader = csv.DictReader(f)
+        first_waypoint = next(reader, None)
+
+    start = None
+    if first_waypoint is not None:
+        # px (North) and py (East) of the first waypoint are the canonical
+        # expected position for this pos_id.
+        start = (
+            float(first_waypoint.get('px', 0)),
+            float(first_waypoint.get('py', 0)),
+        )
+
+    with _trajectory_start_lock:
+        _trajectory_start_cache[cache_key] = (fingerprint, start)
+    return start
+
+
 def latlon_to_ne(
     lat: float,
     lon: float,
@@ -140,27 +180,18 @@ def get_expected_position_from_trajectory(
             )
             return None, None
 
-        # Read first waypoint from CSV
-        with trajectory_file.open('r') as f:
-            reader = csv.DictReader(f)
-            first_waypoint = next(reader, None)
-
-            if first_waypoint is None:
-                logger.error(f"Trajectory file is empty: {trajectory_file}")
-                return None, None
-
-            # Extract px (North) and py (East) from first waypoint
-            # These represent the canonical expected position for this pos_id
-            expected_north = float(first_waypoint.get('px', 0))
-            expected_east = float(first_waypoint.get('py', 0))
-
-            logger.debug(
-                f"Expected position for pos_id={pos_id}: "
-                f"North={expected_north:.2f}m, East={expected_east:.2f}m "
-                f"(from {trajectory_file})"
-            )
+        cached = _read_trajectory_start(trajectory_file)
+        if cached is None:
+            logger.error(f"Trajectory file is empty: {trajectory_file}")
+            return None, None
 
-            return expected_north, expected_east
+        expected_north, expected_east = cached
+        logger.debug(
+            f"Expected position for pos_id={pos_id}: "
+            f"North={expected_north:.2f}m, East={expected_east:.2f}m "
+            f"(from {trajectory_file})"
+        )
+        return expected_north, expected_east
 
     except (ValueError, KeyError) as e:
         logger.error(
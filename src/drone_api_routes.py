@@ -1,6 +1,7 @@
 """Shared canonical drone API route constants for runtime and tooling callers."""
 
 DRONE_STATE_ROUTE = "/api/v1/drone/state"
+DRONE_STATE_VERSION_HEADER = "X-MDS-State-Version"
 DRONE_LIVE_ARMABILITY_ROUTE = "/api/v1/preflight/armability"
 DRONE_LAUNCH_PREPARATION_ROUTE = "/api/v1/preflight/launch-preparations"
 DRONE_COMMANDS_ROUTE = "/api/v1/drone/commands"
@@ -15,6 +16,7 @@ DRONE_SIDECAR_PROFILE_PROXY_ROUTE_TEMPLATE = "/api/v1/sidecars/{sidecar}/profile
 DRONE_SWARM_CONFIG_ROUTE = "/api/v1/swarm/config"
 DRONE_SWARM_STATE_ROUTE = "/api/v1/swarm/state"
 DRONE_LOCAL_POSITION_ROUTE = "/api/v1/telemetry/local-position"
+DRONE_MAVLINK_INGEST_STATS_ROUTE = "/api/v1/telemetry/mavlink-ingest"
 DRONE_PX4_PARAMS_POLICY_ROUTE = "/api/v1/px4-params/policy"
 DRONE_PX4_PARAMS_SNAPSHOT_REFRESH_ROUTE = "/api/v1/px4-params/snapshots/refresh"
 DRONE_PX4_PARAMS_SNAPSHOT_CURRENT_ROUTE = "/api/v1/px4-params/snapshots/current"
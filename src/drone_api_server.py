@@ -39,14 +39,16 @@ import threading
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set, Tuple
+from typing import Dict, Any, Optional, List, Set, Tuple, Union
 from urllib.parse import quote
 
 # FastAPI imports
 from fastapi import Depends, FastAPI, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, ConfigDict
+from pydantic_core import PydanticSerializationError
 import uvicorn
 import requests
 import asyncio
@@ -100,7 +102,7 @@ SIDECAR_PROFILE_PROXY_DEFAULTS = {
 from src.drone_config import DroneConfig
 from src.constants import NetworkDefaults
 from src.coordinate_utils import latlon_to_ne, get_expected_position_from_trajectory
-from src.command_contract import DroneCommandRequest
+from src.command_contract import DroneCommandRequest, normalize_trigger_time
 from src.command_admission import (
     AirborneAdmissionStatus,
     evaluate_cached_airborne_admission,
@@ -115,6 +117,7 @@ from src.drone_api_routes import (
     DRONE_LAUNCH_PREPARATION_ROUTE,
     DRONE_LIVE_ARMABILITY_ROUTE,
     DRONE_LOCAL_POSITION_ROUTE,
+    DRONE_MAVLINK_INGEST_STATS_ROUTE,
     DRONE_NAVIGATION_GLOBAL_ORIGIN_ROUTE,
     DRONE_NAVIGATION_HOME_ROUTE,
     DRONE_ENV_ROUTE,
@@ -127,6 +130,7 @@ from src.drone_api_routes import (
     DRONE_POSITION_DEVIATION_ROUTE,
     DRONE_SIDECAR_PROFILE_PROXY_ROUTE_TEMPLATE,
     DRONE_STATE_ROUTE,
+    DRONE_STATE_VERSION_HEADER,
     DRONE_SWARM_CONFIG_ROUTE,
     DRONE_SWARM_STATE_ROUTE,
     DRONE_SYSTEM_HEALTH_ROUTE,
@@ -160,6 +164,7 @@ from src.settings.env_status import (
     validate_node_env_updates,
 )
 from src.settings.runtime import get_local_env_path
+from src.state_stream_broadcaster import StateStreamBroadcaster
 from src.mission_startup import probe_offboard_armability
 from src.security.auth import (
     MACHINE_CREDENTIAL_HEADER,
@@ -345,7 +350,10 @@ class CommandAckResponse(BaseModel):
     current_state: int = Field(..., description="Current drone state before command")
     new_state: Optional[int] = Field(None, description="New state after command accepted")
     mission_type: Optional[int] = Field(None, description="Parsed mission type")
-    trigger_time: Optional[int] = Field(None, description="Trigger time from command")
+    trigger_time: Optional[Union[int, float]] = Field(
+        None,
+        description="Trigger time from command (Unix epoch seconds, may be fractional)",
+    )
     message: str = Field(..., description="Human-readable status message")
     error_code: Optional[str] = Field(None, description="Error code (e.g., E100, E201)")
     error_detail: Optional[str] = Field(None, description="Detailed error information")
@@ -376,7 +384,7 @@ class _NodeCommandRecord:
     command_id: str
     semantic_identity: _CommandSemanticIdentity
     mission_type: int
-    trigger_time: int
+    trigger_time: Union[int, float]
     phase: str
     outcome: Optional[str]
     response: Optional[Dict[str, Any]]
@@ -391,7 +399,7 @@ class _CommandStateSnapshot:
 
     command_id: Optional[str]
     mission_type: int
-    trigger_time: int
+    trigger_time: Union[int, float]
     state: int
 
 
@@ -414,6 +422,90 @@ class _LaunchCommitAdmission:
     readiness_valid_until_monotonic: Optional[float] = None
 
 
+@dataclass(frozen=True)
+class _DroneStatePayloadSnapshot:
+    """One serialized drone-state version shared by every HTTP and WebSocket reader."""
+
+    text: str
+    body: bytes
+    etag: str
+    version: int
+    fingerprint: Dict[str, Any]
+    serialized_at_monotonic: float
+
+
+class _DroneStatePayloadCache:
+    """Serialize each drone-state version once and hand the same bytes to all readers.
+
+    Reads within ``min_refresh_sec`` of the last check reuse the snapshot without
+    touching the communicator. Afterwards the raw state is rebuilt and compared
+    with the previous one, ignoring ``*_age_ms`` fields that tick on every call.
+    An unchanged state keeps its version (and weak ETag) and is re-serialized
+    only once ``max_reuse_sec`` has passed, which bounds how far ages and
+    ``server_time`` can lag behind.
+    """
+
+    def __init__(self, state_provider, serializer, *, min_refresh_sec: float, max_reuse_sec: float):
+        self._state_provider = state_provider
+        self._serializer = serializer
+        self.min_refresh_sec = min_refresh_sec
+        self.max_reuse_sec = max_reuse_sec
+        self._lock = threading.Lock()
+        # Versions restart with the process; the epoch keeps old ETags from matching.
+        self._epoch = os.urandom(4).hex()
+        self._version = 0
+        self._snapshot: Optional[_DroneStatePayloadSnapshot] = None
+        self._checked_at = float("-inf")
+        self.serialization_count = 0
+
+    @staticmethod
+    def _fingerprint(drone_state: Dict[str, Any]) -> Dict[str, Any]:
+        return {key: value for key, value in drone_state.items() if not key.endswith("_age_ms")}
+
+    def get(self) -> Optional[_DroneStatePayloadSnapshot]:
+        with self._lock:
+            now = time.monotonic()
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.min_refresh_sec:
+                return snapshot
+
+            drone_state = self._state_provider()
+            self._checked_at = now
+            if not drone_state:
+                self._snapshot = None
+                return None
+
+            fingerprint = self._fingerprint(drone_state)
+            unchanged = snapshot is not None and snapshot.fingerprint == fingerprint
+            if unchanged and now - snapshot.serialized_at_monotonic < self.max_reuse_sec:
+                return snapshot
+            if not unchanged:
+                self._version += 1
+
+            text = self._serializer(drone_state)
+            self.serialization_count += 1
+            self._snapshot = _DroneStatePayloadSnapshot(
+                text=text,
+                body=text.encode("utf-8"),
+                etag=f'W/"{self._epoch}-{self._version}"',
+                version=self._version,
+                fingerprint=fingerprint,
+                serialized_at_monotonic=now,
+            )
+            return self._snapshot
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against one ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    return any((c[2:] if c.startswith("W/") else c) == opaque_tag for c in candidates)
+
+
 class LiveArmabilityResponse(LiveArmabilityTrustEnvelope):
     """Full node response extending the shared trust-bearing envelope."""
 
@@ -706,6 +798,25 @@ class LocalPositionNEDResponse(BaseModel):
     timestamp: int
 
 
+class MavlinkMessageTypeStatsResponse(BaseModel):
+    count: int
+    rate_hz: float
+    decode_avg_us: Optional[float] = None
+    handler_avg_us: Optional[float] = None
+    handler_max_us: Optional[float] = None
+    age_ms: Optional[int] = None
+
+
+class MavlinkIngestStatsResponse(BaseModel):
+    uptime_sec: float
+    dispatched_count: int
+    filtered_count: int
+    filtered_by_id: Dict[str, int]
+    ingest_busy_ratio: float
+    message_types: Dict[str, MavlinkMessageTypeStatsResponse]
+    timestamp: int
+
+
 def _listen_port(value: Optional[str], default: int) -> int:
     text = str(value or "").strip()
     if text.isdigit():
@@ -993,11 +1104,69 @@ class DroneAPIServer:
 
         self.params = params
         self.drone_communicator = None  # Will be set later
+        self.local_mavlink_controller = None  # Optional, set later for ingest statistics
         self.drone_config = drone_config
 
         # WebSocket connection management
         self.active_websockets: List[WebSocket] = []
         self.last_state_hash = None  # Track state changes
+        self._drone_state_payloads = _DroneStatePayloadCache(
+            lambda: self.drone_communicator.get_drone_state(),
+            self._serialize_drone_state_json,
+            min_refresh_sec=self._bounded_numeric_param(
+                "DRONE_STATE_PAYLOAD_MIN_REFRESH_SEC",
+                default=0.05,
+                minimum=0.0,
+                integer=False,
+            ),
+            max_reuse_sec=self._bounded_numeric_param(
+                "DRONE_STATE_PAYLOAD_MAX_REUSE_SEC",
+                default=1.0,
+                minimum=0.0,
+                integer=False,
+            ),
+        )
+        # One producer per state stream, shared by every WebSocket subscriber.
+        drone_state_max_rate_hz = self._bounded_numeric_param(
+            "DRONE_STATE_STREAM_MAX_RATE_HZ",
+            default=10.0,
+            minimum=0.1,
+            integer=False,
+        )
+        self._drone_state_stream = StateStreamBroadcaster(
+            self._drone_state_stream_message,
+            default_rate_hz=min(
+                drone_state_max_rate_hz,
+                self._bounded_numeric_param(
+                    "DRONE_STATE_STREAM_DEFAULT_RATE_HZ",
+                    default=1.0,
+                    minimum=0.1,
+                    integer=False,
+                ),
+            ),
+            max_rate_hz=drone_state_max_rate_hz,
+            name="drone-state",
+        )
+        swarm_state_rate_hz = self._bounded_numeric_param(
+            "SMART_SWARM_STATE_STREAM_RATE_HZ",
+            default=15.0,
+            minimum=1.0,
+            integer=False,
+        )
+        self._swarm_state_stream = StateStreamBroadcaster(
+            self._swarm_state_stream_message,
+            default_rate_hz=swarm_state_rate_hz,
+            max_rate_hz=max(
+                swarm_state_rate_hz,
+                self._bounded_numeric_param(
+                    "SMART_SWARM_STATE_STREAM_MAX_RATE_HZ",
+                    default=30.0,
+                    minimum=1.0,
+                    integer=False,
+                ),
+            ),
+            name="swarm-state",
+        )
         self._live_probe_lock = asyncio.Lock()
         self._px4_param_lock = asyncio.Lock()
         self._ulog_lock = asyncio.Lock()
@@ -1108,6 +1277,10 @@ class DroneAPIServer:
         """Setter for injecting the DroneCommunicator dependency after initialization."""
         self.drone_communicator = drone_communicator
 
+    def set_local_mavlink_controller(self, local_mavlink_controller):
+        """Setter for injecting the LocalMavlinkController whose ingest statistics are exposed."""
+        self.local_mavlink_controller = local_mavlink_controller
+
     def _register_command_report_capability(
         self,
         *,
@@ -1968,8 +2141,8 @@ class DroneAPIServer:
         )
 
     @staticmethod
-    def _serialize_drone_state_payload(drone_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Normalize raw communicator state into the canonical HTTP/WebSocket payload shape."""
+    def _normalize_drone_state_payload(drone_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the canonical ``timestamp``/``server_time`` fields to raw communicator state."""
         payload = dict(drone_state)
         server_time_ms = int(time.time() * 1000)
         raw_update_time = payload.get('update_time')
@@ -1987,8 +2160,24 @@ class DroneAPIServer:
             payload['timestamp'] = server_time_ms
 
         payload['server_time'] = server_time_ms
+        return payload
+
+    @staticmethod
+    def _serialize_drone_state_payload(drone_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize raw communicator state into the canonical HTTP/WebSocket payload shape."""
+        payload = DroneAPIServer._normalize_drone_state_payload(drone_state)
         return DroneStateResponse.model_validate(payload).model_dump()
 
+    @staticmethod
+    def _serialize_drone_state_json(drone_state: Dict[str, Any]) -> str:
+        """Validate and encode the canonical payload to JSON text in a single pass."""
+        model = DroneStateResponse.model_validate(DroneAPIServer._normalize_drone_state_payload(drone_state))
+        try:
+            return model.model_dump_json()
+        except PydanticSerializationError:
+            # Untyped (Any) fields holding values pydantic cannot encode natively.
+            return json.dumps(jsonable_encoder(model.model_dump()), separators=(",", ":"))
+
     @staticmethod
     def _serialize_swarm_state_payload(swarm_state: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize Smart Swarm leader-state payloads into the canonical route contract."""
@@ -1996,18 +2185,44 @@ class DroneAPIServer:
         payload["emitted_at_ms"] = safe_int(payload.get("emitted_at_ms"), int(time.time() * 1000))
         return SwarmStateResponse.model_validate(payload).model_dump()
 
+    def _drone_state_stream_message(self) -> str:
+        """One `/ws/drone-state` message: the shared snapshot or the unavailable sentinel."""
+        snapshot = self._drone_state_payloads.get()
+        if snapshot is not None:
+            return snapshot.text
+        return json.dumps(
+            {"error": "Drone state not available", "timestamp": int(time.time() * 1000)},
+            separators=(",", ":"),
+        )
+
+    def _swarm_state_stream_message(self) -> str:
+        """One `/ws/swarm-state` message: the leader-state payload or the unavailable sentinel."""
+        swarm_state = self.drone_communicator.get_swarm_state()
+        if swarm_state:
+            payload = self._serialize_swarm_state_payload(swarm_state)
+        else:
+            payload = {"error": "Swarm state not available", "emitted_at_ms": int(time.time() * 1000)}
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
     def setup_routes(self):
         """Define all API routes (same as Flask version)"""
 
         @self.app.get(DRONE_STATE_ROUTE, response_model=DroneStateResponse)
-        async def get_drone_state():
-            """Endpoint to retrieve the current state of the drone."""
+        async def get_drone_state(request: Request):
+            """Endpoint to retrieve the current state of the drone.
+
+            Serves the shared pre-serialized snapshot. Clients that send the
+            previous weak ETag in ``If-None-Match`` get ``304`` while the
+            telemetry is unchanged.
+            """
             try:
-                drone_state = self.drone_communicator.get_drone_state()
-                if drone_state:
-                    return self._serialize_drone_state_payload(drone_state)
-                else:
+                snapshot = self._drone_state_payloads.get()
+                if snapshot is None:
                     raise HTTPException(status_code=404, detail="Drone State not found")
+                headers = {"ETag": snapshot.etag, DRONE_STATE_VERSION_HEADER: str(snapshot.version)}
+                if _etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+                    return Response(status_code=304, headers=headers)
+                return Response(content=snapshot.body, media_type="application/json", headers=headers)
             except HTTPException:
                 raise
             except Exception as e:
@@ -2186,7 +2401,7 @@ class DroneAPIServer:
             command_data: Dict[str, Any] = {}
             command_id: Optional[str] = None
             mission_type: Optional[int] = None
-            trigger_time: Optional[int] = None
+            trigger_time: Optional[Union[int, float]] = None
             command_report_capability: Optional[str] = None
             idempotency_record: Optional[_NodeCommandRecord] = None
             mutation_started = False
@@ -2194,7 +2409,7 @@ class DroneAPIServer:
             state_snapshot = _CommandStateSnapshot(
                 command_id=getattr(self.drone_config, "current_command_id", None),
                 mission_type=int(self.drone_config.mission),
-                trigger_time=int(getattr(self.drone_config, "trigger_time", 0) or 0),
+                trigger_time=normalize_trigger_time(getattr(self.drone_config, "trigger_time", 0)),
                 state=current_state,
             )
 
@@ -2245,7 +2460,7 @@ class DroneAPIServer:
                     )
 
                 mission_type = int(command_data["mission_type"])
-                trigger_time = int(command_data.get("trigger_time", 0))
+                trigger_time = normalize_trigger_time(command_data.get("trigger_time", 0))
                 if mission_type == Mission.TEST.value:
                     try:
                         command.ground_test_safety.validate_for_runtime(
@@ -3003,6 +3218,19 @@ class DroneAPIServer:
                 logger.error(f"Error retrieving LOCAL_POSITION_NED: {e}")
                 raise HTTPException(status_code=500, detail="Failed to retrieve NED position")
 
+        @self.app.get(DRONE_MAVLINK_INGEST_STATS_ROUTE, response_model=MavlinkIngestStatsResponse)
+        async def get_mavlink_ingest_stats():
+            """
+            Per-message-type statistics of the local MAVLink telemetry stream.
+
+            Reports message rate, decode and handler cost and staleness for every
+            type in the dispatch table, plus how many frames were dropped at the
+            parser and the share of wall time the telemetry thread spends on them.
+            """
+            if self.local_mavlink_controller is None:
+                raise HTTPException(status_code=503, detail="Local MAVLink controller not available")
+            return {**self.local_mavlink_controller.get_ingest_stats(), 'timestamp': int(time.time() * 1000)}
+
         @self.app.get(DRONE_PX4_PARAMS_POLICY_ROUTE, response_model=Px4ParamPolicyResponse)
         async def get_px4_param_policy():
             """Return the local PX4 parameter subsystem policy envelope."""
@@ -3346,7 +3574,7 @@ class DroneAPIServer:
                 ws://drone-ip:7070/ws/drone-state
 
             Example (JavaScript):
-                const ws = new WebSocket('ws://192.168.1.100:7070/ws/drone-state');
+                const ws = new WebSocket('ws://192.168.1.100:7070/ws/drone-state?rate_hz=5');
                 ws.onmessage = (event) => {
                     const droneState = JSON.parse(event.data);
                     console.log('Drone state:', droneState);
@@ -3360,7 +3588,10 @@ class DroneAPIServer:
                         state = json.loads(await ws.recv())
                         print(f"Drone state: {state}")
 
-            The endpoint sends state updates at 1 Hz (configurable).
+            State is serialized once per tick and shared by all clients. Each
+            client streams at DRONE_STATE_STREAM_DEFAULT_RATE_HZ unless it asks
+            for its own rate with ``?rate_hz=`` or a ``{"rate_hz": x}`` message,
+            capped at DRONE_STATE_STREAM_MAX_RATE_HZ.
             """
             await websocket.accept()
             self.active_websockets.append(websocket)
@@ -3369,25 +3600,8 @@ class DroneAPIServer:
             logger.info(f"Active WebSocket connections: {len(self.active_websockets)}")
 
             try:
-                while True:
-                    # Get current drone state
-                    drone_state = self.drone_communicator.get_drone_state()
-
-                    if drone_state:
-                        # Send state to client
-                        await websocket.send_json(self._serialize_drone_state_payload(drone_state))
-                    else:
-                        # Send error message if state not available
-                        await websocket.send_json({
-                            "error": "Drone state not available",
-                            "timestamp": int(time.time() * 1000)
-                        })
-
-                    # Update interval: 1 Hz (can be adjusted based on requirements)
-                    # For higher frequency: 0.1 (10 Hz) or 0.05 (20 Hz)
-                    # For lower frequency: 2 (0.5 Hz) or 5 (0.2 Hz)
-                    await asyncio.sleep(1.0)
-
+                await self._drone_state_stream.serve(websocket, websocket.query_params.get("rate_hz"))
+                logger.info(f"WebSocket client disconnected from {websocket.client.host}")
             except WebSocketDisconnect:
                 logger.info(f"WebSocket client disconnected from {websocket.client.host}")
             except Exception as e:
@@ -3402,20 +3616,9 @@ class DroneAPIServer:
         async def websocket_swarm_state(websocket: WebSocket):
             """Dedicated Smart Swarm leader-state stream for follower control."""
             await websocket.accept()
-            rate_hz = max(1.0, safe_float(getattr(self.params, "SMART_SWARM_STATE_STREAM_RATE_HZ", 15), 15.0))
-            interval = 1.0 / rate_hz
-
             try:
-                while True:
-                    swarm_state = self.drone_communicator.get_swarm_state()
-                    if swarm_state:
-                        await websocket.send_json(self._serialize_swarm_state_payload(swarm_state))
-                    else:
-                        await websocket.send_json({
-                            "error": "Swarm state not available",
-                            "emitted_at_ms": int(time.time() * 1000),
-                        })
-                    await asyncio.sleep(interval)
+                await self._swarm_state_stream.serve(websocket, websocket.query_params.get("rate_hz"))
+                logger.info("Smart Swarm WebSocket client disconnected")
             except WebSocketDisconnect:
                 logger.info("Smart Swarm WebSocket client disconnected")
             except Exception as exc:
@@ -3625,7 +3828,7 @@ class DroneAPIServer:
         command_id: Optional[str],
         semantic_identity: _CommandSemanticIdentity,
         mission_type: int,
-        trigger_time: int,
+        trigger_time: Union[int, float],
         known_command: Optional[Dict[str, Any]],
     ) -> Tuple[str, Optional[_NodeCommandRecord], Optional[str]]:
         """Reserve a new command ID or classify an existing delivery.
@@ -3664,7 +3867,7 @@ class DroneAPIServer:
                 trigger_time_authoritative = bool(
                     known_command.get("trigger_time_authoritative", True)
                 )
-                known_trigger_time = int(known_command.get("trigger_time", 0) or 0)
+                known_trigger_time = normalize_trigger_time(known_command.get("trigger_time", 0))
                 if (
                     known_mission_type != mission_type
                     or (
@@ -3783,7 +3986,7 @@ class DroneAPIServer:
                 known_command.get("trigger_time_authoritative", True)
             )
             known_trigger_time = (
-                int(known_command.get("trigger_time", trigger_time) or 0)
+                normalize_trigger_time(known_command.get("trigger_time", trigger_time))
                 if trigger_time_authoritative
                 else trigger_time
             )
@@ -3940,7 +4143,7 @@ class DroneAPIServer:
         pos_id: int,
         current_state: int,
         mission_type: int,
-        trigger_time: int,
+        trigger_time: Union[int, float],
         detail: str,
         timestamp: int,
     ) -> CommandAckResponse:
@@ -3980,7 +4183,7 @@ class DroneAPIServer:
         """
         current_core = (
             int(self.drone_config.mission),
-            int(getattr(self.drone_config, "trigger_time", 0) or 0),
+            normalize_trigger_time(getattr(self.drone_config, "trigger_time", 0)),
             int(self.drone_config.state),
         )
         previous_core = (
@@ -4006,7 +4209,7 @@ class DroneAPIServer:
         pos_id: int,
         current_state: int,
         mission_type: Optional[int],
-        trigger_time: Optional[int],
+        trigger_time: Optional[Union[int, float]],
         state_snapshot: _CommandStateSnapshot,
         exc: Exception,
         timestamp: int,
@@ -4061,7 +4264,7 @@ class DroneAPIServer:
         pos_id: int,
         current_state: int,
         mission_type: Optional[int],
-        trigger_time: Optional[int],
+        trigger_time: Optional[Union[int, float]],
         state_snapshot: _CommandStateSnapshot,
         exc: Exception,
         timestamp: int,
@@ -4090,7 +4293,7 @@ class DroneAPIServer:
         pos_id: int,
         current_state: int,
         mission_type: Optional[int],
-        trigger_time: Optional[int],
+        trigger_time: Optional[Union[int, float]],
         mutation_started: bool,
         command_committed: bool,
         state_snapshot: _CommandStateSnapshot,
@@ -4344,7 +4547,7 @@ class DroneAPIServer:
         if current_command_id == command_id:
             return {
                 'mission_type': int(self.drone_config.mission),
-                'trigger_time': int(getattr(self.drone_config, 'trigger_time', 0) or 0),
+                'trigger_time': normalize_trigger_time(getattr(self.drone_config, 'trigger_time', 0)),
                 'state': int(self.drone_config.state),
                 'phase': 'pending',
                 'trigger_time_authoritative': True,
@@ -4374,7 +4577,7 @@ class DroneAPIServer:
                     'mission_type': int(
                         getattr(record, 'mission_type', self.drone_config.mission)
                     ),
-                    'trigger_time': int(getattr(record, 'trigger_time', 0) or 0),
+                    'trigger_time': normalize_trigger_time(getattr(record, 'trigger_time', 0)),
                     'state': int(self.drone_config.state),
                     'phase': 'executing',
                     'trigger_time_authoritative': True,
@@ -4413,7 +4616,7 @@ class DroneAPIServer:
     def _build_acceptance_message(
         self,
         mission_name: str,
-        trigger_time: int,
+        trigger_time: Union[int, float],
         superseded_pending_command: bool = False,
     ) -> str:
         """Build a precise operator-facing ACK message."""
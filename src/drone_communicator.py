@@ -8,12 +8,16 @@ import os
 import re
 import math
 import tempfile
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 from functions.data_utils import safe_float, safe_get, safe_int
 from mds_logging import get_logger
-from src.command_contract import GroundTestSafetyAcknowledgement, PrecisionMoveRequest
+from src.command_contract import (
+    GroundTestSafetyAcknowledgement,
+    PrecisionMoveRequest,
+    normalize_trigger_time,
+)
 from src.command_installation import (
     CommandInstallationRejected,
     CommandInstallationResult,
@@ -70,6 +74,8 @@ class DroneCommunicator:
         # Initialize api_server as None; it will be injected later
         self.api_server = None
         self._command_install_lock = threading.RLock()
+        # (checked_at, swarm file fingerprint, parsed entry) for read_swarm().
+        self._swarm_file_cache: Optional[Tuple[float, Optional[Tuple[int, int, int]], Any]] = None
 
     def set_api_server(self, api_server):
         """Setter for injecting DroneAPIServer dependency after initialization."""
@@ -89,6 +95,38 @@ class DroneCommunicator:
         ):
             return runtime_swarm
 
+        latest_swarm = self._read_swarm_file_cached()
+        if isinstance(latest_swarm, dict) and latest_swarm:
+            return dict(latest_swarm)
+
+        return current_swarm
+
+    def _read_swarm_file_cached(self) -> Optional[Dict[str, Any]]:
+        """
+        Return this drone's swarm file entry without touching disk in steady state.
+
+        Like the runtime assignment, the entry is served from memory and the
+        swarm file is re-stat'ed at most every
+        ``Params.SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC``; it is re-read
+        only when its inode, mtime or size changed. In online swarm mode the
+        fetch is repeated at most once per recheck interval.
+        """
+        now = time.monotonic()
+        cached = self._swarm_file_cache
+        if cached is not None and now - cached[0] < Params.SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC:
+            return cached[2]
+
+        fingerprint = None
+        if Params.offline_swarm or not Params.swarm_url:
+            try:
+                stat = os.stat(Params.swarm_file_name)
+                fingerprint = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                fingerprint = None
+            if cached is not None and fingerprint is not None and cached[1] == fingerprint:
+                self._swarm_file_cache = (now, fingerprint, cached[2])
+                return cached[2]
+
         try:
             latest_swarm = self.drone_config.read_swarm()
         except Exception as exc:
@@ -98,11 +136,8 @@ class DroneCommunicator:
                 exc,
             )
             latest_swarm = None
-
-        if isinstance(latest_swarm, dict) and latest_swarm:
-            return latest_swarm
-
-        return current_swarm
+        self._swarm_file_cache = (now, fingerprint, latest_swarm)
+        return latest_swarm
 
     def _resolve_telemetry_timestamp_ms(self) -> int:
         telemetry_timestamp_ms = safe_int(getattr(self.drone_config, "telemetry_timestamp_ms", 0))
@@ -390,7 +425,7 @@ class DroneCommunicator:
         return normalized
 
     @staticmethod
-    def _parse_command_header(command_data: Dict[str, Any]) -> Tuple[int, int]:
+    def _parse_command_header(command_data: Dict[str, Any]) -> Tuple[int, Union[int, float]]:
         try:
             mission_value = command_data["mission_type"]
             trigger_time_value = command_data["trigger_time"]
@@ -400,10 +435,7 @@ class DroneCommunicator:
         mission = int(mission_value)
         if mission not in Mission._value2member_map_:
             raise ValueError(f"Unknown mission command: {mission}")
-        trigger_time = int(trigger_time_value)
-        if trigger_time < 0:
-            raise ValueError("trigger_time must be non-negative")
-        return mission, trigger_time
+        return mission, normalize_trigger_time(trigger_time_value)
 
     def _prepare_command(self, command_data: Dict[str, Any]) -> PreparedCommandInstallation:
         """Validate a command and stage all files without publishing mutation."""
@@ -23,6 +23,7 @@ from src.action_result_protocol import (
     format_legacy_diagnostics,
     read_bounded_result_fd,
 )
+from src.command_contract import normalize_trigger_time
 from src.command_execution_contract import (
     DroneExecutionOutcome,
     format_superseded_execution_error,
@@ -50,7 +51,7 @@ class RunningMissionProcess:
     process: ManagedProcess
     command_id: Optional[str] = None
     mission_type: Optional[int] = None
-    trigger_time: int = 0
+    trigger_time: Union[int, float] = 0
     superseded: bool = False
     # Mission children are launched in their own POSIX session.  Owning the
     # process group lets an override stop helper processes as well as the
@@ -72,7 +73,7 @@ class AcceptedCommandClaim:
 
     command_id: Optional[str]
     mission_type: int
-    trigger_time: int = 0
+    trigger_time: Union[int, float] = 0
     ground_test_request_file: Optional[str] = None
 
 
@@ -103,7 +104,7 @@ class RecentCommandRecord:
     """Recent terminal command metadata for idempotent duplicate delivery."""
     command_id: str
     mission_type: int
-    trigger_time: int
+    trigger_time: Union[int, float]
     phase: str
     state: int
     recorded_at_monotonic: float
@@ -129,6 +130,22 @@ class ProcessStopSummary:
     cleanup_unconfirmed: int = 0
 
 
+@dataclass(frozen=True)
+class MissionTriggerReport:
+    """Measured launch timing of one scheduled (non-immediate) mission."""
+
+    mission_type: int
+    command_id: Optional[str]
+    trigger_time: float
+    launch_deadline: float
+    launched_at: float
+
+    @property
+    def lateness_sec(self) -> float:
+        """Seconds between the launch deadline and the mission subprocess start."""
+        return self.launched_at - self.launch_deadline
+
+
 class DroneSetup:
     """
     DroneSetup manages execution of drone missions (drone shows, takeoff, landing, etc.) via mission scripts.
@@ -137,14 +154,19 @@ class DroneSetup:
     - Logs success/failure with detailed info.
     """
 
-    def __init__(self, params, drone_config):
+    def __init__(self, params, drone_config, clock=time.time):
         """
         Args:
             params: Configuration parameters (must include 'trigger_sooner_seconds', etc.).
             drone_config: Object holding current mission, state, and related config.
+            clock: Wall-clock source (Unix seconds) used for trigger decisions.
         """
         self.params = params
         self.drone_config = drone_config
+        self.clock = clock
+
+        # Latest measured launch timing per mission type (timed missions only)
+        self.trigger_reports = {}
 
         # For preventing repeated logs about the same mission/state changes:
         self.last_logged_mission = None
@@ -551,7 +573,7 @@ class DroneSetup:
                 getattr(self.drone_config, "current_command_id", None)
             ),
             mission_type=int(getattr(self.drone_config, "mission", Mission.NONE.value)),
-            trigger_time=int(getattr(self.drone_config, "trigger_time", 0) or 0),
+            trigger_time=normalize_trigger_time(getattr(self.drone_config, "trigger_time", 0)),
             ground_test_request_file=getattr(
                 self.drone_config,
                 "ground_test_request_file",
@@ -760,7 +782,7 @@ class DroneSetup:
         command_id: Optional[str],
         *,
         mission_type: Optional[int],
-        trigger_time: int = 0,
+        trigger_time: Union[int, float] = 0,
         phase: str,
         state: int = State.IDLE.value,
     ):
@@ -776,7 +798,7 @@ class DroneSetup:
             self.recent_command_history[normalized_command_id] = RecentCommandRecord(
                 command_id=normalized_command_id,
                 mission_type=int(mission_type),
-                trigger_time=int(trigger_time or 0),
+                trigger_time=normalize_trigger_time(trigger_time),
                 phase=phase,
                 state=int(state),
                 recorded_at_monotonic=now_monotonic,
@@ -799,7 +821,7 @@ class DroneSetup:
 
             return {
                 'mission_type': int(record.mission_type),
-                'trigger_time': int(record.trigger_time),
+                'trigger_time': record.trigger_time,
                 'state': int(record.state),
                 'phase': str(record.phase),
             }
@@ -1756,7 +1778,7 @@ class DroneSetup:
     # --------------------- MISSION HANDLER HELPERS ---------------------
     # Extracted common logic to reduce duplication in mission handlers
 
-    def _check_mission_conditions(self, current_time: int, earlier_trigger_time: int) -> bool:
+    def _check_mission_conditions(self, current_time: float, earlier_trigger_time: float) -> bool:
         """
         Check if conditions are met to execute a mission.
 
@@ -1765,8 +1787,8 @@ class DroneSetup:
         - Current time must be >= earlier_trigger_time
 
         Args:
-            current_time: Current timestamp in milliseconds
-            earlier_trigger_time: Adjusted trigger time
+            current_time: Current Unix time in seconds (may be fractional)
+            earlier_trigger_time: Adjusted trigger time in Unix seconds
 
         Returns:
             True if conditions are met, False otherwise
@@ -1956,10 +1978,10 @@ class DroneSetup:
                 logger.debug("schedule_mission: Drone is already in TRIGGERED state, skipping.")
                 return
 
-            current_time = int(time.time())
+            current_time = self.clock()
             try:
-                trigger_time = int(self.drone_config.trigger_time)
-                trigger_sooner = int(self.params.trigger_sooner_seconds)
+                trigger_time = float(self.drone_config.trigger_time)
+                trigger_sooner = float(self.params.trigger_sooner_seconds)
                 earlier_trigger_time = trigger_time - trigger_sooner
             except (AttributeError, ValueError, TypeError) as e:
                 logger.error(f"Error calculating trigger time: {e}")
@@ -1984,6 +2006,8 @@ class DroneSetup:
                 # Only log at INFO level when something actually happened
                 if success:
                     logger.info(f"Mission executed: {message}")
+                    if trigger_time > 0:
+                        self._record_trigger_report(scheduler_claim, trigger_time, earlier_trigger_time)
                 else:
                     # Routine "no mission" cases logged at DEBUG (file only)
                     logger.debug(f"Mission check: {message}")
@@ -1995,6 +2019,51 @@ class DroneSetup:
         finally:
             self.command_state_transaction_lock.release()
 
+    def next_trigger_deadline(self) -> Optional[float]:
+        """
+        Unix time at which a pending timed mission must be launched, if any.
+
+        This is the trigger time minus ``trigger_sooner_seconds`` (the window the
+        mission script needs to initialize before its synchronized start).
+        Returns None when no timed mission is waiting.
+        """
+        if self.drone_config.state != State.MISSION_READY.value:
+            return None
+        try:
+            trigger_time = float(self.drone_config.trigger_time or 0)
+            trigger_sooner = float(self.params.trigger_sooner_seconds)
+        except (AttributeError, ValueError, TypeError):
+            return None
+        if trigger_time <= 0:
+            return None
+        return trigger_time - trigger_sooner
+
+    def _record_trigger_report(
+        self,
+        claim: AcceptedCommandClaim,
+        trigger_time: float,
+        launch_deadline: float,
+    ) -> MissionTriggerReport:
+        """Record how late a timed mission was launched relative to its deadline."""
+        report = MissionTriggerReport(
+            mission_type=claim.mission_type,
+            command_id=claim.command_id,
+            trigger_time=trigger_time,
+            launch_deadline=launch_deadline,
+            launched_at=self.clock(),
+        )
+        self.trigger_reports[claim.mission_type] = report
+        logger.info(
+            "Mission %s (command %s) launched %.1f ms after its trigger deadline "
+            "(trigger_time=%.3f, launch deadline=%.3f).",
+            claim.mission_type,
+            claim.command_id,
+            report.lateness_sec * 1000.0,
+            trigger_time,
+            launch_deadline,
+        )
+        return report
+
     # --------------------- MISSION HANDLERS ---------------------
 
     async def _handle_no_mission(self, current_time: int, earlier_trigger_time: int) -> tuple:
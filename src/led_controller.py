@@ -1,10 +1,12 @@
 # src/led_controller.py
 
+import atexit
+import bisect
 import time
 import threading
 
 from mds_logging import get_logger
-from typing import Union, Tuple, TYPE_CHECKING
+from typing import Callable, Iterable, List, Optional, Sequence, Union, Tuple, TYPE_CHECKING
 from src.params import Params
 
 # Import LED color definitions
@@ -50,6 +52,208 @@ if not Params.sim_mode:
             print("[LED] WARNING: No LED library available - LED support disabled")
             print("[LED] Install: pip install rpi-ws281x (Pi 4) OR pip install Pi5Neo (Pi 5)")
 
+# Max time the render worker gets at interpreter exit to push its last frame
+LED_RENDER_EXIT_FLUSH_SEC = 0.5
+
+RGB = Tuple[int, int, int]
+
+
+def _clamp_rgb(r, g, b) -> RGB:
+    return (
+        int(max(0, min(255, float(r)))),
+        int(max(0, min(255, float(g)))),
+        int(max(0, min(255, float(b)))),
+    )
+
+
+class LEDColorTimeline:
+    """
+    Time-indexed LED color track for one drone, stored as change points only.
+
+    ``times`` are seconds from mission start in ascending order and
+    ``colors[i]`` holds from ``times[i]`` until the next change point.
+    """
+
+    def __init__(self, times: Sequence[float], colors: Sequence[RGB]):
+        if len(times) != len(colors):
+            raise ValueError("LED timeline needs one color per time")
+        self.times: List[float] = []
+        self.colors: List[RGB] = []
+        for t, color in zip(times, colors):
+            color = _clamp_rgb(*color)
+            if self.times and float(t) < self.times[-1]:
+                raise ValueError("LED timeline times must be ascending")
+            if self.colors and color == self.colors[-1]:
+                continue
+            self.times.append(float(t))
+            self.colors.append(color)
+
+    @classmethod
+    def from_waypoints(cls, waypoints: Iterable[Sequence[float]]) -> "LEDColorTimeline":
+        """Build from trajectory rows ``(t, ..., ledr, ledg, ledb)``."""
+        times, colors = [], []
+        for waypoint in waypoints:
+            times.append(waypoint[0])
+            colors.append((waypoint[-3], waypoint[-2], waypoint[-1]))
+        return cls(times, colors)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def index_at(self, t: float) -> int:
+        """Index of the color showing at ``t`` seconds, or -1 before the first change."""
+        return bisect.bisect_right(self.times, t) - 1
+
+    def color_at(self, t: float) -> Optional[RGB]:
+        index = self.index_at(t)
+        return self.colors[index] if index >= 0 else None
+
+
+class LEDRenderWorker:
+    """
+    Dedicated thread that owns LED strip output.
+
+    Callers hand over frames with ``submit`` and return immediately. Frames are
+    latest-value-wins: a frame still waiting when a newer one arrives is
+    replaced, and a frame equal to what the strip shows, or is rendering right
+    now, is dropped. A preloaded ``LEDColorTimeline`` is played against
+    ``clock`` (seconds, same base as the timeline's start time) until a
+    submitted frame overrides it.
+
+    Args:
+        render: Pushes one (r, g, b) frame to the strip; called only on the worker thread.
+        clock: Wall clock used for timeline playback, injectable for tests.
+    """
+
+    def __init__(self, render: Callable[[int, int, int], None], clock: Callable[[], float] = time.time):
+        self._render = render
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._pending: Optional[RGB] = None
+        self._last_rendered: Optional[RGB] = None
+        self._in_flight: Optional[RGB] = None
+        self._timeline: Optional[LEDColorTimeline] = None
+        self._timeline_start = 0.0
+        self._busy = False
+        self._generation = 0
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.submitted_count = 0
+        self.coalesced_count = 0
+        self.duplicate_count = 0
+        self.rendered_count = 0
+
+    def start(self) -> "LEDRenderWorker":
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="led-render", daemon=True)
+                self._thread.start()
+        return self
+
+    def submit(self, r: int, g: int, b: int) -> None:
+        """Queue a frame without waiting for the strip; stops timeline playback."""
+        color = (r, g, b)
+        with self._cond:
+            self.submitted_count += 1
+            self._timeline = None
+            if self._pending is not None:
+                self.coalesced_count += 1
+                self._pending = None
+            # While a frame is rendering, that frame is what the strip will show.
+            shown = self._in_flight if self._busy else self._last_rendered
+            if color == shown:
+                self.duplicate_count += 1
+                return
+            self._pending = color
+            self._cond.notify()
+
+    def play_timeline(self, timeline: LEDColorTimeline, start_time: float) -> None:
+        """Render ``timeline`` against the clock, with t=0 at ``start_time``."""
+        with self._cond:
+            self._pending = None
+            self._timeline = timeline
+            self._timeline_start = float(start_time)
+            self._cond.notify()
+
+    def stop_timeline(self) -> None:
+        with self._cond:
+            self._timeline = None
+
+    def interrupt(self) -> None:
+        """Drop queued work and forget the shown color, e.g. after another writer used the strip."""
+        with self._cond:
+            self._pending = None
+            self._timeline = None
+            self._last_rendered = None
+            self._in_flight = None
+            self._generation += 1
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until no submitted frame is waiting or being rendered."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending is not None or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, flush_timeout: float = LED_RENDER_EXIT_FLUSH_SEC) -> None:
+        self.flush(flush_timeout)
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(flush_timeout)
+
+    def _next_frame_locked(self) -> Tuple[Optional[RGB], Optional[float]]:
+        """Frame to render now (if any) and how long to wait otherwise."""
+        if self._pending is not None:
+            frame, self._pending = self._pending, None
+            return frame, None
+        timeline = self._timeline
+        if timeline is None:
+            return None, None
+        elapsed = self._clock() - self._timeline_start
+        index = timeline.index_at(elapsed)
+        if index + 1 < len(timeline):
+            wait = max(0.0, timeline.times[index + 1] - elapsed)
+        else:
+            self._timeline = None
+            wait = None
+        if index >= 0 and timeline.colors[index] != self._last_rendered:
+            return timeline.colors[index], None
+        return None, wait
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    frame, wait = self._next_frame_locked()
+                    if frame is not None:
+                        break
+                    self._cond.wait(wait)
+                self._busy = True
+                self._in_flight = frame
+                generation = self._generation
+            try:
+                self._render(*frame)
+            except Exception:
+                # A failing strip must not kill the worker; the next frame retries.
+                frame = None
+            with self._cond:
+                self._busy = False
+                self._in_flight = None
+                if frame is not None:
+                    self.rendered_count += 1
+                    if generation == self._generation:
+                        self._last_rendered = frame
+                self._cond.notify_all()
+
 
 class LEDController:
     """
@@ -70,6 +274,7 @@ class LEDController:
     """
     _instance = None
     _lock = threading.Lock()
+    _worker_lock = threading.Lock()
 
     def __init__(self):
         """
@@ -88,6 +293,7 @@ class LEDController:
 
         self.strip = None
         self.led_library = None
+        self.worker: Optional[LEDRenderWorker] = None
 
         # Skip hardware initialization in simulation mode
         if Params.sim_mode:
@@ -177,12 +383,56 @@ class LEDController:
                     LEDController._instance = LEDController()
         return LEDController._instance
 
+    @staticmethod
+    def render_worker() -> Optional[LEDRenderWorker]:
+        """
+        Returns the render worker that owns strip output, starting it on first use.
+        Returns None when there is no LED hardware to drive.
+        """
+        instance = LEDController.get_instance()
+        if instance.strip is None:
+            return None
+        if instance.worker is None:
+            with LEDController._worker_lock:
+                if instance.worker is None:
+                    instance.worker = LEDRenderWorker(instance._fill_strip).start()
+                    atexit.register(instance.worker.stop)
+        return instance.worker
+
+    def _fill_strip(self, r: int, g: int, b: int):
+        """Writes one color to every pixel and pushes the strip (render worker thread)."""
+        with LEDController._lock:
+            # TODO (Future): Abstract this with LED driver interface class
+            try:
+                if self.led_library == 'Pi5Neo':
+                    # Pi 5: Use Pi5Neo API
+                    for i in range(Params.led_count):
+                        self.strip.set_led_color(i, r, g, b)
+                    self.strip.update_strip()
+
+                elif self.led_library == 'rpi_ws281x':
+                    # Pi 4 and earlier: Use rpi_ws281x API
+                    color = Color(r, g, b)
+                    for i in range(self.strip.numPixels()):
+                        self.strip.setPixelColor(i, color)
+                    self.strip.show()
+
+                self.logger.debug("Set color to R:%d, G:%d, B:%d", r, g, b)
+
+            except Exception as e:
+                # Never crash - just log error
+                self.logger.error(f"Error setting LED color: {e}")
+
     @staticmethod
     def set_color(r: int, g: int, b: int):
         """
         Sets all LEDs to the specified RGB color.
         RGB values are clamped to 0-255 range and converted to integers for robustness.
 
+        The frame is handed to the render worker and this call returns without
+        touching the strip; repeated colors are dropped and a newer color
+        replaces one not yet shown. Stops any playing color timeline.
+
         Args:
             r: Red component (0-255, will be clamped)
             g: Green component (0-255, will be clamped)
@@ -197,43 +447,31 @@ class LEDController:
 
         # Robust value clamping and type conversion
         try:
-            r = int(max(0, min(255, float(r))))
-            g = int(max(0, min(255, float(g))))
-            b = int(max(0, min(255, float(b))))
+            r, g, b = _clamp_rgb(r, g, b)
         except (ValueError, TypeError) as e:
             # Safe fallback to black
             instance = LEDController.get_instance()
             instance.logger.warning(f"LED color conversion error: {e}, using safe defaults (0,0,0)")
             r, g, b = 0, 0, 0
 
-        with LEDController._lock:
-            instance = LEDController.get_instance()
-
-            # Safe return if no LED hardware
-            if instance.strip is None:
-                return
-
-            # Set LED colors with library-specific API
-            # TODO (Future): Abstract this with LED driver interface class
-            try:
-                if instance.led_library == 'Pi5Neo':
-                    # Pi 5: Use Pi5Neo API
-                    for i in range(Params.led_count):
-                        instance.strip.set_led_color(i, r, g, b)
-                    instance.strip.update_strip()
-
-                elif instance.led_library == 'rpi_ws281x':
-                    # Pi 4 and earlier: Use rpi_ws281x API
-                    color = Color(r, g, b)
-                    for i in range(instance.strip.numPixels()):
-                        instance.strip.setPixelColor(i, color)
-                    instance.strip.show()
+        worker = LEDController.render_worker()
+        if worker is not None:
+            worker.submit(r, g, b)
 
-                instance.logger.debug("Set color to R:%d, G:%d, B:%d", r, g, b)
+    @staticmethod
+    def play_timeline(timeline: LEDColorTimeline, start_time: float):
+        """
+        Plays a preloaded color timeline on the render worker, with t=0 at
+        ``start_time`` (UNIX time, the mission clock). The next ``set_color``
+        or ``turn_off`` takes over from the timeline.
 
-            except Exception as e:
-                # Never crash - just log error
-                instance.logger.error(f"Error setting LED color: {e}")
+        Safety: Never crashes - returns silently if LED hardware unavailable
+        """
+        if Params.sim_mode or not len(timeline):
+            return
+        worker = LEDController.render_worker()
+        if worker is not None:
+            worker.play_timeline(timeline, start_time)
 
     @staticmethod
     def set_state(state: Union['LEDState', str]):
@@ -303,10 +541,13 @@ class LEDController:
         if Params.sim_mode:
             return
 
+        worker = LEDController.render_worker()
+        if worker is None:
+            return
+
+        worker.interrupt()
         with LEDController._lock:
             instance = LEDController.get_instance()
-            if instance.strip is None:
-                return
 
             try:
                 r = int(max(0, min(255, float(r))))
@@ -342,10 +583,13 @@ class LEDController:
         if Params.sim_mode:
             return
 
+        worker = LEDController.render_worker()
+        if worker is None:
+            return
+
+        worker.interrupt()
         with LEDController._lock:
             instance = LEDController.get_instance()
-            if instance.strip is None:
-                return
 
             try:
                 r = int(max(0, min(255, float(r))))
@@ -384,31 +628,16 @@ class LEDController:
     @staticmethod
     def turn_off():
         """
-        Turns off all LEDs.
+        Turns off all LEDs (through the render worker, like ``set_color``).
 
         Safety: Never crashes - returns silently if LED hardware unavailable
         """
         if Params.sim_mode:
             return
 
-        with LEDController._lock:
-            instance = LEDController.get_instance()
-            if instance.strip is None:
-                return
-
-            try:
-                # TODO (Future): Abstract LED operations with driver interface
-                if instance.led_library == 'Pi5Neo':
-                    for i in range(Params.led_count):
-                        instance.strip.set_led_color(i, 0, 0, 0)
-                    instance.strip.update_strip()
-
-                elif instance.led_library == 'rpi_ws281x':
-                    for i in range(instance.strip.numPixels()):
-                        instance.strip.setPixelColor(i, Color(0, 0, 0))
-                    instance.strip.show()
-
-                instance.logger.info("All LEDs turned off")
+        worker = LEDController.render_worker()
+        if worker is None:
+            return
 
-            except Exception as e:
-                instance.logger.error(f"Error turning off LEDs: {e}")
+        worker.submit(0, 0, 0)
+        LEDController.get_instance().logger.info("All LEDs turned off")
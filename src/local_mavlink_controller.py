@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from pymavlink import mavutil
 
+from src.mavlink_dispatch import MavlinkDispatcher
 from src.px4_flight_modes import (
     PX4_MAIN_MODE_AUTO,
     PX4_MAIN_MODE_OFFBOARD,
@@ -37,12 +38,10 @@ class LocalMavlinkController:
         """
         self.latest_messages = {}
         self.debug_enabled = debug_enabled
-        # Define which message types to listen for
-        self.message_filter = [
-            'GLOBAL_POSITION_INT', 'HOME_POSITION', 'BATTERY_STATUS', 'GPS_GLOBAL_ORIGIN',
-            'ATTITUDE', 'HEARTBEAT', 'GPS_RAW_INT', 'SYS_STATUS', 'LOCAL_POSITION_NED',
-            'STATUSTEXT'
-        ]
+        self.message_dispatcher = self._build_message_dispatcher()
+        # Message types to listen for come from the dispatch table; everything
+        # else is dropped inside the parser before CRC and payload decoding.
+        self.message_filter = self.message_dispatcher.message_types
         
         self.local_mavlink_port = int(getattr(params, 'local_mavlink_port', 12550))
         self.local_mavlink_timeout_sec = max(1, int(getattr(params, 'LOCAL_MAVLINK_TIMEOUT_SEC', 5)))
@@ -64,11 +63,33 @@ class LocalMavlinkController:
         self._status_text_buffers: Dict[int, Dict[str, Any]] = {}
         self._status_messages: OrderedDict[str, Dict[str, Any]] = OrderedDict()
 
+    def _build_message_dispatcher(self) -> MavlinkDispatcher:
+        """Dispatch table keyed by MAVLink message ID for the listener's handlers."""
+        return MavlinkDispatcher({
+            'HEARTBEAT': self._handle_heartbeat,
+            'GLOBAL_POSITION_INT': self.process_global_position_int,
+            'HOME_POSITION': self.set_home_position,
+            'BATTERY_STATUS': self.process_battery_status,
+            'ATTITUDE': self.process_attitude,
+            'GPS_RAW_INT': self.process_gps_raw_int,
+            'LOCAL_POSITION_NED': self.process_local_position_ned,
+            'SCALED_PRESSURE': self.process_scaled_pressure,
+            'GPS_GLOBAL_ORIGIN': self.process_gps_global_origin,
+            'SYS_STATUS': self.process_sys_status,
+            'STATUSTEXT': self.process_status_text,
+        })
+
+    def get_ingest_stats(self) -> Dict[str, Any]:
+        """Per-message-type rates, decode/handler cost and staleness of the local stream."""
+        return self.message_dispatcher.snapshot()
+
     def _open_mavlink_connection(self):
         """Open a fresh UDP listener for the locally routed MAVLink stream."""
         connection_string = f"udpin:127.0.0.1:{self.local_mavlink_port}"
         self.log_debug(f"Opening LocalMavlinkController on {connection_string}")
-        return mavutil.mavlink_connection(connection_string)
+        connection = mavutil.mavlink_connection(connection_string)
+        self.message_dispatcher.install_parser_filter(connection)
+        return connection
 
     def _reset_mavlink_connection(self, reason: str) -> None:
         """Close and reopen the local MAVLink listener after repeated silence/errors."""
@@ -143,39 +164,18 @@ class LocalMavlinkController:
         Process incoming Mavlink messages based on their type and update the drone_config object.
         """
         msg_type = msg.get_type()
+        if msg_type != 'HEARTBEAT':
+            self.latest_messages[msg_type] = msg
 
+        if not self.message_dispatcher.dispatch(msg):
+            self.log_debug(f"Received unhandled message type: {msg_type}")
+
+    def _handle_heartbeat(self, msg):
         # A routed MAVLink network can carry HEARTBEATs from QGC, companion
         # computers, and other components. Only a flight-controller heartbeat
         # may own flight mode, system state, arming state, or their freshness.
-        if msg_type == 'HEARTBEAT':
-            if self.process_heartbeat(msg):
-                self.latest_messages[msg_type] = msg
-            return
-
-        self.latest_messages[msg_type] = msg
-
-        if msg_type == 'GLOBAL_POSITION_INT':
-            self.process_global_position_int(msg)
-        elif msg_type == 'HOME_POSITION':
-            self.set_home_position(msg)
-        elif msg_type == 'BATTERY_STATUS':
-            self.process_battery_status(msg)
-        elif msg_type == 'ATTITUDE':
-            self.process_attitude(msg)
-        elif msg_type == 'GPS_RAW_INT':
-            self.process_gps_raw_int(msg)
-        elif msg_type == 'LOCAL_POSITION_NED':
-            self.process_local_position_ned(msg)
-        elif msg_type == 'SCALED_PRESSURE':
-            self.process_scaled_pressure(msg)
-        elif msg_type == 'GPS_GLOBAL_ORIGIN':
-            self.process_gps_global_origin(msg)
-        elif msg_type == 'SYS_STATUS':
-            self.process_sys_status(msg)
-        elif msg_type == 'STATUSTEXT':
-            self.process_status_text(msg)
-        else:
-            self.log_debug(f"Received unhandled message type: {msg.get_type()}")
+        if self.process_heartbeat(msg):
+            self.latest_messages['HEARTBEAT'] = msg
 
     @staticmethod
     def _now_ms() -> int:
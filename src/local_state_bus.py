@@ -0,0 +1,348 @@
+# src/local_state_bus.py
+"""
+Shared-memory local state bus between the coordinator and mission processes.
+
+The coordinator is the single writer: `LocalStateBusPublisher` periodically
+packs the numeric core of its drone state and the home position into a
+fixed-layout named shared-memory segment. Mission processes on the same host
+read it with `read_local_state_snapshot()` in microseconds, without HTTP, JSON
+or pydantic.
+
+Writes follow a seqlock: the sequence counter is odd while the payload is being
+rewritten, so readers retry reads that overlapped a write. A CRC over the
+payload additionally rejects torn reads on weakly ordered CPUs. Readers return
+``None`` when the segment is missing, disabled, stale or unreadable, and callers
+fall back to the local drone API over HTTP.
+"""
+
+import math
+import struct
+import threading
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, NamedTuple, Optional
+
+from mds_logging import get_logger
+from src.params import Params
+
+logger = get_logger("local_state_bus")
+
+MAGIC = b"MDSB"
+LAYOUT_VERSION = 1
+READ_ATTEMPTS = 8
+
+# Drone-state keys carried on the bus use the same names as the HTTP payload.
+_STATE_FIELDS = (
+    ("hw_id", "q"),
+    ("pos_id", "q"),
+    ("state", "q"),
+    ("mission", "q"),
+    ("update_time", "q"),
+    ("flight_mode", "q"),
+    ("base_mode", "q"),
+    ("system_status", "q"),
+    ("is_armed", "?"),
+    ("is_ready_to_arm", "?"),
+    ("home_position_set", "?"),
+    ("global_position_valid", "?"),
+    ("gps_fix_type", "q"),
+    ("heartbeat_timestamp_ms", "q"),
+    ("position_lat", "d"),
+    ("position_long", "d"),
+    ("position_alt", "d"),
+    ("velocity_north", "d"),
+    ("velocity_east", "d"),
+    ("velocity_down", "d"),
+    ("yaw", "d"),
+    ("relative_altitude_m", "d"),
+)
+_HOME_FIELDS = (
+    ("home_available", "?"),
+    ("home_latitude", "d"),
+    ("home_longitude", "d"),
+    ("home_altitude", "d"),
+)
+_FIELDS = (("published_at", "d"),) + _STATE_FIELDS + _HOME_FIELDS
+_FIELD_NAMES = tuple(name for name, _ in _FIELDS)
+STATE_KEYS = tuple(name for name, _ in _STATE_FIELDS)
+
+_HEADER = struct.Struct("<4sHHQ")  # magic, layout version, payload size, sequence
+_SEQUENCE = struct.Struct("<Q")
+_SEQUENCE_OFFSET = 8
+_PAYLOAD = struct.Struct("<" + "".join(code for _, code in _FIELDS))
+_CRC = struct.Struct("<I")
+_PAYLOAD_OFFSET = _HEADER.size
+SEGMENT_SIZE = _HEADER.size + _PAYLOAD.size + _CRC.size
+
+_owned_segments = set()  # segment names created (and tracked) by writers in this process
+
+
+class LocalStateSnapshot(NamedTuple):
+    """Decoded bus contents in the same shapes as the local HTTP routes."""
+
+    drone_state: Dict[str, Any]
+    home_position: Optional[Dict[str, Any]]
+    published_at: float
+    sequence: int
+
+
+def segment_name(drone_api_port: Optional[int] = None) -> str:
+    """Segment name scoped by drone API port so co-hosted SITL drones never collide."""
+    port = Params.drone_api_port if drone_api_port is None else drone_api_port
+    return f"mds_local_state_{port}"
+
+
+def _encode(code: str, value: Any) -> Any:
+    if code == "?":
+        return bool(value)
+    if code == "q":
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+    try:
+        return float(value) if value is not None else math.nan
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _decode_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _attach_untracked(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process unlink it at exit."""
+    segment = shared_memory.SharedMemory(name=name)
+    if name in _owned_segments:
+        return segment
+    # Python < 3.13 registers attached segments with the resource tracker, which
+    # would unlink the coordinator's segment when a mission process exits.
+    try:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    except Exception:
+        pass
+    return segment
+
+
+class LocalStateBusWriter:
+    """Single-writer owner of the shared-memory state segment."""
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name or segment_name()
+        try:
+            self._segment = shared_memory.SharedMemory(name=self.name, create=True, size=SEGMENT_SIZE)
+        except FileExistsError:
+            # Left behind by a coordinator that did not shut down cleanly.
+            stale = shared_memory.SharedMemory(name=self.name)
+            stale.close()
+            stale.unlink()
+            self._segment = shared_memory.SharedMemory(name=self.name, create=True, size=SEGMENT_SIZE)
+        _owned_segments.add(self.name)
+        self._sequence = 0
+        _HEADER.pack_into(self._segment.buf, 0, MAGIC, LAYOUT_VERSION, _PAYLOAD.size, self._sequence)
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def publish(self, drone_state: Dict[str, Any], home_position: Optional[Dict[str, Any]]) -> int:
+        """Publish one snapshot; returns the new (even) sequence number."""
+        home = home_position or {}
+        home_available = bool(home_position) and home.get("latitude") is not None
+        values = {
+            "published_at": time.time(),
+            "home_available": home_available,
+            "home_latitude": home.get("latitude"),
+            "home_longitude": home.get("longitude"),
+            "home_altitude": home.get("altitude"),
+        }
+        for key in STATE_KEYS:
+            values[key] = drone_state.get(key)
+        payload = _PAYLOAD.pack(*(_encode(code, values[name]) for name, code in _FIELDS))
+        record = payload + _CRC.pack(zlib.crc32(payload))
+
+        buffer = self._segment.buf
+        self._sequence += 1
+        _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, self._sequence)
+        buffer[_PAYLOAD_OFFSET:SEGMENT_SIZE] = record
+        self._sequence += 1
+        _SEQUENCE.pack_into(buffer, _SEQUENCE_OFFSET, self._sequence)
+        return self._sequence
+
+    def close(self, unlink: bool = True) -> None:
+        if self._segment is None:
+            return
+        self._segment.close()
+        if unlink:
+            try:
+                self._segment.unlink()
+            except FileNotFoundError:
+                pass
+            _owned_segments.discard(self.name)
+        self._segment = None
+
+
+class LocalStateBusReader:
+    """Lock-free reader; attaches lazily and re-attaches after the writer restarts."""
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name or segment_name()
+        self._segment = None
+
+    def _buffer(self):
+        if self._segment is None:
+            try:
+                segment = _attach_untracked(self.name)
+            except (FileNotFoundError, OSError, ValueError):
+                return None
+            if segment.size < SEGMENT_SIZE:
+                segment.close()
+                return None
+            self._segment = segment
+        return self._segment.buf
+
+    def _detach(self) -> None:
+        if self._segment is not None:
+            try:
+                self._segment.close()
+            except BufferError:
+                pass
+            self._segment = None
+
+    def read(self, max_age_sec: Optional[float] = None) -> Optional[LocalStateSnapshot]:
+        buffer = self._buffer()
+        if buffer is None:
+            return None
+
+        for _ in range(READ_ATTEMPTS):
+            magic, version, payload_size, sequence = _HEADER.unpack_from(buffer, 0)
+            if magic != MAGIC or version != LAYOUT_VERSION or payload_size != _PAYLOAD.size:
+                self._detach()
+                return None
+            if sequence & 1:
+                continue
+            record = bytes(buffer[_PAYLOAD_OFFSET:SEGMENT_SIZE])
+            if _SEQUENCE.unpack_from(buffer, _SEQUENCE_OFFSET)[0] != sequence:
+                continue
+            payload = record[:_PAYLOAD.size]
+            if zlib.crc32(payload) != _CRC.unpack_from(record, _PAYLOAD.size)[0]:
+                continue
+            break
+        else:
+            return None
+
+        if sequence == 0:
+            return None
+        values = dict(zip(_FIELD_NAMES, _PAYLOAD.unpack(payload)))
+        published_at = values["published_at"]
+        if max_age_sec is not None and time.time() - published_at > max_age_sec:
+            # Stale: the writer may have restarted with a fresh segment.
+            self._detach()
+            return None
+
+        drone_state = {}
+        for key, code in _STATE_FIELDS:
+            value = values[key]
+            drone_state[key] = _decode_float(value) if code == "d" else value
+        home_position = None
+        if values["home_available"]:
+            home_position = {
+                "latitude": values["home_latitude"],
+                "longitude": values["home_longitude"],
+                "altitude": _decode_float(values["home_altitude"]),
+                "timestamp": int(published_at * 1000),
+            }
+        return LocalStateSnapshot(drone_state, home_position, published_at, sequence)
+
+    def close(self) -> None:
+        self._detach()
+
+
+_default_reader: Optional[LocalStateBusReader] = None
+
+
+def read_local_state_snapshot(max_age_sec: Optional[float] = None) -> Optional[LocalStateSnapshot]:
+    """Read this drone's latest coordinator snapshot, or ``None`` to fall back to HTTP."""
+    global _default_reader
+    if not Params.LOCAL_STATE_BUS_ENABLED:
+        return None
+    if _default_reader is None:
+        _default_reader = LocalStateBusReader()
+    if max_age_sec is None:
+        max_age_sec = Params.LOCAL_STATE_BUS_MAX_AGE_SEC
+    try:
+        return _default_reader.read(max_age_sec=max_age_sec)
+    except Exception as exc:
+        logger.debug(f"Local state bus read failed, falling back to HTTP: {exc}")
+        return None
+
+
+class LocalStateBusPublisher:
+    """
+    Coordinator thread that publishes the communicator's drone state to the bus.
+    """
+
+    def __init__(self, drone_communicator, drone_config, interval: Optional[float] = None):
+        self.drone_communicator = drone_communicator
+        self.drone_config = drone_config
+        self.interval = Params.LOCAL_STATE_BUS_PUBLISH_INTERVAL_SEC if interval is None else interval
+        self.writer: Optional[LocalStateBusWriter] = None
+        self.running = False
+        self.thread = None
+        self._stop_event = threading.Event()
+
+    def start(self):
+        """
+        Create the segment and start the publishing thread.
+        """
+        if not Params.LOCAL_STATE_BUS_ENABLED:
+            logger.info("Local state bus disabled; mission processes will use the HTTP API.")
+            return
+        if self.running:
+            logger.warning("LocalStateBusPublisher is already running.")
+            return
+
+        try:
+            self.writer = LocalStateBusWriter()
+        except OSError as e:
+            logger.warning(f"Local state bus unavailable ({e}); mission processes will use the HTTP API.")
+            return
+        self.running = True
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._publish_loop, daemon=True)
+        self.thread.start()
+        logger.info(f"LocalStateBusPublisher started on segment {self.writer.name}.")
+
+    def stop(self):
+        """
+        Stop the publishing thread and remove the segment.
+        """
+        self.running = False
+        self._stop_event.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2)
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        logger.info("LocalStateBusPublisher stopped.")
+
+    def publish_once(self) -> int:
+        drone_state = self.drone_communicator.get_drone_state()
+        home = getattr(self.drone_config, "home_position", None) or {}
+        home_position = None
+        if home:
+            home_position = {
+                "latitude": home.get("lat"),
+                "longitude": home.get("long"),
+                "altitude": home.get("alt"),
+            }
+        return self.writer.publish(drone_state, home_position)
+
+    def _publish_loop(self):
+        while self.running:
+            try:
+                self.publish_once()
+            except Exception as e:
+                logger.error(f"LocalStateBusPublisher encountered an error: {e}", exc_info=True)
+            self._stop_event.wait(self.interval)
@@ -0,0 +1,210 @@
+# src/mavlink_dispatch.py
+"""
+Table-driven MAVLink ingest for the local telemetry listener.
+
+`MavlinkDispatcher` maps MAVLink message IDs to handlers. Installed on a
+pymavlink connection, it also filters at the parser level: frames whose ID is
+not in the table are skipped right after their header is read, so they never
+pay for pymavlink's pure-Python CRC or payload unpacking.
+
+Every dispatched message updates per-type counters (rate, decode and handler
+time, staleness) that `snapshot()` returns for the drone API. Counters are
+written only by the telemetry thread; snapshots taken from other threads read
+plain ints and floats and may be a message behind, never torn.
+"""
+
+import time
+from typing import Any, Callable, Dict, Optional
+
+from pymavlink import mavutil
+
+mavlink = mavutil.mavlink
+
+
+class _MessageTypeStats:
+    __slots__ = (
+        "name",
+        "count",
+        "decode_ns",
+        "handler_ns",
+        "handler_max_ns",
+        "last_received",
+        "window_start",
+        "window_count",
+        "rate_hz",
+    )
+
+    def __init__(self, name: str, now: float):
+        self.name = name
+        self.count = 0
+        self.decode_ns = 0
+        self.handler_ns = 0
+        self.handler_max_ns = 0
+        self.last_received: Optional[float] = None
+        self.window_start = now
+        self.window_count = 0
+        self.rate_hz = 0.0
+
+
+class MavlinkDispatcher:
+    """
+    Dispatch MAVLink messages through a {message ID: handler} table and keep
+    per-type ingest statistics.
+
+    Args:
+        handlers: Handler per MAVLink message name (e.g. ``"ATTITUDE"``).
+        rate_window_sec: Window over which per-type message rates are measured.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[Any], Any]],
+        rate_window_sec: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._clock = clock
+        self.rate_window_sec = rate_window_sec
+        self.started_at = clock()
+        self._ids_by_name: Dict[str, int] = {}
+        self._handlers: Dict[int, Callable[[Any], Any]] = {}
+        self._stats: Dict[int, _MessageTypeStats] = {}
+        for name, handler in handlers.items():
+            msg_id = getattr(mavlink, f"MAVLINK_MSG_ID_{name}")
+            self._ids_by_name[name] = msg_id
+            self._handlers[msg_id] = handler
+            self._stats[msg_id] = _MessageTypeStats(name, self.started_at)
+        self.filtered_count = 0
+        self.filtered_by_id: Dict[int, int] = {}
+
+    @property
+    def message_types(self):
+        """Message names in table order, suitable for ``recv_match(type=...)``."""
+        return list(self._ids_by_name)
+
+    def install_parser_filter(self, connection) -> bool:
+        """
+        Skip unwanted frames inside ``connection``'s pymavlink parser.
+
+        Wanted frames go through the original ``decode`` (CRC, signing, payload
+        unpack), which is timed per type. Others become header-only
+        ``MAVLink_unknown`` messages that ``recv_match`` discards by type.
+        Returns False when ``connection`` has no pymavlink parser to wrap.
+        """
+        parser = getattr(connection, "mav", None)
+        decode = getattr(parser, "decode", None)
+        if decode is None:
+            return False
+
+        wanted = self._handlers
+        stats_by_id = self._stats
+        filtered_by_id = self.filtered_by_id
+        perf_counter_ns = time.perf_counter_ns
+
+        def filtering_decode(msgbuf):
+            # The parser only hands over complete frames (header + payload + CRC).
+            if msgbuf[0] == mavlink.PROTOCOL_MARKER_V1:
+                msg_id = msgbuf[5]
+            else:
+                msg_id = msgbuf[7] | (msgbuf[8] << 8) | (msgbuf[9] << 16)
+
+            if msg_id in wanted:
+                started = perf_counter_ns()
+                msg = decode(msgbuf)
+                stats_by_id[msg_id].decode_ns += perf_counter_ns() - started
+                return msg
+
+            self.filtered_count += 1
+            filtered_by_id[msg_id] = filtered_by_id.get(msg_id, 0) + 1
+            msg = mavlink.MAVLink_unknown(msg_id, b"")
+            if msgbuf[0] == mavlink.PROTOCOL_MARKER_V1:
+                msg._header = mavlink.MAVLink_header(
+                    msg_id, mlen=msgbuf[1], seq=msgbuf[2], srcSystem=msgbuf[3], srcComponent=msgbuf[4]
+                )
+            else:
+                msg._header = mavlink.MAVLink_header(
+                    msg_id,
+                    incompat_flags=msgbuf[2],
+                    compat_flags=msgbuf[3],
+                    mlen=msgbuf[1],
+                    seq=msgbuf[4],
+                    srcSystem=msgbuf[5],
+                    srcComponent=msgbuf[6],
+                )
+            return msg
+
+        parser.decode = filtering_decode
+        return True
+
+    def _resolve_id(self, msg) -> Optional[int]:
+        get_msg_id = getattr(msg, "get_msgId", None)
+        if get_msg_id is not None:
+            msg_id = get_msg_id()
+            if msg_id in self._handlers:
+                return msg_id
+        return self._ids_by_name.get(msg.get_type())
+
+    def dispatch(self, msg) -> bool:
+        """Run the handler registered for ``msg``; returns False when there is none."""
+        msg_id = self._resolve_id(msg)
+        if msg_id is None:
+            return False
+
+        now = self._clock()
+        stats = self._stats[msg_id]
+        started = time.perf_counter_ns()
+        try:
+            self._handlers[msg_id](msg)
+        finally:
+            elapsed = time.perf_counter_ns() - started
+            stats.count += 1
+            stats.handler_ns += elapsed
+            if elapsed > stats.handler_max_ns:
+                stats.handler_max_ns = elapsed
+            stats.last_received = now
+            stats.window_count += 1
+            window_elapsed = now - stats.window_start
+            if window_elapsed >= self.rate_window_sec:
+                stats.rate_hz = stats.window_count / window_elapsed
+                stats.window_start = now
+                stats.window_count = 0
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-type and aggregate ingest statistics as plain JSON-ready values."""
+        now = self._clock()
+        uptime = max(now - self.started_at, 1e-9)
+        message_types = {}
+        total_count = 0
+        total_handler_ns = 0
+        total_decode_ns = 0
+        for stats in list(self._stats.values()):
+            count = stats.count
+            window_elapsed = now - stats.window_start
+            rate_hz = stats.rate_hz
+            if window_elapsed >= self.rate_window_sec or (not rate_hz and window_elapsed > 0):
+                # No completed window yet, or the stream slowed or stopped since the last one.
+                rate_hz = stats.window_count / window_elapsed
+            message_types[stats.name] = {
+                "count": count,
+                "rate_hz": round(rate_hz, 2),
+                "decode_avg_us": round(stats.decode_ns / count / 1000.0, 2) if count else None,
+                "handler_avg_us": round(stats.handler_ns / count / 1000.0, 2) if count else None,
+                "handler_max_us": round(stats.handler_max_ns / 1000.0, 2) if count else None,
+                "age_ms": (
+                    int((now - stats.last_received) * 1000) if stats.last_received is not None else None
+                ),
+            }
+            total_count += count
+            total_handler_ns += stats.handler_ns
+            total_decode_ns += stats.decode_ns
+
+        return {
+            "uptime_sec": round(uptime, 3),
+            "dispatched_count": total_count,
+            "filtered_count": self.filtered_count,
+            "filtered_by_id": {str(msg_id): count for msg_id, count in sorted(self.filtered_by_id.items())},
+            # Share of wall time the telemetry thread spent decoding and handling wanted messages.
+            "ingest_busy_ratio": round((total_handler_ns + total_decode_ns) / (uptime * 1e9), 6),
+            "message_types": message_types,
+        }
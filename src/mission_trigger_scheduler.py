@@ -0,0 +1,103 @@
+# src/mission_trigger_scheduler.py
+"""
+Deadline-driven mission trigger scheduling for the coordinator.
+
+`DroneSetup.schedule_mission` used to be polled at `schedule_mission_frequency`,
+so a timed mission launched on the first tick after its deadline: up to one
+poll period late on every drone. `MissionTriggerScheduler` keeps the poll
+cadence for picking up new commands and feeding the watchdog, but once a timed
+mission's launch deadline (`trigger_time - trigger_sooner_seconds`) falls inside
+the next poll period it sleeps to that exact deadline instead:
+
+1. a coarse sleep until `wake_margin` seconds before the deadline,
+2. a re-read of the deadline (the command may have been replaced or cancelled
+   meanwhile), then
+3. a short final sleep to the deadline and a `schedule_mission()` call.
+
+The clock and sleep functions are injectable so tests can drive the schedule
+with a fake clock.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from mds_logging import get_logger
+
+logger = get_logger("mission_trigger_scheduler")
+
+DEFAULT_POLL_INTERVAL_SEC = 0.5
+DEFAULT_WAKE_MARGIN_SEC = 0.05
+
+
+class MissionTriggerScheduler:
+    """Runs `DroneSetup.schedule_mission` on a poll cadence and at exact launch deadlines."""
+
+    def __init__(
+        self,
+        drone_setup,
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+        wake_margin: float = DEFAULT_WAKE_MARGIN_SEC,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        on_tick: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            drone_setup: The DroneSetup whose missions are scheduled.
+            poll_interval: Seconds between routine `schedule_mission` calls.
+            wake_margin: How early the coarse sleep ends before a launch deadline.
+            clock: Wall-clock source in Unix seconds (same clock as trigger times).
+            sleep: Awaitable sleep function.
+            on_tick: Optional callback run at the start of every iteration
+                (watchdog notify, state-change logging).
+        """
+        self.drone_setup = drone_setup
+        self.poll_interval = max(0.01, float(poll_interval))
+        self.wake_margin = max(0.0, float(wake_margin))
+        self.clock = clock
+        self.sleep = sleep
+        self.on_tick = on_tick
+
+    async def run(self):
+        """Schedule missions forever."""
+        while True:
+            await self.run_once()
+
+    async def run_once(self):
+        """Run one scheduler iteration: either a poll tick or a deadline launch."""
+        if self.on_tick is not None:
+            self.on_tick()
+
+        deadline = self.drone_setup.next_trigger_deadline()
+        if deadline is not None:
+            remaining = deadline - self.clock()
+            if remaining > self.poll_interval:
+                # Not due yet; keep polling so new commands and the watchdog are serviced.
+                await self.drone_setup.schedule_mission()
+                await self.sleep(min(self.poll_interval, remaining - self.poll_interval))
+                return
+            if remaining > 0 and not await self._sleep_until(deadline):
+                return
+
+        await self.drone_setup.schedule_mission()
+        await self.sleep(self.poll_interval)
+
+    async def _sleep_until(self, deadline: float) -> bool:
+        """
+        Sleep to `deadline`, waking `wake_margin` early to re-check it.
+
+        Returns False when the pending deadline changed while sleeping; the
+        caller then starts a fresh iteration against the new state.
+        """
+        coarse = deadline - self.wake_margin - self.clock()
+        if coarse > 0:
+            await self.sleep(coarse)
+        if self.drone_setup.next_trigger_deadline() != deadline:
+            logger.debug("Launch deadline %.3f changed while waiting; rescheduling.", deadline)
+            return False
+        remaining = deadline - self.clock()
+        if remaining > 0:
+            await self.sleep(remaining)
+        return True
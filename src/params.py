@@ -223,7 +223,8 @@ class Params:
     SMART_SWARM_GCS_NOTIFY_TIMEOUT_SEC = 2.0     # Per-request timeout for follower -> GCS leader-change notify
     SMART_SWARM_USE_REALTIME_STREAM = True
     SMART_SWARM_ENABLE_HTTP_FALLBACK = True
-    SMART_SWARM_STATE_STREAM_RATE_HZ = 15
+    SMART_SWARM_STATE_STREAM_RATE_HZ = 15        # Default /ws/swarm-state rate; followers may request their own with ?rate_hz=
+    SMART_SWARM_STATE_STREAM_MAX_RATE_HZ = 30    # Server-side cap on any /ws/swarm-state client's requested rate
     SMART_SWARM_STREAM_CONNECT_TIMEOUT_SEC = 3.0
     SMART_SWARM_STREAM_BACKOFF_INITIAL_SEC = 0.25
     SMART_SWARM_STREAM_BACKOFF_MAX_SEC = 2.0
@@ -240,6 +241,7 @@ class Params:
     # minimum seconds between successive elections
     LEADER_ELECTION_COOLDOWN = 30
     SMART_SWARM_LEADER_LOSS_STRATEGY = "upstream_or_hold"
+    SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC = 0.25  # Max age of the in-memory runtime assignment before re-stat'ing its file
 
     
     csv_dt = 0.05                     # default step time of the processed CSV file to generate (s)
@@ -256,6 +258,12 @@ class Params:
     git_poll_interval = 10                  # GCS git status polling interval in seconds
     GCS_TELEMETRY_REQUEST_TIMEOUT_SEC = 2.0 # Per-request timeout for GCS -> drone telemetry pulls
     GCS_GIT_STATUS_REQUEST_TIMEOUT_SEC = 5.0  # Per-request timeout for GCS -> drone git-status pulls
+    GCS_FLEET_CONFIG_WATCH_INTERVAL_SEC = 1.0  # stat() cadence for detecting external config.json edits
+    GCS_HEARTBEAT_STREAM_RESYNC_SEC = 30.0  # /ws/heartbeats pushes changes as they happen plus a full snapshot this often
+    DRONE_STATE_PAYLOAD_MIN_REFRESH_SEC = 0.05  # Drone API readers within this window share one serialized state snapshot
+    DRONE_STATE_PAYLOAD_MAX_REUSE_SEC = 1.0     # Unchanged state is re-serialized (fresh ages/server_time) at least this often
+    DRONE_STATE_STREAM_DEFAULT_RATE_HZ = 1.0    # /ws/drone-state rate for clients that do not request one
+    DRONE_STATE_STREAM_MAX_RATE_HZ = 10.0       # Server-side cap on any /ws/drone-state client's requested rate
     get_drone_state_URI = DRONE_STATE_ROUTE.lstrip('/')  # Canonical drone state route
     send_drone_command_URI = DRONE_COMMANDS_ROUTE.lstrip('/')  # Canonical drone command route
 
@@ -337,6 +345,7 @@ class Params:
     # Sleep Interval for Main Loop
     sleep_interval = 0.1           # Sleep interval for the main loop in seconds
     trigger_sooner_seconds = 4     # Trigger mission a bit early to compensate for initialization
+    trigger_wake_margin_seconds = 0.05  # Scheduler wakes this early before a launch deadline to re-check the pending mission
 
     max_takeoff_alt = 100          # Maximum allowable takeoff altitude
     default_takeoff_alt = 10       # Default takeoff altitude
@@ -360,6 +369,8 @@ class Params:
     PX4_PARAMETER_MAVLINK_HEARTBEAT_TIMEOUT_SEC = 5.0
     PX4_PARAMETER_MAVLINK_SNAPSHOT_TIMEOUT_SEC = 45.0
     PX4_PARAMETER_MAVLINK_IDLE_TIMEOUT_SEC = 1.5
+    PX4_PARAMETER_MAVLINK_HASH_TIMEOUT_SEC = 0.5   # _HASH_CHECK round trip used to validate the cached parameter set
+    PX4_PARAMETER_MAVLINK_REREQUEST_ROUNDS = 5     # PARAM_REQUEST_READ rounds for indices lost during a listing
     PX4_PARAMETER_METADATA_CATALOG_PATHS = os.environ.get("MDS_PX4_PARAMETER_METADATA_CATALOG_PATHS", "")
     PX4_PARAMETER_ONLINE_DOCS_METADATA_ENABLED = _env_flag("MDS_PX4_PARAMETER_ONLINE_DOCS_METADATA_ENABLED", True)
     PX4_PARAMETER_METADATA_CACHE_DIR = os.environ.get("MDS_PX4_PARAMETER_METADATA_CACHE_DIR", "~/.cache/mds/px4-param-docs")
@@ -455,6 +466,12 @@ class Params:
     QUICKSCOUT_PROGRESS_REPORT_INTERVAL_SEC = 2.0 # Canonical cadence for QuickScout runtime status reports to GCS
     QUICKSCOUT_PROGRESS_STREAM_TIMEOUT_SEC = 0.5  # Per-read timeout when mission-progress callbacks are only hints
     QUICKSCOUT_FINISHED_CHECK_TIMEOUT_SEC = 5.0   # Timeout for each is_mission_finished probe during QuickScout monitoring
+    QUICKSCOUT_PROGRESS_RETRY_INITIAL_SEC = 0.5   # First backoff after a rejected/unreachable QuickScout progress report
+    QUICKSCOUT_PROGRESS_RETRY_MAX_SEC = 8.0       # Backoff ceiling while the GCS keeps rejecting QuickScout progress reports
+    QUICKSCOUT_PROGRESS_FLUSH_TIMEOUT_SEC = 10.0  # Max wait at mission exit for the final QuickScout progress report
+    LOCAL_STATE_BUS_ENABLED = _env_flag("MDS_LOCAL_STATE_BUS_ENABLED", True)  # Coordinator publishes drone state to shared memory for mission processes
+    LOCAL_STATE_BUS_PUBLISH_INTERVAL_SEC = 0.1    # Coordinator shared-memory state publish cadence
+    LOCAL_STATE_BUS_MAX_AGE_SEC = 1.0             # Older shared-memory snapshots are ignored in favour of the HTTP API
     ULOG_DOWNLOAD_REQUIRE_DISARMED = _env_flag("MDS_ULOG_DOWNLOAD_REQUIRE_DISARMED", True)
     ULOG_ERASE_REQUIRE_DISARMED = _env_flag("MDS_ULOG_ERASE_REQUIRE_DISARMED", True)
     ULOG_DOWNLOAD_JOB_TTL_SEC = _safe_float(os.environ.get("MDS_ULOG_DOWNLOAD_JOB_TTL_SEC", "1800"), 1800.0)
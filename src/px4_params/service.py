@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import re
 import struct
+import threading
 import time
 import uuid
 from typing import Any, Dict, Iterable, Optional
@@ -29,6 +30,7 @@ from src.px4_param_models import (
     Px4ParamValueType,
 )
 from src.px4_params.catalog import Px4ParamCatalogEntry, load_px4_param_catalog_index
+from src.px4_params.sync import Px4ParamSyncCache, Px4ParamSyncEngine, Px4ParamSyncResult
 
 
 class Px4ParamService:
@@ -37,6 +39,9 @@ class Px4ParamService:
     def __init__(self, params: Any, *, hw_id: str) -> None:
         self.params = params
         self.hw_id = str(hw_id)
+        self._mavlink_sync_lock = threading.Lock()
+        self._mavlink_sync_cache: dict[int, Px4ParamSyncCache] = {}
+        self.last_mavlink_sync: Optional[Px4ParamSyncResult] = None
 
     def build_policy(self) -> Px4ParamPolicyResponse:
         docs_version = self._safe_docs_version()
@@ -513,83 +518,65 @@ class Px4ParamService:
         return None
 
     def _collect_mavlink_param_entries_blocking(self, component_id: int) -> list[dict[str, Any]]:
-        mavlink_port = self._safe_int("local_mavlink2rest_port", 14569)
         heartbeat_timeout = self._safe_float("PX4_PARAMETER_MAVLINK_HEARTBEAT_TIMEOUT_SEC", 5.0)
-        snapshot_timeout = self._safe_float("PX4_PARAMETER_MAVLINK_SNAPSHOT_TIMEOUT_SEC", 45.0)
-        idle_timeout = self._safe_float("PX4_PARAMETER_MAVLINK_IDLE_TIMEOUT_SEC", 1.5)
-        connection = mavutil.mavlink_connection(
-            f"udpin:127.0.0.1:{mavlink_port}",
-            source_system=255,
-            source_component=190,
-        )
+        connection = self._open_mavlink_param_connection()
         try:
-            heartbeat = connection.wait_heartbeat(timeout=heartbeat_timeout)
-            if heartbeat is None:
-                raise RuntimeError("No MAVLink heartbeat received for PX4 parameter snapshot fallback")
-
-            connection.target_system = int(getattr(heartbeat, "srcSystem", connection.target_system) or connection.target_system)
-            connection.target_component = int(component_id or getattr(heartbeat, "srcComponent", 1) or 1)
-            connection.param_fetch_all()
-
-            entries: dict[str, dict[str, Any]] = {}
-            expected_count: int | None = None
-            deadline = time.time() + snapshot_timeout
-
-            while time.time() < deadline:
-                message = connection.recv_match(type="PARAM_VALUE", blocking=True, timeout=idle_timeout)
-                if message is None:
-                    if expected_count is not None and len(entries) >= expected_count:
-                        break
-                    continue
-
-                name = self._normalize_param_id(getattr(message, "param_id", ""))
-                value_type, decoded_value = self._decode_mavlink_param_value(
-                    getattr(message, "param_type", None),
-                    getattr(message, "param_value", None),
-                )
-                entries[name] = {
-                    "name": name,
-                    "value_type": value_type,
-                    "value": decoded_value,
-                }
-
-                raw_expected_count = getattr(message, "param_count", None)
-                if raw_expected_count is not None:
-                    expected_count = max(int(raw_expected_count), expected_count or 0)
-
-                if expected_count is not None and len(entries) >= expected_count:
-                    drain_deadline = time.time() + idle_timeout
-                    while time.time() < drain_deadline:
-                        extra = connection.recv_match(type="PARAM_VALUE", blocking=True, timeout=0.2)
-                        if extra is None:
-                            break
-                        name = self._normalize_param_id(getattr(extra, "param_id", ""))
-                        value_type, decoded_value = self._decode_mavlink_param_value(
-                            getattr(extra, "param_type", None),
-                            getattr(extra, "param_value", None),
-                        )
-                        entries[name] = {
-                            "name": name,
-                            "value_type": value_type,
-                            "value": decoded_value,
-                        }
-                    break
-
-            if not entries:
-                raise RuntimeError("MAVLink fallback did not receive any PARAM_VALUE messages")
-
-            if expected_count is not None and len(entries) < expected_count:
-                raise RuntimeError(
-                    f"MAVLink fallback received only {len(entries)} of {expected_count} PX4 parameters"
+            with self._mavlink_sync_lock:
+                cached = self._mavlink_sync_cache.get(int(component_id or 1))
+
+            if cached is not None:
+                # Any inbound packet is enough to learn the routed peer; waiting
+                # for a 1 Hz heartbeat would dominate a cache-validated snapshot.
+                if connection.recv_match(blocking=True, timeout=heartbeat_timeout) is None:
+                    raise RuntimeError("No MAVLink traffic received for PX4 parameter snapshot fallback")
+                target_system = cached.target_system
+            else:
+                heartbeat = connection.wait_heartbeat(timeout=heartbeat_timeout)
+                if heartbeat is None:
+                    raise RuntimeError("No MAVLink heartbeat received for PX4 parameter snapshot fallback")
+                target_system = int(
+                    getattr(heartbeat, "srcSystem", connection.target_system) or connection.target_system
                 )
 
-            return list(entries.values())
+            target_component = int(component_id or 1)
+            connection.target_system = target_system
+            connection.target_component = target_component
+
+            engine = Px4ParamSyncEngine(
+                connection,
+                decode_value=self._decode_mavlink_param_value,
+                normalize_id=self._normalize_param_id,
+                idle_timeout=self._safe_float("PX4_PARAMETER_MAVLINK_IDLE_TIMEOUT_SEC", 1.5),
+                snapshot_timeout=self._safe_float("PX4_PARAMETER_MAVLINK_SNAPSHOT_TIMEOUT_SEC", 45.0),
+                hash_timeout=self._safe_float("PX4_PARAMETER_MAVLINK_HASH_TIMEOUT_SEC", 0.5),
+                max_rerequest_rounds=self._safe_int("PX4_PARAMETER_MAVLINK_REREQUEST_ROUNDS", 5),
+            )
+            refreshed, result = engine.sync(
+                target_system=target_system,
+                component_id=target_component,
+                cached=cached,
+            )
+            with self._mavlink_sync_lock:
+                if refreshed.hash_value is not None:
+                    self._mavlink_sync_cache[target_component] = refreshed
+                else:
+                    self._mavlink_sync_cache.pop(target_component, None)
+                self.last_mavlink_sync = result
+            return result.entries
         finally:
             try:
                 connection.close()
             except Exception:
                 pass
 
+    def _open_mavlink_param_connection(self) -> Any:
+        mavlink_port = self._safe_int("local_mavlink2rest_port", 14569)
+        return mavutil.mavlink_connection(
+            f"udpin:127.0.0.1:{mavlink_port}",
+            source_system=255,
+            source_component=190,
+        )
+
     @staticmethod
     def _normalize_param_id(raw_name: Any) -> str:
         if isinstance(raw_name, bytes):
@@ -0,0 +1,228 @@
+"""Incremental PX4 parameter sync over the MAVLink parameter microservice.
+
+PX4 publishes a `_HASH_CHECK` pseudo-parameter whose value is a CRC over the
+full parameter set. The engine keeps the last complete set per vehicle
+component, validates it with one `_HASH_CHECK` round trip, and only falls back
+to `PARAM_REQUEST_LIST` when the hash differs. Lost `PARAM_VALUE` messages are
+recovered with targeted `PARAM_REQUEST_READ` calls by index instead of failing
+the whole listing.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+HASH_CHECK_PARAM_ID = "_HASH_CHECK"
+
+
+@dataclass(frozen=True)
+class Px4ParamSyncCache:
+    target_system: int
+    component_id: int
+    param_count: int
+    hash_value: int | None
+    entries_by_index: dict[int, dict[str, Any]] = field(default_factory=dict)
+    synced_at: float = 0.0
+
+    def entries(self) -> list[dict[str, Any]]:
+        return [dict(self.entries_by_index[index]) for index in sorted(self.entries_by_index)]
+
+
+@dataclass(frozen=True)
+class Px4ParamSyncResult:
+    entries: list[dict[str, Any]]
+    cache_hit: bool
+    hash_value: int | None
+    received_count: int
+    rerequested_count: int
+    elapsed_sec: float
+
+
+class Px4ParamSyncEngine:
+    """Blocking sync loop for one open pymavlink connection."""
+
+    def __init__(
+        self,
+        connection: Any,
+        *,
+        decode_value: Callable[[Any, Any], tuple[Any, int | float]],
+        normalize_id: Callable[[Any], str],
+        idle_timeout: float,
+        snapshot_timeout: float,
+        hash_timeout: float,
+        max_rerequest_rounds: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.connection = connection
+        self._decode_value = decode_value
+        self._normalize_id = normalize_id
+        self.idle_timeout = max(0.05, float(idle_timeout))
+        self.snapshot_timeout = max(self.idle_timeout, float(snapshot_timeout))
+        self.hash_timeout = max(0.05, float(hash_timeout))
+        self.max_rerequest_rounds = max(0, int(max_rerequest_rounds))
+        self._clock = clock
+
+    def sync(
+        self,
+        *,
+        target_system: int,
+        component_id: int,
+        cached: Px4ParamSyncCache | None = None,
+    ) -> tuple[Px4ParamSyncCache, Px4ParamSyncResult]:
+        started_at = self._clock()
+        deadline = started_at + self.snapshot_timeout
+
+        if cached is not None and cached.hash_value is not None and cached.entries_by_index:
+            remote_hash = self.request_hash(target_system, component_id)
+            if remote_hash is not None and remote_hash == cached.hash_value:
+                return cached, Px4ParamSyncResult(
+                    entries=cached.entries(),
+                    cache_hit=True,
+                    hash_value=remote_hash,
+                    received_count=0,
+                    rerequested_count=0,
+                    elapsed_sec=self._clock() - started_at,
+                )
+
+        entries_by_index, expected_count, hash_value, rerequested = self._collect_listing(
+            target_system,
+            component_id,
+            deadline,
+        )
+
+        if not entries_by_index:
+            raise RuntimeError("MAVLink fallback did not receive any PARAM_VALUE messages")
+
+        missing = self._missing_indices(expected_count, entries_by_index)
+        if expected_count is not None and missing:
+            raise RuntimeError(
+                f"MAVLink fallback received only {expected_count - len(missing)} of "
+                f"{expected_count} PX4 parameters"
+            )
+
+        if hash_value is None:
+            hash_value = self.request_hash(target_system, component_id)
+
+        refreshed = Px4ParamSyncCache(
+            target_system=int(target_system),
+            component_id=int(component_id),
+            param_count=int(expected_count if expected_count is not None else len(entries_by_index)),
+            hash_value=hash_value,
+            entries_by_index=entries_by_index,
+            synced_at=time.time(),
+        )
+        return refreshed, Px4ParamSyncResult(
+            entries=refreshed.entries(),
+            cache_hit=False,
+            hash_value=hash_value,
+            received_count=len(entries_by_index),
+            rerequested_count=rerequested,
+            elapsed_sec=self._clock() - started_at,
+        )
+
+    def request_hash(self, target_system: int, component_id: int) -> int | None:
+        """Ask PX4 for `_HASH_CHECK`; returns None when the vehicle does not answer."""
+        for _attempt in range(2):
+            self.connection.mav.param_request_read_send(
+                int(target_system),
+                int(component_id),
+                HASH_CHECK_PARAM_ID.encode("ascii"),
+                -1,
+            )
+            attempt_deadline = self._clock() + self.hash_timeout
+            while True:
+                remaining = attempt_deadline - self._clock()
+                if remaining <= 0:
+                    break
+                message = self.connection.recv_match(type="PARAM_VALUE", blocking=True, timeout=remaining)
+                if message is None:
+                    break
+                if self._normalize_id(getattr(message, "param_id", "")) == HASH_CHECK_PARAM_ID:
+                    return self._decode_hash(message)
+        return None
+
+    def _collect_listing(
+        self,
+        target_system: int,
+        component_id: int,
+        deadline: float,
+    ) -> tuple[dict[int, dict[str, Any]], int | None, int | None, int]:
+        self.connection.mav.param_request_list_send(int(target_system), int(component_id))
+
+        entries_by_index: dict[int, dict[str, Any]] = {}
+        expected_count: int | None = None
+        hash_value: int | None = None
+        rounds = 0
+        rerequested = 0
+
+        while self._clock() < deadline:
+            message = self.connection.recv_match(type="PARAM_VALUE", blocking=True, timeout=self.idle_timeout)
+            if message is None:
+                if rounds >= self.max_rerequest_rounds:
+                    break
+                rounds += 1
+                if expected_count is None:
+                    self.connection.mav.param_request_list_send(int(target_system), int(component_id))
+                    continue
+                missing = self._missing_indices(expected_count, entries_by_index)
+                if not missing:
+                    break
+                for index in missing:
+                    self.connection.mav.param_request_read_send(
+                        int(target_system),
+                        int(component_id),
+                        b"",
+                        int(index),
+                    )
+                rerequested += len(missing)
+                continue
+
+            name = self._normalize_id(getattr(message, "param_id", ""))
+            if name == HASH_CHECK_PARAM_ID:
+                hash_value = self._decode_hash(message)
+                continue
+
+            raw_count = getattr(message, "param_count", None)
+            if raw_count is not None:
+                expected_count = max(int(raw_count), expected_count or 0)
+
+            raw_index = getattr(message, "param_index", None)
+            try:
+                index = int(raw_index)
+            except (TypeError, ValueError):
+                continue
+            if index < 0 or (expected_count is not None and index >= expected_count):
+                continue
+
+            value_type, decoded_value = self._decode_value(
+                getattr(message, "param_type", None),
+                getattr(message, "param_value", None),
+            )
+            entries_by_index[index] = {
+                "name": name,
+                "value_type": value_type,
+                "value": decoded_value,
+            }
+
+            if expected_count is not None and len(entries_by_index) >= expected_count:
+                break
+
+        return entries_by_index, expected_count, hash_value, rerequested
+
+    @staticmethod
+    def _missing_indices(expected_count: int | None, entries_by_index: dict[int, Any]) -> list[int]:
+        if expected_count is None:
+            return []
+        return [index for index in range(expected_count) if index not in entries_by_index]
+
+    def _decode_hash(self, message: Any) -> int | None:
+        try:
+            _value_type, value = self._decode_value(
+                getattr(message, "param_type", None),
+                getattr(message, "param_value", None),
+            )
+        except Exception:
+            return None
+        return int(value)
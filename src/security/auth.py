@@ -7,6 +7,7 @@ agent/MCP tooling.
 
 from __future__ import annotations
 
+import atexit
 import base64
 import calendar
 import hashlib
@@ -17,6 +18,7 @@ import secrets
 import tempfile
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -83,6 +85,9 @@ ULOG_MACHINE_OPERATIONS = frozenset(
 _MACHINE_CREDENTIAL_REPLAY_LIMIT = 4096
 _MACHINE_CREDENTIAL_REPLAY_LOCK = threading.Lock()
 _MACHINE_CREDENTIAL_REPLAY_CACHE: dict[str, int] = {}
+API_TOKEN_LAST_USED_FLUSH_SECONDS = 5.0
+_API_TOKEN_INDEX_LOCK = threading.Lock()
+_API_TOKEN_INDEXES: dict[str, "_ApiTokenIndex"] = {}
 
 
 def utc_now_iso() -> str:
@@ -278,6 +283,158 @@ def _token_record_is_active(record: dict[str, Any], *, now_epoch: int) -> bool:
     return now_epoch < expires_epoch
 
 
+def _token_expiry_epoch(expires_at: Any) -> float | None:
+    """UTC epoch for a token's expires_at; -inf when it cannot be parsed."""
+    if not expires_at:
+        return None
+    try:
+        return float(calendar.timegm(time.strptime(str(expires_at), "%Y-%m-%dT%H:%M:%SZ")))
+    except (TypeError, ValueError):
+        return float("-inf")
+
+
+def _file_fingerprint(path: Path) -> tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class _ApiTokenIndex:
+    """Process-wide token_hash -> record index for one tokens file.
+
+    Routes build a fresh AuthService per request, so the index lives at module
+    level keyed by file path. Every verification stats the file and reloads it
+    when it changed (revocations from other processes apply immediately);
+    create/revoke in this process force a reload on the next verification.
+    last_used_at/last_used_ip stay in memory and are written back by a
+    debounced flush instead of rewriting the file on every request.
+    """
+
+    def __init__(self, path: Path, flush_delay_seconds: float = API_TOKEN_LAST_USED_FLUSH_SECONDS):
+        self.path = path
+        self.flush_delay_seconds = flush_delay_seconds
+        # Reentrant: AuthStore holds it across load_tokens -> save_tokens.
+        self._lock = threading.RLock()
+        self._fingerprint: tuple[int, int, int] | None = None
+        self._loaded = False
+        self._by_hash: dict[str, list[tuple[dict[str, Any], float | None]]] = {}
+        self._pending_last_used: dict[str, tuple[str, str | None]] = {}
+        self._flush_timer: threading.Timer | None = None
+        self.load_count = 0
+        self.flush_count = 0
+
+    def _rebuild_locked(self, payload: dict[str, Any], fingerprint: tuple[int, int, int] | None) -> None:
+        by_hash: dict[str, list[tuple[dict[str, Any], float | None]]] = {}
+        for token in self._overlay_locked(payload).get("tokens", []):
+            if not isinstance(token, dict) or not token.get("token_hash"):
+                continue
+            entry = (token, _token_expiry_epoch(token.get("expires_at")))
+            by_hash.setdefault(str(token["token_hash"]), []).append(entry)
+        self._by_hash = by_hash
+        self._fingerprint = fingerprint
+        self._loaded = True
+
+    def _refresh_locked(self) -> None:
+        fingerprint = _file_fingerprint(self.path)
+        if self._loaded and fingerprint == self._fingerprint:
+            return
+        self.load_count += 1
+        self._rebuild_locked(_read_json_file(self.path, {"version": 1, "tokens": []}), fingerprint)
+
+    def _overlay_locked(self, payload: dict[str, Any]) -> dict[str, Any]:
+        if self._pending_last_used:
+            for token in payload.get("tokens", []):
+                if isinstance(token, dict) and token.get("id") in self._pending_last_used:
+                    token["last_used_at"], token["last_used_ip"] = self._pending_last_used[token["id"]]
+        return payload
+
+    def overlay_last_used(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Apply not-yet-flushed last-used metadata to a freshly read payload."""
+        with self._lock:
+            return self._overlay_locked(payload)
+
+    def note_saved(self, payload: dict[str, Any]) -> None:
+        """Forget pending metadata the saved payload already carries; reload on next use."""
+        with self._lock:
+            for token in payload.get("tokens", []):
+                if not isinstance(token, dict):
+                    continue
+                pending = self._pending_last_used.get(token.get("id"))
+                if pending == (token.get("last_used_at"), token.get("last_used_ip")):
+                    self._pending_last_used.pop(token["id"], None)
+            self._loaded = False
+
+    def verify(self, token_plaintext: str, source_ip: str | None = None) -> dict[str, Any] | None:
+        if not token_plaintext:
+            return None
+        token_hash = hash_api_token(token_plaintext)
+        now = time.time()
+        with self._lock:
+            self._refresh_locked()
+            for token, expires_epoch in self._by_hash.get(token_hash, ()):
+                if token.get("revoked") or (expires_epoch is not None and now >= expires_epoch):
+                    continue
+                if not hmac.compare_digest(token_hash, str(token.get("token_hash", ""))):
+                    continue
+                token["last_used_at"] = utc_now_iso()
+                token["last_used_ip"] = source_ip
+                if token.get("id"):
+                    self._pending_last_used[token["id"]] = (token["last_used_at"], source_ip)
+                    self._schedule_flush_locked()
+                return AuthStore.sanitize_token(token)
+        return None
+
+    def _schedule_flush_locked(self) -> None:
+        if self._flush_timer is not None:
+            return
+        self._flush_timer = threading.Timer(self.flush_delay_seconds, self._flush_from_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+        self.flush()
+
+    def flush(self) -> bool:
+        """Write pending last-used metadata into the current file contents."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_last_used:
+                return False
+            payload = self._overlay_locked(_read_json_file(self.path, {"version": 1, "tokens": []}))
+            try:
+                _atomic_write_json(self.path, payload, mode=0o600)
+            except OSError:
+                return False
+            self._pending_last_used.clear()
+            self.flush_count += 1
+            self._rebuild_locked(payload, _file_fingerprint(self.path))
+            return True
+
+
+def _api_token_index(path: Path) -> _ApiTokenIndex:
+    key = os.path.abspath(path)
+    with _API_TOKEN_INDEX_LOCK:
+        index = _API_TOKEN_INDEXES.get(key)
+        if index is None:
+            index = _API_TOKEN_INDEXES[key] = _ApiTokenIndex(Path(key))
+        return index
+
+
+@atexit.register
+def flush_api_token_usage() -> None:
+    """Persist pending token last-used metadata for every tokens file in use."""
+    with _API_TOKEN_INDEX_LOCK:
+        indexes = list(_API_TOKEN_INDEXES.values())
+    for index in indexes:
+        index.flush()
+
+
 def _consume_machine_credential_nonce(jti: str, expires_at: int, *, now_epoch: int) -> bool:
     """Reject immediate replay in one node process while keeping memory bounded."""
 
@@ -439,6 +596,7 @@ class AuthStore:
 
     def __init__(self, settings: AuthSettings):
         self.settings = settings
+        self._token_index = _api_token_index(settings.tokens_file)
 
     def load_users(self) -> dict[str, Any]:
         return _read_json_file(self.settings.users_file, {"version": 1, "users": []})
@@ -447,10 +605,25 @@ class AuthStore:
         _atomic_write_json(self.settings.users_file, payload, mode=0o600)
 
     def load_tokens(self) -> dict[str, Any]:
-        return _read_json_file(self.settings.tokens_file, {"version": 1, "tokens": []})
+        payload = _read_json_file(self.settings.tokens_file, {"version": 1, "tokens": []})
+        return self._token_index.overlay_last_used(payload)
 
     def save_tokens(self, payload: dict[str, Any]) -> None:
         _atomic_write_json(self.settings.tokens_file, payload, mode=0o600)
+        self._token_index.note_saved(payload)
+
+    def flush_token_usage(self) -> bool:
+        return self._token_index.flush()
+
+    @contextmanager
+    def _token_write(self):
+        """Serialize a read-modify-write of the tokens file with last-used flushes.
+
+        Without it a flush could read the file before a create/revoke saves and
+        write its stale copy back afterwards, dropping the change.
+        """
+        with self._token_index._lock:
+            yield
 
     def list_users(self) -> list[dict[str, Any]]:
         users = self.load_users().get("users", [])
@@ -589,9 +762,10 @@ class AuthStore:
             "notes": str(notes or ""),
         }
 
-        payload = self.load_tokens()
-        payload.setdefault("tokens", []).append(record)
-        self.save_tokens(payload)
+        with self._token_write():
+            payload = self.load_tokens()
+            payload.setdefault("tokens", []).append(record)
+            self.save_tokens(payload)
         public_record = self.sanitize_token(record)
         public_record["token"] = token_plaintext
         return public_record
@@ -601,42 +775,22 @@ class AuthStore:
         return [self.sanitize_token(token) for token in tokens if isinstance(token, dict)]
 
     def revoke_token(self, token_id: str) -> dict[str, Any]:
-        payload = self.load_tokens()
-        target = None
-        for token in payload.get("tokens", []):
-            if isinstance(token, dict) and token.get("id") == token_id:
-                target = token
-                break
-        if target is None:
-            raise KeyError("token not found")
-        target["revoked"] = True
-        target["revoked_at"] = utc_now_iso()
-        self.save_tokens(payload)
+        with self._token_write():
+            payload = self.load_tokens()
+            target = None
+            for token in payload.get("tokens", []):
+                if isinstance(token, dict) and token.get("id") == token_id:
+                    target = token
+                    break
+            if target is None:
+                raise KeyError("token not found")
+            target["revoked"] = True
+            target["revoked_at"] = utc_now_iso()
+            self.save_tokens(payload)
         return self.sanitize_token(target)
 
     def verify_token(self, token_plaintext: str, source_ip: str | None = None) -> dict[str, Any] | None:
-        payload = self.load_tokens()
-        now = time.time()
-        changed = False
-        for token in payload.get("tokens", []):
-            if not isinstance(token, dict) or token.get("revoked"):
-                continue
-            expires_at = token.get("expires_at")
-            if expires_at:
-                try:
-                    expires_epoch = time.mktime(time.strptime(str(expires_at), "%Y-%m-%dT%H:%M:%SZ"))
-                    if now >= expires_epoch:
-                        continue
-                except ValueError:
-                    continue
-            if verify_api_token(token_plaintext, str(token.get("token_hash", ""))):
-                token["last_used_at"] = utc_now_iso()
-                token["last_used_ip"] = source_ip
-                changed = True
-                if changed:
-                    self.save_tokens(payload)
-                return self.sanitize_token(token)
-        return None
+        return self._token_index.verify(token_plaintext, source_ip=source_ip)
 
     @staticmethod
     def sanitize_token(token: dict[str, Any]) -> dict[str, Any]:
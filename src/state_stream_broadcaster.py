@@ -0,0 +1,279 @@
+"""
+Shared fan-out for the drone API's state WebSockets.
+
+`/ws/drone-state` and `/ws/swarm-state` used to run one loop per client, each
+building and serializing the state on its own fixed timer. A
+`StateStreamBroadcaster` runs a single producer per stream instead:
+
+- the producer ticks at the fastest rate any subscriber asked for (never above
+  the server cap), calls ``produce`` once per tick and hands the same text to
+  every subscriber that is due on that tick;
+- each subscriber picks its own rate with ``?rate_hz=`` on connect or by
+  sending ``{"rate_hz": x}`` at any time (acknowledged with a ``stream_rate``
+  message), clamped to ``[MIN_RATE_HZ, max_rate_hz]``;
+- every subscriber has a one-slot, latest-wins mailbox, so a consumer that
+  falls behind skips to the newest state instead of queueing old ones, and a
+  socket whose send stalls past ``send_timeout`` is dropped.
+
+Serialization cost therefore scales with the fastest requested rate, not with
+the number of connected clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Optional
+
+from mds_logging import get_logger
+
+logger = get_logger("state_stream")
+
+MIN_RATE_HZ = 0.1
+DEFAULT_SEND_TIMEOUT_SEC = 5.0
+STREAM_RATE_MESSAGE_TYPE = "stream_rate"
+
+
+def parse_rate_hz(raw: Any, *, default: float, maximum: float) -> float:
+    """Clamp a client-requested rate; unparseable values fall back to ``default``."""
+    try:
+        rate_hz = float(raw)
+    except (TypeError, ValueError):
+        rate_hz = float(default)
+    if rate_hz != rate_hz:  # NaN
+        rate_hz = float(default)
+    return min(float(maximum), max(MIN_RATE_HZ, rate_hz))
+
+
+class StateStreamSubscriber:
+    """Delivery state for one socket: its rate, schedule and latest-wins mailbox."""
+
+    __slots__ = ("rate_hz", "next_due_at", "pending", "controls", "wake", "sent", "coalesced")
+
+    def __init__(self, rate_hz: float, now: float):
+        self.rate_hz = rate_hz
+        self.next_due_at = now
+        self.pending: Optional[str] = None
+        self.controls: deque[str] = deque()
+        self.wake = asyncio.Event()
+        self.sent = 0
+        self.coalesced = 0
+
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.rate_hz
+
+    def offer(self, text: str) -> None:
+        if self.pending is not None:
+            self.coalesced += 1
+        self.pending = text
+        self.wake.set()
+
+
+class StateStreamBroadcaster:
+    """Single producer that serializes a state stream once per tick for every socket."""
+
+    def __init__(
+        self,
+        produce: Callable[[], str],
+        *,
+        default_rate_hz: float,
+        max_rate_hz: float,
+        send_timeout: float = DEFAULT_SEND_TIMEOUT_SEC,
+        clock: Callable[[], float] = time.monotonic,
+        name: str = "state",
+    ):
+        """
+        Args:
+            produce: Builds and serializes the current state message.
+            default_rate_hz: Rate for clients that do not ask for one.
+            max_rate_hz: Server-side cap on any client's rate.
+            send_timeout: Seconds one send may take before the socket is
+                dropped as too slow.
+            clock: Monotonic time source in seconds.
+            name: Stream name used in log messages.
+        """
+        self.produce = produce
+        self.max_rate_hz = max(MIN_RATE_HZ, float(max_rate_hz))
+        self.default_rate_hz = parse_rate_hz(default_rate_hz, default=1.0, maximum=self.max_rate_hz)
+        self.send_timeout = max(0.01, float(send_timeout))
+        self.clock = clock
+        self.name = name
+        self.produced_count = 0
+        self.dropped_count = 0
+        self._subscribers: list[StateStreamSubscriber] = []
+        self._next_tick_at: Optional[float] = None
+        self._tick_now = False
+        self._rescheduled: Optional[asyncio.Event] = None
+        self._producer: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def tick_interval(self) -> Optional[float]:
+        """Producer period: the shortest interval any subscriber asked for."""
+        if not self._subscribers:
+            return None
+        return 1.0 / max(subscriber.rate_hz for subscriber in self._subscribers)
+
+    def subscribe(self, rate_hz: Any = None) -> StateStreamSubscriber:
+        """Register a subscriber; it is due immediately so it gets a first message."""
+        rate = self.default_rate_hz if rate_hz is None else parse_rate_hz(
+            rate_hz, default=self.default_rate_hz, maximum=self.max_rate_hz
+        )
+        subscriber = StateStreamSubscriber(rate, self.clock())
+        self._subscribers.append(subscriber)
+        self._tick_now = True
+        self._reschedule()
+        return subscriber
+
+    def unsubscribe(self, subscriber: StateStreamSubscriber) -> None:
+        if subscriber in self._subscribers:
+            self._subscribers.remove(subscriber)
+
+    def set_rate(self, subscriber: StateStreamSubscriber, rate_hz: Any) -> float:
+        """Change one subscriber's rate and return the rate actually granted."""
+        subscriber.rate_hz = parse_rate_hz(rate_hz, default=subscriber.rate_hz, maximum=self.max_rate_hz)
+        subscriber.next_due_at = min(subscriber.next_due_at, self.clock() + subscriber.interval)
+        self._reschedule()
+        return subscriber.rate_hz
+
+    def tick(self) -> Optional[float]:
+        """
+        Produce once and deliver to every subscriber due on this tick.
+
+        Subscribers due within half a producer period share the tick, so a
+        1 Hz client rides along on a 10 Hz client's ticks. Returns when the
+        producer must tick next, or None without subscribers.
+        """
+        period = self.tick_interval
+        if period is None:
+            self._next_tick_at = None
+            return None
+        now = self.clock()
+        due = [subscriber for subscriber in self._subscribers if subscriber.next_due_at - now <= period / 2]
+        if due:
+            try:
+                text = self.produce()
+            except Exception as exc:
+                logger.warning(f"{self.name} stream produce failed: {exc}")
+                text = None
+            else:
+                self.produced_count += 1
+            for subscriber in due:
+                if text is not None:
+                    subscriber.offer(text)
+                subscriber.next_due_at += subscriber.interval
+                if subscriber.next_due_at <= now:
+                    # Behind schedule (stalled loop): restart rather than burst.
+                    subscriber.next_due_at = now + subscriber.interval
+        self._next_tick_at = now + period
+        return self._next_tick_at
+
+    async def serve(self, websocket, rate_hz: Any = None) -> None:
+        """Stream to one accepted socket until it disconnects or is dropped as slow."""
+        subscriber = self.subscribe(rate_hz)
+        self._ensure_producer()
+        receiver = asyncio.ensure_future(self._receive_controls(websocket, subscriber))
+        try:
+            while True:
+                woken = asyncio.ensure_future(subscriber.wake.wait())
+                done, _ = await asyncio.wait({woken, receiver}, return_when=asyncio.FIRST_COMPLETED)
+                if woken not in done:
+                    woken.cancel()
+                    receiver.result()
+                    return
+                subscriber.wake.clear()
+                while (subscriber.controls or subscriber.pending is not None) and not receiver.done():
+                    if subscriber.controls:
+                        text = subscriber.controls.popleft()
+                    else:
+                        text, subscriber.pending = subscriber.pending, None
+                    try:
+                        await asyncio.wait_for(websocket.send_text(text), self.send_timeout)
+                    except asyncio.TimeoutError:
+                        self.dropped_count += 1
+                        logger.warning(
+                            f"Dropping slow {self.name} stream client: send exceeded {self.send_timeout:.1f}s"
+                        )
+                        await self._close_quietly(websocket)
+                        return
+                    subscriber.sent += 1
+        finally:
+            receiver.cancel()
+            self.unsubscribe(subscriber)
+            if not self._subscribers:
+                await self._stop_producer()
+
+    async def _receive_controls(self, websocket, subscriber: StateStreamSubscriber) -> None:
+        """Handle in-band rate requests until the client disconnects."""
+        while True:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                return
+            text = message.get("text")
+            if not text:
+                continue
+            try:
+                request = json.loads(text)
+            except ValueError:
+                continue
+            if not isinstance(request, dict) or "rate_hz" not in request:
+                continue
+            granted = self.set_rate(subscriber, request["rate_hz"])
+            subscriber.controls.append(json.dumps({
+                "type": STREAM_RATE_MESSAGE_TYPE,
+                "rate_hz": granted,
+                "max_rate_hz": self.max_rate_hz,
+            }))
+            subscriber.wake.set()
+
+    @staticmethod
+    async def _close_quietly(websocket) -> None:
+        try:
+            await asyncio.wait_for(websocket.close(code=1013), 1.0)
+        except Exception:
+            pass
+
+    def _reschedule(self) -> None:
+        if self._rescheduled is not None:
+            self._rescheduled.set()
+
+    def _ensure_producer(self) -> None:
+        producer = self._producer
+        if producer is not None and not producer.done() and producer.get_loop() is asyncio.get_running_loop():
+            return
+        self._rescheduled = asyncio.Event()
+        self._producer = asyncio.create_task(self._run())
+
+    async def _stop_producer(self) -> None:
+        producer, self._producer = self._producer, None
+        self._rescheduled = None
+        self._next_tick_at = None
+        if producer is not None and producer.get_loop() is asyncio.get_running_loop():
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        rescheduled = self._rescheduled
+        next_tick_at = None
+        while True:
+            if self._tick_now or next_tick_at is None or self.clock() >= next_tick_at:
+                self._tick_now = False
+                next_tick_at = self.tick()
+            elif self.tick_interval is not None:
+                # A rate change may pull the next tick in.
+                next_tick_at = min(next_tick_at, self.clock() + self.tick_interval)
+            timeout = None if next_tick_at is None else max(0.0, next_tick_at - self.clock())
+            try:
+                await asyncio.wait_for(rescheduled.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            rescheduled.clear()
@@ -1,10 +1,13 @@
 import json
 import os
+import threading
+import time
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from mds_logging import get_logger
+from src.params import Params
 
 
 logger = get_logger("swarm_runtime_state")
@@ -12,6 +15,16 @@ logger = get_logger("swarm_runtime_state")
 _ENV_PATH = "MDS_SWARM_RUNTIME_ASSIGNMENT_PATH"
 _DEFAULT_FILENAME = "smart_swarm_assignment.json"
 
+# In-memory copy of the runtime assignment file. Readers are served from here
+# and only re-stat the file once the recheck interval has elapsed; the file is
+# re-parsed only when its (inode, mtime, size) fingerprint changes. Writes from
+# this process refresh the cache directly.
+_cache_lock = threading.Lock()
+_cache_path: Optional[Path] = None
+_cache_fingerprint: Optional[Tuple[int, int, int]] = None
+_cache_assignment: Optional[Dict[str, Any]] = None
+_cache_checked_at = float("-inf")
+
 
 def get_runtime_assignment_path() -> Path:
     override = os.getenv(_ENV_PATH)
@@ -57,21 +70,81 @@ def write_runtime_swarm_assignment(assignment: Optional[Dict[str, Any]]) -> None
         temp_path = Path(handle.name)
 
     temp_path.replace(path)
+    _store_cached_assignment(path, _stat_fingerprint(path), _normalize_assignment(payload))
 
 
-def read_runtime_swarm_assignment() -> Optional[Dict[str, Any]]:
-    """Read the latest persisted live Smart Swarm assignment, if present."""
-    path = get_runtime_assignment_path()
-    if not path.exists():
+def _stat_fingerprint(path: Path) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _normalize_assignment(payload: Any) -> Optional[Dict[str, Any]]:
+    assignment = payload.get("assignment") if isinstance(payload, dict) else None
+    if not isinstance(assignment, dict) or not assignment:
         return None
+    return dict(assignment)
 
+
+def _load_assignment(path: Path) -> Optional[Dict[str, Any]]:
     try:
         payload = json.loads(path.read_text())
     except Exception as exc:
         logger.debug("Failed to read runtime swarm assignment from %s: %s", path, exc)
         return None
+    return _normalize_assignment(payload)
 
-    assignment = payload.get("assignment") if isinstance(payload, dict) else None
-    if not isinstance(assignment, dict) or not assignment:
-        return None
-    return assignment
+
+def _store_cached_assignment(
+    path: Path,
+    fingerprint: Optional[Tuple[int, int, int]],
+    assignment: Optional[Dict[str, Any]],
+) -> None:
+    global _cache_path, _cache_fingerprint, _cache_assignment, _cache_checked_at
+    with _cache_lock:
+        _cache_path = path
+        _cache_fingerprint = fingerprint
+        _cache_assignment = assignment
+        _cache_checked_at = time.monotonic()
+
+
+def invalidate_runtime_swarm_assignment_cache() -> None:
+    """Drop the in-memory assignment so the next read goes back to the file."""
+    global _cache_path, _cache_fingerprint, _cache_assignment, _cache_checked_at
+    with _cache_lock:
+        _cache_path = None
+        _cache_fingerprint = None
+        _cache_assignment = None
+        _cache_checked_at = float("-inf")
+
+
+def read_runtime_swarm_assignment() -> Optional[Dict[str, Any]]:
+    """Return the latest live Smart Swarm assignment, if present.
+
+    Served from memory; the file is re-stat'ed at most every
+    ``Params.SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC`` and re-read only when
+    its inode, mtime or size changed (external edit or atomic replacement).
+    """
+    global _cache_checked_at
+    path = get_runtime_assignment_path()
+
+    with _cache_lock:
+        if (
+            _cache_path == path
+            and time.monotonic() - _cache_checked_at < Params.SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC
+        ):
+            return dict(_cache_assignment) if _cache_assignment else None
+
+    fingerprint = _stat_fingerprint(path)
+    with _cache_lock:
+        if _cache_path == path and _cache_fingerprint == fingerprint:
+            _cache_checked_at = time.monotonic()
+            return dict(_cache_assignment) if _cache_assignment else None
+
+    # Stat before reading: if the file is replaced in between, the newer content
+    # is cached under the older fingerprint and simply re-read on the next check.
+    assignment = _load_assignment(path) if fingerprint is not None else None
+    _store_cached_assignment(path, fingerprint, assignment)
+    return dict(assignment) if assignment else None
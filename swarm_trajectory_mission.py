@@ -110,6 +110,7 @@ from mavsdk.action import ActionError
 from tenacity import retry, stop_after_attempt, wait_fixed
 
 from src.led_controller import LEDController
+from src.local_state_bus import read_local_state_snapshot
 from src.flight_timeout_utils import (
     calculate_controlled_landing_timeout,
     calculate_land_disarm_timeout,
@@ -1694,7 +1695,14 @@ async def _has_reached_initial_climb_altitude(
 
 
 def _get_local_drone_state_snapshot(timeout: float = 1.0):
-    """Read the local drone API state for mode/velocity/home-hover diagnostics."""
+    """Read the local drone state for mode/velocity/home-hover diagnostics.
+
+    Uses the coordinator's shared-memory state bus when it is fresh and the
+    local drone API over HTTP otherwise.
+    """
+    bus_snapshot = read_local_state_snapshot()
+    if bus_snapshot is not None:
+        return bus_snapshot.drone_state
     try:
         response = requests.get(
             f"http://127.0.0.1:{Params.drone_api_port}{DRONE_STATE_ROUTE}",
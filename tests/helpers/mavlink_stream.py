@@ -0,0 +1,71 @@
+"""Synthetic PX4-like MAVLink streams for ingest tests and benchmarks."""
+
+from __future__ import annotations
+
+import heapq
+
+from pymavlink.dialects.v20 import ardupilotmega as mavlink2
+
+# Approximate PX4 onboard stream rates (Hz); the first group is what the listener consumes.
+PX4_ONBOARD_RATES = {
+    "HEARTBEAT": 1,
+    "GLOBAL_POSITION_INT": 10,
+    "ATTITUDE": 50,
+    "GPS_RAW_INT": 5,
+    "LOCAL_POSITION_NED": 30,
+    "SYS_STATUS": 5,
+    "BATTERY_STATUS": 1,
+    "HOME_POSITION": 0.5,
+    "SCALED_PRESSURE": 20,
+    "STATUSTEXT": 0.5,
+    "HIGHRES_IMU": 50,
+    "ATTITUDE_QUATERNION": 50,
+    "ATTITUDE_TARGET": 10,
+    "POSITION_TARGET_LOCAL_NED": 10,
+    "VFR_HUD": 10,
+    "SERVO_OUTPUT_RAW": 10,
+    "ALTITUDE": 10,
+    "TIMESYNC": 10,
+    "ESTIMATOR_STATUS": 5,
+    "EXTENDED_SYS_STATE": 5,
+    "VIBRATION": 2,
+    "SYSTEM_TIME": 1,
+}
+
+
+def build_message(name: str, dialect=mavlink2):
+    """Message of the given type with every field set to one.
+
+    Non-zero values keep MAVLink 2 from truncating trailing zero bytes, so the
+    frames are full length like live telemetry.
+    """
+    cls = dialect.mavlink_map[getattr(dialect, f"MAVLINK_MSG_ID_{name}")]
+    args = []
+    for field, field_type in zip(cls.fieldnames, cls.fieldtypes):
+        array_length = cls.array_lengths[cls.ordered_fieldnames.index(field)]
+        if field_type == "char":
+            args.append(b"x")
+        elif array_length:
+            args.append([1] * array_length)
+        elif field_type in ("float", "double"):
+            args.append(1.0)
+        else:
+            args.append(1)
+    return cls(*args)
+
+
+def build_synthetic_stream(seconds: float, rates: dict | None = None, dialect=mavlink2) -> bytes:
+    """Time-ordered frames for ``seconds`` of stream at the given per-type rates."""
+    rates = rates or PX4_ONBOARD_RATES
+    encoder = dialect.MAVLink(None, srcSystem=1, srcComponent=1)
+    templates = {name: build_message(name, dialect) for name in rates}
+    schedule = [(0.0, name) for name in rates]
+    heapq.heapify(schedule)
+    frames = []
+    while schedule:
+        at, name = heapq.heappop(schedule)
+        if at >= seconds:
+            continue
+        frames.append(templates[name].pack(encoder))
+        heapq.heappush(schedule, (at + 1.0 / rates[name], name))
+    return b"".join(frames)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import filecmp
+import importlib.util
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from functions.create_active_csv import create_active_csv, hold_position
+from functions.trajectories import map_shape_to_code
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+BENCHMARK_PATH = REPO_ROOT / "tools" / "benchmark_active_csv.py"
+SHAPES = [
+    "eight_shape", "circle", "square", "helix", "heart_shape", "infinity_shape",
+    "spiral_square", "star_shape", "zigzag", "sine_wave", "stationary",
+]
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location("benchmark_active_csv", BENCHMARK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("direction", [1, -1])
+@pytest.mark.parametrize("shape_name", SHAPES)
+def test_shape_over_step_array_matches_per_step_evaluation(shape_name, direction):
+    _, shape_fcn, shape_args = map_shape_to_code(shape_name)
+    steps = np.arange(2503)
+
+    columns = shape_fcn(steps, 25.0, 5.0, direction, 10, 0.01, *shape_args)
+    per_step = np.array([shape_fcn(int(step), 25.0, 5.0, direction, 10, 0.01, *shape_args) for step in steps]).T
+
+    assert all(np.shape(column) == steps.shape for column in columns)
+    np.testing.assert_allclose(np.array(columns), per_step, rtol=0, atol=1e-12)
+
+
+def _generate(create, path: Path, shape_name: str, **kwargs) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        create(shape_name, 2, 4.0, -1, 12.0, 3.5, -1.25, 8, 2, 2.5, 1.5, 0.02, output_file=str(path), **kwargs)
+
+
+@pytest.mark.parametrize("shape_name", SHAPES)
+def test_bulk_csv_matches_row_by_row_reference(tmp_path, shape_name):
+    legacy = _load_benchmark().legacy_create_active_csv
+    _generate(legacy, tmp_path / "legacy.csv", shape_name)
+    _generate(create_active_csv, tmp_path / "bulk.csv", shape_name)
+    _generate(create_active_csv, tmp_path / "exact.csv", shape_name, float_format=None)
+
+    reference = pd.read_csv(tmp_path / "legacy.csv")
+    bulk = pd.read_csv(tmp_path / "bulk.csv")
+    assert list(bulk.columns) == list(reference.columns)
+    assert bulk[["idx", "mode", "ledr", "ledg", "ledb"]].equals(reference[["idx", "mode", "ledr", "ledg", "ledb"]])
+    np.testing.assert_allclose(bulk.to_numpy(float), reference.to_numpy(float), rtol=1e-11, atol=1e-11)
+    if shape_name not in ("square", "heart_shape"):
+        # Square writes integer zeros per row and heart differs by 1 ulp under numpy.
+        assert filecmp.cmp(tmp_path / "legacy.csv", tmp_path / "exact.csv", shallow=False)
+
+
+def test_phase_helpers_still_accept_a_csv_writer():
+    buffer = io.StringIO()
+    last_time, last_step, coordinates = hold_position(0.03, 0.01, csv.writer(buffer), 1.0, 5, (1, 2.5, -3), mode=40)
+
+    assert buffer.getvalue().splitlines() == [
+        "5,1.0,1,2.5,-3,0,0,0,0,0,0,0,40,0,0,0",
+        "6,1.01,1,2.5,-3,0,0,0,0,0,0,0,40,0,0,0",
+        "7,1.02,1,2.5,-3,0,0,0,0,0,0,0,40,0,0,0",
+    ]
+    assert (last_time, last_step, coordinates) == (1.03, 8, (1, 2.5, -3))
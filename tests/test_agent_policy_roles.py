@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
 import yaml
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 
-from agent_runtime import AgentPolicy, AgentRuntimeError, PolicyDecisionStatus
+from agent_runtime import AgentPolicy, AgentRuntimeError, PolicyDecisionStatus, tool_executor
 from agent_runtime.tool_executor import (
     InternalToolExecutionContext,
+    close_internal_clients,
     execute_policy_allowed_guarded_route_tool,
+    execute_policy_allowed_read_only_tool,
     list_policy_available_guarded_tools,
 )
 from agent_runtime.tool_registry import ToolRegistry, load_default_tool_registry
@@ -198,3 +202,54 @@ async def test_guarded_dispatch_reloads_policy_and_observes_circuit_breaker(
     assert result.is_error is True
     assert "Simurgh action circuit breaker is enabled" in result.text
     assert dispatch_count == 0
+
+
+async def test_read_only_tool_calls_reuse_one_client_without_carrying_cookies(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = FastAPI()
+    seen: list[dict[str, str]] = []
+
+    @app.get("/api/v1/system/health")
+    async def health(request: Request, response: Response) -> dict[str, str]:
+        seen.append({"client": request.client.host, "cookie": request.headers.get("cookie", "")})
+        response.set_cookie("session", "leaked")
+        return {"status": "ok"}
+
+    monkeypatch.setattr(tool_executor, "_internal_clients", OrderedDict())
+    context = InternalToolExecutionContext(app=app, base_url="http://testserver")
+
+    for _ in range(3):
+        result = await execute_policy_allowed_read_only_tool(
+            context,
+            name="mds.system.health.read",
+            arguments={},
+            channel="agent",
+        )
+        assert result.is_error is False
+
+    assert len(tool_executor._internal_clients) == 1
+    assert [entry["cookie"] for entry in seen] == ["", "", ""]
+    assert {entry["client"] for entry in seen} == {tool_executor.INTERNAL_TOOL_CLIENT_HOST}
+
+
+async def test_internal_clients_are_closed_on_eviction_and_shutdown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(tool_executor, "_internal_clients", OrderedDict())
+    app = FastAPI()
+    clients = [
+        tool_executor._internal_client(
+            InternalToolExecutionContext(app=app, base_url=f"http://testserver-{index}")
+        )
+        for index in range(tool_executor._INTERNAL_CLIENT_CACHE_SIZE + 1)
+    ]
+    await asyncio.sleep(0)
+
+    assert clients[0].is_closed is True
+    assert not any(client.is_closed for client in clients[1:])
+
+    await close_internal_clients()
+
+    assert all(client.is_closed for client in clients)
+    assert len(tool_executor._internal_clients) == 0
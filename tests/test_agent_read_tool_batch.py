@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+
+from fastapi import FastAPI, HTTPException
+
+from agent_runtime.tool_executor import (
+    InternalToolExecutionContext,
+    ReadOnlyToolCallResult,
+    ReadOnlyToolResultCache,
+    execute_policy_allowed_read_only_tool,
+    execute_policy_allowed_read_only_tools,
+)
+from agent_runtime.policy import load_default_policy
+from agent_runtime.tool_registry import load_default_tool_registry
+
+
+ROUTE_DELAYS = {
+    "/api/v1/system/health": 0.05,
+    "/api/v1/fleet/telemetry": 0.15,
+    "/api/v1/fleet/heartbeats": 0.3,
+}
+TOOL_CALLS = [
+    ("mds.system.health.read", {}),
+    ("mds.fleet.telemetry.read", {}),
+    ("mds.fleet.heartbeats.read", {}),
+]
+
+
+def _slow_app(hits: dict[str, int]) -> FastAPI:
+    app = FastAPI()
+
+    def add_route(path: str, delay: float) -> None:
+        @app.get(path)
+        async def read_route() -> dict[str, str]:
+            hits[path] = hits.get(path, 0) + 1
+            await asyncio.sleep(delay)
+            return {"status": "ok", "path": path}
+
+    for path, delay in ROUTE_DELAYS.items():
+        add_route(path, delay)
+    return app
+
+
+class _OverlapRecorder:
+    """Wrap the single-call executor and record how many calls overlap."""
+
+    def __init__(
+        self,
+        *,
+        release_at: int,
+        hang: frozenset[str] = frozenset(),
+        result: ReadOnlyToolCallResult | None = None,
+    ) -> None:
+        self.events: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release_at = release_at
+        self.hang = hang
+        self.result = result
+        self._all_started = asyncio.Event()
+
+    async def __call__(self, request, *, name: str, **kwargs) -> ReadOnlyToolCallResult:
+        self.events.append(("start", name))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.in_flight >= self.release_at:
+            self._all_started.set()
+        try:
+            if name in self.hang:
+                await asyncio.Event().wait()
+            # Every call holds until ``release_at`` calls are in flight, so a
+            # serial executor never gets past the first one.
+            await self._all_started.wait()
+            if self.result is not None:
+                return self.result
+            return await execute_policy_allowed_read_only_tool(request, name=name, **kwargs)
+        finally:
+            self.in_flight -= 1
+            self.events.append(("complete", name))
+
+
+async def test_independent_read_tools_run_concurrently():
+    hits: dict[str, int] = {}
+    context = InternalToolExecutionContext(app=_slow_app(hits), base_url="http://testserver")
+    events: list[tuple[str, int]] = []
+    recorder = _OverlapRecorder(release_at=len(TOOL_CALLS))
+
+    async def started(index: int) -> None:
+        events.append(("start", index))
+
+    async def completed(index: int, _result) -> None:
+        events.append(("complete", index))
+
+    registry = load_default_tool_registry()
+    policy = load_default_policy()
+
+    results = await asyncio.wait_for(
+        execute_policy_allowed_read_only_tools(
+            context,
+            TOOL_CALLS,
+            channel="agent",
+            registry=registry,
+            policy=policy,
+            on_call_start=started,
+            on_call_complete=completed,
+            execute_tool=recorder,
+        ),
+        timeout=5.0,
+    )
+
+    assert [result.structured_content["path"] for result in results] == list(ROUTE_DELAYS)
+    assert all(not result.is_error for result in results)
+    assert recorder.max_in_flight == len(TOOL_CALLS)
+    assert [kind for kind, _ in recorder.events[:3]] == ["start", "start", "start"]
+    assert [kind for kind, _ in events[:3]] == ["start", "start", "start"]
+    assert sorted(index for kind, index in events if kind == "complete") == [0, 1, 2]
+
+
+async def test_concurrency_cap_and_turn_deadline_bound_the_batch():
+    hits: dict[str, int] = {}
+    context = InternalToolExecutionContext(app=_slow_app(hits), base_url="http://testserver")
+    recorder = _OverlapRecorder(
+        release_at=1,
+        hang=frozenset({"mds.fleet.telemetry.read", "mds.fleet.heartbeats.read"}),
+        result=ReadOnlyToolCallResult(text="ok", is_error=False),
+    )
+
+    registry = load_default_tool_registry()
+    policy = load_default_policy()
+
+    results = await asyncio.wait_for(
+        execute_policy_allowed_read_only_tools(
+            context,
+            TOOL_CALLS,
+            channel="agent",
+            registry=registry,
+            policy=policy,
+            max_concurrency=1,
+            deadline_seconds=0.2,
+            execute_tool=recorder,
+        ),
+        timeout=5.0,
+    )
+
+    assert [result.is_error for result in results] == [False, True, True]
+    assert "timed out at the turn deadline" in results[1].text
+    # The last call is either skipped or cut off, depending on how close to
+    # the deadline the loop wakes it.
+    assert "turn deadline" in results[2].text
+    assert recorder.max_in_flight == 1
+    assert [name for kind, name in recorder.events if kind == "start"][:2] == [
+        "mds.system.health.read",
+        "mds.fleet.telemetry.read",
+    ]
+    assert hits == {}
+
+
+async def test_cached_repeat_skips_the_route_until_ttl_expires():
+    hits: dict[str, int] = {}
+    context = InternalToolExecutionContext(app=_slow_app(hits), base_url="http://testserver")
+    now = [100.0]
+    cache = ReadOnlyToolResultCache(ttl_seconds=2.0, clock=lambda: now[0])
+
+    first = await execute_policy_allowed_read_only_tools(context, TOOL_CALLS, channel="agent", result_cache=cache)
+    repeat = await execute_policy_allowed_read_only_tools(context, TOOL_CALLS, channel="agent", result_cache=cache)
+
+    assert repeat == first
+    assert hits == {path: 1 for path in ROUTE_DELAYS}
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    now[0] += 2.5
+    await execute_policy_allowed_read_only_tools(context, TOOL_CALLS[:1], channel="agent", result_cache=cache)
+    assert hits["/api/v1/system/health"] == 2
+
+
+async def test_cache_keys_on_canonical_arguments_and_skips_errors():
+    registry = load_default_tool_registry()
+    tool = registry.require("mds.fleet.telemetry.read")
+    cache = ReadOnlyToolResultCache(ttl_seconds=5.0)
+    app = FastAPI()
+    hits = {"count": 0}
+
+    @app.get("/api/v1/system/health")
+    async def failing_health() -> dict[str, str]:
+        hits["count"] += 1
+        raise HTTPException(status_code=503, detail="unavailable")
+
+    context = InternalToolExecutionContext(app=app, base_url="http://testserver")
+    for _ in range(2):
+        failed = await execute_policy_allowed_read_only_tool(
+            context,
+            name="mds.system.health.read",
+            arguments={},
+            channel="agent",
+            result_cache=cache,
+        )
+        assert failed.is_error is True
+    assert hits["count"] == 2
+
+    assert ReadOnlyToolResultCache._key(tool, {"a": 1, "b": [2, 3]}) == ReadOnlyToolResultCache._key(
+        tool, {"b": [2, 3], "a": 1}
+    )
+    assert ReadOnlyToolResultCache._key(registry.require("mds.sitl.instances.create"), {}) is None
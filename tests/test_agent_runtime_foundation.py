@@ -25,6 +25,7 @@ from agent_runtime import (
     load_default_policy,
     load_default_tool_registry,
 )
+from agent_runtime.policy import _load_policy_file_cached
 from agent_runtime.tool_executor import _route_path_with_arguments
 from tests.test_api_route_inventory import GCS_EXPECTED_HTTP
 
@@ -340,6 +341,28 @@ def test_agent_runtime_can_be_disabled_by_env(monkeypatch):
     assert "agent runtime disabled" in decision.reasons
 
 
+def test_default_policy_is_cached_until_file_changes_and_reapplies_env(tmp_path, monkeypatch):
+    policy_file = tmp_path / "agent_policy.yaml"
+    policy_file.write_text(yaml.safe_dump(_enabled_policy_payload()), encoding="utf-8")
+    monkeypatch.setenv("MDS_AGENT_POLICY_FILE", str(policy_file))
+    _load_policy_file_cached.cache_clear()
+
+    first = load_default_policy()
+    monkeypatch.setenv("MDS_AGENT_ACTION_CIRCUIT_BREAKER", "false")
+    second = load_default_policy()
+
+    assert _load_policy_file_cached.cache_info().misses == 1
+    assert first.action_circuit_breaker_enabled is True
+    assert second.action_circuit_breaker_enabled is False
+
+    payload = _enabled_policy_payload()
+    payload["defaults"]["agent_enabled"] = False
+    policy_file.write_text(yaml.safe_dump(payload) + "# edited\n", encoding="utf-8")
+
+    assert load_default_policy().agent_enabled is False
+    assert _load_policy_file_cached.cache_info().misses == 2
+
+
 def test_policy_rejects_malformed_runtime_policy():
     payload = _enabled_policy_payload()
     payload["runtime_modes"]["read_only"] = "bad"
@@ -86,6 +86,7 @@ GCS_EXPECTED_HTTP = {
         "/api/v1/origin/elevation",
         "/api/v1/origin/bootstrap",
         "/api/v1/origin/deviations",
+        "/api/v1/origin/fleet-fit",
         "/api/v1/origin/launch-positions",
         "/api/v1/px4-params/policy",
         "/api/v1/px4-params/profiles",
@@ -281,6 +282,7 @@ DRONE_EXPECTED_HTTP = {
         "/api/v1/swarm/state",
         "/api/v1/system/env",
         "/api/v1/telemetry/local-position",
+        "/api/v1/telemetry/mavlink-ingest",
         "/api/v1/px4-params/policy",
         "/api/v1/px4-params/snapshots/current",
         "/api/v1/px4-params/values/{name}",
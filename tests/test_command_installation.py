@@ -11,6 +11,7 @@ from src.command_installation import (
     CommandInstallationResult,
 )
 from src.drone_communicator import DroneCommunicator
+from src.drone_setup import DroneSetup
 from src.enums import Mission, State
 
 
@@ -266,3 +267,24 @@ def test_successful_quickscout_install_returns_typed_proof_and_private_artifact(
     assert config.update_branch is None
     assert drones[config.hw_id] is config
     assert _transaction_debris(tmp_path) == []
+
+
+def test_fractional_trigger_time_survives_install_into_the_launch_deadline(
+    tmp_path,
+    monkeypatch,
+):
+    communicator, config, _ = _build_communicator(tmp_path, monkeypatch)
+
+    result = communicator.process_command(
+        {
+            "mission_type": Mission.TAKE_OFF.value,
+            "trigger_time": 1700000006.37,
+            "command_id": "fractional-takeoff",
+        }
+    )
+
+    assert result.committed is True
+    assert result.trigger_time == 1700000006.37
+    assert config.trigger_time == 1700000006.37
+    setup = DroneSetup(SimpleNamespace(trigger_sooner_seconds=4), config)
+    assert setup.next_trigger_deadline() == pytest.approx(1700000002.37)
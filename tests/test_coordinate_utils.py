@@ -183,6 +183,41 @@ class TestGetExpectedPositionFromTrajectory:
         assert north == 12.0
         assert east == -3.5
 
+    def test_first_waypoint_is_cached_until_file_changes(self, tmp_path, monkeypatch):
+        """Test that polling reuses the parsed start until the CSV is rewritten."""
+        from src import coordinate_utils
+
+        trajectory_dir = tmp_path / "shapes" / "swarm" / "processed"
+        trajectory_dir.mkdir(parents=True)
+        csv_file = trajectory_dir / "Drone 3.csv"
+        csv_file.write_text("t,px,py,pz,vx,vy,vz\n0.0,1.0,2.0,0.0,0,0,0\n")
+
+        parses = []
+        original_reader = coordinate_utils.csv.DictReader
+
+        def _counting_reader(*args, **kwargs):
+            parses.append(1)
+            return original_reader(*args, **kwargs)
+
+        monkeypatch.setattr(coordinate_utils.csv, "DictReader", _counting_reader)
+        monkeypatch.setattr(coordinate_utils, "_trajectory_start_cache", {})
+
+        for _ in range(5):
+            assert coordinate_utils.get_expected_position_from_trajectory(
+                3, sim_mode=False, base_dir=str(tmp_path)
+            ) == (1.0, 2.0)
+        assert len(parses) == 1
+
+        # A re-import rewrites the file; the new stat fingerprint invalidates it.
+        csv_file.write_text("t,px,py,pz,vx,vy,vz\n0.0,10.0,-20.0,0.0,0,0,0\n")
+        stat = csv_file.stat()
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert coordinate_utils.get_expected_position_from_trajectory(
+            3, sim_mode=False, base_dir=str(tmp_path)
+        ) == (10.0, -20.0)
+        assert len(parses) == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -215,6 +215,98 @@ class TestDroneStateTelemetryFields:
         assert payload["battery_age_ms"] == 250
 
 
+class TestDroneStatePayloadCache:
+    """Shared single-pass drone-state serialization with weak ETags."""
+
+    @pytest.fixture
+    def payload_cache(self, api_server):
+        cache = api_server._drone_state_payloads
+        cache.min_refresh_sec = 60.0
+        cache.max_reuse_sec = 60.0
+        return cache
+
+    def test_body_matches_validated_payload(self, test_client, api_server, mock_drone_communicator):
+        response = test_client.get("/api/v1/drone/state")
+
+        expected = api_server._serialize_drone_state_payload(mock_drone_communicator.get_drone_state.return_value)
+        data = response.json()
+        for volatile_key in ("server_time", "timestamp"):
+            assert data.pop(volatile_key) > 0
+            expected.pop(volatile_key)
+        assert data == expected
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["x-mds-state-version"] == "1"
+
+    def test_readers_share_one_serialization(self, test_client, payload_cache, mock_drone_communicator):
+        bodies = {test_client.get("/api/v1/drone/state").content for _ in range(5)}
+        with test_client.websocket_connect("/ws/drone-state") as websocket:
+            ws_text = websocket.receive_text()
+
+        assert bodies == {ws_text.encode("utf-8")}
+        assert payload_cache.serialization_count == 1
+        assert mock_drone_communicator.get_drone_state.call_count == 1
+
+    def test_unchanged_state_answers_not_modified(self, test_client, payload_cache):
+        etag = test_client.get("/api/v1/drone/state").headers["etag"]
+
+        response = test_client.get("/api/v1/drone/state", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_age_only_changes_keep_version(self, test_client, payload_cache, mock_drone_communicator):
+        state = dict(mock_drone_communicator.get_drone_state.return_value)
+        mock_drone_communicator.get_drone_state.return_value = {**state, "battery_age_ms": 100}
+        first = test_client.get("/api/v1/drone/state")
+
+        payload_cache.min_refresh_sec = 0.0
+        mock_drone_communicator.get_drone_state.return_value = {**state, "battery_age_ms": 900}
+        unchanged = test_client.get("/api/v1/drone/state", headers={"If-None-Match": first.headers["etag"]})
+
+        mock_drone_communicator.get_drone_state.return_value = {**state, "battery_age_ms": 900, "position_alt": 5.0}
+        changed = test_client.get("/api/v1/drone/state", headers={"If-None-Match": first.headers["etag"]})
+
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != first.headers["etag"]
+        assert changed.headers["x-mds-state-version"] == "2"
+        assert changed.json()["position_alt"] == 5.0
+        assert payload_cache.serialization_count == 2
+
+    def test_unchanged_state_is_reserialized_after_max_reuse(self, test_client, payload_cache):
+        first = test_client.get("/api/v1/drone/state")
+        payload_cache.min_refresh_sec = 0.0
+        payload_cache.max_reuse_sec = 0.0
+
+        second = test_client.get("/api/v1/drone/state")
+
+        assert payload_cache.serialization_count == 2
+        assert second.headers["etag"] == first.headers["etag"]
+
+
+class TestMavlinkIngestStats:
+    def test_unavailable_without_local_controller(self, test_client):
+        response = test_client.get("/api/v1/telemetry/mavlink-ingest")
+
+        assert response.status_code == 503
+
+    def test_reports_controller_dispatch_statistics(self, test_client, api_server):
+        from src.mavlink_dispatch import MavlinkDispatcher
+
+        dispatcher = MavlinkDispatcher({"ATTITUDE": lambda msg: None})
+        dispatcher.dispatch(Mock(get_msgId=lambda: 30, get_type=lambda: "ATTITUDE"))
+        api_server.set_local_mavlink_controller(Mock(get_ingest_stats=dispatcher.snapshot))
+
+        response = test_client.get("/api/v1/telemetry/mavlink-ingest")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["dispatched_count"] == 1
+        assert data["message_types"]["ATTITUDE"]["count"] == 1
+        assert data["timestamp"] > 0
+
+
 class TestNodeEnvironment:
     """Test node-local env inspection and mutation endpoints."""
 
@@ -1993,6 +2085,32 @@ class TestCommands:
         assert "idempotent ACK" in data["message"]
         mock_drone_communicator.process_command.assert_not_called()
 
+    def test_send_command_duplicate_delivery_with_fractional_trigger_returns_idempotent_ack(
+        self,
+        test_client,
+        mock_drone_config,
+        mock_drone_communicator,
+    ):
+        mock_drone_config.state = 1
+        mock_drone_config.mission = Mission.TEST_LED.value
+        mock_drone_config.trigger_time = 12345.5
+        mock_drone_config.current_command_id = "cmd-fractional"
+
+        response = test_client.post(
+            "/api/v1/drone/commands",
+            json={
+                "mission_type": Mission.TEST_LED.value,
+                "trigger_time": 12345.5,
+                "command_id": "cmd-fractional",
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "accepted"
+        assert "idempotent ACK" in data["message"]
+        mock_drone_communicator.process_command.assert_not_called()
+
     def test_send_command_duplicate_delivery_after_completion_returns_idempotent_ack(
         self,
         test_client,
@@ -8,6 +8,7 @@ Tests for WebSocket real-time streaming endpoint.
 import pytest
 import json
 import asyncio
+import time
 from fastapi.testclient import TestClient
 from starlette.websockets import WebSocketDisconnect
 
@@ -56,6 +57,25 @@ class TestWebSocketConnection:
                 assert 'timestamp' in data
 
 
+    def test_client_requested_rate_is_capped_and_acknowledged(self, test_client):
+        with test_client.websocket_connect("/ws/drone-state?rate_hz=50") as websocket:
+            started = time.monotonic()
+            for _ in range(5):
+                assert 'pos_id' in websocket.receive_json()
+            # Default 1 Hz would take 4 s; the request is capped at 10 Hz.
+            assert time.monotonic() - started < 2.0
+
+            websocket.send_json({"rate_hz": 2})
+            message = websocket.receive_json()
+            while message.get("type") != "stream_rate":
+                message = websocket.receive_json()
+            assert message == {"type": "stream_rate", "rate_hz": 2.0, "max_rate_hz": 10.0}
+
+    def test_swarm_websocket_accepts_follower_rate(self, test_client):
+        with test_client.websocket_connect("/ws/swarm-state?rate_hz=5") as websocket:
+            assert [websocket.receive_json()["stream_seq"] for _ in range(3)] == [7, 7, 7]
+
+
 class TestWebSocketDataStreaming:
     """Test WebSocket data streaming"""
 
@@ -145,6 +145,34 @@ def test_get_drone_state_falls_back_to_cached_swarm_assignment():
     assert state["follow_mode"] == 1
 
 
+def test_get_drone_state_reads_swarm_file_only_when_it_changes(monkeypatch, tmp_path):
+    from src.params import Params
+
+    swarm_file = tmp_path / "swarm.json"
+    swarm_file.write_text("{}")
+    monkeypatch.setattr(Params, "offline_swarm", True)
+    monkeypatch.setattr(Params, "swarm_file_name", str(swarm_file))
+    monkeypatch.setattr(Params, "SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC", 60.0)
+    drone_config = build_drone_config(follow_value=2)
+    reads = []
+    drone_config.read_swarm = lambda: reads.append(1) or {"follow": 2 + len(reads) - 1}
+    params = SimpleNamespace(enable_udp_telemetry=False, enable_default_subscriptions=False)
+    communicator = DroneCommunicator(drone_config=drone_config, params=params, drones={})
+
+    for _ in range(50):
+        assert communicator.get_drone_state()["follow_mode"] == 2
+    assert len(reads) == 1
+
+    # Unchanged file after the recheck window: one stat, no re-read.
+    monkeypatch.setattr(Params, "SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC", 0.0)
+    assert communicator.get_drone_state()["follow_mode"] == 2
+    assert len(reads) == 1
+
+    swarm_file.write_text('{"changed": true}')
+    assert communicator.get_drone_state()["follow_mode"] == 3
+    assert len(reads) == 2
+
+
 def test_get_swarm_state_exposes_realtime_fields():
     drone_config = build_drone_config(follow_value=0)
     params = SimpleNamespace(enable_udp_telemetry=False, enable_default_subscriptions=False)
@@ -1,3 +1,5 @@
+import json
+import time
 from pathlib import Path
 
 from fleet_candidates import FleetCandidateRegistry
@@ -243,3 +245,105 @@ def test_recover_candidate_updates_existing_config_for_same_hw_id(tmp_path: Path
     assert config_rows[0]["ip"] == "10.0.0.212"
     assert config_rows[0]["mavlink_port"] == 14620
     assert config_rows[0]["notes"] == "Recovered same airframe with new companion"
+
+
+def _persisted_candidates(state_path: Path) -> dict:
+    payload = json.loads(state_path.read_text(encoding="utf-8"))
+    return {candidate["candidate_id"]: candidate for candidate in payload["candidates"]}
+
+
+def test_liveness_only_heartbeats_are_written_behind(tmp_path: Path):
+    state_path = tmp_path / "fleet_candidates.json"
+    events_path = tmp_path / "fleet_candidate_events.jsonl"
+    registry = FleetCandidateRegistry(
+        state_path=str(state_path),
+        events_path=str(events_path),
+        state_flush_interval_sec=60.0,
+    )
+    heartbeat = {"hw_id": "101", "ip": "10.0.0.101", "runtime_mode": "real"}
+
+    for offset_ms in range(0, 50_000, 1000):
+        registry.observe_heartbeat(
+            {**heartbeat, "timestamp": 1_700_000_000_000 + offset_ms},
+            load_config=lambda: [],
+        )
+
+    assert registry.state_write_count == 1
+    assert _persisted_candidates(state_path)["real:hw-101"]["last_seen"] == 1_700_000_000_000
+    assert registry.get_candidate("real:hw-101", load_config=lambda: []).last_seen == 1_700_000_049_000
+    events = events_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["event_type"] for line in events] == ["candidate.first_seen"]
+
+    assert registry.flush_state() is True
+    assert registry.state_write_count == 2
+    assert _persisted_candidates(state_path)["real:hw-101"]["last_seen"] == 1_700_000_049_000
+    assert registry.flush_state() is False
+
+
+def test_heartbeat_transitions_are_persisted_immediately(tmp_path: Path):
+    state_path = tmp_path / "fleet_candidates.json"
+    events_path = tmp_path / "fleet_candidate_events.jsonl"
+    registry = FleetCandidateRegistry(
+        state_path=str(state_path),
+        events_path=str(events_path),
+        state_flush_interval_sec=60.0,
+    )
+    registry.observe_heartbeat(
+        {"hw_id": "101", "ip": "10.0.0.101", "timestamp": 1_700_000_000_000, "runtime_mode": "real"},
+        load_config=lambda: [],
+    )
+
+    registry.observe_heartbeat(
+        {"hw_id": "101", "ip": "10.0.0.201", "timestamp": 1_700_000_001_000, "runtime_mode": "real"},
+        load_config=lambda: [],
+    )
+    assert registry.state_write_count == 2
+    assert _persisted_candidates(state_path)["real:hw-101"]["primary_control_ip"] == "10.0.0.201"
+
+    conflicted = registry.observe_heartbeat(
+        {"hw_id": "101", "ip": "10.0.0.201", "timestamp": 1_700_000_002_000, "runtime_mode": "real"},
+        load_config=lambda: [{"hw_id": 7, "pos_id": 7, "ip": "10.0.0.201"}],
+    )
+    assert conflicted.registration_state == FleetCandidateState.CONFLICT
+    assert registry.state_write_count == 3
+    persisted = _persisted_candidates(state_path)["real:hw-101"]
+    assert persisted["registration_state"] == FleetCandidateState.CONFLICT.value
+    assert persisted["last_seen"] == 1_700_000_002_000
+    events = [json.loads(line) for line in events_path.read_text(encoding="utf-8").splitlines()]
+    assert [event["event_type"] for event in events] == ["candidate.first_seen", "candidate.state_changed"]
+
+
+def test_write_behind_timer_flushes_pending_liveness(tmp_path: Path):
+    state_path = tmp_path / "fleet_candidates.json"
+    registry = FleetCandidateRegistry(
+        state_path=str(state_path),
+        events_path=str(tmp_path / "fleet_candidate_events.jsonl"),
+        state_flush_interval_sec=0.05,
+    )
+    for timestamp_ms in (1_700_000_000_000, 1_700_000_001_000):
+        registry.observe_heartbeat(
+            {"hw_id": "101", "ip": "10.0.0.101", "timestamp": timestamp_ms, "runtime_mode": "real"},
+            load_config=lambda: [],
+        )
+
+    deadline = time.monotonic() + 5.0
+    while registry.state_write_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert registry.state_write_count == 2
+    assert _persisted_candidates(state_path)["real:hw-101"]["last_seen"] == 1_700_000_001_000
+
+
+def test_zero_flush_interval_keeps_write_through(tmp_path: Path):
+    registry = FleetCandidateRegistry(
+        state_path=str(tmp_path / "fleet_candidates.json"),
+        events_path=str(tmp_path / "fleet_candidate_events.jsonl"),
+        state_flush_interval_sec=0,
+    )
+    for offset_ms in range(0, 3000, 1000):
+        registry.observe_heartbeat(
+            {"hw_id": "101", "timestamp": 1_700_000_000_000 + offset_ms, "runtime_mode": "real"},
+            load_config=lambda: [],
+        )
+
+    assert registry.state_write_count == 3
@@ -0,0 +1,200 @@
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from fleet_config_snapshot import FleetConfigSnapshot, FleetConfigSnapshotService
+
+
+def _write_config(path, drones):
+    path.write_text(json.dumps({"version": 1, "drones": drones}))
+
+
+def _counting_loader():
+    calls = {"count": 0}
+
+    def _load(path):
+        calls["count"] += 1
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    return calls, _load
+
+
+def test_snapshot_reuses_parse_until_file_fingerprint_changes(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"}])
+    calls, loader = _counting_loader()
+    service = FleetConfigSnapshotService(str(config_path), loader=loader)
+
+    first = service.get()
+    second = service.get()
+
+    assert first is second
+    assert calls["count"] == 1
+    assert first.version == 1
+
+    _write_config(config_path, [
+        {"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"},
+        {"hw_id": 2, "pos_id": 3, "ip": "10.0.0.2"},
+    ])
+    os.utime(config_path, ns=(first.fingerprint[1] + 1_000_000, first.fingerprint[1] + 1_000_000))
+
+    third = service.get()
+
+    assert calls["count"] == 2
+    assert third.version == 2
+    assert [drone["hw_id"] for drone in third.drones] == [1, 2]
+
+
+def test_snapshot_detects_atomic_replacement(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"}])
+    service = FleetConfigSnapshotService(str(config_path))
+    first = service.get()
+
+    replacement = tmp_path / "config.json.tmp"
+    _write_config(replacement, [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.9"}])
+    os.replace(replacement, config_path)
+
+    assert service.get().get_by_hw_id(1)["ip"] == "10.0.0.9"
+    assert service.get().version == first.version + 1
+
+
+def test_snapshot_indexes_and_immutability():
+    snapshot = FleetConfigSnapshot.from_drones([
+        {"hw_id": "1", "pos_id": 4, "ip": "10.0.0.1", "tags": ["a"]},
+        {"hw_id": 2, "pos_id": 4, "ip": "10.0.0.2"},
+        {"hw_id": "003", "ip": "10.0.0.2"},
+    ])
+
+    assert snapshot.get_by_hw_id(1)["ip"] == "10.0.0.1"
+    assert snapshot.get_by_hw_id("3")["ip"] == "10.0.0.2"
+    assert [drone["hw_id"] for drone in snapshot.get_by_pos_id(4)] == ["1", 2]
+    assert [drone["hw_id"] for drone in snapshot.get_by_pos_id(3)] == ["003"]
+    assert [drone["hw_id"] for drone in snapshot.get_by_ip("10.0.0.2")] == [2, "003"]
+
+    with pytest.raises(TypeError):
+        snapshot.get_by_hw_id(1)["ip"] = "mutated"
+
+    rows = snapshot.as_list()
+    rows[0]["ip"] = "mutated"
+    rows[0]["tags"].append("b")
+    assert snapshot.get_by_hw_id(1)["ip"] == "10.0.0.1"
+    assert snapshot.get_by_hw_id(1)["tags"] == ("a",)
+
+
+def test_listeners_only_fire_when_fleet_content_changes(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"}])
+    service = FleetConfigSnapshotService(str(config_path))
+    service.get()
+    seen = []
+    service.add_listener(lambda snapshot: seen.append(snapshot.version))
+
+    # Same content, new inode: reload but no notification.
+    replacement = tmp_path / "same.json"
+    _write_config(replacement, [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"}])
+    os.replace(replacement, config_path)
+    service.get()
+    assert seen == []
+
+    _write_config(config_path, [{"hw_id": 1, "pos_id": 2, "ip": "10.0.0.1"}])
+    service.refresh()
+    assert seen == [2]
+
+
+async def test_async_listener_is_scheduled_on_owning_loop(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"}])
+    service = FleetConfigSnapshotService(str(config_path))
+    service.get()
+    received = asyncio.Queue()
+
+    async def _on_change(snapshot):
+        received.put_nowait(snapshot.as_list())
+
+    remove = service.add_async_listener(_on_change)
+    _write_config(config_path, [{"hw_id": 7, "pos_id": 7, "ip": "10.0.0.7"}])
+    await asyncio.to_thread(service.refresh)
+
+    rows = await asyncio.wait_for(received.get(), timeout=2.0)
+    assert rows == [{"hw_id": 7, "pos_id": 7, "ip": "10.0.0.7"}]
+    remove()
+
+
+def test_concurrent_readers_share_one_snapshot(tmp_path):
+    config_path = tmp_path / "config.json"
+    _write_config(config_path, [{"hw_id": index, "pos_id": index, "ip": f"10.0.0.{index}"} for index in range(1, 40)])
+    calls, loader = _counting_loader()
+    service = FleetConfigSnapshotService(str(config_path), loader=loader)
+    results = []
+
+    def _reader():
+        for _ in range(200):
+            results.append(service.get())
+
+    threads = [threading.Thread(target=_reader) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls["count"] == 1
+    assert len({id(snapshot) for snapshot in results}) == 1
+
+
+def _load_real_app():
+    module_path = Path(__file__).resolve().parents[1] / "gcs-server" / "app_fastapi.py"
+    spec = importlib.util.spec_from_file_location("app_fastapi_fleet_snapshot_test", module_path)
+    real_app = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = real_app
+    spec.loader.exec_module(real_app)
+    return real_app
+
+
+async def test_invalid_config_write_keeps_last_snapshot_and_pollers(tmp_path):
+    real_app = _load_real_app()
+    config_path = tmp_path / "config.json"
+    drones = [{"hw_id": 1, "pos_id": 1, "ip": "10.0.0.1"}, {"hw_id": 2, "pos_id": 2, "ip": "10.0.0.2"}]
+    _write_config(config_path, drones)
+    service = FleetConfigSnapshotService(str(config_path))
+    good = service.get()
+
+    background = real_app.BackgroundServices()
+    background.apply_drone_targets(good.as_list())
+    reconciled = []
+
+    async def _on_change(snapshot):
+        reconciled.append(snapshot.version)
+        await background.handle_fleet_config_change(snapshot)
+
+    remove = service.add_async_listener(_on_change)
+    try:
+        # A half-written save, then a payload without a drones list, then a deleted file.
+        for broken in ('{"version": 1, "drones": [{"hw_id": 1', '{"version": 1}'):
+            config_path.write_text(broken)
+            assert (await asyncio.to_thread(service.refresh)) is good
+            assert service.get() is good
+        config_path.unlink()
+        assert service.get() is good
+        await asyncio.sleep(0.05)
+
+        assert reconciled == []
+        assert [drone["hw_id"] for drone in background.drones] == ["1", "2"]
+        assert {"1", "2"} <= set(real_app.telemetry_data_all_drones)
+
+        # The operator fixes the file: the next good content is picked up and notified.
+        _write_config(config_path, drones[:1])
+        background.running = True  # reconcile only re-targets; no pollers are started here
+        assert service.get().version == good.version + 1
+        await asyncio.sleep(0.05)
+        assert reconciled == [good.version + 1]
+        assert [drone["hw_id"] for drone in background.drones] == ["1"]
+    finally:
+        remove()
@@ -8,7 +8,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from api_routes.origin import create_origin_router
-from origin import build_desired_launch_positions_report
+from origin import build_desired_launch_positions_report, build_fleet_origin_fit_report
 
 
 def _fresh_reference_telemetry(**overrides):
@@ -102,6 +102,7 @@ def test_origin_router_registers_expected_routes():
     assert "/api/v1/origin/bootstrap" in routes
     assert "/api/v1/origin/deviations" in routes
     assert "/api/v1/origin/compute" in routes
+    assert "/api/v1/origin/fleet-fit" in routes
     assert "/api/v1/origin/launch-positions" in routes
     assert "/get-origin" not in routes
     assert "/set-origin" not in routes
@@ -397,3 +398,38 @@ def test_origin_router_desired_launch_positions_supports_csv_and_kml_formats():
     assert "application/vnd.google-earth.kml+xml" in kml_response.headers["content-type"]
     assert "<Placemark>" in kml_response.text
     assert "attachment; filename=desired_launch_positions.kml" == kml_response.headers["content-disposition"]
+
+
+def test_origin_router_fleet_fit_passes_heading_options_to_report():
+    deps = _make_deps()
+    deps.build_fleet_origin_fit_report = Mock(return_value={"status": "success", "heading": 12.0})
+    app = FastAPI()
+    app.include_router(create_origin_router(deps))
+
+    with TestClient(app) as client:
+        response = client.get("/api/v1/origin/fleet-fit", params={"solve_heading": "true"})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "success", "heading": 12.0}
+    args, kwargs = deps.build_fleet_origin_fit_report.call_args
+    assert args == (deps.telemetry_data_all_drones, [{"hw_id": "1", "pos_id": 1}])
+    assert kwargs == {
+        "solve_heading": True,
+        "heading_deg": 0.0,
+        "trajectory_resolver": deps.get_expected_position_from_trajectory,
+    }
+    deps.save_origin.assert_not_called()
+
+
+def test_origin_router_fleet_fit_without_usable_fixes_is_a_client_error():
+    deps = _make_deps()
+    deps.telemetry_data_all_drones = {}
+    deps.build_fleet_origin_fit_report = build_fleet_origin_fit_report
+    app = FastAPI()
+    app.include_router(create_origin_router(deps))
+
+    with TestClient(app) as client:
+        response = client.get("/api/v1/origin/fleet-fit")
+
+    assert response.status_code == 400
+    assert "fresh global position" in response.json()["detail"]
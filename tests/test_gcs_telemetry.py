@@ -1,4 +1,9 @@
-from telemetry import _build_telemetry_unavailable_record, telemetry_data_all_drones
+from telemetry import (
+    _build_telemetry_unavailable_record,
+    _refresh_unchanged_telemetry,
+    last_telemetry_time,
+    telemetry_data_all_drones,
+)
 
 
 def test_build_telemetry_unavailable_record_marks_link_loss():
@@ -25,3 +30,32 @@ def test_build_telemetry_unavailable_record_marks_link_loss():
     assert degraded["readiness_status"] == "unknown"
     assert "Telemetry link is stale or lost" in degraded["readiness_summary"]
     assert degraded["preflight_blockers"]
+
+
+def test_refresh_unchanged_telemetry_keeps_record_after_not_modified(monkeypatch):
+    telemetry_data_all_drones.clear()
+    record = {"hw_id": "1", "position_alt": 1234.5, "telemetry_available": True, "heartbeat_last_seen": 1}
+    telemetry_data_all_drones["1"] = record
+    monkeypatch.setitem(
+        __import__("telemetry").last_heartbeats,
+        "1",
+        {"received_at_gcs_ms": 1700000000500, "network_info": {"wifi": "ok"}},
+    )
+    last_telemetry_time.pop("1", None)
+
+    assert _refresh_unchanged_telemetry("1") is True
+
+    refreshed = telemetry_data_all_drones["1"]
+    assert refreshed is not record
+    assert refreshed["position_alt"] == 1234.5
+    assert refreshed["heartbeat_last_seen"] == 1700000000500
+    assert refreshed["heartbeat_network_info"] == {"wifi": "ok"}
+    assert last_telemetry_time["1"] > 0
+
+
+def test_refresh_unchanged_telemetry_requires_live_record():
+    telemetry_data_all_drones.clear()
+    assert _refresh_unchanged_telemetry("1") is False
+
+    telemetry_data_all_drones["1"] = _build_telemetry_unavailable_record("1", "172.18.0.2", "Connection failed")
+    assert _refresh_unchanged_telemetry("1") is False
@@ -74,3 +74,25 @@ def test_handle_heartbeat_post_rejects_missing_runtime_mode(monkeypatch):
 
     assert result["accepted"] is False
     assert heartbeat_module.last_heartbeats == {}
+
+
+def test_accepted_heartbeats_bump_the_version_and_notify_listeners(monkeypatch):
+    _reset_heartbeat_state()
+    monkeypatch.setattr(
+        heartbeat_module,
+        "resolve_runtime_mode",
+        lambda: SimpleNamespace(mode="sitl", sim_mode=True, source="env:MDS_MODE"),
+    )
+    notified = []
+    remove = heartbeat_module.add_heartbeat_listener(notified.append)
+    try:
+        before = heartbeat_module.get_heartbeat_version()
+        heartbeat_module.handle_heartbeat_post(pos_id=1, hw_id="101", runtime_mode="sitl")
+        heartbeat_module.handle_heartbeat_post(pos_id=1, hw_id="101", runtime_mode="real")
+    finally:
+        remove()
+    heartbeat_module.handle_heartbeat_post(pos_id=1, hw_id="101", runtime_mode="sitl")
+
+    # Only the accepted heartbeat counts, and a removed listener hears nothing more.
+    assert notified == [before + 1]
+    assert heartbeat_module.get_heartbeat_version() == before + 2
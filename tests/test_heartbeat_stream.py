@@ -0,0 +1,261 @@
+"""Change-driven /ws/heartbeats push, simulated against a fake clock."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "gcs-server"))
+
+from api_routes.core import _build_heartbeat_response, create_core_router  # noqa: E402
+from heartbeat_stream import HeartbeatStreamHub  # noqa: E402
+from schemas import HeartbeatStreamMessage  # noqa: E402
+
+DRONES = 60
+SOCKETS = 40
+HEARTBEAT_INTERVAL = 10.0
+LEGACY_PUSH_INTERVAL = 2.0
+LOST_DRONE = "7"
+LOST_AFTER = 100.0
+SIMULATED_SEC = 240.0
+EPOCH = 1_700_000_000.0  # presence treats small timestamps as seconds, so simulate real wall time
+
+
+class FakeClock:
+    def __init__(self, now: float = EPOCH):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeFleet:
+    """Heartbeat store + GCS route dependencies driven by a fake clock."""
+
+    def __init__(self, clock, drones: int = DRONES):
+        self.clock = clock
+        self.heartbeats = {}
+        self.listeners = []
+        self.deps = SimpleNamespace(
+            Params=SimpleNamespace(TELEMETRY_POLLING_TIMEOUT=10, heartbeat_interval=HEARTBEAT_INTERVAL),
+            load_config=lambda: [
+                {"hw_id": str(index), "pos_id": index, "ip": f"10.0.0.{index}"} for index in range(1, drones + 1)
+            ],
+            get_all_heartbeats=lambda: {key: dict(value) for key, value in self.heartbeats.items()},
+            telemetry_data_all_drones={},
+            last_telemetry_time={},
+            add_heartbeat_listener=self.add_listener,
+            log_system_event=lambda *args, **kwargs: None,
+            log_system_error=lambda *args, **kwargs: None,
+        )
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def post(self, hw_id: str) -> None:
+        now_ms = int(self.clock() * 1000)
+        self.heartbeats[hw_id] = {
+            "pos_id": int(hw_id),
+            "ip": f"10.0.0.{hw_id}",
+            "timestamp": now_ms,
+            "sent_at_node_ms": now_ms,
+            "received_at_gcs_ms": now_ms,
+            "runtime_mode": "sitl",
+        }
+        for listener in list(self.listeners):
+            listener(len(self.heartbeats))
+
+    def rows(self, now: float):
+        return _build_heartbeat_response(self.deps, now=now).heartbeats
+
+
+def _heartbeat_schedule():
+    """(time, hw_id) for every heartbeat: staggered 10 s cadence, drone 7 goes silent."""
+    events = []
+    for index in range(1, DRONES + 1):
+        t = index * HEARTBEAT_INTERVAL / DRONES
+        while t <= SIMULATED_SEC:
+            if not (str(index) == LOST_DRONE and t > LOST_AFTER):
+                events.append((EPOCH + t, str(index)))
+            t += HEARTBEAT_INTERVAL
+    return sorted(events)
+
+
+def _lost_state(message: dict):
+    for row in message["data"]:
+        if row["hw_id"] == LOST_DRONE and row["presence_state"] in ("recently_lost", "stale", "offline"):
+            return row["presence_state"]
+    return None
+
+
+def _simulate_change_driven():
+    clock = FakeClock()
+    fleet = FakeFleet(clock)
+    hub = HeartbeatStreamHub(fleet.rows, clock=clock, resync_interval=30.0, queue_size=64)
+    queues = [hub.subscribe() for _ in range(SOCKETS)]
+    bytes_sent = sum(len(queue.get_nowait()) for queue in queues)
+    lost_notices = []
+
+    def deliver():
+        nonlocal bytes_sent
+        for position, queue in enumerate(queues):
+            while not queue.empty():
+                text = queue.get_nowait()
+                bytes_sent += len(text)
+                state = _lost_state(json.loads(text)) if position == 0 else None
+                if state is not None and (not lost_notices or lost_notices[-1][1] != state):
+                    lost_notices.append((clock(), state))
+
+    events = _heartbeat_schedule()
+    hub.publish()
+    deliver()
+    while clock() < EPOCH + SIMULATED_SEC:
+        next_heartbeat = events[0][0] if events else float("inf")
+        if hub.next_wake_at < next_heartbeat:
+            clock.now = hub.next_wake_at
+        else:
+            # A heartbeat burst lands within the producer's coalescing window.
+            clock.now = next_heartbeat
+            while events and events[0][0] <= next_heartbeat + hub.min_publish_interval:
+                fleet.post(events.pop(0)[1])
+            clock.now = next_heartbeat + hub.min_publish_interval
+        if clock() >= EPOCH + SIMULATED_SEC:
+            break
+        hub.publish()
+        deliver()
+    return bytes_sent, lost_notices
+
+
+def _simulate_legacy_polling():
+    clock = FakeClock()
+    fleet = FakeFleet(clock)
+    events = _heartbeat_schedule()
+    bytes_sent = 0
+    lost_notices = []
+    while clock() < EPOCH + SIMULATED_SEC:
+        while events and events[0][0] <= clock():
+            fleet.post(events.pop(0)[1])
+        text = HeartbeatStreamMessage(timestamp=int(clock() * 1000), data=fleet.rows(clock())).model_dump_json()
+        bytes_sent += len(text) * SOCKETS
+        state = _lost_state(json.loads(text))
+        if state is not None and (not lost_notices or lost_notices[-1][1] != state):
+            lost_notices.append((clock(), state))
+        clock.now += LEGACY_PUSH_INTERVAL
+    return bytes_sent, lost_notices
+
+
+def test_change_driven_push_sends_fewer_bytes_and_reports_loss_sooner():
+    new_bytes, new_notices = _simulate_change_driven()
+    legacy_bytes, legacy_notices = _simulate_legacy_polling()
+
+    last_heartbeat = max(t for t, hw_id in _heartbeat_schedule() if hw_id == LOST_DRONE)
+    # live_sec = max(telemetry timeout, 2 x heartbeat interval); then the 30/60 s grace windows.
+    crossings = {"recently_lost": last_heartbeat + 20, "stale": last_heartbeat + 30, "offline": last_heartbeat + 60}
+
+    assert [state for _, state in new_notices] == ["recently_lost", "stale", "offline"]
+    assert [state for _, state in legacy_notices] == ["recently_lost", "stale", "offline"]
+    for (new_at, state), (legacy_at, _) in zip(new_notices, legacy_notices):
+        assert 0 <= new_at - crossings[state] < 0.01
+        assert legacy_at - crossings[state] > 0.5
+    assert new_bytes * 2 < legacy_bytes
+
+
+def test_slow_subscriber_is_reset_to_a_full_snapshot_instead_of_queueing():
+    clock = FakeClock()
+    fleet = FakeFleet(clock, drones=3)
+    hub = HeartbeatStreamHub(fleet.rows, clock=clock, queue_size=2)
+    hub.publish()
+    slow = hub.subscribe()
+
+    for hw_id in ("1", "2", "3"):
+        clock.now += 1.0
+        fleet.post(hw_id)
+        hub.publish()
+
+    # Snapshot + delta(1) filled the queue; delta(2) overflowed and was replaced by a snapshot.
+    messages = [json.loads(slow.get_nowait()) for _ in range(slow.qsize())]
+    assert [message["type"] for message in messages] == ["heartbeat", "heartbeat_delta"]
+    assert [row["presence_state"] for row in messages[0]["data"]] == ["live", "live", "never_seen"]
+    assert [row["hw_id"] for row in messages[1]["data"]] == ["3"]
+
+
+def test_telemetry_only_return_is_pushed_without_waiting_for_resync():
+    clock = FakeClock()
+    fleet = FakeFleet(clock, drones=2)
+    hub = HeartbeatStreamHub(fleet.rows, clock=clock, resync_interval=30.0)
+    hub.publish()
+    queue = hub.subscribe()
+    queue.get_nowait()
+
+    # Drone 1 comes back through telemetry polling; no heartbeat listener fires.
+    fleet.deps.last_telemetry_time["1"] = clock()
+    fleet.deps.telemetry_data_all_drones["1"] = {"timestamp": int(clock() * 1000)}
+    assert hub.next_wake_at <= clock() + hub.max_idle_interval
+    clock.now = hub.next_wake_at
+    hub.publish()
+
+    delta = json.loads(queue.get_nowait())
+    assert delta["type"] == "heartbeat_delta"
+    assert [row["hw_id"] for row in delta["data"]] == ["1"]
+    assert delta["data"][0]["presence_state"] != "never_seen"
+
+
+def test_websocket_pushes_accepted_heartbeat_as_a_delta():
+    fleet = FakeFleet(time.time, drones=2)
+    app = FastAPI()
+    app.include_router(create_core_router(fleet.deps))
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/heartbeats") as first, client.websocket_connect("/ws/heartbeats") as second:
+            snapshots = [first.receive_json(), second.receive_json()]
+            assert all(snapshot["type"] == "heartbeat" for snapshot in snapshots)
+            assert all(row["presence_state"] == "never_seen" for row in snapshots[0]["data"])
+
+            # Heartbeats are accepted on whatever thread handles the POST.
+            poster = threading.Thread(target=fleet.post, args=("2",))
+            poster.start()
+            poster.join()
+            deltas = [first.receive_json(), second.receive_json()]
+
+    for delta in deltas:
+        assert delta["type"] == "heartbeat_delta"
+        assert [row["hw_id"] for row in delta["data"]] == ["2"]
+        assert delta["data"][0]["presence_state"] == "live"
+        assert delta["removed"] == []
+
+
+@pytest.mark.asyncio
+async def test_producer_stops_when_the_last_socket_leaves():
+    fleet = FakeFleet(FakeClock(), drones=1)
+    hub = HeartbeatStreamHub(fleet.rows, add_change_listener=fleet.add_listener, clock=fleet.clock)
+
+    class Socket:
+        def __init__(self):
+            self.sent = []
+            self.inbox = asyncio.Queue()
+
+        async def send_text(self, text):
+            self.sent.append(text)
+
+        async def receive(self):
+            return await self.inbox.get()
+
+    socket = Socket()
+    serving = asyncio.create_task(hub.serve(socket))
+    await asyncio.sleep(0.01)
+    assert hub.subscriber_count == 1 and len(fleet.listeners) == 1
+
+    await socket.inbox.put({"type": "websocket.disconnect"})
+    await asyncio.wait_for(serving, 1.0)
+
+    assert hub.subscriber_count == 0
+    assert fleet.listeners == []
+    assert len(socket.sent) == 1
@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+
+from mds_logging import get_logger
+from src.led_controller import LEDColorTimeline, LEDController, LEDRenderWorker
+from src.params import Params
+
+RED, GREEN, BLUE = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+
+
+class FakeStrip:
+    """Records rendered frames; optionally blocks until released."""
+
+    def __init__(self, delay: float = 0.0):
+        self.frames = []
+        self.delay = delay
+        self.release = threading.Event()
+        self.release.set()
+
+    def render(self, r, g, b):
+        self.release.wait(2.0)
+        if self.delay:
+            time.sleep(self.delay)
+        self.frames.append(((r, g, b), time.time()))
+
+    @property
+    def colors(self):
+        return [color for color, _ in self.frames]
+
+
+@pytest.fixture
+def strip_and_worker():
+    strip = FakeStrip()
+    worker = LEDRenderWorker(strip.render).start()
+    yield strip, worker
+    worker.stop()
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for the render worker"
+        time.sleep(0.005)
+
+
+def test_latest_frame_wins_while_strip_is_busy(strip_and_worker):
+    strip, worker = strip_and_worker
+    strip.release.clear()
+
+    worker.submit(*RED)
+    _wait_for(lambda: worker._busy)
+    for color in [(1, 1, 1), (2, 2, 2), BLUE]:
+        worker.submit(*color)
+    strip.release.set()
+
+    assert worker.flush()
+    assert strip.colors == [RED, BLUE]
+    assert worker.coalesced_count == 2
+    assert worker.rendered_count == 2
+
+
+def test_frame_matching_the_old_color_is_kept_while_another_frame_renders():
+    strip = FakeStrip(delay=0.1)
+    worker = LEDRenderWorker(strip.render).start()
+    try:
+        worker.submit(*RED)
+        assert worker.flush()
+        worker.submit(*GREEN)
+        time.sleep(0.02)
+        worker.submit(*RED)
+        assert worker.flush()
+    finally:
+        worker.stop()
+
+    assert strip.colors == [RED, GREEN, RED]
+    assert worker.duplicate_count == 0
+
+
+def test_repeated_colors_are_dropped_and_submit_never_waits_for_the_strip():
+    strip = FakeStrip(delay=0.05)
+    worker = LEDRenderWorker(strip.render).start()
+    try:
+        started = time.perf_counter()
+        for tick in range(2000):
+            worker.submit(*(GREEN if tick < 1000 else BLUE))
+        submit_elapsed = time.perf_counter() - started
+        assert worker.flush()
+    finally:
+        worker.stop()
+
+    assert submit_elapsed < 0.05 * 2
+    assert strip.colors[-1] == BLUE
+    assert len(strip.colors) <= 2
+    assert worker.submitted_count == 2000
+    assert worker.duplicate_count + worker.coalesced_count >= 1998
+
+
+def test_timeline_plays_change_points_against_the_mission_clock(strip_and_worker):
+    strip, worker = strip_and_worker
+    waypoints = (
+        [(0.01 * i, 0.0, *RED) for i in range(5)]
+        + [(0.05 + 0.01 * i, 0.0, *GREEN) for i in range(5)]
+        + [(0.10 + 0.01 * i, 0.0, *BLUE) for i in range(5)]
+    )
+    timeline = LEDColorTimeline.from_waypoints(waypoints)
+    assert timeline.times == [0.0, 0.05, 0.10]
+    assert timeline.color_at(-1.0) is None
+    assert timeline.color_at(0.07) == GREEN
+
+    start = time.time() + 0.05
+    worker.play_timeline(timeline, start)
+    _wait_for(lambda: len(strip.frames) == 3)
+
+    assert strip.colors == [RED, GREEN, BLUE]
+    for (_, rendered_at), change_at in zip(strip.frames, timeline.times):
+        assert start + change_at - 0.005 <= rendered_at <= start + change_at + 0.05
+
+
+def test_submitted_color_overrides_a_playing_timeline(strip_and_worker):
+    strip, worker = strip_and_worker
+    timeline = LEDColorTimeline([0.0, 0.2], [GREEN, BLUE])
+
+    worker.play_timeline(timeline, time.time())
+    _wait_for(lambda: strip.colors == [GREEN])
+    worker.submit(*RED)
+    time.sleep(0.3)
+
+    assert strip.colors == [GREEN, RED]
+
+
+def test_set_color_hands_frames_to_the_worker(monkeypatch):
+    class FakePi5Neo:
+        def __init__(self):
+            self.updates = 0
+
+        def set_led_color(self, index, r, g, b):
+            pass
+
+        def update_strip(self):
+            self.updates += 1
+
+    controller = object.__new__(LEDController)
+    controller.logger = get_logger("led")
+    controller.strip = FakePi5Neo()
+    controller.led_library = "Pi5Neo"
+    controller.worker = None
+    monkeypatch.setattr(LEDController, "_instance", controller)
+    monkeypatch.setattr(Params, "sim_mode", False)
+
+    try:
+        for _ in range(500):
+            LEDController.set_color(10, 20, 30.7)
+        assert controller.worker.flush()
+        assert controller.strip.updates == 1
+
+        LEDController.play_timeline(LEDColorTimeline([0.0], [GREEN]), time.time())
+        _wait_for(lambda: controller.strip.updates == 2)
+        LEDController.turn_off()
+        assert controller.worker.flush()
+        assert controller.strip.updates == 3
+    finally:
+        controller.worker.stop()
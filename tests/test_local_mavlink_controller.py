@@ -6,6 +6,7 @@ from pymavlink import mavutil
 
 from src.local_mavlink_controller import LocalMavlinkController
 from src.px4_flight_modes import describe_px4_custom_mode
+from tests.helpers.mavlink_stream import build_synthetic_stream
 
 
 def build_controller(mock_drone_config):
@@ -19,6 +20,7 @@ def build_controller(mock_drone_config):
     controller.log_debug = lambda *args, **kwargs: None
     controller.log_info = lambda *args, **kwargs: None
     controller.log_warning = lambda *args, **kwargs: None
+    controller.message_dispatcher = controller._build_message_dispatcher()
     controller.run_telemetry_thread = Mock()
     controller.telemetry_thread = Mock()
     controller.telemetry_thread.is_alive.return_value = False
@@ -497,3 +499,22 @@ def test_process_attitude_tracks_yaw_rate(mock_drone_config):
 
     assert mock_drone_config.yaw > 0
     assert mock_drone_config.yaw_rate_deg_s > 28.0
+
+
+def test_synthetic_stream_is_dispatched_through_table_with_stats(mock_drone_config):
+    controller = build_controller(mock_drone_config)
+    parser = mavutil.mavlink.MAVLink(None)
+    assert controller.message_dispatcher.install_parser_filter(SimpleNamespace(mav=parser))
+
+    for msg in parser.parse_buffer(build_synthetic_stream(1.0)):
+        if msg.get_type() in controller.message_dispatcher.message_types:
+            controller.process_message(msg)
+
+    stats = controller.get_ingest_stats()
+    assert stats["message_types"]["ATTITUDE"]["count"] == 50
+    assert stats["message_types"]["SCALED_PRESSURE"]["count"] == 20
+    assert stats["message_types"]["GPS_GLOBAL_ORIGIN"]["count"] == 0
+    assert stats["filtered_count"] > 0  # HIGHRES_IMU, VFR_HUD, ... never decoded
+    assert "HIGHRES_IMU" not in controller.latest_messages
+    assert controller.latest_messages["ATTITUDE"].get_type() == "ATTITUDE"
+    assert mock_drone_config.yaw_rate_deg_s != 0.0
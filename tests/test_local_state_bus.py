@@ -0,0 +1,150 @@
+import os
+import struct
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import actions
+from src import local_state_bus as bus
+
+
+@pytest.fixture
+def segment_name():
+    return f"mds_test_state_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def writer(segment_name):
+    writer = bus.LocalStateBusWriter(segment_name)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
+def _drone_state(**overrides):
+    state = {
+        "hw_id": 3,
+        "pos_id": 3,
+        "state": 2,
+        "mission": 2,
+        "update_time": 1234567890,
+        "flight_mode": 50593792,
+        "base_mode": 29,
+        "system_status": 3,
+        "is_armed": True,
+        "is_ready_to_arm": True,
+        "home_position_set": True,
+        "global_position_valid": True,
+        "gps_fix_type": 3,
+        "heartbeat_timestamp_ms": 1234567890123,
+        "position_lat": 35.7244359,
+        "position_long": 51.2756087,
+        "position_alt": 1294.4,
+        "velocity_north": 1.5,
+        "velocity_east": -0.25,
+        "velocity_down": 0.1,
+        "yaw": 100.0,
+        "relative_altitude_m": 8.4,
+        "readiness_checks": [],  # non-numeric keys stay on the HTTP path only
+    }
+    state.update(overrides)
+    return state
+
+
+def test_published_snapshot_round_trips_through_shared_memory(writer, segment_name):
+    home = {"latitude": 35.7244359, "longitude": 51.2756087, "altitude": 1286.0}
+    sequence = writer.publish(_drone_state(), home)
+
+    snapshot = bus.LocalStateBusReader(segment_name).read(max_age_sec=5.0)
+
+    assert snapshot.sequence == sequence == 2
+    assert snapshot.drone_state == {key: _drone_state()[key] for key in bus.STATE_KEYS}
+    assert snapshot.home_position["latitude"] == home["latitude"]
+    assert snapshot.home_position["longitude"] == home["longitude"]
+    assert snapshot.home_position["altitude"] == home["altitude"]
+
+
+def test_missing_values_and_home_decode_as_none(writer, segment_name):
+    writer.publish(_drone_state(relative_altitude_m=None), None)
+
+    snapshot = bus.LocalStateBusReader(segment_name).read()
+
+    assert snapshot.drone_state["relative_altitude_m"] is None
+    assert snapshot.home_position is None
+
+
+def test_reader_rejects_in_progress_torn_and_stale_writes(writer, segment_name, monkeypatch):
+    reader = bus.LocalStateBusReader(segment_name)
+    assert reader.read() is None  # nothing published yet
+
+    writer.publish(_drone_state(), None)
+    buffer = writer._segment.buf
+
+    # Odd sequence: the writer is mid-update.
+    struct.pack_into("<Q", buffer, 8, writer.sequence + 1)
+    assert reader.read() is None
+    struct.pack_into("<Q", buffer, 8, writer.sequence)
+
+    # Payload changed without a matching CRC: torn read.
+    original = bytes(buffer[16:24])
+    struct.pack_into("<d", buffer, 16, 0.0)
+    assert reader.read() is None
+    buffer[16:24] = original
+    assert reader.read() is not None
+
+    monkeypatch.setattr(bus.time, "time", lambda: bus.time.monotonic() + 10**10)
+    assert reader.read(max_age_sec=1.0) is None
+
+
+def test_reader_without_segment_returns_none(segment_name):
+    assert bus.LocalStateBusReader(segment_name).read() is None
+
+
+def test_publisher_maps_communicator_state_and_config_home(segment_name, monkeypatch):
+    monkeypatch.setattr(bus, "segment_name", lambda: segment_name)
+    communicator = SimpleNamespace(get_drone_state=lambda: _drone_state(position_alt=1300.0))
+    drone_config = SimpleNamespace(home_position={"lat": 35.72, "long": 51.27, "alt": 1286.0})
+    publisher = bus.LocalStateBusPublisher(communicator, drone_config, interval=60)
+    publisher.start()
+    try:
+        snapshot = bus.LocalStateBusReader(segment_name).read(max_age_sec=5.0)
+    finally:
+        publisher.stop()
+
+    assert snapshot.drone_state["position_alt"] == 1300.0
+    assert snapshot.home_position["latitude"] == 35.72
+    assert snapshot.home_position["altitude"] == 1286.0
+    assert bus.LocalStateBusReader(segment_name).read() is None  # segment removed on stop
+
+
+def test_relative_altitude_uses_bus_without_http(mocker):
+    snapshot = bus.LocalStateSnapshot(
+        drone_state=_drone_state(position_alt=1296.0),
+        home_position={"latitude": 35.72, "longitude": 51.27, "altitude": 1286.0, "timestamp": 0},
+        published_at=0.0,
+        sequence=2,
+    )
+    mocker.patch("actions.read_local_state_snapshot", return_value=snapshot)
+    http_get = mocker.patch("actions.requests.get")
+
+    assert actions._get_local_relative_altitude_snapshot() == pytest.approx(10.0)
+    http_get.assert_not_called()
+
+
+def test_local_snapshots_fall_back_to_http_when_bus_unavailable(mocker):
+    mocker.patch("actions.read_local_state_snapshot", return_value=None)
+    responses = {
+        actions.DRONE_STATE_ROUTE: {"position_alt": 1290.0},
+        actions.DRONE_NAVIGATION_HOME_ROUTE: {"altitude": 1286.0},
+    }
+
+    def fake_get(url, timeout):
+        route = next(route for route in responses if url.endswith(route))
+        return SimpleNamespace(status_code=200, json=lambda: responses[route])
+
+    http_get = mocker.patch("actions.requests.get", side_effect=fake_get)
+
+    assert actions._get_local_relative_altitude_snapshot() == pytest.approx(4.0)
+    assert http_get.call_count == 2
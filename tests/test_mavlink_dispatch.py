@@ -0,0 +1,141 @@
+from types import SimpleNamespace
+
+import pytest
+from pymavlink import mavutil
+from pymavlink.dialects.v10 import ardupilotmega as mavlink1
+from pymavlink.dialects.v20 import ardupilotmega as mavlink2
+
+from src.mavlink_dispatch import MavlinkDispatcher
+from tests.helpers.mavlink_stream import build_message, build_synthetic_stream
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _filtered_parser(dispatcher):
+    parser = mavutil.mavlink.MAVLink(None)
+    decoded = []
+    original_decode = parser.decode
+
+    def spy_decode(msgbuf):
+        decoded.append(msgbuf[5] if msgbuf[0] == mavutil.mavlink.PROTOCOL_MARKER_V1 else msgbuf[7])
+        return original_decode(msgbuf)
+
+    parser.decode = spy_decode
+    assert dispatcher.install_parser_filter(SimpleNamespace(mav=parser)) is True
+    return parser, decoded
+
+
+@pytest.mark.parametrize("dialect", [mavlink1, mavlink2], ids=["mavlink1", "mavlink2"])
+def test_parser_filter_skips_decoding_unwanted_frames(dialect):
+    received = []
+    dispatcher = MavlinkDispatcher({"ATTITUDE": received.append})
+    parser, decoded = _filtered_parser(dispatcher)
+    encoder = dialect.MAVLink(None, srcSystem=7, srcComponent=1)
+    frames = []
+    for seq, name in enumerate(("HIGHRES_IMU", "ATTITUDE", "VFR_HUD"), start=40):
+        encoder.seq = seq
+        frames.append(build_message(name, dialect).pack(encoder))
+    stream = b"".join(frames)
+
+    messages = parser.parse_buffer(stream)
+
+    assert [msg.get_type() for msg in messages] == [
+        f"UNKNOWN_{mavutil.mavlink.MAVLINK_MSG_ID_HIGHRES_IMU}",
+        "ATTITUDE",
+        f"UNKNOWN_{mavutil.mavlink.MAVLINK_MSG_ID_VFR_HUD}",
+    ]
+    assert decoded == [mavutil.mavlink.MAVLINK_MSG_ID_ATTITUDE]
+    # Skipped frames keep their header so pymavlink's sequence accounting still works.
+    assert [msg.get_srcSystem() for msg in messages] == [7, 7, 7]
+    assert [msg.get_seq() for msg in messages] == [40, 41, 42]
+    assert dispatcher.filtered_count == 2
+    assert dispatcher.filtered_by_id == {
+        mavutil.mavlink.MAVLINK_MSG_ID_HIGHRES_IMU: 1,
+        mavutil.mavlink.MAVLINK_MSG_ID_VFR_HUD: 1,
+    }
+
+    assert dispatcher.dispatch(messages[1]) is True
+    assert received == [messages[1]]
+
+
+def test_install_parser_filter_ignores_connections_without_parser():
+    assert MavlinkDispatcher({"ATTITUDE": lambda msg: None}).install_parser_filter(object()) is False
+
+
+def test_dispatch_resolves_by_id_or_name_and_reports_unhandled():
+    received = []
+    dispatcher = MavlinkDispatcher({"ATTITUDE": received.append})
+
+    by_name = SimpleNamespace(get_type=lambda: "ATTITUDE")
+    assert dispatcher.dispatch(by_name) is True
+    assert dispatcher.dispatch(SimpleNamespace(get_type=lambda: "VFR_HUD")) is False
+    assert received == [by_name]
+
+
+def test_snapshot_reports_rate_handler_cost_and_staleness():
+    clock = FakeClock()
+    dispatcher = MavlinkDispatcher(
+        {"ATTITUDE": lambda msg: None, "HEARTBEAT": lambda msg: None},
+        rate_window_sec=1.0,
+        clock=clock,
+    )
+    attitude = SimpleNamespace(get_type=lambda: "ATTITUDE")
+    for _ in range(50):
+        clock.now += 0.02
+        dispatcher.dispatch(attitude)
+
+    stats = dispatcher.snapshot()
+    attitude_stats = stats["message_types"]["ATTITUDE"]
+    assert attitude_stats["count"] == 50
+    assert attitude_stats["rate_hz"] == pytest.approx(50.0, rel=0.05)
+    assert attitude_stats["handler_avg_us"] >= 0
+    assert attitude_stats["handler_max_us"] >= attitude_stats["handler_avg_us"]
+    assert attitude_stats["age_ms"] == 0
+    assert stats["message_types"]["HEARTBEAT"] == {
+        "count": 0,
+        "rate_hz": 0.0,
+        "decode_avg_us": None,
+        "handler_avg_us": None,
+        "handler_max_us": None,
+        "age_ms": None,
+    }
+    assert stats["dispatched_count"] == 50
+    assert 0 <= stats["ingest_busy_ratio"] < 1
+
+    # A stream that stops ages, and its rate decays over the stalled window.
+    clock.now += 4.0
+    stalled = dispatcher.snapshot()["message_types"]["ATTITUDE"]
+    assert stalled["age_ms"] == 4000
+    assert stalled["rate_hz"] == pytest.approx(10.0, rel=0.05)
+
+
+def test_handler_errors_propagate_but_are_counted():
+    def failing(msg):
+        raise ValueError("bad message")
+
+    dispatcher = MavlinkDispatcher({"ATTITUDE": failing})
+    with pytest.raises(ValueError):
+        dispatcher.dispatch(SimpleNamespace(get_type=lambda: "ATTITUDE"))
+
+    assert dispatcher.snapshot()["message_types"]["ATTITUDE"]["count"] == 1
+
+
+def test_synthetic_stream_counts_every_frame():
+    stream = build_synthetic_stream(2.0)
+    dispatcher = MavlinkDispatcher({"ATTITUDE": lambda msg: None, "HEARTBEAT": lambda msg: None})
+    parser, decoded = _filtered_parser(dispatcher)
+
+    for msg in parser.parse_buffer(stream):
+        dispatcher.dispatch(msg)
+
+    stats = dispatcher.snapshot()
+    assert stats["message_types"]["ATTITUDE"]["count"] == 100
+    assert stats["message_types"]["HEARTBEAT"]["count"] == 2
+    assert len(decoded) == 102
+    assert stats["dispatched_count"] + stats["filtered_count"] == len(mavutil.mavlink.MAVLink(None).parse_buffer(stream))
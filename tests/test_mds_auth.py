@@ -2,6 +2,7 @@ import json
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -9,6 +10,7 @@ from fastapi.testclient import TestClient
 
 from api_routes.auth import create_auth_router
 from auth_runtime import MDSAuthMiddleware
+from src.security import auth as auth_module
 from src.security.auth import AuthService, AuthSettings, hash_password, verify_password
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -116,6 +118,99 @@ def test_auth_store_user_and_token_lifecycle(monkeypatch, tmp_path):
     assert service.store.verify_token(plaintext) is None
 
 
+def test_token_verification_serves_from_memory_and_defers_last_used(monkeypatch, tmp_path):
+    _set_auth_env(monkeypatch, tmp_path, dashboard=False, api=True)
+    service = AuthService(AuthSettings.from_env())
+    created = service.store.create_token("fleet", scopes=["drone"], created_by="admin")
+    tokens_file = service.settings.tokens_file
+    on_disk_before = tokens_file.read_bytes()
+
+    for _ in range(200):
+        # Routes build a fresh service per request; the index is shared per file.
+        assert AuthService(AuthSettings.from_env()).store.verify_token(
+            created["token"], source_ip="10.0.0.7"
+        )["id"] == created["id"]
+
+    assert tokens_file.read_bytes() == on_disk_before
+    assert service.store._token_index.load_count == 1
+    assert service.store.list_tokens()[0]["last_used_ip"] == "10.0.0.7"
+
+    assert service.store.flush_token_usage() is True
+    persisted = json.loads(tokens_file.read_text())["tokens"][0]
+    assert persisted["last_used_ip"] == "10.0.0.7"
+    assert persisted["last_used_at"]
+    assert service.store.flush_token_usage() is False
+
+
+def test_token_revocation_applies_immediately_in_and_out_of_process(monkeypatch, tmp_path):
+    _set_auth_env(monkeypatch, tmp_path, dashboard=False, api=True)
+    service = AuthService(AuthSettings.from_env())
+    local = service.store.create_token("local", scopes=["operator"])
+    remote = service.store.create_token("remote", scopes=["operator"])
+    assert service.store.verify_token(local["token"], source_ip="10.0.0.1")
+    assert service.store.verify_token(remote["token"])
+
+    service.store.revoke_token(local["id"])
+    assert service.store.verify_token(local["token"]) is None
+
+    # A revocation written by another process (e.g. tools/mds_auth_admin.py).
+    tokens_file = service.settings.tokens_file
+    payload = json.loads(tokens_file.read_text())
+    for token in payload["tokens"]:
+        if token["id"] == remote["id"]:
+            token["revoked"] = True
+    tokens_file.write_text(json.dumps(payload, indent=2) + "\n")
+    assert service.store.verify_token(remote["token"]) is None
+
+    # Last-used metadata flushed afterwards must not resurrect either token.
+    service.store.flush_token_usage()
+    persisted = {token["id"]: token for token in json.loads(tokens_file.read_text())["tokens"]}
+    assert persisted[local["id"]]["revoked"] is True
+    assert persisted[local["id"]]["last_used_ip"] == "10.0.0.1"
+    assert persisted[remote["id"]]["revoked"] is True
+
+
+def test_revocation_survives_a_concurrent_last_used_flush(monkeypatch, tmp_path):
+    _set_auth_env(monkeypatch, tmp_path, dashboard=False, api=True)
+    service = AuthService(AuthSettings.from_env())
+    created = service.store.create_token("fleet", scopes=["operator"])
+    assert service.store.verify_token(created["token"], source_ip="10.0.0.9")
+
+    flush_read = threading.Event()
+    revoke_returned = threading.Event()
+    real_write = auth_module._atomic_write_json
+
+    def paused_write(path, payload, mode=0o600):
+        if threading.current_thread() is flusher:
+            # The flush has read the file; let the revoke run before it writes back.
+            flush_read.set()
+            revoke_returned.wait(0.5)
+        real_write(path, payload, mode=mode)
+
+    monkeypatch.setattr(auth_module, "_atomic_write_json", paused_write)
+    flusher = threading.Thread(target=service.store.flush_token_usage)
+    flusher.start()
+    assert flush_read.wait(2.0)
+    service.store.revoke_token(created["id"])
+    revoke_returned.set()
+    flusher.join(2.0)
+
+    persisted = json.loads(service.settings.tokens_file.read_text())["tokens"][0]
+    assert persisted["revoked"] is True
+    assert persisted["last_used_ip"] == "10.0.0.9"
+    assert service.store.verify_token(created["token"]) is None
+
+
+def test_expired_tokens_are_rejected_by_the_index(monkeypatch, tmp_path):
+    _set_auth_env(monkeypatch, tmp_path, dashboard=False, api=True)
+    service = AuthService(AuthSettings.from_env())
+    created = service.store.create_token("short", scopes=["viewer"], ttl_seconds=60)
+    assert service.store.verify_token(created["token"])
+
+    monkeypatch.setattr("src.security.auth.time.time", lambda: 4_102_444_800.0)
+    assert service.store.verify_token(created["token"]) is None
+
+
 def test_auth_admin_status_redacts_password_hashes(monkeypatch, tmp_path):
     _set_auth_env(monkeypatch, tmp_path, dashboard=True, api=False)
     service = AuthService(AuthSettings.from_env())
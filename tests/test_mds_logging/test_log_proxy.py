@@ -11,6 +11,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'gcs-serv
 
 import httpx
 
+from fleet_config_snapshot import FleetConfigSnapshot
+
 
 def _ulog_job(*, status="queued", size_bytes=8):
     return {
@@ -59,21 +61,21 @@ class TestResolveDroneIp:
             {"hw_id": "1", "ip": "192.168.1.101"},
             {"hw_id": "5", "ip": "192.168.1.105"},
         ]
-        with patch("log_proxy.load_config", return_value=drones):
+        with patch("log_proxy.get_fleet_config_snapshot", return_value=FleetConfigSnapshot.from_drones(drones)):
             ip = resolve_drone_ip(5)
             assert ip == "192.168.1.105"
 
     def test_resolve_unknown_drone_returns_none(self):
         from log_proxy import resolve_drone_ip
         drones = [{"hw_id": "1", "ip": "192.168.1.101"}]
-        with patch("log_proxy.load_config", return_value=drones):
+        with patch("log_proxy.get_fleet_config_snapshot", return_value=FleetConfigSnapshot.from_drones(drones)):
             ip = resolve_drone_ip(99)
             assert ip is None
 
     def test_resolve_handles_string_hw_id(self):
         from log_proxy import resolve_drone_ip
         drones = [{"hw_id": "005", "ip": "192.168.1.105"}]
-        with patch("log_proxy.load_config", return_value=drones):
+        with patch("log_proxy.get_fleet_config_snapshot", return_value=FleetConfigSnapshot.from_drones(drones)):
             ip = resolve_drone_ip(5)
             assert ip == "192.168.1.105"
 
@@ -469,18 +471,17 @@ class TestUlogSummaryFallback:
 
 
 class TestStreamDroneLogs:
-    def test_stream_error_emits_structured_warning_entry(self):
+    @pytest.mark.asyncio
+    async def test_stream_error_emits_structured_warning_entry(self):
         from log_proxy import stream_drone_logs
 
-        with patch("log_proxy.httpx.Client") as MockClient:
+        with patch("log_proxy.httpx.AsyncClient") as MockClient:
             client_instance = MagicMock()
             client_instance.stream = MagicMock(side_effect=httpx.ConnectError("All connection attempts failed"))
-            client_instance.__enter__ = MagicMock(return_value=client_instance)
-            client_instance.__exit__ = MagicMock(return_value=None)
             MockClient.return_value = client_instance
 
             stream = stream_drone_logs("192.168.1.105", drone_id=5)
-            line = next(stream)
+            line = await anext(stream)
 
         assert line.startswith("data: ")
         payload = json.loads(line[len("data: "):])
@@ -490,31 +491,35 @@ class TestStreamDroneLogs:
         assert payload["drone_id"] == 5
         assert "All connection attempts failed" in payload["msg"]
 
-    def test_stream_cancellation_exits_quietly(self):
+    @pytest.mark.asyncio
+    async def test_stream_close_releases_upstream_quietly(self):
         from log_proxy import stream_drone_logs
 
-        class _CancelingResponse:
+        closed = []
+
+        class _Response:
             def raise_for_status(self):
                 return None
 
-            def iter_lines(self):
-                raise GeneratorExit
-                yield  # pragma: no cover
+            async def aiter_lines(self):
+                yield "data: {\"msg\": \"first\"}"
+                yield "data: {\"msg\": \"second\"}"
 
         class _StreamContext:
-            def __enter__(self):
-                return _CancelingResponse()
+            async def __aenter__(self):
+                return _Response()
 
-            def __exit__(self, exc_type, exc, tb):
+            async def __aexit__(self, exc_type, exc, tb):
+                closed.append(exc_type)
                 return None
 
-        with patch("log_proxy.httpx.Client") as MockClient:
+        with patch("log_proxy.httpx.AsyncClient") as MockClient:
             client_instance = MagicMock()
             client_instance.stream = MagicMock(return_value=_StreamContext())
-            client_instance.__enter__ = MagicMock(return_value=client_instance)
-            client_instance.__exit__ = MagicMock(return_value=None)
             MockClient.return_value = client_instance
 
             stream = stream_drone_logs("192.168.1.105", drone_id=5)
-            with pytest.raises(StopIteration):
-                next(stream)
+            assert await anext(stream) == 'data: {"msg": "first"}\n\n'
+            await stream.aclose()
+
+        assert closed == [GeneratorExit]
@@ -0,0 +1,157 @@
+"""Pooled drone clients and streamed bodies in the GCS log proxy, against a stub drone."""
+import asyncio
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'gcs-server'))
+
+import log_proxy  # noqa: E402
+
+ULOG_CHUNK = b"\x00ULog" * (64 * 1024 // 5)
+ULOG_CHUNKS = 1024  # ~64 MiB per download
+SSE_EVENTS = 2000
+
+
+class _StubDroneHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        return None
+
+    def do_GET(self):
+        self.server.requests.append(self.client_address)
+        if self.path.startswith("/api/logs/sessions"):
+            body = json.dumps({"sessions": [{"session_id": "s_1", "size_bytes": 1}]}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path.startswith("/api/logs/stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            if "source=hold" in self.path:
+                # A live tail: one event, then stay open until the test releases it.
+                self._write_chunk(f"data: {json.dumps({'seq': 0})}\n\n".encode())
+                self.server.release.wait(10)
+                self._write_chunk(b"")
+                return
+            for index in range(SSE_EVENTS):
+                self._write_chunk(f": keepalive\n\ndata: {json.dumps({'seq': index})}\n\n".encode())
+            self._write_chunk(b"")
+        elif "/content" in self.path:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(ULOG_CHUNK) * ULOG_CHUNKS))
+            self.end_headers()
+            for _ in range(ULOG_CHUNKS):
+                self.wfile.write(ULOG_CHUNK)
+        else:
+            self.send_error(404)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+
+@pytest.fixture
+def stub_drone(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubDroneHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.release = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("MDS_DRONE_API_PORT", str(server.server_address[1]))
+    monkeypatch.setattr(log_proxy, "_authenticated_ulog_headers", lambda *args: dict(args[3] or {}))
+    yield server
+    server.release.set()
+    server.shutdown()
+    server.server_close()
+
+
+async def test_repeated_requests_reuse_one_pooled_connection(stub_drone):
+    try:
+        for _ in range(50):
+            sessions = await log_proxy.fetch_drone_sessions("127.0.0.1")
+            content = await log_proxy.fetch_drone_session_content("127.0.0.1", "s_1", level="INFO")
+            assert sessions["sessions"][0]["session_id"] == "s_1"
+            assert content is not None
+    finally:
+        await log_proxy.close_drone_clients()
+
+    assert len(stub_drone.requests) == 100
+    assert len(set(stub_drone.requests)) == 1
+
+
+async def test_sse_tail_streams_only_data_lines_and_returns_connection(stub_drone):
+    try:
+        events = [line async for line in log_proxy.stream_drone_logs("127.0.0.1", drone_id=1)]
+        await log_proxy.fetch_drone_sessions("127.0.0.1")
+    finally:
+        await log_proxy.close_drone_clients()
+
+    assert len(events) == SSE_EVENTS
+    assert json.loads(events[-1][len("data: "):]) == {"seq": SSE_EVENTS - 1}
+    assert all(event.endswith("\n\n") for event in events)
+    # The tail ran on the streaming pool; the JSON read opened the request pool's connection.
+    assert len(set(stub_drone.requests)) == 2
+
+
+async def test_open_tails_do_not_starve_short_reads(stub_drone):
+    tail_count = log_proxy._DRONE_CLIENT_LIMITS.max_connections + 4
+    tails = [
+        log_proxy.stream_drone_logs("127.0.0.1", drone_id=1, source="hold") for _ in range(tail_count)
+    ]
+    try:
+        for tail in tails:
+            first = await asyncio.wait_for(tail.__anext__(), 5.0)
+            assert json.loads(first[len("data: "):]) == {"seq": 0}
+
+        for _ in range(10):
+            sessions = await asyncio.wait_for(log_proxy.fetch_drone_sessions("127.0.0.1"), 5.0)
+            assert sessions["sessions"][0]["session_id"] == "s_1"
+    finally:
+        stub_drone.release.set()
+        for tail in tails:
+            await tail.aclose()
+        await log_proxy.close_drone_clients()
+
+    assert len(set(stub_drone.requests)) == tail_count + 1
+
+
+async def _download(drone_ip: str) -> int:
+    total = 0
+    upstream = await log_proxy.open_drone_ulog_download_stream(drone_ip, "job-1", access_token="token")
+    try:
+        async for chunk in upstream.aiter_bytes():
+            total += len(chunk)
+    finally:
+        await upstream.aclose()
+    return total
+
+
+async def test_large_ulog_download_is_streamed_in_constant_memory(stub_drone):
+    tracemalloc.start()
+    try:
+        # The first transfer pays one-off allocations (lazy imports, pool setup).
+        first = await _download("127.0.0.1")
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        second = await _download("127.0.0.1")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        await log_proxy.close_drone_clients()
+
+    assert first == second == len(ULOG_CHUNK) * ULOG_CHUNKS
+    # Socket read-ahead is bounded by the event loop, not by the body size.
+    assert peak - baseline < first // 4
+    assert len(set(stub_drone.requests)) == 1
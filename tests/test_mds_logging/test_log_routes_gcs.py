@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'gcs-serv
 
 from fastapi import FastAPI
 from auth_runtime import MDSAuthMiddleware
+from fleet_config_snapshot import FleetConfigSnapshot
 
 from mds_logging.watcher import LogWatcher
 from mds_logging.registry import register_component, clear_registry
@@ -357,8 +358,8 @@ class TestDroneOnboardUlogProxy:
         node_token = _create_drone_machine_token(monkeypatch, tmp_path)
         monkeypatch.setattr(
             log_proxy,
-            "load_config",
-            lambda: [{"hw_id": "5", "ip": "10.0.0.5"}],
+            "get_fleet_config_snapshot",
+            lambda: FleetConfigSnapshot.from_drones([{"hw_id": "5", "ip": "10.0.0.5"}]),
         )
         captured = []
 
@@ -426,8 +427,8 @@ class TestDroneOnboardUlogProxy:
         monkeypatch.setenv("MDS_API_AUTH_ENABLED", "true")
         monkeypatch.setattr(
             log_proxy,
-            "load_config",
-            lambda: [{"hw_id": "5", "ip": "10.0.0.5"}],
+            "get_fleet_config_snapshot",
+            lambda: FleetConfigSnapshot.from_drones([{"hw_id": "5", "ip": "10.0.0.5"}]),
         )
 
         with pytest.raises(log_proxy.DroneProxyResponseError) as error:
@@ -448,8 +449,8 @@ class TestDroneOnboardUlogProxy:
         monkeypatch.delenv("MDS_SITL_GCS_API_TOKEN_FILE", raising=False)
         monkeypatch.setattr(
             log_proxy,
-            "load_config",
-            lambda: [{"hw_id": "5", "ip": "10.0.0.5"}],
+            "get_fleet_config_snapshot",
+            lambda: FleetConfigSnapshot.from_drones([{"hw_id": "5", "ip": "10.0.0.5"}]),
         )
 
         assert (
@@ -477,8 +478,8 @@ class TestDroneOnboardUlogProxy:
         )
         monkeypatch.setattr(
             log_proxy,
-            "load_config",
-            lambda: [{"hw_id": "5", "ip": "10.0.0.5"}],
+            "get_fleet_config_snapshot",
+            lambda: FleetConfigSnapshot.from_drones([{"hw_id": "5", "ip": "10.0.0.5"}]),
         )
 
         with pytest.raises(log_proxy.DroneProxyResponseError) as error:
@@ -595,10 +596,6 @@ class TestDroneOnboardUlogProxy:
     def test_download_drone_ulog_content_stream(self, tmp_path, monkeypatch):
         import log_proxy
 
-        class FakeAsyncClient:
-            async def aclose(self):
-                return None
-
         class FakeAsyncResponse:
             status_code = 200
             headers = {
@@ -644,7 +641,7 @@ class TestDroneOnboardUlogProxy:
         async def fake_open(_drone_ip, job_id, *, access_token):
             assert job_id == "job-1"
             assert access_token
-            return FakeAsyncClient(), FakeAsyncResponse()
+            return FakeAsyncResponse()
 
         monkeypatch.setattr(log_proxy, "create_drone_ulog_download_job", fake_create)
         monkeypatch.setattr(log_proxy, "open_drone_ulog_download_stream", fake_open)
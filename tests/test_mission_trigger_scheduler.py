@@ -0,0 +1,138 @@
+"""Deadline-driven mission trigger scheduling with a fake clock."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from src.command_contract import DroneCommandRequest, normalize_trigger_time
+from src.drone_config import DroneConfig
+from src.drone_setup import DroneSetup
+from src.enums import Mission, State
+from src.mission_trigger_scheduler import MissionTriggerScheduler
+
+POLL_INTERVAL = 0.5  # Params.schedule_mission_frequency = 2 Hz
+SLEEP_OVERSHOOT = 0.001  # every fake sleep wakes 1 ms late
+
+
+class FakeClock:
+    """Wall clock that only advances when the scheduler sleeps."""
+
+    def __init__(self, now: float):
+        self.now = now
+        self.sleeps = []
+        self.on_sleep = None
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += max(0.0, seconds) + SLEEP_OVERSHOOT
+        if self.on_sleep is not None:
+            self.on_sleep(self.now)
+        await asyncio.sleep(0)
+
+
+def _show_setup(clock: FakeClock, trigger_time: float):
+    params = Mock()
+    params.trigger_sooner_seconds = 4
+    params.main_offboard_executer = "drone_show.py"
+    drone_config = Mock(spec=DroneConfig)
+    drone_config.state = State.MISSION_READY.value
+    drone_config.mission = Mission.DRONE_SHOW_FROM_CSV.value
+    drone_config.trigger_time = trigger_time
+    drone_config.current_command_id = "show-1"
+    drone_config.ground_test_request_file = None
+    drone_config.auto_global_origin = None
+    drone_config.use_global_setpoints = None
+    setup = DroneSetup(params, drone_config, clock=clock)
+
+    launches = []
+
+    async def fake_launch(script_name, action):
+        launches.append((clock(), action))
+        return True, f"{script_name} launched"
+
+    setup.execute_mission_script = fake_launch
+    return setup, launches
+
+
+async def _run_until_launched(scheduler: MissionTriggerScheduler, launches, max_iterations=200):
+    for _ in range(max_iterations):
+        await scheduler.run_once()
+        if launches:
+            return
+    pytest.fail("mission was never launched")
+
+
+@pytest.mark.asyncio
+async def test_fractional_trigger_launches_at_deadline_not_next_poll_tick():
+    clock = FakeClock(1000.0)
+    setup, launches = _show_setup(clock, trigger_time=1006.37)
+    scheduler = MissionTriggerScheduler(setup, poll_interval=POLL_INTERVAL, clock=clock, sleep=clock.sleep)
+
+    await _run_until_launched(scheduler, launches)
+
+    launched_at, action = launches[0]
+    deadline = 1006.37 - 4
+    assert "--start_time=1006.37" in action
+    assert 0 <= launched_at - deadline < POLL_INTERVAL / 50
+    report = setup.trigger_reports[Mission.DRONE_SHOW_FROM_CSV.value]
+    assert report.command_id == "show-1"
+    assert report.launch_deadline == pytest.approx(deadline)
+    assert report.lateness_sec == pytest.approx(launched_at - deadline)
+    # No sleep crosses the deadline: the scheduler never relies on a poll tick to notice it.
+    assert max(clock.sleeps) <= POLL_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_deadline_moved_during_final_wait_is_rescheduled():
+    clock = FakeClock(1000.0)
+    setup, launches = _show_setup(clock, trigger_time=1004.3)
+    scheduler = MissionTriggerScheduler(setup, poll_interval=POLL_INTERVAL, clock=clock, sleep=clock.sleep)
+
+    def postpone(now):
+        if now > 1000.2 and setup.drone_config.trigger_time == 1004.3:
+            setup.drone_config.trigger_time = 1005.9
+
+    clock.on_sleep = postpone
+    await _run_until_launched(scheduler, launches)
+
+    assert 0 <= launches[0][0] - (1005.9 - 4) < POLL_INTERVAL / 50
+    assert "--start_time=1005.9" in launches[0][1]
+
+
+@pytest.mark.asyncio
+async def test_immediate_missions_keep_the_poll_cadence():
+    clock = FakeClock(1000.0)
+    setup, launches = _show_setup(clock, trigger_time=0)
+    setup.drone_config.state = State.IDLE.value
+    ticks = []
+    scheduler = MissionTriggerScheduler(
+        setup,
+        poll_interval=POLL_INTERVAL,
+        clock=clock,
+        sleep=clock.sleep,
+        on_tick=lambda: ticks.append(clock()),
+    )
+
+    for _ in range(3):
+        await scheduler.run_once()
+
+    assert launches == []
+    assert clock.sleeps == [POLL_INTERVAL] * 3
+    assert len(ticks) == 3
+    assert setup.trigger_reports == {}
+
+
+def test_command_contract_accepts_fractional_trigger_times():
+    fractional = DroneCommandRequest(mission_type=Mission.DRONE_SHOW_FROM_CSV.value, trigger_time=1700000000.25)
+    whole = DroneCommandRequest(mission_type=Mission.DRONE_SHOW_FROM_CSV.value, trigger_time=1700000000.0)
+
+    assert fractional.trigger_time == 1700000000.25
+    assert type(whole.trigger_time) is int
+    assert normalize_trigger_time(None) == 0
+    for invalid in (True, "1700000000", -1, float("inf")):
+        with pytest.raises(ValueError):
+            DroneCommandRequest(mission_type=Mission.DRONE_SHOW_FROM_CSV.value, trigger_time=invalid)
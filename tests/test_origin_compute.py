@@ -1,49 +1,144 @@
-from types import SimpleNamespace
+import math
+import time
 
+import numpy as np
+import pymap3d as pm
 import pytest
+from pyproj import Proj, Transformer
 
 import origin
+import origin_solver
+from origin_solver import fit_origin, rotate_offsets
 
 
-def test_compute_origin_from_drone_accepts_low_residual_non_success(monkeypatch):
-    monkeypatch.setattr(
-        origin,
-        "minimize",
-        lambda *args, **kwargs: SimpleNamespace(
-            success=False,
-            message="ABNORMAL_TERMINATION_IN_LNSRCH",
-            fun=5.123889543883753e-07,
-            x=[35.724435686078365, 51.275581311948706],
-        ),
+def _tmerc_offset(origin_lat, origin_lon, lat, lon):
+    transformer = Transformer.from_proj(
+        Proj("epsg:4326"),
+        Proj(f"+proj=tmerc +lat_0={origin_lat} +lon_0={origin_lon} +k=1 +units=m +ellps=WGS84"),
+        always_xy=True,
     )
+    east, north = transformer.transform(lon, lat)
+    return north, east
 
-    lat, lon = origin.compute_origin_from_drone(
-        35.7243908,
-        51.2756092,
-        -5.0,
-        2.5,
-    )
 
-    assert lat == pytest.approx(35.724435686078365)
-    assert lon == pytest.approx(51.275581311948706)
+@pytest.mark.parametrize(
+    ("current_lat", "current_lon", "north", "east"),
+    [
+        (35.7243908, 51.2756092, -5.0, 2.5),
+        (47.397742, 8.545594, 120.0, -340.0),
+        (-33.8688, 151.2093, -480.0, 15.0),
+    ],
+)
+def test_compute_origin_from_drone_places_fix_at_intended_offset(current_lat, current_lon, north, east):
+    lat, lon = origin.compute_origin_from_drone(current_lat, current_lon, north, east)
+
+    ned_north, ned_east, _down = pm.geodetic2ned(current_lat, current_lon, 0.0, lat, lon, 0.0)
+    assert ned_north == pytest.approx(north, abs=1e-6)
+    assert ned_east == pytest.approx(east, abs=1e-6)
+
+    # The previous optimizer fitted a transverse-Mercator frame; both models
+    # agree to well under a millimetre over launch-field distances.
+    tm_north, tm_east = _tmerc_offset(lat, lon, current_lat, current_lon)
+    assert tm_north == pytest.approx(north, abs=1e-3)
+    assert tm_east == pytest.approx(east, abs=1e-3)
+
+
+def test_compute_origin_from_drone_rejects_non_finite_inputs():
+    with pytest.raises(ValueError):
+        origin.compute_origin_from_drone(float("nan"), 51.0, 1.0, 1.0)
+
+
+def _fleet_fixes(origin_lat, origin_lon, offsets, heading_deg, noise_m=0.0, seed=7):
+    rng = np.random.default_rng(seed)
+    north = np.array([item[0] for item in offsets], dtype=float)
+    east = np.array([item[1] for item in offsets], dtype=float)
+    rotated_north, rotated_east = rotate_offsets(north, east, heading_deg)
+    rotated_north = rotated_north + rng.normal(0.0, noise_m, north.size)
+    rotated_east = rotated_east + rng.normal(0.0, noise_m, east.size)
+    lat, lon, _alt = pm.ned2geodetic(rotated_north, rotated_east, 0.0, origin_lat, origin_lon, 0.0)
+    return np.asarray(lat), np.asarray(lon), north, east
+
+
+def test_fit_origin_recovers_origin_and_heading_for_fleet():
+    offsets = [(0.0, 0.0), (0.0, 5.0), (5.0, 0.0), (10.0, 10.0), (-15.0, 20.0), (30.0, -8.0)]
+    lat, lon, north, east = _fleet_fixes(35.7, 51.3, offsets, heading_deg=37.5)
+
+    fit = fit_origin(lat, lon, north, east, keys=list("abcdef"), solve_heading=True)
+
+    recovered_north, recovered_east, _down = pm.geodetic2ned(fit.origin_lat, fit.origin_lon, 0.0, 35.7, 51.3, 0.0)
+    assert math.hypot(recovered_north, recovered_east) < 1e-4
+    assert fit.heading_deg == pytest.approx(37.5, abs=1e-6)
+    assert [residual.key for residual in fit.residuals] == list("abcdef")
+    assert fit.max_m < 1e-4
 
 
-def test_compute_origin_from_drone_rejects_non_success_high_residual(monkeypatch):
+def test_fit_origin_reports_per_drone_residuals_under_noise():
+    offsets = [(float(n), float(e)) for n in range(0, 50, 10) for e in range(0, 50, 10)]
+    lat, lon, north, east = _fleet_fixes(47.39, 8.54, offsets, heading_deg=0.0, noise_m=0.5)
+    lat[3], lon[3], _alt = pm.ned2geodetic(offsets[3][0] + 6.0, offsets[3][1], 0.0, 47.39, 8.54, 0.0)
+
+    fit = fit_origin(lat, lon, north, east)
+
+    worst = max(fit.residuals, key=lambda residual: residual.horizontal_m)
+    assert worst.key == 3
+    assert worst.north_m > 4.0
+    recovered_north, recovered_east, _down = pm.geodetic2ned(fit.origin_lat, fit.origin_lon, 0.0, 47.39, 8.54, 0.0)
+    assert math.hypot(recovered_north, recovered_east) < 0.6
+
+
+def test_fit_origin_heading_requires_distinct_positions():
+    with pytest.raises(ValueError, match="heading"):
+        fit_origin([35.0], [51.0], [1.0], [2.0], solve_heading=True)
+
+
+def test_fleet_fit_is_a_single_vectorized_solve(monkeypatch):
+    offsets = [(float(index % 20) * 3.0, float(index // 20) * 3.0) for index in range(200)]
+    lat, lon, north, east = _fleet_fixes(35.7, 51.3, offsets, heading_deg=12.0, noise_m=0.2)
+    projected_sizes = []
+    geodetic2ned = origin_solver.pm.geodetic2ned
+
+    def _counting_geodetic2ned(lat_arg, *args, **kwargs):
+        projected_sizes.append(np.size(lat_arg))
+        return geodetic2ned(lat_arg, *args, **kwargs)
+
+    monkeypatch.setattr(origin_solver.pm, "geodetic2ned", _counting_geodetic2ned)
+    fit = fit_origin(lat, lon, north, east, solve_heading=True)
+
+    assert fit.drone_count == 200
+    assert fit.heading_deg == pytest.approx(12.0, abs=0.2)
+    # One whole-fleet projection per re-centring pass, never one per drone.
+    assert projected_sizes == [200] * origin_solver.DEFAULT_RECENTER_ITERATIONS
+
+
+def test_build_fleet_origin_fit_report_skips_unusable_drones(monkeypatch):
+    offsets = {"1": (0.0, 0.0), "2": (0.0, 5.0), "3": (5.0, 0.0)}
+    now_ms = int(time.time() * 1000)
+    telemetry = {hw_id: {"hw_id": hw_id} for hw_id in offsets}
     monkeypatch.setattr(
         origin,
-        "minimize",
-        lambda *args, **kwargs: SimpleNamespace(
-            success=False,
-            message="ABNORMAL_TERMINATION_IN_LNSRCH",
-            fun=0.75,
-            x=[35.724435686078365, 51.275581311948706],
-        ),
+        "validate_fresh_global_position",
+        lambda record, **_kwargs: {
+            "latitude": pm.ned2geodetic(*offsets[record["hw_id"]], 0.0, 35.7, 51.3, 0.0)[0],
+            "longitude": pm.ned2geodetic(*offsets[record["hw_id"]], 0.0, 35.7, 51.3, 0.0)[1],
+            "position_timestamp_ms": now_ms,
+        },
+    )
+    drones = [
+        {"hw_id": "1", "pos_id": 1},
+        {"hw_id": "2", "pos_id": 2},
+        {"hw_id": "3", "pos_id": 3},
+        {"hw_id": "4", "pos_id": 4},
+    ]
+    starts = {1: (0.0, 0.0), 2: (0.0, 5.0), 3: (5.0, 0.0)}
+
+    report = origin.build_fleet_origin_fit_report(
+        telemetry,
+        drones,
+        trajectory_resolver=lambda pos_id, _sim: starts.get(pos_id, (None, None)),
     )
 
-    with pytest.raises(Exception, match="Optimization failed"):
-        origin.compute_origin_from_drone(
-            35.7243908,
-            51.2756092,
-            -5.0,
-            2.5,
-        )
+    assert report["origin"]["lat"] == pytest.approx(35.7, abs=1e-9)
+    assert report["origin"]["lon"] == pytest.approx(51.3, abs=1e-9)
+    assert set(report["residuals"]) == {"1", "2", "3"}
+    assert report["skipped"] == [{"hw_id": "4", "pos_id": 4, "reason": "trajectory_missing"}]
+    assert report["summary"]["fitted_drones"] == 3
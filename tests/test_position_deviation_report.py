@@ -1,3 +1,4 @@
+import pymap3d as pm
 import pytest
 
 import origin
@@ -123,3 +124,61 @@ def test_position_deviation_report_rejects_cross_hardware_telemetry(monkeypatch)
     assert deviation["current"] is None
     assert "identity" in deviation["message"].lower()
     assert report["summary"]["online"] == 0
+
+
+def test_position_deviation_report_matches_per_drone_conversion_for_fleet(monkeypatch):
+    monkeypatch.setattr(origin.time, "time", lambda: NOW_MS / 1000)
+    monkeypatch.setattr(origin.Params, "acceptable_deviation", 3.0, raising=False)
+    monkeypatch.setattr(origin.Params, "LOCAL_MAVLINK_STALE_TIMEOUT_SEC", 15, raising=False)
+    monkeypatch.setattr(origin.Params, "sim_mode", False, raising=False)
+
+    origin_lat, origin_lon, origin_alt = 48.8566406, 2.359282, 50.704
+    starts = {1: (0.0, 0.0), 2: (0.0, 5.0), 3: (5.0, 0.0), 4: (10.0, -10.0)}
+    offsets = {"1": (0.5, 0.0), "2": (0.0, 7.0), "3": (12.0, 0.0)}
+    telemetry = {}
+    for hw_id, (north, east) in offsets.items():
+        start_north, start_east = starts[int(hw_id)]
+        lat, lon, _alt = pm.ned2geodetic(
+            start_north + north, start_east + east, 0.0, origin_lat, origin_lon, origin_alt
+        )
+        telemetry[hw_id] = _valid_global_position(
+            hw_id=hw_id, position_lat=float(lat), position_long=float(lon)
+        )
+    drones = [{"hw_id": str(pos_id), "pos_id": pos_id} for pos_id in (1, 2, 3, 4, 5)]
+
+    report = origin.build_position_deviation_report(
+        telemetry,
+        drones,
+        origin_lat=origin_lat,
+        origin_lon=origin_lon,
+        origin_alt=origin_alt,
+        trajectory_resolver=lambda pos_id, _sim: starts.get(pos_id, (None, None)),
+    )
+
+    deviations = report["deviations"]
+    assert list(deviations) == ["1", "2", "3", "4", "5"]
+    assert [deviations[key]["status"] for key in deviations] == [
+        "ok", "warning", "error", "no_telemetry", "error",
+    ]
+    for hw_id, (north, east) in offsets.items():
+        entry = deviations[hw_id]
+        expected_lat, expected_lon, _alt = pm.ned2geodetic(
+            *starts[int(hw_id)], 0, origin_lat, origin_lon, origin_alt
+        )
+        assert entry["expected"]["lat"] == pytest.approx(float(expected_lat), abs=1e-12)
+        assert entry["expected"]["lon"] == pytest.approx(float(expected_lon), abs=1e-12)
+        assert entry["deviation"]["north"] == pytest.approx(north, abs=1e-6)
+        assert entry["deviation"]["east"] == pytest.approx(east, abs=1e-6)
+        assert isinstance(entry["current"]["north"], float)
+    assert deviations["4"]["expected"]["north"] == 10.0
+    assert report["summary"] == {
+        "total_drones": 5,
+        "online": 3,
+        "within_threshold": 1,
+        "warnings": 1,
+        "errors": 2,
+        "no_telemetry": 1,
+        "best_deviation": pytest.approx(0.5, abs=1e-6),
+        "worst_deviation": pytest.approx(12.0, abs=1e-6),
+        "average_deviation": pytest.approx(19.5 / 3, abs=1e-6),
+    }
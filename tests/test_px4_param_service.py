@@ -327,3 +327,152 @@ def test_decode_mavlink_param_value_handles_integer_and_float_payloads():
     assert int_value == 42
     assert float_type == Px4ParamValueType.FLOAT
     assert float_value == 12.75
+
+
+class _FakePx4ParamLink:
+    """In-process PX4 parameter microservice with scripted PARAM_VALUE loss."""
+
+    def __init__(self, params, *, hash_value=0x1A2B3C4D, drop_indices=()):
+        self.params = list(params)
+        self.hash_value = hash_value
+        self.drop_indices = set(drop_indices)
+        self.queue = []
+        self.list_requests = 0
+        self.read_requests = []
+        self.target_system = 1
+        self.target_component = 1
+        self.closed = False
+        self.mav = SimpleNamespace(
+            param_request_list_send=self._on_request_list,
+            param_request_read_send=self._on_request_read,
+        )
+
+    def _param_value(self, index):
+        name, param_type, value = self.params[index]
+        if param_type == mavutil.mavlink.MAV_PARAM_TYPE_INT32:
+            value = struct.unpack(">f", struct.pack(">i", value))[0]
+        return SimpleNamespace(
+            param_id=name,
+            param_type=param_type,
+            param_value=value,
+            param_index=index,
+            param_count=len(self.params),
+        )
+
+    def _hash_message(self):
+        return SimpleNamespace(
+            param_id="_HASH_CHECK",
+            param_type=mavutil.mavlink.MAV_PARAM_TYPE_UINT32,
+            param_value=struct.unpack(">f", struct.pack(">I", self.hash_value))[0],
+            param_index=-1,
+            param_count=len(self.params),
+        )
+
+    def _on_request_list(self, target_system, target_component):
+        self.list_requests += 1
+        for index in range(len(self.params)):
+            if index in self.drop_indices:
+                continue
+            self.queue.append(self._param_value(index))
+        self.queue.append(self._hash_message())
+        self.drop_indices = set()
+
+    def _on_request_read(self, target_system, target_component, param_id, param_index):
+        self.read_requests.append((param_id, param_index))
+        if param_id == b"_HASH_CHECK":
+            self.queue.append(self._hash_message())
+        else:
+            self.queue.append(self._param_value(param_index))
+
+    def wait_heartbeat(self, timeout=None):
+        return SimpleNamespace(srcSystem=1, srcComponent=1)
+
+    def recv_match(self, type=None, blocking=False, timeout=None):
+        if type is None:
+            return SimpleNamespace(get_type=lambda: "ATTITUDE")
+        return self.queue.pop(0) if self.queue else None
+
+    def close(self):
+        # A fresh UDP socket is opened per snapshot, so nothing survives close().
+        self.queue.clear()
+        self.closed = True
+
+
+def _fake_px4_params():
+    return [
+        ("MAV_SYS_ID", mavutil.mavlink.MAV_PARAM_TYPE_INT32, 7),
+        ("MPC_XY_CRUISE", mavutil.mavlink.MAV_PARAM_TYPE_REAL32, 4.5),
+        ("COM_ARM_WO_GPS", mavutil.mavlink.MAV_PARAM_TYPE_INT32, 0),
+        ("MIS_TAKEOFF_ALT", mavutil.mavlink.MAV_PARAM_TYPE_REAL32, 2.5),
+    ]
+
+
+def _build_sync_service(link):
+    service = _build_service()
+    service.params.PX4_PARAMETER_MAVLINK_IDLE_TIMEOUT_SEC = 0.05
+    service._open_mavlink_param_connection = lambda: link
+    return service
+
+
+def test_mavlink_sync_rerequests_only_missing_indices():
+    link = _FakePx4ParamLink(_fake_px4_params(), drop_indices={1, 3})
+    service = _build_sync_service(link)
+
+    entries = service._collect_mavlink_param_entries_blocking(1)
+
+    assert [entry["name"] for entry in entries] == [
+        "MAV_SYS_ID",
+        "MPC_XY_CRUISE",
+        "COM_ARM_WO_GPS",
+        "MIS_TAKEOFF_ALT",
+    ]
+    assert entries[0]["value"] == 7
+    assert entries[1]["value_type"] == Px4ParamValueType.FLOAT
+    assert link.list_requests == 1
+    assert link.read_requests == [(b"", 1), (b"", 3)]
+    assert service.last_mavlink_sync.rerequested_count == 2
+    assert service.last_mavlink_sync.hash_value == 0x1A2B3C4D
+    assert link.closed is True
+
+
+def test_mavlink_sync_returns_cached_set_when_hash_is_unchanged():
+    link = _FakePx4ParamLink(_fake_px4_params())
+    service = _build_sync_service(link)
+    first = service._collect_mavlink_param_entries_blocking(1)
+
+    second = service._collect_mavlink_param_entries_blocking(1)
+
+    assert second == first
+    assert link.list_requests == 1
+    assert link.read_requests[-1] == (b"_HASH_CHECK", -1)
+    assert service.last_mavlink_sync.cache_hit is True
+    assert service.last_mavlink_sync.elapsed_sec < 1.0
+
+
+def test_mavlink_sync_refetches_when_hash_changes():
+    link = _FakePx4ParamLink(_fake_px4_params())
+    service = _build_sync_service(link)
+    service._collect_mavlink_param_entries_blocking(1)
+
+    link.params[1] = ("MPC_XY_CRUISE", mavutil.mavlink.MAV_PARAM_TYPE_REAL32, 6.0)
+    link.hash_value = 0x0BADF00D
+    entries = service._collect_mavlink_param_entries_blocking(1)
+
+    assert link.list_requests == 2
+    assert service.last_mavlink_sync.cache_hit is False
+    assert next(entry for entry in entries if entry["name"] == "MPC_XY_CRUISE")["value"] == 6.0
+
+
+def test_mavlink_sync_reports_incomplete_listing_after_rerequest_rounds():
+    link = _FakePx4ParamLink(_fake_px4_params(), drop_indices={2})
+    link._on_request_read = lambda *args: None
+    link.mav.param_request_read_send = link._on_request_read
+    service = _build_sync_service(link)
+    service.params.PX4_PARAMETER_MAVLINK_REREQUEST_ROUNDS = 2
+
+    try:
+        service._collect_mavlink_param_entries_blocking(1)
+    except RuntimeError as exc:
+        assert "received only 3 of 4" in str(exc)
+    else:
+        raise AssertionError("incomplete listing should fail")
@@ -1,5 +1,9 @@
 import asyncio
+import http.server
+import json
 import math
+import threading
+import time
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
@@ -297,3 +301,105 @@ def test_progress_report_contains_metrics_only_and_checks_http_acceptance(monkey
         timeout=2,
     )
     response.raise_for_status.assert_called_once_with()
+
+
+class _SlowProgressHandler(http.server.BaseHTTPRequestHandler):
+    delay_sec = 0.4
+    received = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay_sec)
+        type(self).received.append(json.loads(body))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def slow_progress_server():
+    _SlowProgressHandler.received = []
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _SlowProgressHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", _SlowProgressHandler.received
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_progress_uplink_never_delays_waypoint_loop_on_slow_gcs(monkeypatch, slow_progress_server):
+    gcs_url, received = slow_progress_server
+    monkeypatch.setattr(qsm, "gcs_auth_headers", MagicMock(return_value={}))
+    uplink = qsm.ProgressUplink(gcs_url, "mission-5", "1").start()
+
+    step_durations = []
+    for waypoint in range(1, 21):
+        started = time.perf_counter()
+        uplink.submit(waypoint, 20, waypoint * 10.0)
+        await asyncio.sleep(0.02)  # stand-in for setpoint delivery between waypoints
+        step_durations.append(time.perf_counter() - started)
+
+    delivered = await uplink.close(timeout_sec=5.0)
+
+    # Every waypoint step stays far below the stub's 0.4 s response time.
+    assert max(step_durations) < 0.2
+    assert delivered == (20, 20, 200.0)
+    assert received[-1] == {
+        "hw_id": "1",
+        "current_waypoint_index": 20,
+        "total_waypoints": 20,
+        "distance_covered_m": 200.0,
+    }
+    # Superseded waypoints were coalesced instead of queued behind the slow GCS.
+    assert len(received) < 20
+    assert uplink.coalesced_count > 0
+
+
+@pytest.mark.asyncio
+async def test_progress_uplink_retries_rejected_report_with_backoff(monkeypatch):
+    report_progress = MagicMock(side_effect=[False, False, True])
+    monkeypatch.setattr(qsm, "report_progress", report_progress)
+    monkeypatch.setattr(qsm.Params, "QUICKSCOUT_PROGRESS_RETRY_INITIAL_SEC", 0.01, raising=False)
+    monkeypatch.setattr(qsm.Params, "QUICKSCOUT_PROGRESS_RETRY_MAX_SEC", 0.02, raising=False)
+    uplink = qsm.ProgressUplink("http://127.0.0.1:5030", "mission-6", "1").start()
+
+    uplink.submit(3, 8, 42.0)
+    delivered = await uplink.close(timeout_sec=2.0)
+
+    assert delivered == (3, 8, 42.0)
+    assert report_progress.call_count == 3
+    assert uplink.failed_count == 2
+    report_progress.assert_called_with("http://127.0.0.1:5030", "mission-6", "1", 3, 8, 42.0)
+
+
+@pytest.mark.parametrize(("status_code", "expected"), [(404, None), (422, None), (408, False), (429, False), (503, False)])
+def test_progress_report_marks_permanent_client_errors_terminal(monkeypatch, status_code, expected):
+    response = qsm.requests.Response()
+    response.status_code = status_code
+    monkeypatch.setattr(qsm.requests, "post", MagicMock(return_value=response))
+    monkeypatch.setattr(qsm, "gcs_auth_headers", MagicMock(return_value={}))
+
+    assert qsm.report_progress("http://127.0.0.1:5030", "mission-7", "1", 2, 8, 12.5) is expected
+
+
+@pytest.mark.asyncio
+async def test_progress_uplink_drops_terminally_rejected_report(monkeypatch):
+    report_progress = MagicMock(side_effect=[None, True])
+    monkeypatch.setattr(qsm, "report_progress", report_progress)
+    monkeypatch.setattr(qsm.Params, "QUICKSCOUT_PROGRESS_RETRY_INITIAL_SEC", 5.0, raising=False)
+    uplink = qsm.ProgressUplink("http://127.0.0.1:5030", "mission-8", "1").start()
+
+    uplink.submit(3, 8, 42.0)
+    assert await uplink.close(timeout_sec=1.0) is None
+    assert report_progress.call_count == 1
+    assert uplink.dropped_count == 1
+    assert uplink.failed_count == 0
+
+    uplink.start().submit(4, 8, 50.0)
+    assert await uplink.close(timeout_sec=1.0) == (4, 8, 50.0)
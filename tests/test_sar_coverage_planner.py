@@ -175,3 +175,98 @@ class TestBoustrophedonPlanner:
 
         # Some drones may get fewer waypoints, but should not crash
         assert area > 0
+
+
+class TestVectorizedPlannerParity:
+    """The vectorized planner must match the per-point reference pipeline."""
+
+    @pytest.mark.parametrize("vertices,drone_count,sweep_width_m", [(7, 3, 30), (120, 12, 12)])
+    def test_plans_match_pointwise_reference_within_millimetre(self, planner, vertices, drone_count, sweep_width_m):
+        from tools.benchmark_quickscout_coverage_planner import (
+            PointwiseReferencePlanner,
+            build_drone_positions,
+            build_search_area,
+            max_waypoint_error_m,
+        )
+
+        args = (
+            build_search_area(vertices, radius_deg=0.01),
+            build_drone_positions(drone_count),
+            SurveyConfig(sweep_width_m=sweep_width_m, overlap_percent=10),
+        )
+        plans, area = planner.plan(*args)
+        reference_plans, reference_area = PointwiseReferencePlanner().plan(*args)
+
+        assert area == pytest.approx(reference_area)
+        assert max_waypoint_error_m(plans, reference_plans) < 1e-3
+        for plan, reference in zip(plans, reference_plans):
+            assert [wp.is_survey_leg for wp in plan.waypoints] == [wp.is_survey_leg for wp in reference.waypoints]
+            assert [wp.sequence for wp in plan.waypoints] == [wp.sequence for wp in reference.waypoints]
+            assert plan.total_distance_m == pytest.approx(reference.total_distance_m, abs=1e-3)
+            assert plan.assigned_area_sq_m == pytest.approx(reference.assigned_area_sq_m)
+
+    def test_sweep_lines_through_vertices_match_shapely_clipping(self, planner):
+        from shapely.geometry import Polygon
+        from tools.benchmark_quickscout_coverage_planner import PointwiseReferencePlanner
+
+        # Lines at y=55 touch the notch vertex and y=95 runs along the top edge.
+        for ring in ([(0, 0), (100, 0), (100, 100), (50, 55), (0, 100)], [(0, 0), (100, 0), (100, 95), (0, 95)]):
+            polygon = Polygon(ring)
+            lines = planner._generate_sweep_lines(polygon, 0.0, 10.0)
+            expected = PointwiseReferencePlanner._pointwise_sweep_lines(polygon, 0.0, 10.0)
+
+            assert len(lines) == len(expected)
+            for line, reference in zip(lines, expected):
+                assert [c for xy in line.coords for c in xy] == pytest.approx([c for xy in reference.coords for c in xy], abs=1e-9)
+
+
+class TestMakespanSectorAssignment:
+    @pytest.mark.parametrize("seed", range(8))
+    def test_max_completion_time_never_exceeds_greedy(self, planner, seed):
+        import random
+
+        rng = random.Random(seed)
+        polygon = make_rectangle(47.0, 8.0, 1200, 800)
+        drones = {
+            str(pos_id): (46.99 + rng.uniform(-0.01, 0.02), 7.99 + rng.uniform(-0.01, 0.02))
+            for pos_id in range(1, rng.randint(3, 8) + 1)
+        }
+        common = dict(sweep_width_m=40, cruise_speed_ms=8, survey_speed_ms=5)
+
+        greedy_plans, _ = planner.plan(polygon, drones, SurveyConfig(**common))
+        makespan_plans, _ = planner.plan(polygon, drones, SurveyConfig(sector_assignment="makespan", **common))
+
+        assert len(makespan_plans) == len(greedy_plans)
+        assert max(plan.predicted_completion_s for plan in makespan_plans) <= max(
+            plan.predicted_completion_s for plan in greedy_plans
+        )
+
+    def test_makespan_shortens_slowest_drone_when_greedy_order_is_poor(self, planner):
+        polygon = make_rectangle(47.0, 8.0, 1000, 1000)
+        # Drone "1" is planned first and grabs the sector nearest to it,
+        # leaving drone "2" (far to the south) the far sector.
+        drones = {"1": (46.9945, 8.0), "2": (46.97, 8.0)}
+        config = SurveyConfig(sweep_width_m=50, cruise_speed_ms=5, survey_speed_ms=5)
+
+        greedy_plans, _ = planner.plan(polygon, drones, config)
+        makespan_plans, _ = planner.plan(
+            polygon, drones, config.model_copy(update={"sector_assignment": "makespan"})
+        )
+
+        greedy_worst = max(plan.predicted_completion_s for plan in greedy_plans)
+        makespan_worst = max(plan.predicted_completion_s for plan in makespan_plans)
+        assert makespan_worst < greedy_worst
+
+    def test_plans_report_predicted_completion_time(self, planner, default_config):
+        polygon = make_rectangle(47.0, 8.0, 300, 300)
+        drones = {"1": (46.995, 8.0), "2": (47.0, 7.995)}
+
+        plans, _ = planner.plan(polygon, drones, default_config.model_copy(update={"sector_assignment": "makespan"}))
+
+        for plan in plans:
+            expected = (
+                plan.transit_distance_m / default_config.cruise_speed_ms
+                + plan.total_distance_m / default_config.survey_speed_ms
+            )
+            assert plan.transit_distance_m > 0
+            assert plan.predicted_completion_s == pytest.approx(expected)
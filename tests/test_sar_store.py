@@ -495,3 +495,181 @@ def test_quickscout_store_migrates_legacy_poi_rows(tmp_path, monkeypatch):
     assert len(loaded) == 1
     assert loaded[0].id == "legacy-poi-1"
     assert loaded[0].summary == "Legacy dock contact"
+
+
+def _executing_operation(drone_count: int = 1) -> QuickScoutOperationRecord:
+    operation = _build_operation()
+    operation.state = SurveyState.EXECUTING
+    template_plan = operation.plans[0]
+    operation.plans = [
+        template_plan.model_copy(update={"hw_id": str(index), "pos_id": index})
+        for index in range(1, drone_count + 1)
+    ]
+    operation.drone_states = {
+        str(index): DroneSurveyState(hw_id=str(index), state=SurveyState.EXECUTING, total_waypoints=10)
+        for index in range(1, drone_count + 1)
+    }
+    return operation
+
+
+def _operation_payload_json(db_path, mission_id):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute(
+            "SELECT payload_json FROM quickscout_operations WHERE mission_id = ?",
+            (mission_id,),
+        ).fetchone()[0]
+
+
+def test_progress_reports_write_narrow_rows_and_read_back_in_operation(tmp_path):
+    import sar.service as service_module
+
+    db_path = tmp_path / "quickscout.sqlite3"
+    store = store_module.QuickScoutStore(str(db_path))
+    operation = _executing_operation(drone_count=3)
+    store.save_operation(operation)
+    service = service_module.QuickScoutService(store=store)
+    payload_before = _operation_payload_json(db_path, operation.mission_id)
+
+    assert service.update_drone_progress(operation.mission_id, "2", 4, 10, distance_covered_m=120.5)
+    assert not service.update_drone_progress(operation.mission_id, "2", 3, 10, distance_covered_m=130.0)
+    assert not service.update_drone_progress(operation.mission_id, "9", 1, 10)
+
+    assert _operation_payload_json(db_path, operation.mission_id) == payload_before
+    loaded = store.get_operation(operation.mission_id)
+    drone = loaded.drone_states["2"]
+    assert drone.current_waypoint_index == 4
+    assert drone.distance_covered_m == 120.5
+    assert drone.coverage_percent == 40.0
+    assert drone.estimated_remaining_s == 6.0
+    assert drone.last_update_at is not None
+    assert loaded.updated_at >= drone.last_update_at
+    assert loaded.drone_states["1"].current_waypoint_index == 0
+    assert [item.drone_states["2"].current_waypoint_index for item in store.list_operations()] == [4]
+
+    # Lifecycle writes carry the merged progress forward instead of clobbering it.
+    def mark_completed(current):
+        current.drone_states["1"].state = SurveyState.COMPLETED
+        return current
+
+    store.mutate_operation(operation.mission_id, mark_completed)
+    reloaded = store.get_operation(operation.mission_id)
+    assert reloaded.drone_states["1"].state == SurveyState.COMPLETED
+    assert reloaded.drone_states["2"].current_waypoint_index == 4
+
+
+def test_progress_gating_uses_persisted_state_and_plan(tmp_path):
+    import sar.service as service_module
+    from fastapi import HTTPException
+
+    store = store_module.QuickScoutStore(str(tmp_path / "quickscout.sqlite3"))
+    operation = _executing_operation()
+    operation.drone_states["1"].state = SurveyState.READY
+    store.save_operation(operation)
+    service = service_module.QuickScoutService(store=store)
+
+    try:
+        service.update_drone_progress(operation.mission_id, "1", 1, 10)
+    except HTTPException as exc:
+        assert exc.detail["code"] == "quickscout_progress_before_execution"
+    else:
+        raise AssertionError("progress before execution must be rejected")
+
+    def start(current):
+        current.drone_states["1"].state = SurveyState.EXECUTING
+        return current
+
+    store.mutate_operation(operation.mission_id, start)
+    try:
+        service.update_drone_progress(operation.mission_id, "1", 1, 12)
+    except HTTPException as exc:
+        assert exc.detail["code"] == "quickscout_progress_plan_mismatch"
+    else:
+        raise AssertionError("progress for a different plan must be rejected")
+    assert service.update_drone_progress(operation.mission_id, "1", 1, 10)
+
+
+def test_progress_backfills_operations_saved_before_progress_table(tmp_path):
+    import sar.service as service_module
+
+    db_path = tmp_path / "quickscout.sqlite3"
+    store = store_module.QuickScoutStore(str(db_path))
+    operation = _executing_operation()
+    operation.drone_states["1"].current_waypoint_index = 2
+    store.save_operation(operation)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("DELETE FROM quickscout_drone_progress")
+
+    service = service_module.QuickScoutService(store=store)
+    assert not service.update_drone_progress(operation.mission_id, "1", 1, 10)
+    assert service.update_drone_progress(operation.mission_id, "1", 5, 10)
+    assert store.get_operation(operation.mission_id).drone_states["1"].current_waypoint_index == 5
+
+
+def test_store_reuses_per_thread_connections_and_reconnects_after_close(tmp_path):
+    store = store_module.QuickScoutStore(str(tmp_path / "quickscout.sqlite3"))
+
+    first = store._connect()
+    assert store._connect() is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert first.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    other_thread_connections = []
+    worker = threading.Thread(target=lambda: other_thread_connections.append(store._connect()))
+    worker.start()
+    worker.join()
+    assert other_thread_connections[0] is not first
+
+    store.close()
+    store.save_operation(_build_operation())
+    assert store._connect() is not first
+    assert store.get_operation("mission-1") is not None
+
+
+def test_concurrent_readers_and_writers_persist_every_write(tmp_path):
+    import sar.service as service_module
+
+    db_path = tmp_path / "quickscout.sqlite3"
+    store = store_module.QuickScoutStore(str(db_path))
+    operation = _executing_operation(drone_count=4)
+    store.save_operation(operation)
+    service = service_module.QuickScoutService(store=store)
+    errors = []
+    stop_readers = threading.Event()
+
+    def reader():
+        try:
+            while not stop_readers.is_set():
+                assert store.get_operation(operation.mission_id) is not None
+                store.list_findings(operation.mission_id)
+        except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+            errors.append(exc)
+
+    def writer(hw_id):
+        try:
+            for waypoint in range(1, 11):
+                service.update_drone_progress(operation.mission_id, hw_id, waypoint, 10, float(waypoint))
+                store.save_finding(
+                    operation.mission_id,
+                    QuickScoutFinding(id=f"finding-{hw_id}-{waypoint}", lat=47.0, lng=8.0, mission_id=operation.mission_id),
+                )
+        except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+            errors.append(exc)
+
+    readers = [threading.Thread(target=reader) for _ in range(6)]
+    writers = [threading.Thread(target=writer, args=(hw_id,)) for hw_id in operation.drone_states]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join(timeout=30.0)
+    stop_readers.set()
+    for thread in readers:
+        thread.join(timeout=30.0)
+
+    assert errors == []
+    store.close()
+    reopened = store_module.QuickScoutStore(str(db_path))
+    loaded = reopened.get_operation(operation.mission_id)
+    assert {hw_id: drone.current_waypoint_index for hw_id, drone in loaded.drone_states.items()} == {
+        hw_id: 10 for hw_id in operation.drone_states
+    }
+    assert len(reopened.list_findings(operation.mission_id)) == 40
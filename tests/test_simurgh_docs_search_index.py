@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from agent_runtime import docs_index
+from agent_runtime.docs_index import GeneratedDocsIndex, load_default_docs_index
+from agent_runtime.retrieval import load_default_retriever
+
+
+def _chunk(chunk_id: str, text: str, **overrides):
+    payload = {
+        "id": chunk_id,
+        "resource_id": f"test.{chunk_id}",
+        "title": f"Chunk {chunk_id}",
+        "heading": "",
+        "path": f"docs/{chunk_id}.md",
+        "audience": "operator",
+        "summary": "",
+        "tags": [],
+        "text": text,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _index(*chunks) -> GeneratedDocsIndex:
+    return GeneratedDocsIndex.from_mapping({"version": 1, "resources": [], "chunks": list(chunks)})
+
+
+def _write_index(path, *chunks) -> None:
+    path.write_text(json.dumps({"version": 1, "resources": [], "chunks": list(chunks)}), encoding="utf-8")
+
+
+def test_search_keeps_substring_and_snake_case_phrase_matches():
+    index = _index(
+        _chunk("a", "Always disarm before swapping batteries."),
+        _chunk("b", "Set sitl_mode before starting the containers."),
+        _chunk("c", "Unrelated text about LED colors."),
+    )
+
+    assert [chunk.id for chunk, _score, _snippet in index.search("arm")] == ["a"]
+    assert [chunk.id for chunk, _score, _snippet in index.search("sitl_mode")] == ["b"]
+    assert index.search("telemetry") == []
+
+
+def test_search_prefers_rare_terms_and_respects_filters():
+    common = "drone " * 20
+    index = _index(
+        _chunk("common", common + "mission", tags=["missions"]),
+        _chunk("rare", "drone quickscout sector", tags=["missions"]),
+        _chunk("dev", "drone quickscout sector", audience="developer"),
+        *[_chunk(f"filler{n}", common) for n in range(8)],
+    )
+
+    hits = index.search("drone quickscout", tags=("missions",))
+    assert [chunk.id for chunk, _score, _snippet in hits] == ["rare", "common"]
+    assert [chunk.id for chunk, _score, _snippet in index.search("quickscout", audience="developer")] == ["dev"]
+    assert index.chunk_by_id("rare").resource_id == "test.rare"
+    with pytest.raises(KeyError):
+        index.chunk_by_id("missing")
+
+
+def test_term_lookup_matches_a_full_vocabulary_scan():
+    search_index = load_default_docs_index().search_index
+    vocabulary = search_index._vocabulary
+
+    for term in ("arm", "disarm", "sitl_mode", "mo", "origin", "gps-fix", "zzqx", "a", "-"):
+        assert search_index.tokens_containing(term) == [token for token in vocabulary if term in token]
+
+
+def test_term_cache_evicts_least_recently_used_terms(monkeypatch):
+    monkeypatch.setattr(docs_index, "MAX_CACHED_TERMS", 2)
+    search_index = _index(_chunk("a", "disarm origin mission")).search_index
+
+    arm = search_index.postings("arm")
+    search_index.postings("origin")
+    assert search_index.postings("arm") is arm
+    search_index.postings("mission")
+
+    assert list(search_index._term_cache) == ["arm", "mission"]
+    assert search_index.postings("arm") is arm
+
+
+def test_default_index_is_memoized_until_the_file_changes(tmp_path, monkeypatch):
+    index_path = tmp_path / "docs-index.json"
+    _write_index(index_path, _chunk("first", "origin alignment notes"))
+    monkeypatch.setenv(docs_index.DOCS_INDEX_ENV, str(index_path))
+
+    first = load_default_docs_index()
+    assert load_default_docs_index() is first
+    assert load_default_retriever().index is first
+
+    _write_index(index_path, _chunk("second", "origin alignment notes, revised"))
+    stat = index_path.stat()
+    os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = load_default_docs_index()
+    assert second is not first
+    assert [chunk.id for chunk in second.chunks] == ["second"]
+
+
+def test_missing_index_file_still_raises_runtime_error(tmp_path, monkeypatch):
+    monkeypatch.setenv(docs_index.DOCS_INDEX_ENV, str(tmp_path / "missing.json"))
+
+    with pytest.raises(docs_index.AgentRuntimeError, match="not found"):
+        load_default_docs_index()
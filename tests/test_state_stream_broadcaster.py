@@ -0,0 +1,186 @@
+"""Single-producer fan-out for the drone API state WebSockets."""
+
+import asyncio
+import json
+import time
+
+from src.state_stream_broadcaster import MIN_RATE_HZ, StateStreamBroadcaster, parse_rate_hz
+
+MAX_RATE_HZ = 10.0
+MIXED_RATES = [0.5, 1.0, 2.0, 5.0, 10.0, 40.0]  # 40 Hz asks above the cap
+STATE = {f"field_{index}": index * 0.123456789 for index in range(500)}
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSocket:
+    def __init__(self, send_delay: float = 0.0):
+        self.send_delay = send_delay
+        self.sent = []
+        self.inbox = asyncio.Queue()
+        self.closed_with = None
+
+    async def send_text(self, text):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.sent.append(text)
+
+    async def receive(self):
+        return await self.inbox.get()
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def _serialize_state():
+    return json.dumps(STATE)
+
+
+def test_rates_are_clamped_to_the_server_cap():
+    assert parse_rate_hz("5", default=1.0, maximum=MAX_RATE_HZ) == 5.0
+    assert parse_rate_hz(40, default=1.0, maximum=MAX_RATE_HZ) == MAX_RATE_HZ
+    assert parse_rate_hz(0, default=1.0, maximum=MAX_RATE_HZ) == MIN_RATE_HZ
+    assert parse_rate_hz("fast", default=1.0, maximum=MAX_RATE_HZ) == 1.0
+    assert parse_rate_hz("nan", default=1.0, maximum=MAX_RATE_HZ) == 1.0
+
+
+def test_mixed_rate_subscribers_share_one_serialization_per_tick():
+    clock = FakeClock()
+    broadcaster = StateStreamBroadcaster(
+        lambda: f"state@{clock():.3f}", default_rate_hz=1.0, max_rate_hz=MAX_RATE_HZ, clock=clock
+    )
+    subscribers = [broadcaster.subscribe(rate) for rate in MIXED_RATES for _ in range(20)]
+    delivered = {id(subscriber): 0 for subscriber in subscribers}
+
+    simulated_sec = 60.0
+    end = clock() + simulated_sec
+    next_tick_at = broadcaster.tick()
+    while next_tick_at < end:
+        for subscriber in subscribers:
+            if subscriber.pending is not None:
+                delivered[id(subscriber)] += 1
+                subscriber.pending = None
+        clock.now = next_tick_at
+        next_tick_at = broadcaster.tick()
+
+    for subscriber in subscribers:
+        assert abs(delivered[id(subscriber)] - subscriber.rate_hz * simulated_sec) <= 1
+    assert max(subscriber.rate_hz for subscriber in subscribers) == MAX_RATE_HZ
+    # Per-client loops would serialize sum(rates) times per second; one producer tracks the fastest rate.
+    assert broadcaster.produced_count <= MAX_RATE_HZ * simulated_sec + 1
+    assert sum(delivered.values()) > 20 * broadcaster.produced_count
+
+
+def test_producer_slows_down_when_only_slow_subscribers_remain():
+    clock = FakeClock()
+    broadcaster = StateStreamBroadcaster(lambda: "state", default_rate_hz=1.0, max_rate_hz=MAX_RATE_HZ, clock=clock)
+    fast = broadcaster.subscribe(10)
+    broadcaster.subscribe(0.5)
+    assert broadcaster.tick() == clock() + 0.1
+
+    broadcaster.unsubscribe(fast)
+    assert broadcaster.tick() == clock() + 2.0
+
+
+def test_lagging_subscriber_keeps_only_the_latest_state():
+    clock = FakeClock()
+    states = iter(range(100))
+    broadcaster = StateStreamBroadcaster(
+        lambda: f"state-{next(states)}", default_rate_hz=5.0, max_rate_hz=MAX_RATE_HZ, clock=clock
+    )
+    subscriber = broadcaster.subscribe()
+    for _ in range(4):
+        broadcaster.tick()
+        clock.now += subscriber.interval
+
+    assert subscriber.pending == "state-3"
+    assert subscriber.coalesced == 3
+
+
+async def test_many_local_clients_at_mixed_rates_get_their_rates_with_bounded_cpu():
+    broadcaster = StateStreamBroadcaster(_serialize_state, default_rate_hz=1.0, max_rate_hz=MAX_RATE_HZ)
+    sockets = [(rate, FakeSocket()) for rate in MIXED_RATES for _ in range(40)]
+    duration = 1.5
+
+    cpu_started = time.process_time()
+    serving = [asyncio.create_task(broadcaster.serve(socket, rate)) for rate, socket in sockets]
+    await asyncio.sleep(duration)
+    for _, socket in sockets:
+        await socket.inbox.put({"type": "websocket.disconnect"})
+    await asyncio.wait_for(asyncio.gather(*serving), 2.0)
+    cpu_used = time.process_time() - cpu_started
+
+    for rate, socket in sockets:
+        expected = min(rate, MAX_RATE_HZ) * duration
+        assert expected * 0.7 - 1 <= len(socket.sent) <= expected * 1.1 + 1
+        assert all(text == socket.sent[0] for text in socket.sent)
+    delivered = sum(len(socket.sent) for _, socket in sockets)
+    assert broadcaster.produced_count <= MAX_RATE_HZ * duration + 2
+    assert broadcaster.subscriber_count == 0
+
+    # What the old per-client loops spent on serialization alone for the same deliveries.
+    legacy_started = time.process_time()
+    for _ in range(delivered):
+        _serialize_state()
+    legacy_cpu = time.process_time() - legacy_started
+    assert cpu_used < legacy_cpu
+
+
+async def test_stalled_client_is_dropped_without_slowing_the_others():
+    broadcaster = StateStreamBroadcaster(
+        lambda: "state", default_rate_hz=MAX_RATE_HZ, max_rate_hz=MAX_RATE_HZ, send_timeout=0.2
+    )
+    stalled, healthy = FakeSocket(send_delay=60.0), FakeSocket()
+    stalled_task = asyncio.create_task(broadcaster.serve(stalled))
+    healthy_task = asyncio.create_task(broadcaster.serve(healthy))
+
+    await asyncio.wait_for(stalled_task, 1.0)
+    await asyncio.sleep(0.5)
+    await healthy.inbox.put({"type": "websocket.disconnect"})
+    await asyncio.wait_for(healthy_task, 1.0)
+
+    assert broadcaster.dropped_count == 1
+    assert stalled.closed_with == 1013 and stalled.sent == []
+    assert len(healthy.sent) >= 6
+
+
+async def test_slow_client_skips_to_the_newest_state_instead_of_queueing():
+    states = iter(range(1000))
+    broadcaster = StateStreamBroadcaster(
+        lambda: str(next(states)), default_rate_hz=MAX_RATE_HZ, max_rate_hz=MAX_RATE_HZ
+    )
+    slow = FakeSocket(send_delay=0.25)
+    serving = asyncio.create_task(broadcaster.serve(slow))
+    await asyncio.sleep(1.2)
+    await slow.inbox.put({"type": "websocket.disconnect"})
+    await asyncio.wait_for(serving, 1.0)
+
+    received = [int(text) for text in slow.sent]
+    assert 3 <= len(received) <= 6
+    assert received == sorted(received)
+    # Each send took ~2.5 ticks, so intermediate states were skipped rather than buffered.
+    assert received[-1] - received[0] >= 2 * (len(received) - 1)
+
+
+async def test_client_can_renegotiate_its_rate_in_band():
+    broadcaster = StateStreamBroadcaster(lambda: "state", default_rate_hz=1.0, max_rate_hz=MAX_RATE_HZ)
+    socket = FakeSocket()
+    serving = asyncio.create_task(broadcaster.serve(socket))
+    await asyncio.sleep(0.05)
+    await socket.inbox.put({"type": "websocket.receive", "text": json.dumps({"rate_hz": 50})})
+    await socket.inbox.put({"type": "websocket.receive", "text": "not json"})
+    await asyncio.sleep(0.6)
+    await socket.inbox.put({"type": "websocket.disconnect"})
+    await asyncio.wait_for(serving, 1.0)
+
+    ack = json.loads(socket.sent[1])
+    assert ack == {"type": "stream_rate", "rate_hz": MAX_RATE_HZ, "max_rate_hz": MAX_RATE_HZ}
+    states = [text for text in socket.sent if text == "state"]
+    # One message at 1 Hz, then ~10 Hz for the remaining ~0.6 s.
+    assert len(states) >= 5
@@ -1,8 +1,11 @@
 import navpy
+import numpy as np
 import pytest
 
+from functions import swarm_global_calculator
 from functions.swarm_global_calculator import (
     calculate_follower_global_position,
+    calculate_follower_global_positions,
     calculate_follower_yaw,
 )
 
@@ -61,3 +64,34 @@ def test_body_offsets_follow_leader_heading_with_up_positive_altitude():
 
 def test_follower_yaw_defaults_to_leader_yaw():
     assert calculate_follower_yaw(137.5, {'frame': 'body'}) == pytest.approx(137.5)
+
+
+@pytest.mark.parametrize('frame', ['ned', 'body'])
+def test_array_positions_match_pointwise_calculation(frame):
+    rng = np.random.default_rng(7)
+    count = 500
+    lats = 35.7 + rng.uniform(-0.05, 0.05, count)
+    lons = 51.4 + rng.uniform(-0.05, 0.05, count)
+    alts = 1200.0 + rng.uniform(0.0, 80.0, count)
+    yaws = rng.uniform(-180.0, 360.0, count)
+    offset_config = {'offset_x': 12.5, 'offset_y': -4.0, 'offset_z': 3.0, 'frame': frame}
+
+    follower_lats, follower_lons, follower_alts = calculate_follower_global_positions(
+        lats, lons, alts, yaws, offset_config
+    )
+
+    expected = np.array([
+        calculate_follower_global_position(lat, lon, alt, yaw, offset_config)
+        for lat, lon, alt, yaw in zip(lats, lons, alts, yaws)
+    ])
+    np.testing.assert_allclose(follower_lats, expected[:, 0], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(follower_lons, expected[:, 1], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(follower_alts, expected[:, 2], rtol=0, atol=1e-7)
+
+
+def test_array_positions_fail_loudly_when_latitude_does_not_converge(monkeypatch):
+    monkeypatch.setattr(swarm_global_calculator, 'MAX_LATITUDE_ITERATIONS', 1)
+    offset_config = {'offset_x': 12.5, 'offset_y': -4.0, 'offset_z': 3.0, 'frame': 'ned'}
+
+    with pytest.raises(RuntimeError, match='did not converge within 1 iterations for 2 waypoint'):
+        calculate_follower_global_positions([35.7, 35.8], [51.4, 51.5], [1200.0, 1210.0], [0.0, 90.0], offset_config)
@@ -1,3 +1,11 @@
+import json
+import os
+import threading
+from pathlib import Path
+from unittest import mock
+
+from src import swarm_runtime_state
+from src.params import Params
 from src.swarm_runtime_state import (
     build_runtime_swarm_assignment,
     read_runtime_swarm_assignment,
@@ -69,3 +77,110 @@ def test_build_runtime_swarm_assignment_force_follow_overrides_source():
 
     assert assignment["follow"] == 0
     assert assignment["offset_x"] == 25.0
+
+
+def _assignment(follow):
+    return {"hw_id": 3, "follow": follow, "offset_x": 8.0, "offset_y": 6.0, "offset_z": 0.0, "frame": "body"}
+
+
+def _expire_recheck_window(monkeypatch):
+    monkeypatch.setattr(swarm_runtime_state, "_cache_checked_at", float("-inf"))
+
+
+def test_runtime_swarm_assignment_served_from_memory_in_steady_state(monkeypatch, tmp_path):
+    path = tmp_path / "smart_swarm_assignment.json"
+    monkeypatch.setenv("MDS_SWARM_RUNTIME_ASSIGNMENT_PATH", str(path))
+    monkeypatch.setattr(Params, "SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC", 60.0)
+    write_runtime_swarm_assignment(_assignment(2))
+
+    stat_calls = []
+    real_stat = swarm_runtime_state.os.stat
+    monkeypatch.setattr(swarm_runtime_state.os, "stat", lambda p: stat_calls.append(p) or real_stat(p))
+    read_text = mock.Mock(side_effect=AssertionError("runtime assignment re-read from disk"))
+    monkeypatch.setattr(Path, "read_text", read_text)
+
+    for _ in range(100):
+        assert read_runtime_swarm_assignment() == _assignment(2)
+    assert stat_calls == []
+
+    # Unchanged fingerprint after the recheck window: one stat, no re-parse.
+    _expire_recheck_window(monkeypatch)
+    assert read_runtime_swarm_assignment() == _assignment(2)
+    assert len(stat_calls) == 1
+    read_text.assert_not_called()
+
+
+def test_runtime_swarm_assignment_returns_copies(monkeypatch, tmp_path):
+    monkeypatch.setenv("MDS_SWARM_RUNTIME_ASSIGNMENT_PATH", str(tmp_path / "assignment.json"))
+    write_runtime_swarm_assignment(_assignment(2))
+
+    read_runtime_swarm_assignment()["follow"] = 99
+
+    assert read_runtime_swarm_assignment()["follow"] == 2
+
+
+def test_runtime_swarm_assignment_picks_up_external_edit(monkeypatch, tmp_path):
+    path = tmp_path / "smart_swarm_assignment.json"
+    monkeypatch.setenv("MDS_SWARM_RUNTIME_ASSIGNMENT_PATH", str(path))
+    monkeypatch.setattr(Params, "SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC", 60.0)
+    write_runtime_swarm_assignment(_assignment(2))
+
+    # In-place rewrite by another process (same inode, new mtime).
+    with open(path, "w") as handle:
+        json.dump({"assignment": _assignment(5)}, handle)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert read_runtime_swarm_assignment()["follow"] == 2  # still within the recheck window
+    _expire_recheck_window(monkeypatch)
+    assert read_runtime_swarm_assignment()["follow"] == 5
+
+    path.unlink()
+    _expire_recheck_window(monkeypatch)
+    assert read_runtime_swarm_assignment() is None
+
+
+def test_runtime_swarm_assignment_picks_up_atomic_replacement(monkeypatch, tmp_path):
+    path = tmp_path / "smart_swarm_assignment.json"
+    monkeypatch.setenv("MDS_SWARM_RUNTIME_ASSIGNMENT_PATH", str(path))
+    write_runtime_swarm_assignment(_assignment(2))
+    original_stat = os.stat(path)
+
+    # Another process replaces the file with same-size content and mtime.
+    replacement = tmp_path / "replacement.json"
+    replacement.write_text(json.dumps({"assignment": _assignment(7)}))
+    os.utime(replacement, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+    replacement.replace(path)
+    assert os.stat(path).st_ino != original_stat.st_ino
+
+    _expire_recheck_window(monkeypatch)
+    assert read_runtime_swarm_assignment()["follow"] == 7
+
+
+def test_runtime_swarm_assignment_concurrent_readers_see_whole_assignments(monkeypatch, tmp_path):
+    monkeypatch.setenv("MDS_SWARM_RUNTIME_ASSIGNMENT_PATH", str(tmp_path / "assignment.json"))
+    monkeypatch.setattr(Params, "SMART_SWARM_RUNTIME_ASSIGNMENT_RECHECK_SEC", 0.0)
+    write_runtime_swarm_assignment(_assignment(0))
+    stop = threading.Event()
+    seen, errors = [], []
+
+    def reader():
+        while not stop.is_set():
+            assignment = read_runtime_swarm_assignment()
+            if assignment is None or set(assignment) != set(_assignment(0)):
+                errors.append(assignment)
+            else:
+                seen.append(assignment["follow"])
+
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for follow in range(1, 40):
+        write_runtime_swarm_assignment(_assignment(follow))
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert errors == []
+    assert seen
+    assert read_runtime_swarm_assignment()["follow"] == 39
@@ -1,8 +1,10 @@
 import navpy
+import numpy as np
 import pandas as pd
 import pytest
 
 from functions import swarm_trajectory_processor
+from functions.swarm_global_calculator import calculate_follower_global_position
 
 
 def _leader_relative_ned(follower_trajectory, leader_trajectory):
@@ -100,6 +102,38 @@ def test_execute_processing_compounds_nested_follow_offsets(monkeypatch, tmp_pat
     assert down_3 == pytest.approx(0.0, abs=0.05)
 
 
+def test_calculate_follower_trajectory_matches_pointwise_offsets():
+    leader = pd.DataFrame({
+        't': np.arange(6, dtype=float),
+        'lat': np.linspace(35.70, 35.71, 6),
+        'lon': np.linspace(51.40, 51.42, 6),
+        'alt': np.linspace(1200.0, 1230.0, 6),
+        'vx': 1.0, 'vy': 2.0, 'vz': 0.0,
+        'ax': 0.0, 'ay': 0.0, 'az': 0.0,
+        'yaw': np.linspace(0.0, 150.0, 6),
+        'mode': 70,
+        'ledr': 255, 'ledg': 0, 'ledb': 0,
+    }, index=range(10, 16))
+    offset_config = {'offset_x': 8.0, 'offset_y': 3.0, 'offset_z': 2.0, 'frame': 'body'}
+
+    follower = swarm_trajectory_processor.calculate_follower_trajectory(leader, offset_config)
+
+    assert list(follower.columns) == list(leader.columns)
+    assert list(follower.index) == list(leader.index)
+    for index, leader_row in leader.iterrows():
+        expected = calculate_follower_global_position(
+            leader_row['lat'], leader_row['lon'], leader_row['alt'], leader_row['yaw'], offset_config
+        )
+        assert follower.at[index, 'lat'] == pytest.approx(expected[0], abs=1e-12)
+        assert follower.at[index, 'lon'] == pytest.approx(expected[1], abs=1e-12)
+        assert follower.at[index, 'alt'] == pytest.approx(expected[2], abs=1e-7)
+    pd.testing.assert_series_equal(follower['yaw'], leader['yaw'])
+    pd.testing.assert_frame_equal(follower[['t', 'vx', 'mode']], leader[['t', 'vx', 'mode']])
+    led_color = swarm_trajectory_processor.Params.swarm_follower_led_color
+    assert follower[['ledr', 'ledg', 'ledb']].drop_duplicates().values.tolist() == [list(led_color)]
+    assert leader['ledr'].eq(255).all()
+
+
 def test_analyze_swarm_structure_rejects_circular_follow_chains():
     swarm_data = [
         {'hw_id': 1, 'follow': 2, 'offset_x': 0, 'offset_y': 0, 'offset_z': 0},
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Benchmark ``create_active_csv``: per-row generation vs vectorized bulk writes.
+
+Generates one custom trajectory CSV per drone (``--drones`` of them, each with
+its own start offset) at each ``--step-times`` value, twice:
+
+* ``legacy`` mirrors the previous implementation: one scalar shape-function
+  call and one ``csv.writer.writerow`` per row.
+* ``vectorized`` is ``create_active_csv`` as shipped: every phase evaluated
+  over a numpy step array and written in bulk.
+
+Reports wall time for each, the speedup, the largest numeric difference
+between the two files, and whether ``float_format=None`` output is
+byte-identical to the legacy file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import csv
+import filecmp
+import io
+import json
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from functions.create_active_csv import CSV_HEADER, create_active_csv  # noqa: E402
+from functions.trajectories import map_shape_to_code  # noqa: E402
+
+
+def legacy_create_active_csv(shape_name, num_repeats, diameter, direction, maneuver_time, start_x, start_y,
+                             initial_altitude, climb_rate, move_speed, hold_time, step_time, output_file):
+    """The previous row-at-a-time implementation, kept as the reference."""
+    _, shape_fcn, shape_args = map_shape_to_code(shape_name)
+
+    with open(output_file, mode="w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_HEADER)
+
+        def hold(last_time, last_step, coords, mode, rgb=(0, 0, 0)):
+            hold_steps = int(hold_time / step_time)
+            for i in range(hold_steps):
+                writer.writerow([last_step + i, last_time + i * step_time, *coords, 0, 0, 0, 0, 0, 0, 0, mode, *rgb])
+            return last_time + hold_time, last_step + hold_steps, coords
+
+        def move(target, last_time, last_step, coords, mode, rgb=(0, 0, 0)):
+            distance = math.sqrt(sum((target[k] - coords[k]) ** 2 for k in range(3)))
+            move_time = distance / move_speed
+            move_steps = int(move_time / step_time)
+            for i in range(move_steps):
+                ratio = i / move_steps
+                position = [coords[k] + (target[k] - coords[k]) * ratio for k in range(3)]
+                velocity = [move_speed * (target[k] - coords[k]) / distance for k in range(3)]
+                writer.writerow([last_step + i, last_time + i * step_time, *position, *velocity, 0, 0, 0, 0, mode, *rgb])
+            return last_time + move_time, last_step + move_steps, target
+
+        climb_steps = int(initial_altitude / climb_rate / step_time)
+        for i in range(climb_steps):
+            t = i * step_time
+            z = -1 * (climb_rate * t)
+            writer.writerow([i, t, 0, 0, z, 0.0, 0.0, -climb_rate, 0, 0, 0, 0, 10, 0, 0, 0])
+        state = hold(t, i, (0, 0, z), mode=20)
+
+        start_coordinates = (start_x, start_y, -1 * initial_altitude)
+        state = move(start_coordinates, *state, mode=30)
+        state = hold(*state, mode=40)
+
+        maneuver_start = shape_fcn(0, maneuver_time, diameter, direction, initial_altitude, step_time, *shape_args)[:2]
+        for repeat in range(num_repeats):
+            last_time, last_step, coords = state
+            if maneuver_start[0] != 0 or maneuver_start[1] != 0:
+                target = (coords[0] + maneuver_start[0], coords[1] + maneuver_start[1], coords[2])
+                state = move(target, *state, mode=50)
+                state = hold(*state, mode=60)
+            start_time, last_step, (origin_x, origin_y, _) = state
+            move_steps = int(maneuver_time / step_time)
+            for step in range(move_steps):
+                x, y, z, vx, vy, vz, ax, ay, az = shape_fcn(step, maneuver_time, diameter, direction, initial_altitude, step_time, *shape_args)
+                x += origin_x
+                y += origin_y
+                x -= maneuver_start[0]
+                y -= maneuver_start[1]
+                writer.writerow([last_step + step, start_time + step * step_time, x, y, z, vx, vy, vz, ax, ay, az, 0, 70, 0, 0, 0])
+            state = (start_time + move_steps * step_time, last_step + move_steps, (x, y, z))
+            state = hold(*state, mode=60)
+            if repeat < num_repeats - 1:
+                state = move(start_coordinates, *state, mode=50)
+
+        state = hold(*state, mode=80)
+        move((0, 0, -initial_altitude), *state, mode=90)
+
+
+def _generate(create, out_dir: Path, prefix: str, drones: int, step_time: float, args, **kwargs) -> tuple[float, list[Path]]:
+    paths = []
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for drone in range(drones):
+            path = out_dir / f"{prefix}_{drone}.csv"
+            create(args.shape, args.repeats, args.diameter, 1, args.maneuver_time, 2.0 * drone, -1.5 * drone,
+                   10, 2, 2.5, 2, step_time, output_file=str(path), **kwargs)
+            paths.append(path)
+    return time.perf_counter() - started, paths
+
+
+def run(args) -> list[dict]:
+    report = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out_dir = Path(temp_dir)
+        for step_time in args.step_times:
+            legacy_sec, legacy_paths = _generate(legacy_create_active_csv, out_dir, "legacy", args.drones, step_time, args)
+            vector_sec, vector_paths = _generate(create_active_csv, out_dir, "vector", args.drones, step_time, args)
+            _, exact_paths = _generate(create_active_csv, out_dir, "exact", 1, step_time, args, float_format=None)
+            legacy = pd.read_csv(legacy_paths[0]).to_numpy(float)
+            vector = pd.read_csv(vector_paths[0]).to_numpy(float)
+            report.append({
+                "step_time": step_time,
+                "rate_hz": round(1 / step_time),
+                "drones": args.drones,
+                "rows_per_drone": len(legacy),
+                "legacy_sec": round(legacy_sec, 3),
+                "vectorized_sec": round(vector_sec, 3),
+                "speedup": round(legacy_sec / vector_sec, 1),
+                "max_abs_diff": float(np.abs(legacy - vector).max()) if legacy.shape == vector.shape else None,
+                "repr_mode_byte_identical": filecmp.cmp(legacy_paths[0], exact_paths[0], shallow=False),
+            })
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--shape", default="circle")
+    parser.add_argument("--drones", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=2)
+    parser.add_argument("--diameter", type=float, default=5.0)
+    parser.add_argument("--maneuver-time", type=float, default=120.0)
+    parser.add_argument("--step-times", type=float, nargs="+", default=[0.02, 0.01], help="50 and 100 Hz by default")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    print(json.dumps(report, indent=2))
+    within_tolerance = all(row["max_abs_diff"] is not None and row["max_abs_diff"] < 1e-8 for row in report)
+    return 0 if within_tolerance and all(row["speedup"] > 1 for row in report) else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
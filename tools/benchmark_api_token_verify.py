@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark bearer token verification: file scan + rewrite vs the in-memory index.
+
+Creates a throwaway tokens file with ``--tokens`` records and verifies one of
+them ``--verifications`` times with each implementation:
+
+* ``legacy`` mirrors the previous ``AuthStore.verify_token``: read and parse
+  the file, scan every record (expiry parse + SHA-256 each), then atomically
+  rewrite the file to record last-used metadata.
+* ``indexed`` is the shipped path: one stat per call, a hash lookup, and
+  last-used metadata persisted by a single deferred flush.
+
+Reports verifications per second and how many times each wrote the file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from src.security import auth  # noqa: E402
+from src.security.auth import AuthService, AuthSettings, AuthStore, utc_now_iso, verify_api_token  # noqa: E402
+
+
+def _settings(auth_dir: Path) -> AuthSettings:
+    return AuthSettings(
+        dashboard_auth_enabled=False,
+        api_auth_enabled=True,
+        users_file=auth_dir / "users.json",
+        tokens_file=auth_dir / "api_tokens.json",
+        session_secret_file=auth_dir / "session_secret",
+        csrf_secret_file=auth_dir / "csrf_secret",
+        session_ttl_hours=12,
+        secure_cookies=False,
+        csrf_enabled=True,
+        allowed_cidrs=(),
+        trusted_proxy_cidrs=(),
+    )
+
+
+def legacy_verify_token(store: AuthStore, token_plaintext: str, source_ip: str | None = None):
+    """The previous per-request implementation, kept as the reference."""
+    payload = auth._read_json_file(store.settings.tokens_file, {"version": 1, "tokens": []})
+    now = time.time()
+    for token in payload.get("tokens", []):
+        if not isinstance(token, dict) or token.get("revoked"):
+            continue
+        expires_at = token.get("expires_at")
+        if expires_at:
+            try:
+                expires_epoch = time.mktime(time.strptime(str(expires_at), "%Y-%m-%dT%H:%M:%SZ"))
+                if now >= expires_epoch:
+                    continue
+            except ValueError:
+                continue
+        if verify_api_token(token_plaintext, str(token.get("token_hash", ""))):
+            token["last_used_at"] = utc_now_iso()
+            token["last_used_ip"] = source_ip
+            store.save_tokens(payload)
+            return store.sanitize_token(token)
+    return None
+
+
+def _run(verify, token: str, verifications: int) -> float:
+    started = time.perf_counter()
+    for _ in range(verifications):
+        if verify(token, source_ip="10.0.0.7") is None:
+            raise RuntimeError("verification failed")
+    return time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tokens", type=int, default=200, help="token records in the file")
+    parser.add_argument("--verifications", type=int, default=5000)
+    args = parser.parse_args(argv)
+
+    writes = {"count": 0}
+    atomic_write_json = auth._atomic_write_json
+
+    def counting_write(*write_args, **write_kwargs):
+        writes["count"] += 1
+        return atomic_write_json(*write_args, **write_kwargs)
+
+    auth._atomic_write_json = counting_write
+    with tempfile.TemporaryDirectory() as temp_dir:
+        service = AuthService(_settings(Path(temp_dir)))
+        created = [
+            service.store.create_token(f"drone-{index}", scopes=["drone"], ttl_seconds=86400)
+            for index in range(args.tokens)
+        ]
+        token = created[-1]["token"]
+
+        writes["count"] = 0
+        legacy_sec = _run(lambda *a, **kw: legacy_verify_token(service.store, *a, **kw), token, args.verifications)
+        legacy_writes = writes["count"]
+
+        writes["count"] = 0
+        indexed_sec = _run(service.store.verify_token, token, args.verifications)
+        indexed_request_writes = writes["count"]
+        service.store.flush_token_usage()
+        persisted = json.loads(service.settings.tokens_file.read_text())["tokens"][-1]
+
+    report = {
+        "tokens": args.tokens,
+        "verifications": args.verifications,
+        "legacy_verifications_per_sec": round(args.verifications / legacy_sec),
+        "indexed_verifications_per_sec": round(args.verifications / indexed_sec),
+        "speedup": round(legacy_sec / indexed_sec, 1),
+        "legacy_file_writes": legacy_writes,
+        "indexed_file_writes_during_requests": indexed_request_writes,
+        "indexed_file_writes_after_flush": writes["count"],
+        "last_used_persisted": persisted.get("last_used_ip") == "10.0.0.7",
+    }
+    print(json.dumps(report, indent=2))
+    return 0 if indexed_request_writes == 0 and report["last_used_persisted"] else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Measure CPU per drone-state read: per-request serialization vs the shared snapshot.
+
+Serves the same representative drone state through two in-process ASGI apps
+and fires batches of concurrent ``httpx`` requests at each:
+
+* ``legacy`` mirrors the previous route: normalize + ``model_validate`` +
+  ``model_dump`` per request, then FastAPI's ``response_model`` validation and
+  JSON encoding on top.
+* ``shared`` uses ``_DroneStatePayloadCache`` exactly like the drone API: one
+  single-pass serialization per state version, the same bytes for every reader.
+
+Process CPU time per request is reported for both, alongside the bare cost of
+copying the payload bytes as the lower bound.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, HTTPException, Request  # noqa: E402
+from fastapi.responses import Response  # noqa: E402
+
+from src.drone_api_routes import DRONE_STATE_ROUTE  # noqa: E402
+from src.drone_api_server import (  # noqa: E402
+    DroneAPIServer,
+    DroneStateResponse,
+    _DroneStatePayloadCache,
+    _etag_matches,
+)
+from tools.benchmark_local_state_bus import sample_drone_state  # noqa: E402
+
+
+def build_legacy_app(state: dict) -> FastAPI:
+    app = FastAPI()
+
+    @app.get(DRONE_STATE_ROUTE, response_model=DroneStateResponse)
+    async def get_drone_state():
+        return DroneAPIServer._serialize_drone_state_payload(state)
+
+    return app
+
+
+def build_shared_app(state: dict, min_refresh_sec: float) -> tuple[FastAPI, _DroneStatePayloadCache]:
+    app = FastAPI()
+    cache = _DroneStatePayloadCache(
+        lambda: state,
+        DroneAPIServer._serialize_drone_state_json,
+        min_refresh_sec=min_refresh_sec,
+        max_reuse_sec=1.0,
+    )
+
+    @app.get(DRONE_STATE_ROUTE, response_model=DroneStateResponse)
+    async def get_drone_state(request: Request):
+        snapshot = cache.get()
+        if snapshot is None:
+            raise HTTPException(status_code=404, detail="Drone State not found")
+        headers = {"ETag": snapshot.etag}
+        if _etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+    return app, cache
+
+
+async def _cpu_us_per_request(app: FastAPI, requests: int, concurrency: int) -> tuple[float, bytes]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://drone") as client:
+        body = (await client.get(DRONE_STATE_ROUTE)).content
+        started = time.process_time()
+        for _ in range(requests // concurrency):
+            responses = await asyncio.gather(*(client.get(DRONE_STATE_ROUTE) for _ in range(concurrency)))
+            assert all(response.status_code == 200 for response in responses)
+        elapsed = time.process_time() - started
+    return elapsed / (requests // concurrency * concurrency) * 1e6, body
+
+
+def _serialization_cpu_us(func, iterations: int) -> float:
+    started = time.process_time()
+    for _ in range(iterations):
+        func()
+    return (time.process_time() - started) / iterations * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--min-refresh-sec", type=float, default=0.05)
+    args = parser.parse_args(argv)
+
+    state = sample_drone_state()
+    legacy_us, legacy_body = asyncio.run(_cpu_us_per_request(build_legacy_app(state), args.requests, args.concurrency))
+    shared_app, cache = build_shared_app(state, args.min_refresh_sec)
+    shared_us, shared_body = asyncio.run(_cpu_us_per_request(shared_app, args.requests, args.concurrency))
+
+    legacy_payload, shared_payload = json.loads(legacy_body), json.loads(shared_body)
+    for volatile_key in ("server_time", "timestamp"):
+        legacy_payload.pop(volatile_key, None)
+        shared_payload.pop(volatile_key, None)
+
+    snapshot = cache.get()
+    print(json.dumps({
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "legacy_cpu_us_per_request": round(legacy_us, 1),
+        "shared_cpu_us_per_request": round(shared_us, 1),
+        "legacy_handler_serialize_us": round(_serialization_cpu_us(
+            lambda: DroneStateResponse.model_validate(
+                DroneAPIServer._serialize_drone_state_payload(state)
+            ).model_dump_json(),
+            2000,
+        ), 2),
+        "shared_handler_cache_hit_us": round(_serialization_cpu_us(cache.get, 200000), 3),
+        "payload_copy_us": round(_serialization_cpu_us(lambda: bytes(bytearray(snapshot.body)), 200000), 3),
+        "shared_serializations": cache.serialization_count,
+        "payloads_match": legacy_payload == shared_payload,
+    }, indent=2))
+    return 0 if legacy_payload == shared_payload else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
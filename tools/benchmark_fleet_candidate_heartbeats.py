@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Load-test fleet candidate heartbeats: write-through vs write-behind state.
+
+Drives ``FleetCandidateRegistry.observe_heartbeat`` with paced heartbeats from
+``--candidates`` unconfigured nodes (several sender threads, a 100-drone fleet
+config) against a throwaway state file, once with ``state_flush_interval_sec=0``
+(the previous behaviour: rewrite the state file on every heartbeat) and once
+with the default write-behind interval.
+
+Reports registry lock hold times, heartbeat call latency and state-file writes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "gcs-server"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+from fleet_candidates import DEFAULT_STATE_FLUSH_INTERVAL_SEC, FleetCandidateRegistry  # noqa: E402
+
+FLEET_CONFIG = [{"hw_id": hw_id, "pos_id": hw_id, "ip": f"10.0.1.{hw_id}"} for hw_id in range(1, 101)]
+
+
+class _TimedRLock:
+    """RLock proxy recording how long the outermost acquisition is held."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self.hold_ns: list[int] = []
+
+    def __enter__(self):
+        self._lock.acquire()
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._local.acquired_at = time.perf_counter_ns()
+        self._local.depth = depth + 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            self.hold_ns.append(time.perf_counter_ns() - self._local.acquired_at)
+        self._lock.release()
+        return False
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_load(flush_interval_sec: float, *, candidates: int, rate_hz: float, seconds: float, threads: int) -> dict:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        registry = FleetCandidateRegistry(
+            state_path=str(Path(temp_dir) / "fleet_candidates.json"),
+            events_path=str(Path(temp_dir) / "fleet_candidate_events.jsonl"),
+            state_flush_interval_sec=flush_interval_sec,
+        )
+        timed_lock = _TimedRLock()
+        registry._lock = timed_lock
+        latencies_ns: list[int] = []
+        latencies_lock = threading.Lock()
+        started = time.monotonic()
+        interval = threads / rate_hz
+
+        def sender(worker: int) -> None:
+            local_latencies = []
+            sent = 0
+            while True:
+                due = started + sent * interval
+                if due - started >= seconds:
+                    break
+                delay = due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                hw_id = 1000 + (sent * threads + worker) % candidates
+                call_started = time.perf_counter_ns()
+                registry.observe_heartbeat(
+                    {
+                        "hw_id": str(hw_id),
+                        "ip": f"10.0.2.{hw_id % 250}",
+                        "timestamp": int(time.time() * 1000),
+                        "runtime_mode": "real",
+                    },
+                    load_config=lambda: [dict(row) for row in FLEET_CONFIG],
+                )
+                local_latencies.append(time.perf_counter_ns() - call_started)
+                sent += 1
+            with latencies_lock:
+                latencies_ns.extend(local_latencies)
+
+        workers = [threading.Thread(target=sender, args=(index,)) for index in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        writes_during_load = registry.state_write_count
+        registry.flush_state()
+
+        hold_us = [value / 1000 for value in timed_lock.hold_ns]
+        latency_us = [value / 1000 for value in latencies_ns]
+        return {
+            "state_flush_interval_sec": flush_interval_sec,
+            "heartbeats": len(latencies_ns),
+            "state_writes_during_load": writes_during_load,
+            "state_writes_per_sec": round(writes_during_load / seconds, 1),
+            "lock_hold_p50_us": round(statistics.median(hold_us), 1),
+            "lock_hold_p99_us": round(_percentile(hold_us, 0.99), 1),
+            "lock_hold_max_us": round(max(hold_us), 1),
+            "heartbeat_p99_us": round(_percentile(latency_us, 0.99), 1),
+        }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--rate-hz", type=float, default=400.0, help="total heartbeats per second")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    load = dict(candidates=args.candidates, rate_hz=args.rate_hz, seconds=args.seconds, threads=args.threads)
+    write_through = run_load(0.0, **load)
+    write_behind = run_load(DEFAULT_STATE_FLUSH_INTERVAL_SEC, **load)
+    print(json.dumps({"write_through": write_through, "write_behind": write_behind}, indent=2))
+    # First sightings are durable transitions; everything after them is liveness.
+    bounded = write_behind["state_writes_during_load"] <= args.candidates + args.seconds / DEFAULT_STATE_FLUSH_INTERVAL_SEC + 1
+    return 0 if bounded else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Compare local drone-state read latency: shared-memory bus vs loopback HTTP.
+
+Serves a representative drone-state payload and home position through a
+FastAPI/uvicorn app on loopback (validated with the drone API's own
+``DroneStateResponse`` serializer), publishes the same state to a
+``LocalStateBusWriter`` segment, then times what mission processes do for a
+relative-altitude read: two ``requests.get`` round trips plus JSON decoding,
+versus one ``read_local_state_snapshot``-style bus read.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+import requests  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from src.drone_api_routes import DRONE_NAVIGATION_HOME_ROUTE, DRONE_STATE_ROUTE  # noqa: E402
+from src.drone_api_server import DroneAPIServer  # noqa: E402
+from src.local_state_bus import LocalStateBusReader, LocalStateBusWriter  # noqa: E402
+
+HOME = {"latitude": 35.7244359, "longitude": 51.2756087, "altitude": 1286.0}
+
+
+def sample_drone_state() -> dict:
+    return {
+        "hw_id": 3, "pos_id": 3, "detected_pos_id": 3, "state": 2, "mission": 2, "last_mission": 0,
+        "trigger_time": 0, "position_lat": 35.7244359, "position_long": 51.2756087, "position_alt": 1294.4,
+        "velocity_north": 1.5, "velocity_east": -0.25, "velocity_down": 0.1, "yaw": 100.0,
+        "battery_voltage": 15.3, "battery_remaining_percent": 78.0, "update_time": int(time.time()),
+        "flight_mode": 50593792, "base_mode": 29, "system_status": 4, "is_armed": True,
+        "is_ready_to_arm": True, "home_position_set": True, "global_position_valid": True,
+        "relative_altitude_m": 8.4, "altitude_report": {"source": "relative_home", "display_m": 8.4},
+        "readiness_status": "ready", "readiness_summary": "Ready to fly", "hdop": 0.7, "vdop": 1.1,
+        "gps_fix_type": 3, "satellites_visible": 12, "ip": "127.0.0.1",
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_http_server(state: dict) -> tuple[uvicorn.Server, str]:
+    app = FastAPI()
+
+    @app.get(DRONE_STATE_ROUTE)
+    async def get_drone_state():
+        return DroneAPIServer._serialize_drone_state_payload(state)
+
+    @app.get(DRONE_NAVIGATION_HOME_ROUTE)
+    async def get_home_pos():
+        return {**HOME, "timestamp": int(time.time() * 1000)}
+
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("benchmark HTTP server did not start")
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def _http_relative_altitude(base_url: str) -> float:
+    drone_state = requests.get(f"{base_url}{DRONE_STATE_ROUTE}", timeout=1.0).json()
+    home_position = requests.get(f"{base_url}{DRONE_NAVIGATION_HOME_ROUTE}", timeout=1.0).json()
+    return float(drone_state["position_alt"]) - float(home_position["altitude"])
+
+
+def _bus_relative_altitude(reader: LocalStateBusReader) -> float:
+    snapshot = reader.read(max_age_sec=60.0)
+    return snapshot.drone_state["position_alt"] - snapshot.home_position["altitude"]
+
+
+def _time_us(func, iterations: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--http-iterations", type=int, default=300)
+    parser.add_argument("--bus-iterations", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    state = sample_drone_state()
+    server, base_url = _start_http_server(state)
+    writer = LocalStateBusWriter(f"mds_local_state_bench_{os.getpid()}")
+    reader = LocalStateBusReader(writer.name)
+    try:
+        writer.publish(state, HOME)
+        http_value = _http_relative_altitude(base_url)
+        bus_value = _bus_relative_altitude(reader)
+        http_median, http_p99 = _time_us(lambda: _http_relative_altitude(base_url), args.http_iterations)
+        bus_median, bus_p99 = _time_us(lambda: _bus_relative_altitude(reader), args.bus_iterations)
+    finally:
+        reader.close()
+        writer.close()
+        server.should_exit = True
+
+    print(json.dumps({
+        "http_relative_altitude_median_us": round(http_median, 1),
+        "http_relative_altitude_p99_us": round(http_p99, 1),
+        "bus_relative_altitude_median_us": round(bus_median, 2),
+        "bus_relative_altitude_p99_us": round(bus_p99, 2),
+        "speedup": round(http_median / bus_median, 1),
+        "values_match": abs(http_value - bus_value) < 1e-9,
+    }, indent=2))
+    return 0 if abs(http_value - bus_value) < 1e-9 else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Benchmark local MAVLink ingest: full decode + type filter vs parser-level dispatch.
+
+Feeds a synthetic PX4-like onboard stream (or a recorded ``.tlog``) through a
+pymavlink parser twice:
+
+* ``legacy`` decodes every frame (CRC + payload unpack), then drops types not
+  in the listener's filter and dispatches the rest by name, like the previous
+  ``recv_match(type=...)`` + if/elif chain.
+* ``table`` installs ``MavlinkDispatcher``'s parser filter, so frames outside
+  the dispatch table are dropped after the header and the rest go through the
+  ID-keyed table with per-type statistics.
+
+Handlers are no-ops, so the numbers isolate ingest overhead. The report
+includes the telemetry thread's CPU share for one second of stream.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+from pymavlink import mavutil  # noqa: E402
+
+from src.mavlink_dispatch import MavlinkDispatcher  # noqa: E402
+from tests.helpers.mavlink_stream import build_synthetic_stream  # noqa: E402
+
+LISTENER_TYPES = [
+    "HEARTBEAT", "GLOBAL_POSITION_INT", "HOME_POSITION", "BATTERY_STATUS", "ATTITUDE", "GPS_RAW_INT",
+    "LOCAL_POSITION_NED", "SCALED_PRESSURE", "GPS_GLOBAL_ORIGIN", "SYS_STATUS", "STATUSTEXT",
+]
+
+
+def read_tlog_frames(path: Path) -> bytes:
+    """Concatenate the MAVLink frames of a ``.tlog`` (8-byte timestamp + frame records)."""
+    data = path.read_bytes()
+    frames, offset = [], 0
+    while offset + 8 < len(data):
+        offset += 8
+        marker, payload_length = data[offset], data[offset + 1]
+        if marker == mavutil.mavlink.PROTOCOL_MARKER_V2:
+            signed = data[offset + 2] & mavutil.mavlink.MAVLINK_IFLAG_SIGNED
+            length = 10 + payload_length + 2 + (13 if signed else 0)
+        else:
+            length = 6 + payload_length + 2
+        frames.append(data[offset:offset + length])
+        offset += length
+    return b"".join(frames)
+
+
+def _run_legacy(stream: bytes) -> tuple[float, int]:
+    parser = mavutil.mavlink.MAVLink(None)
+    handlers = {name: (lambda msg: None) for name in LISTENER_TYPES}
+    started = time.process_time()
+    handled = 0
+    for msg in parser.parse_buffer(stream) or []:
+        msg_type = msg.get_type()
+        if msg_type not in LISTENER_TYPES:
+            continue
+        handlers[msg_type](msg)
+        handled += 1
+    return time.process_time() - started, handled
+
+
+def _run_table(stream: bytes) -> tuple[float, int, MavlinkDispatcher]:
+    parser = mavutil.mavlink.MAVLink(None)
+    dispatcher = MavlinkDispatcher({name: (lambda msg: None) for name in LISTENER_TYPES})
+    dispatcher.install_parser_filter(type("Connection", (), {"mav": parser})())
+    wanted = set(dispatcher.message_types)
+    started = time.process_time()
+    handled = 0
+    for msg in parser.parse_buffer(stream) or []:
+        if msg.get_type() in wanted and dispatcher.dispatch(msg):
+            handled += 1
+    return time.process_time() - started, handled, dispatcher
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=20.0, help="synthetic stream length")
+    parser.add_argument("--tlog", type=Path, help="replay a recorded .tlog instead of the synthetic stream")
+    args = parser.parse_args(argv)
+
+    stream = read_tlog_frames(args.tlog) if args.tlog else build_synthetic_stream(args.seconds)
+    legacy_cpu, legacy_handled = _run_legacy(stream)
+    table_cpu, table_handled, dispatcher = _run_table(stream)
+    stats = dispatcher.snapshot()
+    frames = stats["dispatched_count"] + stats["filtered_count"]
+
+    report = {
+        "frames": frames,
+        "handled": table_handled,
+        "filtered_at_parser": stats["filtered_count"],
+        "legacy_frames_per_sec": round(frames / legacy_cpu),
+        "table_frames_per_sec": round(frames / table_cpu),
+        "speedup": round(legacy_cpu / table_cpu, 2),
+        "handled_match": legacy_handled == table_handled,
+    }
+    if not args.tlog:
+        report["legacy_thread_cpu_share"] = round(legacy_cpu / args.seconds, 4)
+        report["table_thread_cpu_share"] = round(table_cpu / args.seconds, 4)
+    print(json.dumps(report, indent=2))
+    return 0 if legacy_handled == table_handled else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
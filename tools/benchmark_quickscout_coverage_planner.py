@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Benchmark QuickScout boustrophedon planning on large search polygons.
+
+Plans a many-vertex search area for a drone fleet with the vectorized
+``BoustrophedonPlanner`` and with ``PointwiseReferencePlanner``, which keeps the
+previous one-point-at-a-time pymap3d conversions and per-line shapely clipping.
+The report lists both median timings, the speedup, and the largest waypoint
+disagreement in metres (it must stay below a millimetre).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "gcs-server", REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+import numpy as np  # noqa: E402
+import pymap3d  # noqa: E402
+from shapely.geometry import LineString, MultiLineString, Polygon as ShapelyPolygon  # noqa: E402
+
+from sar.coverage_planner import BoustrophedonPlanner  # noqa: E402
+from sar.schemas import CoverageWaypoint, DroneCoveragePlan, SearchAreaPoint, SurveyConfig  # noqa: E402
+
+MAX_WAYPOINT_ERROR_M = 1e-3
+
+
+class PointwiseReferencePlanner(BoustrophedonPlanner):
+    """Previous planner pipeline: scalar ENU conversions and per-line clipping."""
+
+    def plan(self, polygon_points, drone_positions, config):
+        origin_lat = np.mean([p.lat for p in polygon_points])
+        origin_lng = np.mean([p.lng for p in polygon_points])
+        enu_points = []
+        for p in polygon_points:
+            e, n, _ = pymap3d.geodetic2enu(p.lat, p.lng, 0, origin_lat, origin_lng, 0.0)
+            enu_points.append((e, n))
+
+        polygon = ShapelyPolygon(enu_points)
+        if not polygon.is_valid:
+            polygon = polygon.buffer(0)
+        total_area_sq_m = polygon.area
+
+        spacing = config.sweep_width_m * (1.0 - config.overlap_percent / 100.0)
+        sweep_lines = self._pointwise_sweep_lines(polygon, self._pointwise_sweep_angle(enu_points), spacing)
+        if not sweep_lines:
+            raise ValueError("No sweep lines generated - polygon may be too small for sweep width")
+        boustrophedon_lines = [
+            LineString(list(line.coords)[::-1] if index % 2 else list(line.coords))
+            for index, line in enumerate(sweep_lines)
+        ]
+        partitions = self._partition_lines(boustrophedon_lines, len(drone_positions))
+
+        drone_enu = {}
+        for pos_id, (lat, lng) in drone_positions.items():
+            e, n, _ = pymap3d.geodetic2enu(lat, lng, 0, origin_lat, origin_lng, 0.0)
+            drone_enu[pos_id] = (e, n)
+        assignments = self._assign_sectors(partitions, drone_enu)
+
+        plans = []
+        for pos_id in drone_positions:
+            sector_lines = assignments.get(pos_id)
+            if not sector_lines:
+                continue
+            waypoints = []
+            for line in sector_lines:
+                for x, y in line.coords:
+                    lat, lng, _ = pymap3d.enu2geodetic(x, y, 0, origin_lat, origin_lng, 0.0)
+                    if not waypoints:
+                        waypoints.append(CoverageWaypoint(
+                            lat=lat, lng=lng, alt_msl=config.cruise_altitude_msl,
+                            is_survey_leg=False, speed_ms=config.cruise_speed_ms, sequence=0,
+                        ))
+                    waypoints.append(CoverageWaypoint(
+                        lat=lat, lng=lng, alt_msl=config.cruise_altitude_msl,
+                        is_survey_leg=True, speed_ms=config.survey_speed_ms, sequence=len(waypoints),
+                    ))
+            total_distance = sum(
+                self._haversine_m(a.lat, a.lng, b.lat, b.lng) for a, b in zip(waypoints, waypoints[1:])
+            )
+            plans.append(DroneCoveragePlan(
+                hw_id=str(pos_id),
+                pos_id=int(pos_id),
+                waypoints=waypoints,
+                assigned_area_sq_m=total_area_sq_m * (len(sector_lines) / max(len(boustrophedon_lines), 1)),
+                estimated_duration_s=total_distance / config.survey_speed_ms if config.survey_speed_ms > 0 else 0,
+                total_distance_m=total_distance,
+            ))
+        return plans, total_area_sq_m
+
+    @staticmethod
+    def _pointwise_sweep_angle(enu_points):
+        max_length, best_angle = 0, 0
+        for index, (x1, y1) in enumerate(enu_points):
+            x2, y2 = enu_points[(index + 1) % len(enu_points)]
+            length = math.hypot(x2 - x1, y2 - y1)
+            if length > max_length:
+                max_length, best_angle = length, math.atan2(y2 - y1, x2 - x1)
+        return best_angle
+
+    @staticmethod
+    def _pointwise_sweep_lines(polygon, angle, spacing):
+        cos_a, sin_a = math.cos(-angle), math.sin(-angle)
+        rotated = [(x * cos_a - y * sin_a, x * sin_a + y * cos_a) for x, y in polygon.exterior.coords]
+        min_y, max_y = min(p[1] for p in rotated), max(p[1] for p in rotated)
+        min_x, max_x = min(p[0] for p in rotated) - 10, max(p[0] for p in rotated) + 10
+        cos_b, sin_b = math.cos(angle), math.sin(angle)
+        lines = []
+        y = min_y + spacing / 2
+        while y <= max_y:
+            clipped = polygon.intersection(LineString([
+                (min_x * cos_b - y * sin_b, min_x * sin_b + y * cos_b),
+                (max_x * cos_b - y * sin_b, max_x * sin_b + y * cos_b),
+            ]))
+            if isinstance(clipped, LineString) and not clipped.is_empty:
+                lines.append(clipped)
+            elif isinstance(clipped, MultiLineString):
+                lines.extend(clipped.geoms)
+            y += spacing
+        return lines
+
+
+def build_search_area(vertices: int, radius_deg: float = 0.03) -> list[SearchAreaPoint]:
+    """Star-shaped polygon around (47, 8) whose concave arms split sweep lines."""
+    points = []
+    for index in range(vertices):
+        angle = 2 * math.pi * index / vertices
+        radius = radius_deg * (1 + 0.3 * math.sin(5 * angle))
+        points.append(SearchAreaPoint(lat=47.0 + radius * math.sin(angle), lng=8.0 + 1.4 * radius * math.cos(angle)))
+    return points
+
+
+def build_drone_positions(drone_count: int) -> dict[str, tuple[float, float]]:
+    return {str(pos_id): (46.96 + 0.003 * pos_id, 7.95) for pos_id in range(1, drone_count + 1)}
+
+
+def max_waypoint_error_m(plans, reference_plans) -> float:
+    """Largest horizontal distance between matching waypoints of two plan sets."""
+    if [(p.pos_id, len(p.waypoints)) for p in plans] != [(p.pos_id, len(p.waypoints)) for p in reference_plans]:
+        return math.inf
+    error = 0.0
+    for plan, reference in zip(plans, reference_plans):
+        for waypoint, expected in zip(plan.waypoints, reference.waypoints):
+            error = max(error, BoustrophedonPlanner._haversine_m(waypoint.lat, waypoint.lng, expected.lat, expected.lng))
+    return error
+
+
+def _median_time(planner: BoustrophedonPlanner, args: tuple, rounds: int) -> tuple[float, list]:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        plans, _ = planner.plan(*args)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples), plans
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vertices", type=int, default=400, help="search polygon vertex count")
+    parser.add_argument("--drones", type=int, default=20)
+    parser.add_argument("--sweep-width", type=float, default=8.0, help="sweep width in metres")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    plan_args = (
+        build_search_area(args.vertices),
+        build_drone_positions(args.drones),
+        SurveyConfig(sweep_width_m=args.sweep_width, overlap_percent=10),
+    )
+    vectorized_s, plans = _median_time(BoustrophedonPlanner(), plan_args, args.rounds)
+    pointwise_s, reference_plans = _median_time(PointwiseReferencePlanner(), plan_args, args.rounds)
+    error_m = max_waypoint_error_m(plans, reference_plans)
+
+    print(json.dumps({
+        "vertices": args.vertices,
+        "drones": args.drones,
+        "waypoints": sum(len(plan.waypoints) for plan in plans),
+        "pointwise_median_ms": round(pointwise_s * 1000.0, 2),
+        "vectorized_median_ms": round(vectorized_s * 1000.0, 2),
+        "speedup": round(pointwise_s / vectorized_s, 1),
+        "max_waypoint_error_m": error_m,
+    }, indent=2))
+    return 0 if error_m < MAX_WAYPOINT_ERROR_M else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Measure QuickScout progress-report latency as the fleet grows.
+
+Each fleet size gets a fresh SQLite store with one executing operation whose
+drones all have large coverage plans. Every drone then reports waypoint
+progress in turn, and the median per-report latency is printed next to the
+cost of the whole-record read-modify-write that progress reports used before
+they moved to the narrow per-drone table.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "gcs-server", REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+from sar.schemas import (  # noqa: E402
+    CoverageWaypoint,
+    DroneCoveragePlan,
+    DroneSurveyState,
+    QuickScoutOperationRecord,
+    SearchArea,
+    SearchAreaPoint,
+    SurveyConfig,
+    SurveyState,
+)
+from sar.service import QuickScoutService  # noqa: E402
+from sar.store import QuickScoutStore  # noqa: E402
+
+DEFAULT_FLEET_SIZES = (2, 10, 25, 50)
+
+
+def build_operation(drone_count: int, waypoints_per_drone: int) -> QuickScoutOperationRecord:
+    waypoints = [
+        CoverageWaypoint(
+            lat=47.0 + index * 1e-5,
+            lng=8.0,
+            alt_msl=50.0,
+            is_survey_leg=True,
+            speed_ms=5.0,
+            sequence=index,
+        )
+        for index in range(waypoints_per_drone)
+    ]
+    plans = [
+        DroneCoveragePlan(
+            hw_id=str(hw_id),
+            pos_id=hw_id,
+            waypoints=waypoints,
+            assigned_area_sq_m=100.0,
+            estimated_duration_s=600.0,
+            total_distance_m=5000.0,
+        )
+        for hw_id in range(1, drone_count + 1)
+    ]
+    now = time.time()
+    return QuickScoutOperationRecord(
+        mission_id=f"bench-{drone_count}",
+        state=SurveyState.EXECUTING,
+        search_area=SearchArea(
+            points=[
+                SearchAreaPoint(lat=47.0, lng=8.0),
+                SearchAreaPoint(lat=47.001, lng=8.0),
+                SearchAreaPoint(lat=47.001, lng=8.001),
+            ]
+        ),
+        survey_config=SurveyConfig(),
+        plans=plans,
+        drone_states={
+            plan.hw_id: DroneSurveyState(
+                hw_id=plan.hw_id,
+                pos_id=plan.pos_id,
+                state=SurveyState.EXECUTING,
+                total_waypoints=waypoints_per_drone,
+            )
+            for plan in plans
+        },
+        total_area_sq_m=100.0 * drone_count,
+        estimated_coverage_time_s=600.0,
+        algorithm_used="boustrophedon",
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _median_ms(samples: list[float]) -> float:
+    return round(statistics.median(samples) * 1000.0, 3)
+
+
+def run_benchmark(fleet_sizes: tuple[int, ...], *, waypoints_per_drone: int, rounds: int) -> list[dict[str, object]]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for drone_count in fleet_sizes:
+            store = QuickScoutStore(str(Path(tmpdir) / f"quickscout-{drone_count}.sqlite3"))
+            operation = build_operation(drone_count, waypoints_per_drone)
+            store.save_operation(operation)
+            service = QuickScoutService(store=store)
+
+            narrow_samples = []
+            for waypoint_index in range(1, rounds + 1):
+                for hw_id in operation.drone_states:
+                    started = time.perf_counter()
+                    service.update_drone_progress(
+                        operation.mission_id,
+                        hw_id,
+                        min(waypoint_index, waypoints_per_drone),
+                        waypoints_per_drone,
+                        distance_covered_m=float(waypoint_index),
+                    )
+                    narrow_samples.append(time.perf_counter() - started)
+
+            full_record_samples = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                store.mutate_operation(operation.mission_id, lambda current: current)
+                full_record_samples.append(time.perf_counter() - started)
+
+            results.append(
+                {
+                    "drones": drone_count,
+                    "waypoints_per_drone": waypoints_per_drone,
+                    "progress_report_median_ms": _median_ms(narrow_samples),
+                    "full_record_rewrite_median_ms": _median_ms(full_record_samples),
+                }
+            )
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fleet-size", type=int, action="append", dest="fleet_sizes")
+    parser.add_argument("--waypoints", type=int, default=400, help="waypoints per drone plan")
+    parser.add_argument("--rounds", type=int, default=10, help="progress reports per drone")
+    args = parser.parse_args(argv)
+
+    fleet_sizes = tuple(args.fleet_sizes or DEFAULT_FLEET_SIZES)
+    print(json.dumps(run_benchmark(fleet_sizes, waypoints_per_drone=args.waypoints, rounds=args.rounds), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
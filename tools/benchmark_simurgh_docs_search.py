@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Report cold and warm Simurgh docs search latency against the generated index.
+
+Cold latency covers reading the JSON index, building the inverted index, and
+answering the first query. Warm latency is the per-query cost once the
+memoized index is resident, which is what the assistant pays on every turn.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "gcs-server", REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+from agent_runtime import docs_index  # noqa: E402
+
+DEFAULT_QUERIES = (
+    "how do I arm the drones",
+    "quickscout search mission",
+    "origin position deviation",
+    "led indicator colors",
+    "sitl docker image",
+    "git sync service",
+)
+
+
+def run_benchmark(index_path: Path, queries: tuple[str, ...], *, rounds: int) -> dict[str, object]:
+    docs_index._docs_index_cache.clear()
+    started = time.perf_counter()
+    index = docs_index.load_docs_index(index_path)
+    index.search(queries[0])
+    cold_ms = (time.perf_counter() - started) * 1000.0
+
+    per_query: dict[str, float] = {}
+    for query in queries:
+        samples = []
+        for _ in range(max(1, rounds)):
+            started = time.perf_counter()
+            docs_index.load_docs_index(index_path).search(query)
+            samples.append((time.perf_counter() - started) * 1000.0)
+        per_query[query] = round(statistics.median(samples), 3)
+
+    return {
+        "index_path": docs_index._display_path(index_path),
+        "chunk_count": len(index.chunks),
+        "cold_ms": round(cold_ms, 3),
+        "warm_median_ms": round(statistics.median(per_query.values()), 3),
+        "warm_ms_by_query": per_query,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--index", type=Path, default=docs_index.DEFAULT_DOCS_INDEX_PATH)
+    parser.add_argument("--rounds", type=int, default=25)
+    parser.add_argument("--query", action="append", dest="queries", help="query to time (repeatable)")
+    args = parser.parse_args(argv)
+
+    index_path = args.index if args.index.is_absolute() else REPO_ROOT / args.index
+    queries = tuple(args.queries or DEFAULT_QUERIES)
+    print(json.dumps(run_benchmark(index_path, queries, rounds=args.rounds), indent=2))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
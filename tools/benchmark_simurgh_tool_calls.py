@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Benchmark the fixed per-call overhead of Simurgh read-only tool calls.
+
+Runs ``--calls`` sequential ``mds.system.health.read`` calls against a stub
+FastAPI app whose handler returns immediately, so the numbers isolate the
+executor's own overhead:
+
+* ``legacy`` mirrors the previous per-call path: parse the policy YAML and
+  build a fresh ASGI transport and ``AsyncClient`` for every call.
+* ``pooled`` is ``execute_policy_allowed_read_only_tool`` as shipped: the
+  policy comes from the mtime-keyed cache and calls share one in-process
+  client.
+
+Reports mean per-call latency for each.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "gcs-server"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+
+from agent_runtime import AgentPolicy, PolicyDecisionStatus  # noqa: E402
+from agent_runtime.policy import DEFAULT_POLICY_PATH  # noqa: E402
+from agent_runtime.tool_executor import (  # noqa: E402
+    INTERNAL_TOOL_CLIENT_HOST,
+    InternalToolExecutionContext,
+    execute_policy_allowed_read_only_tool,
+)
+from agent_runtime.tool_registry import load_default_tool_registry  # noqa: E402
+
+TOOL_NAME = "mds.system.health.read"
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/system/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def legacy_call(context: InternalToolExecutionContext) -> None:
+    """The previous per-call path, kept as the reference."""
+    tool = load_default_tool_registry().require(TOOL_NAME)
+    policy = AgentPolicy.from_file(DEFAULT_POLICY_PATH)
+    if policy.evaluate_tool(tool, channel="agent", actor_role="viewer").status is not PolicyDecisionStatus.ALLOW:
+        raise RuntimeError("policy denied the benchmark tool")
+    transport = httpx.ASGITransport(app=context.app, client=(INTERNAL_TOOL_CLIENT_HOST, 0))
+    async with httpx.AsyncClient(transport=transport, base_url=context.base_url, timeout=5.0) as client:
+        response = await client.get(str(tool.route_path))
+    response.raise_for_status()
+
+
+async def pooled_call(context: InternalToolExecutionContext) -> None:
+    result = await execute_policy_allowed_read_only_tool(context, name=TOOL_NAME, arguments={}, channel="agent")
+    if result.is_error:
+        raise RuntimeError(result.text)
+
+
+async def _run(call, context: InternalToolExecutionContext, calls: int) -> float:
+    await call(context)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await call(context)
+    return time.perf_counter() - started
+
+
+async def run(calls: int) -> dict:
+    context = InternalToolExecutionContext(app=build_app(), base_url="http://testserver")
+    legacy_sec = await _run(legacy_call, context, calls)
+    pooled_sec = await _run(pooled_call, context, calls)
+    return {
+        "calls": calls,
+        "legacy_ms_per_call": round(legacy_sec / calls * 1000, 3),
+        "pooled_ms_per_call": round(pooled_sec / calls * 1000, 3),
+        "speedup": round(legacy_sec / pooled_sec, 1),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run(args.calls))
+    print(json.dumps(report, indent=2))
+    return 0 if report["pooled_ms_per_call"] < report["legacy_ms_per_call"] else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
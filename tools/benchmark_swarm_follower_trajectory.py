@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Benchmark follower trajectory generation: per-row navpy calls vs one array pass.
+
+Builds a synthetic leader trajectory shaped like the smoother's output and
+derives a cluster of followers with mixed NED/body offsets twice:
+
+* ``pointwise`` is the previous implementation: ``iterrows`` over the leader,
+  one ``calculate_follower_global_position`` (navpy ``ned2lla``) call per row.
+* ``vectorized`` is ``calculate_follower_trajectory`` as shipped, which
+  converts the whole trajectory per follower in a single array pass.
+
+Reports CPU time for each and the largest lat/lon/alt deviation between them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from functions.swarm_global_calculator import (  # noqa: E402
+    calculate_follower_global_position,
+    calculate_follower_yaw,
+)
+from functions.swarm_trajectory_processor import calculate_follower_trajectory  # noqa: E402
+from src.params import Params  # noqa: E402
+
+
+def build_leader_trajectory(rows: int, step_sec: float = 0.05) -> pd.DataFrame:
+    """Leader trajectory in the smoother's CSV layout: a slow loop around Tehran."""
+    t = np.arange(rows) * step_sec
+    angle = t / max(t[-1], 1.0) * 2 * np.pi
+    return pd.DataFrame({
+        't': t,
+        'lat': 35.7 + 0.004 * np.sin(angle),
+        'lon': 51.4 + 0.005 * np.cos(angle),
+        'alt': 1200.0 + 20.0 * np.sin(2 * angle),
+        'vx': 0.0, 'vy': 0.0, 'vz': 0.0,
+        'ax': 0.0, 'ay': 0.0, 'az': 0.0,
+        'yaw': np.degrees(angle) % 360.0,
+        'mode': 70,
+        'ledr': Params.swarm_leader_led_color[0],
+        'ledg': Params.swarm_leader_led_color[1],
+        'ledb': Params.swarm_leader_led_color[2],
+    })
+
+
+def build_follower_configs(count: int) -> list[dict]:
+    """Ring formation, alternating NED and body-frame offsets."""
+    configs = []
+    for index in range(count):
+        bearing = 2 * np.pi * index / count
+        configs.append({
+            'offset_x': float(10.0 * np.cos(bearing)),
+            'offset_y': float(10.0 * np.sin(bearing)),
+            'offset_z': float(index % 3),
+            'frame': 'body' if index % 2 else 'ned',
+        })
+    return configs
+
+
+def pointwise_follower_trajectory(leader_trajectory: pd.DataFrame, drone_config: dict) -> pd.DataFrame:
+    """The previous row-by-row implementation, kept as the reference."""
+    follower_data = []
+    for _, leader_row in leader_trajectory.iterrows():
+        follower_lat, follower_lon, follower_alt = calculate_follower_global_position(
+            leader_row['lat'], leader_row['lon'], leader_row['alt'], leader_row['yaw'], drone_config
+        )
+        follower_point = leader_row.copy()
+        follower_point['lat'] = follower_lat
+        follower_point['lon'] = follower_lon
+        follower_point['alt'] = follower_alt
+        follower_point['yaw'] = calculate_follower_yaw(leader_row['yaw'], drone_config)
+        follower_point['ledr'] = Params.swarm_follower_led_color[0]
+        follower_point['ledg'] = Params.swarm_follower_led_color[1]
+        follower_point['ledb'] = Params.swarm_follower_led_color[2]
+        follower_data.append(follower_point)
+    return pd.DataFrame(follower_data)
+
+
+def _timed(func, leader: pd.DataFrame, configs: list[dict]) -> tuple[float, list[pd.DataFrame]]:
+    started = time.process_time()
+    results = [func(leader, config) for config in configs]
+    return time.process_time() - started, results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=3000, help="leader trajectory rows")
+    parser.add_argument("--followers", type=int, default=24)
+    args = parser.parse_args(argv)
+
+    leader = build_leader_trajectory(args.rows)
+    configs = build_follower_configs(args.followers)
+    pointwise_cpu, pointwise = _timed(pointwise_follower_trajectory, leader, configs)
+    vectorized_cpu, vectorized = _timed(calculate_follower_trajectory, leader, configs)
+
+    deviation = {column: 0.0 for column in ('lat', 'lon', 'alt', 'yaw')}
+    for reference, result in zip(pointwise, vectorized):
+        for column in deviation:
+            column_deviation = float(np.max(np.abs(reference[column].to_numpy() - result[column].to_numpy())))
+            deviation[column] = max(deviation[column], column_deviation)
+    within_rounding = (
+        deviation['lat'] <= 1e-12 and deviation['lon'] <= 1e-12 and deviation['alt'] <= 1e-7
+        and deviation['yaw'] == 0.0
+    )
+
+    print(json.dumps({
+        "rows": args.rows,
+        "followers": args.followers,
+        "pointwise_cpu_sec": round(pointwise_cpu, 3),
+        "vectorized_cpu_sec": round(vectorized_cpu, 4),
+        "speedup": round(pointwise_cpu / vectorized_cpu, 1),
+        "max_abs_deviation": deviation,
+        "within_rounding": within_rounding,
+    }, indent=2))
+    return 0 if within_rounding else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Concurrent read/write load test for the QuickScout SQLite store.
+
+Reader threads poll mission status and findings while writer threads stream
+progress reports and finding writes, first against the pooled store and then
+against a store that opens a fresh connection per call (the previous
+behaviour). Both runs must leave identical persisted progress and findings;
+the report compares operations per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+for import_root in (REPO_ROOT, REPO_ROOT / "gcs-server", REPO_ROOT / "src"):
+    if str(import_root) not in sys.path:
+        sys.path.insert(0, str(import_root))
+
+from benchmark_quickscout_progress import build_operation  # noqa: E402
+from sar.schemas import QuickScoutFinding  # noqa: E402
+from sar.service import QuickScoutService  # noqa: E402
+from sar.store import QuickScoutStore  # noqa: E402
+
+
+class PerCallConnectionStore(QuickScoutStore):
+    """Baseline that opens and configures a new connection for every call."""
+
+    def _connect(self, *, initialize: bool = True) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        db_exists = self.db_path.exists()
+        connection = sqlite3.connect(self.db_path, timeout=30.0)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA foreign_keys=ON")
+        connection.execute("PRAGMA busy_timeout=30000")
+        if initialize and not db_exists:
+            self._initialize_schema_on_connection(connection)
+        return connection
+
+
+def _run(store: QuickScoutStore, *, drones: int, readers: int, reports_per_drone: int) -> dict[str, object]:
+    operation = build_operation(drones, waypoints_per_drone=reports_per_drone)
+    store.save_operation(operation)
+    service = QuickScoutService(store=store)
+    counts = {"reads": 0, "writes": 0}
+    counts_lock = threading.Lock()
+    stop_readers = threading.Event()
+
+    def reader() -> None:
+        local_reads = 0
+        while not stop_readers.is_set():
+            store.get_operation(operation.mission_id)
+            store.list_findings(operation.mission_id)
+            local_reads += 2
+        with counts_lock:
+            counts["reads"] += local_reads
+
+    def writer(hw_id: str) -> None:
+        for waypoint in range(1, reports_per_drone + 1):
+            service.update_drone_progress(operation.mission_id, hw_id, waypoint, reports_per_drone, float(waypoint))
+            if waypoint % 5 == 0:
+                store.save_finding(
+                    operation.mission_id,
+                    QuickScoutFinding(
+                        id=f"{hw_id}-{waypoint}",
+                        lat=47.0,
+                        lng=8.0,
+                        mission_id=operation.mission_id,
+                        timestamp=float(waypoint),
+                    ),
+                )
+        with counts_lock:
+            counts["writes"] += reports_per_drone + reports_per_drone // 5
+
+    reader_threads = [threading.Thread(target=reader) for _ in range(readers)]
+    writer_threads = [threading.Thread(target=writer, args=(hw_id,)) for hw_id in operation.drone_states]
+    started = time.perf_counter()
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    stop_readers.set()
+    for thread in reader_threads:
+        thread.join()
+
+    loaded = store.get_operation(operation.mission_id)
+    persisted = {
+        "progress": {hw_id: drone.current_waypoint_index for hw_id, drone in sorted(loaded.drone_states.items())},
+        "findings": [finding.id for finding in store.list_findings(operation.mission_id)],
+    }
+    return {
+        "elapsed_s": round(elapsed, 3),
+        "writes_per_s": round(counts["writes"] / elapsed, 1),
+        "reads_per_s": round(counts["reads"] / elapsed, 1),
+        "persisted": persisted,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--drones", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--reports", type=int, default=50, help="progress reports per drone")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for label, store_cls in (("per_call_connections", PerCallConnectionStore), ("pooled", QuickScoutStore)):
+            store = store_cls(str(Path(tmpdir) / f"{label}.sqlite3"))
+            results[label] = _run(store, drones=args.drones, readers=args.readers, reports_per_drone=args.reports)
+            if hasattr(store, "close"):
+                store.close()
+
+    identical = results["pooled"]["persisted"] == results["per_call_connections"]["persisted"]
+    for result in results.values():
+        result.pop("persisted")
+    results["persisted_data_identical"] = identical
+    print(json.dumps(results, indent=2))
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())